@@ -0,0 +1,234 @@
+# ============================================================
+# ab_compare: 共通乱数（CRN）で2つの構成を対にして比べる（装備・ジョブ・隊列の A/B テスト）
+
+# party_variant_from_save	セーブのパーティを1人だけ書き換えた（ジョブ / 装備 / 隊列）PartyMemberRuntime 群を作る
+# compare_configurations	構成 A / B を試行ごとに同じ乱数列で戦わせ、勝率・ラウンド数の差とその区間を返す
+# ============================================================
+# ・試行 i では A と B に同じシードの Random（戦闘用・ポリシー用）を渡す。
+#   両者の行動が同じあいだは乱数の消費も同じなので、差は「構成の違い」による分だけになり、
+#   独立に回すより差の分散がずっと小さい（+4 攻撃力のような小さい差でも少ない試行で分かる）
+# ・勝率差の区間は片方だけが勝った試行数から作る（combat.confidence.paired_diff_interval）。
+#   最初の batch で対の差が全部 0 でも区間が 0 ± 0 に潰れないので、precision の打ち切りが早すぎない
+# ・ラウンド数の差の区間は対ごとの差 d_i = B_i - A_i の平均の正規近似（combat.confidence.mean_interval）
+# ・independent_trials_factor = 独立サンプリング時の差の分散 / 対の差の分散
+#   （独立に回したら同じ精度に何倍の試行が要るかの目安）
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import dataclasses
+from random import Random
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+from combat.battle_sim import (
+    BattlePolicy,
+    clone_enemies_for_trial,
+    clone_party_for_trial,
+    policy_always_fight,
+    run_battle_headless,
+)
+from combat.char_build import build_party_members_from_save
+from combat.confidence import half_width, mean_interval, paired_diff_interval, wilson_interval
+from combat.enemy_build import build_enemies
+from combat.models import EquipmentSet, PartyMemberRuntime
+from combat.runtime_state import RuntimeState
+from combat.verbosity import QUIET, verbosity
+from system.exp_system import LevelTable
+
+
+def party_variant_from_save(
+    state: RuntimeState,
+    level_table: LevelTable,
+    *,
+    member: str,
+    job: Optional[str] = None,
+    equipment: Optional[Union[EquipmentSet, Mapping[str, Optional[str]]]] = None,
+    row: Optional[str] = None,
+) -> List[PartyMemberRuntime]:
+    """
+    state.save のパーティのうち member（名前）だけを書き換えて構築する。state.save は変更しない。
+    ・job: ジョブ名（そのジョブの job_levels があればそれを使う）
+    ・equipment: EquipmentSet なら丸ごと、dict なら指定したスロットだけ差し替え
+    ・row: "front" / "back"
+    """
+    save = {"party": copy.deepcopy(state.save.get("party", []))}
+    entry = next((p for p in save["party"] if p.get("name") == member), None)
+    if entry is None:
+        raise KeyError(f"パーティに {member} がいません")
+
+    if job is not None:
+        if job not in state.jobs_by_name:
+            raise KeyError(f"ジョブ {job} が見つかりません")
+        entry["job"] = job
+    if equipment is not None:
+        if isinstance(equipment, EquipmentSet):
+            entry["equipment"] = dataclasses.asdict(equipment)
+        else:
+            entry["equipment"] = {**(entry.get("equipment") or {}), **equipment}
+    if row is not None:
+        if row not in ("front", "back"):
+            raise ValueError(f"row は front / back で指定してください: {row}")
+        entry["row"] = row
+
+    with verbosity(QUIET):
+        return build_party_members_from_save(
+            save=save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=level_table,
+        )
+
+
+@dataclasses.dataclass
+class _Side:
+    wins: int = 0
+    rounds: int = 0
+    rounds_sq: int = 0
+
+    def summary(self, n: int, confidence: float) -> Dict[str, Any]:
+        return {
+            "win_rate": self.wins / n if n else 0.0,
+            "win_rate_ci": wilson_interval(self.wins, n, confidence),
+            "average_turns": self.rounds / n if n else 0.0,
+            "average_turns_ci": mean_interval(self.rounds, self.rounds_sq, n, confidence),
+        }
+
+
+def _variance(total: float, total_sq: float, n: int) -> float:
+    if n < 2:
+        return 0.0
+    mean = total / n
+    return max(0.0, (total_sq - n * mean * mean) / (n - 1))
+
+
+def compare_configurations(
+    party_a: Sequence[PartyMemberRuntime],
+    party_b: Sequence[PartyMemberRuntime],
+    enemy_names: Sequence[str],
+    n_trials: int = 1000,
+    policy: Optional[BattlePolicy] = None,
+    seed: Optional[int] = None,
+    *,
+    state: Optional[RuntimeState] = None,
+    spells_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    max_rounds: int = 50,
+    difficulty: int = 0,
+    quiet: bool = True,
+    confidence: float = 0.95,
+    precision: Optional[float] = None,
+    batch_size: int = 100,
+) -> Dict[str, Any]:
+    """
+    構成 A / B を同じ敵編成・同じ試行ごとの乱数で n_trials 回ずつ戦わせて比べる。
+    precision を指定すると、batch_size 試行ごとに勝率差の区間の半幅を確認し、
+    precision 以下になったら止める（n_trials は上限）。
+    party_a / party_b / state.save は変更しない。
+
+    戻り値 dict:
+      trials, confidence, stopped_early,
+      a / b                 {win_rate, win_rate_ci, average_turns, average_turns_ci}
+      win_rate_diff         B - A の勝率差（対の差の平均）
+      win_rate_diff_ci      その区間（paired_diff_interval。対の差が全部 0 でも幅が残る）
+      turns_diff / turns_diff_ci  B - A の平均ラウンド数の差とその区間
+      a_only_wins / b_only_wins   片方だけが勝った試行数（差を生んだ試行）
+      independent_trials_factor   独立サンプリングなら何倍の試行が要るか（差の分散が 0 なら None）
+    """
+    if state is None:
+        from combat.runtime_state import get_state
+
+        state = get_state()
+    if policy is None:
+        policy = policy_always_fight
+    if spells_by_name is None:
+        from combat.magic_menu import expand_spells_for_summons
+
+        spells_by_name = expand_spells_for_summons(state.spells)
+    if precision is not None and precision <= 0:
+        raise ValueError(f"precision は正の値で指定してください: {precision}")
+
+    n_trials = max(0, int(n_trials))
+    batch_size = max(1, int(batch_size))
+
+    enemy_template = build_enemies(
+        enemy_defs_by_name=state.monsters,
+        spells_by_name=state.spells,
+        enemy_names=enemy_names,
+        difficulty=difficulty,
+    )
+
+    master_rng = Random(seed)
+    sides = (_Side(), _Side())
+    d_win = d_win_sq = 0
+    d_rounds = d_rounds_sq = 0
+    a_only = b_only = 0
+    trials = 0
+    stopped_early = False
+
+    out_ctx = verbosity(QUIET) if quiet else contextlib.nullcontext()
+    with out_ctx:
+        while trials < n_trials:
+            if (
+                precision is not None
+                and trials > 0
+                and trials % batch_size == 0
+                and half_width(paired_diff_interval(a_only, b_only, trials, confidence))
+                <= precision
+            ):
+                stopped_early = True
+                break
+            trials += 1
+
+            # ★共通乱数：A と B に同じシードの Random を渡す
+            battle_seed = master_rng.getrandbits(64)
+            policy_seed = master_rng.getrandbits(64)
+
+            outcome = []
+            for side, template in zip(sides, (party_a, party_b)):
+                trial_state = dataclasses.replace(state, save=copy.deepcopy(state.save))
+                end_reason, rounds = run_battle_headless(
+                    clone_party_for_trial(template),
+                    clone_enemies_for_trial(enemy_template),
+                    trial_state,
+                    policy=policy,
+                    rng=Random(battle_seed),
+                    policy_rng=Random(policy_seed),
+                    max_rounds=max_rounds,
+                    spells_by_name=spells_by_name,
+                    items_by_name=trial_state.items_by_name,
+                )
+                won = int(end_reason == "enemy_defeated")
+                side.wins += won
+                side.rounds += rounds
+                side.rounds_sq += rounds * rounds
+                outcome.append((won, rounds))
+
+            (won_a, rounds_a), (won_b, rounds_b) = outcome
+            dw = won_b - won_a
+            dr = rounds_b - rounds_a
+            d_win += dw
+            d_win_sq += dw * dw
+            d_rounds += dr
+            d_rounds_sq += dr * dr
+            a_only += int(won_a and not won_b)
+            b_only += int(won_b and not won_a)
+
+    a, b = sides
+    var_paired = _variance(d_win, d_win_sq, trials)
+    var_indep = _variance(a.wins, a.wins, trials) + _variance(b.wins, b.wins, trials)
+
+    return {
+        "trials": trials,
+        "confidence": confidence,
+        "stopped_early": stopped_early,
+        "a": a.summary(trials, confidence),
+        "b": b.summary(trials, confidence),
+        "win_rate_diff": d_win / trials if trials else 0.0,
+        "win_rate_diff_ci": paired_diff_interval(a_only, b_only, trials, confidence),
+        "turns_diff": d_rounds / trials if trials else 0.0,
+        "turns_diff_ci": mean_interval(d_rounds, d_rounds_sq, trials, confidence),
+        "a_only_wins": a_only,
+        "b_only_wins": b_only,
+        "independent_trials_factor": (var_indep / var_paired if var_paired > 0 else None),
+    }
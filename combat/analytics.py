@@ -0,0 +1,517 @@
+# ============================================================
+# analytics: 1回の行動のダメージ分布（確率質量関数 PMF）を厳密に計算する
+
+# DamagePMF	ダメージの PMF（offset + 確率配列）。平均・撃破確率・畳み込みなど
+# factor_raw_pmf	AttackPower * U[1.0, 1.5) の整数部（int 切り捨て）の分布
+# per_hit_damage_pmf	1ヒットあたり基礎ダメージ max(raw - Defense, 1) の分布
+# physical_damage_pmf_char_to_enemy	キャラ→敵の物理ダメージ分布（physical_damage_char_to_enemy の乱数モードと同じ式）
+# physical_damage_pmf_enemy_to_char	敵→キャラの物理ダメージ分布（physical_damage_enemy_to_char の乱数モードと同じ式）
+# magic_damage_pmf_char_to_enemy	キャラ→敵の攻撃魔法ダメージ分布（ヒット数ロール + ヒットごとロールの畳み込み）
+# DuelSolution	solve_duel の戻り値（勝率・引き分け率・平均ラウンド数・撃破ラウンドの累積分布・ラウンド数分布・勝利時の被ダメ分布）
+# p_char_acts_first	calc_initiative（Agi*10 + 0〜9）でキャラが先に動く確率
+# kill_round_cdf	1行動ダメージ分布を毎ラウンド受けたとき、n ラウンド以内に HP が尽きる確率
+# solve_duel	1対1の HP マルコフ連鎖を解いて勝率・平均ラウンド数を厳密に求める（固定ポリシー）
+# solve_duel_from_stats	FinalCharacterStats / FinalEnemyStats から「毎ターンたたかう / 毎ターン魔法X」の1対1を解く
+# ============================================================
+# ・乱数モード（use_expectation=False）の式をそのまま確率計算に置き換えたもの
+#   （一様乱数の係数・ネットヒット数の丸め・クリティカル・属性相性・暗闇/後列の半減を含む）
+# ・「Fire 1発で倒せる確率は？」→ magic_damage_pmf_char_to_enemy(...).prob_at_least(敵HP)
+# ・NumPy は任意依存。未インストールなら呼び出し時に ImportError
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Iterable, Literal, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy 無しでもゲーム本体は動く
+    np = None  # type: ignore[assignment]
+
+from combat.enums import ElementRelation
+from combat.elements import apply_element_relation_to_damage
+from combat.models import FinalCharacterStats, FinalEnemyStats, SpellInfo
+from combat.phys_damage import _calc_net_hits
+from combat.magic_damage import (
+    _calc_expected_magic_hits,
+    _calc_magic_accuracy,
+    _calc_magic_multiplier,
+    _calc_magic_power,
+)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("combat.analytics には NumPy が必要です（pip install numpy）")
+
+
+# ============================================================
+# PMF 本体
+# ============================================================
+
+
+@dataclass(frozen=True)
+class DamagePMF:
+    """
+    P(ダメージ = offset + i) = probs[i]
+    （確率の合計は 1。値の範囲が連続していない場合は 0 が入る）
+    """
+
+    offset: int
+    probs: "np.ndarray"  # float64
+
+    @staticmethod
+    def point(value: int) -> "DamagePMF":
+        """確率1で value になる分布（ミス・無効など）"""
+        _require_numpy()
+        return DamagePMF(offset=int(value), probs=np.ones(1, dtype=np.float64))
+
+    @staticmethod
+    def from_outcomes(values: Iterable[int], weights: Iterable[float]) -> "DamagePMF":
+        """(値, 確率) の組から PMF を作る（同じ値は合算）"""
+        _require_numpy()
+        v = np.fromiter(values, dtype=np.int64)
+        w = np.fromiter(weights, dtype=np.float64)
+        if v.size == 0:
+            return DamagePMF.point(0)
+        lo = int(v.min())
+        return DamagePMF(offset=lo, probs=np.bincount(v - lo, weights=w))
+
+    @property
+    def min_damage(self) -> int:
+        return self.offset
+
+    @property
+    def max_damage(self) -> int:
+        return self.offset + len(self.probs) - 1
+
+    def values(self) -> "np.ndarray":
+        return np.arange(self.offset, self.offset + len(self.probs), dtype=np.int64)
+
+    def mean(self) -> float:
+        return float(np.dot(self.values(), self.probs))
+
+    def variance(self) -> float:
+        v = self.values()
+        m = float(np.dot(v, self.probs))
+        return float(np.dot((v - m) ** 2, self.probs))
+
+    def prob(self, damage: int) -> float:
+        i = int(damage) - self.offset
+        return float(self.probs[i]) if 0 <= i < len(self.probs) else 0.0
+
+    def prob_at_least(self, damage: int) -> float:
+        """ダメージが damage 以上になる確率（HP を渡せば撃破確率）"""
+        i = max(int(damage) - self.offset, 0)
+        return float(self.probs[i:].sum()) if i < len(self.probs) else 0.0
+
+    def map(self, f: Callable[[int], int]) -> "DamagePMF":
+        """各ダメージ値に f を適用した分布（属性補正・分割など）"""
+        return DamagePMF.from_outcomes(
+            (f(int(v)) for v in self.values()), self.probs.tolist()
+        )
+
+    def mix(self, other: "DamagePMF", p_other: float) -> "DamagePMF":
+        """確率 p_other で other、それ以外は self になる混合分布"""
+        lo = min(self.offset, other.offset)
+        hi = max(self.max_damage, other.max_damage)
+        out = np.zeros(hi - lo + 1, dtype=np.float64)
+        out[self.offset - lo : self.offset - lo + len(self.probs)] += self.probs * (
+            1.0 - p_other
+        )
+        out[other.offset - lo : other.offset - lo + len(other.probs)] += (
+            other.probs * p_other
+        )
+        return DamagePMF(offset=lo, probs=out)
+
+    def convolve(self, other: "DamagePMF") -> "DamagePMF":
+        """独立な2つのダメージの和の分布（複数ヒット・複数行動の合計）"""
+        return DamagePMF(
+            offset=self.offset + other.offset,
+            probs=np.convolve(self.probs, other.probs),
+        )
+
+    def convolve_power(self, k: int) -> "DamagePMF":
+        """同じ分布を k 回足した分布（k=0 は 0 ダメージ確定）"""
+        result = DamagePMF.point(0)
+        base = self
+        while k > 0:
+            if k & 1:
+                result = result.convolve(base)
+            k >>= 1
+            if k:
+                base = base.convolve(base)
+        return result
+
+
+# ============================================================
+# 1ヒットあたりの基礎ダメージ
+# ============================================================
+
+
+def factor_raw_pmf(power: int) -> DamagePMF:
+    """
+    int(power * U[1.0, 1.5)) の分布。
+    raw = k となるのは k <= power*u < k+1 の区間なので、その長さ / 0.5 が確率。
+    """
+    _require_numpy()
+    power = int(power)
+    if power <= 0:
+        # 0 以下は raw <= 0 → 呼び出し側の max(..., 1) で 1 に潰れる
+        return DamagePMF.point(0)
+    hi = 1.5 * power
+    ks = np.arange(power, math.ceil(hi), dtype=np.int64)
+    widths = np.minimum(ks + 1, hi) - ks
+    return DamagePMF(offset=power, probs=widths / (0.5 * power))
+
+
+def per_hit_damage_pmf(power: int, defense: int) -> DamagePMF:
+    """AttackPower * [1.0, 1.5] - Defense（最低 1）の分布"""
+    raw = factor_raw_pmf(power)
+    return raw.map(lambda r: max(r - int(defense), 1))
+
+
+# ============================================================
+# 物理ダメージ：キャラ → 敵
+# ============================================================
+
+
+def physical_damage_pmf_char_to_enemy(
+    char: FinalCharacterStats,
+    enemy: FinalEnemyStats,
+    hand: str = "main",
+    element_relation: ElementRelation = "normal",
+    blind: bool = False,
+    attacker_is_mini_or_toad: bool = False,
+    cheer_bonus: int = 0,
+) -> DamagePMF:
+    """physical_damage_char_to_enemy(use_expectation=False) のダメージ分布"""
+    _require_numpy()
+    if attacker_is_mini_or_toad:
+        return DamagePMF.point(0)
+
+    if hand == "off":
+        atk_power = char.off_power
+        atk_mul = char.off_atk_multiplier
+        hit_percent = char.off_accuracy
+        is_long = char.off_long
+    else:
+        atk_power = char.main_power
+        atk_mul = char.main_atk_multiplier
+        hit_percent = char.main_accuracy
+        is_long = char.main_long
+    atk_power += max(cheer_bonus, 0)
+
+    if atk_power <= 0 or atk_mul <= 0:
+        return DamagePMF.point(0)
+
+    if blind:
+        hit_percent //= 2
+    if char.row == "back" and not is_long:
+        hit_percent //= 2
+
+    net_hits = _calc_net_hits(
+        atk_multiplier=atk_mul,
+        hit_percent=hit_percent,
+        def_multiplier=enemy.defense_multiplier,
+        evade_percent=enemy.evasion_percent,
+    )
+    if int(round(net_hits)) <= 0:
+        return DamagePMF.point(0)
+
+    def finish(base: int) -> int:
+        dmg = apply_element_relation_to_damage(int(base * net_hits), element_relation)
+        return max(dmg, 0)
+
+    normal = per_hit_damage_pmf(atk_power, enemy.defense).map(finish)
+
+    # roll_critical と同じ確率でダメージ2倍
+    crit_chance = min(max(1.0 / 16.0 + char.agility / 512, 0.0), 0.5)
+    return normal.mix(normal.map(lambda d: max(d * 2, 0)), crit_chance)
+
+
+# ============================================================
+# 物理ダメージ：敵 → キャラ
+# ============================================================
+
+
+def physical_damage_pmf_enemy_to_char(
+    enemy: FinalEnemyStats,
+    char: FinalCharacterStats,
+    attacker_is_blind: bool = False,
+    attacker_is_mini_or_toad: bool = False,
+    target_is_mini_or_toad: bool = False,
+    target_boosted: bool = False,
+) -> DamagePMF:
+    """
+    physical_damage_enemy_to_char(use_expectation=False) のダメージ分布。
+    target_boosted は target_state.boost_count > 0 に相当。
+    """
+    _require_numpy()
+    if attacker_is_mini_or_toad:
+        return DamagePMF.point(0)
+
+    defense_value = char.defense
+    def_mul = char.defense_multiplier
+    if target_is_mini_or_toad:
+        defense_value = 0
+    if target_boosted:
+        defense_value = 0
+        def_mul = 0
+
+    hit_percent = enemy.accuracy_percent
+    if attacker_is_blind:
+        hit_percent //= 2
+    if char.row == "back":
+        hit_percent //= 2
+
+    net_hits = _calc_net_hits(
+        atk_multiplier=enemy.attack_multiplier,
+        hit_percent=hit_percent,
+        def_multiplier=def_mul,
+        evade_percent=char.evasion_percent,
+    )
+    if net_hits <= 0:
+        return DamagePMF.point(0)
+
+    # スカラー版は base * net_hits（float）を2倍してから int 化する
+    base = per_hit_damage_pmf(enemy.attack_power, defense_value)
+    normal = base.map(lambda b: max(int(b * net_hits), 0))
+    crit = base.map(lambda b: max(int(b * net_hits * 2), 0))
+
+    crit_chance = min(max(1 / 20 + enemy.level / 9999, 0.0), 0.5)
+    return normal.mix(crit, crit_chance)
+
+
+# ============================================================
+# 魔法ダメージ：キャラ → 敵
+# ============================================================
+
+
+def magic_damage_pmf_char_to_enemy(
+    caster: FinalCharacterStats,
+    spell: SpellInfo,
+    enemy: FinalEnemyStats,
+    element_relation: ElementRelation = "normal",
+    split_to_targets: int = 1,
+    blind: bool = False,
+) -> DamagePMF:
+    """
+    magic_damage_char_to_enemy(use_expectation=False) のダメージ分布。
+    ヒット数は floor(期待ヒット数) + Bernoulli(小数部)、各ヒットは独立にロール
+    → 1ヒット分布の畳み込みの混合になる。
+    """
+    _require_numpy()
+    magic_power = _calc_magic_power(caster, spell)
+    magic_mult = _calc_magic_multiplier(caster, spell)
+    magic_acc = _calc_magic_accuracy(caster, spell, blind=blind)
+
+    expected_hits = _calc_expected_magic_hits(
+        magic_mult=magic_mult,
+        magic_acc_percent=magic_acc,
+        mdef_mult=enemy.magic_def_multiplier,
+        magic_resistance_percent=enemy.magic_resistance_percent,
+    )
+    if expected_hits <= 0:
+        return DamagePMF.point(0)
+
+    base_hits = int(expected_hits)
+    frac = expected_hits - base_hits
+
+    per_hit = per_hit_damage_pmf(magic_power, enemy.magic_defense)
+    total = per_hit.convolve_power(base_hits)
+    if frac > 0:
+        total = total.mix(total.convolve(per_hit), frac)
+
+    def finish(dmg: int) -> int:
+        dmg = apply_element_relation_to_damage(dmg, element_relation)
+        if split_to_targets > 1:
+            dmg = int(dmg / split_to_targets)
+        return max(int(dmg), 0)
+
+    return total.map(finish)
+
+
+# ============================================================
+# 1対1の厳密解（HP マルコフ連鎖）
+# ============================================================
+# 固定ポリシー（毎ターン同じ行動）の1対1では、各ラウンドの与ダメージは独立同分布なので
+#   ・敵HPの連鎖（キャラの累積ダメージ）と キャラHPの連鎖（敵の累積ダメージ）は互いに独立
+#   ・連鎖どうしが関係するのは「同じラウンドに両方が致死ダメージに達したとき、どちらが先に動くか」だけ
+# よって 2次元の (キャラHP, 敵HP) 連鎖を解く代わりに、各側の吸収時刻の分布
+#   F(n) = P(n ラウンド以内に HP が尽きる)
+# を1次元の連鎖で求めて組み合わせれば厳密な勝率になる。
+# ※ 状態異常・回復・MP 切れ・敵の特殊攻撃/逃走はモデル化しない（ダメージ分布で表せる範囲のみ）
+
+
+@dataclass(frozen=True)
+class DuelSolution:
+    win_rate_char: float
+    win_rate_enemy: float
+    draw_rate: float  # max_rounds 以内に決着しない確率
+    average_turns: float  # 決着までの平均ラウンド数（引き分けは max_rounds で数える）
+    expected_turns_to_kill_enemy: float  # キャラが敵を倒すまでの平均ラウンド数（反撃なし、max_rounds 打ち切り）
+    expected_turns_to_kill_char: float  # 敵がキャラを倒すまでの平均ラウンド数（同上）
+    p_char_first: float
+    enemy_kill_cdf: "np.ndarray"  # [n] = P(キャラが n ラウンド以内に敵を倒せる)
+    char_kill_cdf: "np.ndarray"  # [n] = P(敵が n ラウンド以内にキャラを倒せる)
+    rounds_pmf: "np.ndarray"  # [n] = P(n ラウンドで終わる)（引き分けは max_rounds に入る）
+    win_damage_pmf: "np.ndarray"  # [j] = P(キャラの勝ち かつ キャラの被ダメージ累計 = j)
+
+
+def p_char_acts_first(char_agility: int, enemy_agility: int) -> float:
+    """
+    calc_initiative = Agi*10 + randint(0, 9) を両者で振り、キャラが先に動く確率。
+    同値はキャラ優先（行動順リストはキャラが先に並び、安定ソートのため）。
+    """
+    a = int(char_agility) * 10
+    b = int(enemy_agility) * 10
+    wins = sum(1 for u in range(10) for v in range(10) if a + u >= b + v)
+    return wins / 100.0
+
+
+def kill_round_cdf(pmf: DamagePMF, hp: int, max_rounds: int) -> "np.ndarray":
+    """
+    毎ラウンド pmf のダメージを受け続けたとき、n ラウンド以内に HP が 0 以下になる確率 F(n)。
+    生存中の状態は「累積ダメージ 0..hp-1」の1次元連鎖（ダメージは 0 以上なので逆戻りしない）。
+    """
+    cdf, _ = _kill_round_chain(pmf, hp, max_rounds, keep_alive=False)
+    return cdf
+
+
+def _kill_round_chain(
+    pmf: DamagePMF, hp: int, max_rounds: int, keep_alive: bool
+) -> Tuple["np.ndarray", Optional["np.ndarray"]]:
+    """
+    kill_round_cdf の本体。keep_alive=True なら生存中の分布の履歴も返す
+    （alive[n, j] = P(n ラウンド後も生存 かつ 累積ダメージ = j)）
+    """
+    _require_numpy()
+    if pmf.offset < 0:
+        raise ValueError("回復を含むダメージ分布（負の値）には対応していません")
+
+    hp = max(int(hp), 0)
+    cdf = np.zeros(max_rounds + 1, dtype=np.float64)
+    history = np.zeros((max_rounds + 1, hp), dtype=np.float64) if keep_alive else None
+    if hp == 0:
+        cdf[:] = 1.0
+        return cdf, history
+
+    off = pmf.offset
+    alive = np.zeros(hp, dtype=np.float64)
+    alive[0] = 1.0
+    if history is not None:
+        history[0] = alive
+    for n in range(1, max_rounds + 1):
+        full = np.convolve(alive, pmf.probs)  # full[j] = P(累積ダメージ = j + off)
+        nxt = np.zeros(hp, dtype=np.float64)
+        lim = hp - off
+        if lim > 0:
+            nxt[off:] = full[:lim]
+        alive = nxt
+        if history is not None:
+            history[n] = alive
+        # 浮動小数の誤差で単調性が崩れないように
+        cdf[n] = min(max(1.0 - float(alive.sum()), cdf[n - 1]), 1.0)
+        if cdf[n] >= 1.0 - 1e-15:
+            cdf[n:] = 1.0
+            break
+    return cdf, history
+
+
+def solve_duel(
+    char_pmf: DamagePMF,
+    enemy_pmf: DamagePMF,
+    char_hp: int,
+    enemy_hp: int,
+    *,
+    p_char_first: float = 0.5,
+    max_rounds: int = 100,
+) -> DuelSolution:
+    """
+    1対1・固定ポリシーの勝率を厳密に求める
+    （simulate_many_battles_multi_party は 1人 vs 1体・毎ターンたたかう のときサンプリングの代わりにこれを使う）。
+    char_pmf: キャラ1行動の敵への与ダメージ分布 / enemy_pmf: 敵1行動のキャラへの与ダメージ分布
+    """
+    fc = kill_round_cdf(char_pmf, enemy_hp, max_rounds)  # キャラが敵を倒す時刻
+    # 敵がキャラを倒す時刻（勝利時の残りHP用に生存中の分布も残す）
+    fe, char_alive = _kill_round_chain(enemy_pmf, char_hp, max_rounds, keep_alive=True)
+
+    pc = np.diff(fc)  # [n-1] = P(ちょうど n ラウンド目に倒す)
+    pe = np.diff(fe)
+
+    # 同じラウンドに両者が致死 → 先に動いた方の勝ち
+    win_by_round = pc * ((1.0 - fe[1:]) + p_char_first * pe)
+    lose_by_round = pe * ((1.0 - fc[1:]) + (1.0 - p_char_first) * pc)
+    win = float(win_by_round.sum())
+    lose = float(lose_by_round.sum())
+    draw = float((1.0 - fc[-1]) * (1.0 - fe[-1]))
+
+    rounds_pmf = np.zeros(max_rounds + 1, dtype=np.float64)
+    rounds_pmf[1:] = win_by_round + lose_by_round
+    rounds_pmf[max_rounds] += draw
+
+    # n ラウンド目に倒したとき、キャラが先に動いていれば n-1 ラウンド後、後なら n ラウンド後の被ダメージ
+    # （後攻で勝つのは n ラウンド目の敵の攻撃を生き延びたときだけ＝char_alive[n] がそれ）
+    win_damage_pmf = pc @ (
+        p_char_first * char_alive[:-1] + (1.0 - p_char_first) * char_alive[1:]
+    )
+
+    survive_c = 1.0 - fc[:-1]  # P(T > n), n = 0..max_rounds-1
+    survive_e = 1.0 - fe[:-1]
+
+    return DuelSolution(
+        win_rate_char=max(win, 0.0),
+        win_rate_enemy=max(lose, 0.0),
+        draw_rate=max(draw, 0.0),
+        average_turns=float(np.dot(survive_c, survive_e)),
+        expected_turns_to_kill_enemy=float(survive_c.sum()),
+        expected_turns_to_kill_char=float(survive_e.sum()),
+        p_char_first=p_char_first,
+        enemy_kill_cdf=fc,
+        char_kill_cdf=fe,
+        rounds_pmf=rounds_pmf,
+        win_damage_pmf=win_damage_pmf,
+    )
+
+
+def solve_duel_from_stats(
+    char: FinalCharacterStats,
+    enemy: FinalEnemyStats,
+    *,
+    policy: Literal["fight", "magic"] = "fight",
+    spell: Optional[SpellInfo] = None,
+    element_relation: ElementRelation = "normal",
+    char_hp: Optional[int] = None,
+    enemy_hp: Optional[int] = None,
+    max_rounds: int = 100,
+) -> DuelSolution:
+    """
+    キャラ「毎ターンたたかう（右手）」または「毎ターン spell を唱える」vs 敵「毎ターン物理攻撃」の1対1。
+    element_relation はキャラ側の攻撃（武器属性 / 魔法属性）と敵の相性。
+    HP 省略時はキャラ max_hp / 敵 hp（満タン）から開始。
+    """
+    if policy == "magic":
+        if spell is None:
+            raise ValueError("policy='magic' の場合は spell が必要です")
+        char_pmf = magic_damage_pmf_char_to_enemy(
+            char, spell, enemy, element_relation=element_relation
+        )
+    elif policy == "fight":
+        char_pmf = physical_damage_pmf_char_to_enemy(
+            char, enemy, element_relation=element_relation
+        )
+    else:
+        raise ValueError(f"未対応の policy です: {policy}")
+
+    enemy_pmf = physical_damage_pmf_enemy_to_char(enemy, char)
+
+    return solve_duel(
+        char_pmf,
+        enemy_pmf,
+        char_hp=char.max_hp if char_hp is None else char_hp,
+        enemy_hp=enemy.hp if enemy_hp is None else enemy_hp,
+        p_char_first=p_char_acts_first(char.agility, enemy.agility),
+        max_rounds=max_rounds,
+    )
@@ -0,0 +1,647 @@
+# ============================================================
+# batch_battle: K 戦を同時に進める配列版バトル状態（NumPy、struct-of-arrays）
+
+# BatchAction	パーティ1人ぶんの固定コマンド（fight / magic / defend）
+# PreparedBatchAction	BatchAction を呪文 JSON・属性相性まで解決したもの（ラウンドごとに引き直さない）
+# BatchBattleState	K 戦ぶんの HP / 最大HP / 状態異常ビット / MP / Reflect 回数 / ジャンプ中フラグを配列で保持
+# status_mask	Status の集合 → ビットマスク（int）
+# prepare_batch_actions	BatchAction 列を PreparedBatchAction 列へ解決
+# resolve_round_batch	K 戦ぶんの 1 ラウンドを一括で進める（Fight / 黒魔法・白魔法 / Defend / 敵の通常攻撃）
+# run_batch_battles	決着（または max_rounds）まで resolve_round_batch を回す
+# simulate_many_battles_batch	simulate_many_battles_multi_party と同じ形式の集計を配列版で返す
+# ============================================================
+# ・アクター番号はパーティが先（0..P-1）、敵が後（P..P+E-1）。同値イニシアチブはキャラ優先
+#   （battle_sim の安定ソートと同じ）
+# ・扱うのは「よく使うコマンド」だけ：
+#     キャラ：Fight（先頭の生存敵・メインハンド）/ 攻撃魔法（先頭の生存敵）/
+#             HP回復魔法（HP割合が最も低い生存味方）/ Defend
+#     敵    ：通常物理攻撃のみ（生存かつジャンプ中でないメンバーから一様に選ぶ）
+#   スペシャル・AoE・アイテム・逃走・混乱の行動変化は扱わない（詳細は battle_sim 側で）
+# ・ターン開始時の毒ダメージ、睡眠/麻痺による行動不能、沈黙、暗闇、小人/カエル、
+#   Reflect（単体魔法の跳ね返し）、防御の半減は battle_sim と同じ扱い
+# ・NumPy は任意依存。未インストールなら呼び出し時に ImportError
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy 無しでもゲーム本体は動く
+    np = None  # type: ignore[assignment]
+
+from combat.confidence import mean_interval, wilson_interval
+from combat.damage_batch import (
+    _require_numpy,
+    magic_damage_char_to_enemy_batch,
+    physical_damage_char_to_enemy_batch,
+    physical_damage_enemy_to_char_batch,
+)
+from combat.elements import (
+    element_relation_and_hits_for_monster,
+    monster_element_masks,
+    resolve_element_relation,
+)
+from combat.enemy_build import build_enemies
+from combat.enums import ElementRelation, Status
+from combat.magic_damage import (
+    _calc_magic_accuracy,
+    _calc_magic_multiplier,
+    _calc_magic_power,
+    _is_offensive_white,
+)
+from combat.models import EnemyRuntime, PartyMemberRuntime, SpellInfo
+from combat.progression import (
+    compute_cp_reward,
+    compute_exp_reward,
+    compute_gil_reward,
+)
+from combat.spell_table import lookup_spell
+from combat.status_effects import ff3_confused_self_dummy_enemy
+
+BatchCommand = Literal["fight", "magic", "defend"]
+
+# 状態異常 → ビット
+STATUS_BITS: Dict[Status, int] = {s: 1 << i for i, s in enumerate(Status)}
+
+_OUT_OF_BATTLE_BITS = STATUS_BITS[Status.KO] | STATUS_BITS[Status.PETRIFY]
+_CANNOT_ACT_BITS = STATUS_BITS[Status.SLEEP] | STATUS_BITS[Status.PARALYZE]
+_MINI_OR_TOAD_BITS = STATUS_BITS[Status.MINI] | STATUS_BITS[Status.TOAD]
+
+# end_reason の配列表現（0 は継続中）
+END_CONTINUE = 0
+END_ENEMY_DEFEATED = 1
+END_CHAR_DEFEATED = 2
+END_TIMEOUT = 3
+END_REASON_NAMES = ("continue", "enemy_defeated", "char_defeated", "timeout")
+
+
+def status_mask(statuses: Iterable[Status]) -> int:
+    """Status の集合をビットマスクに変換する"""
+    mask = 0
+    for s in statuses:
+        mask |= STATUS_BITS[s]
+    return mask
+
+
+@dataclass
+class BatchAction:
+    kind: BatchCommand
+    spell_name: Optional[str] = None  # kind == "magic" のときだけ使う
+
+
+@dataclass
+class PreparedBatchAction:
+    kind: BatchCommand
+    spell_name: Optional[str] = None
+    spell: Optional[SpellInfo] = None
+    mp_level: int = 0  # 1〜8（magic のみ）
+    is_heal: bool = False
+    reflectable: bool = False
+    relations: Optional[List[ElementRelation]] = None  # 敵スロットごとの属性相性
+
+
+@dataclass
+class BatchBattleState:
+    """
+    K 戦ぶんの可変状態を (K, アクター数) の配列で持つ。
+    ステータス（攻撃力・防御など）は全戦共通なのでテンプレートの stats をそのまま参照する。
+    """
+
+    party: List[PartyMemberRuntime]  # 参照のみ（変更しない）
+    enemies: List[EnemyRuntime]  # 参照のみ（変更しない）
+    hp: "np.ndarray"  # (K, A) int32
+    max_hp: "np.ndarray"  # (A,) int32
+    status: "np.ndarray"  # (K, A) uint32 ビットマスク
+    mp: "np.ndarray"  # (K, P, 8) int16（列 i が MP レベル i+1）
+    max_mp: "np.ndarray"  # (P, 8) int16
+    reflect: "np.ndarray"  # (K, A) int16
+    jumping: "np.ndarray"  # (K, P) bool
+    defending: "np.ndarray"  # (K, P) bool
+    agility: "np.ndarray"  # (A,) int64
+    end_reason: "np.ndarray"  # (K,) int8（END_*）
+    rounds: "np.ndarray"  # (K,) int32
+
+    @classmethod
+    def from_runtime(
+        cls,
+        party: List[PartyMemberRuntime],
+        enemies: List[EnemyRuntime],
+        k: int,
+    ) -> "BatchBattleState":
+        """現在の PartyMemberRuntime / EnemyRuntime の状態を K 戦ぶん複製して作る"""
+        _require_numpy()
+        if k <= 0:
+            raise ValueError(f"k は 1 以上を指定してください: {k}")
+
+        actors = [pm.state for pm in party] + [em.state for em in enemies]
+        n_party = len(party)
+
+        hp0 = np.array([s.hp for s in actors], dtype=np.int32)
+        status0 = np.array([status_mask(s.statuses) for s in actors], dtype=np.uint32)
+        reflect0 = np.array([s.reflect_charges for s in actors], dtype=np.int16)
+        mp0 = np.array(
+            [[pm.state.mp_pool.get(i, 0) for i in range(1, 9)] for pm in party],
+            dtype=np.int16,
+        ).reshape(n_party, 8)
+        max_mp = np.array(
+            [[pm.state.max_mp_pool.get(i, 0) for i in range(1, 9)] for pm in party],
+            dtype=np.int16,
+        ).reshape(n_party, 8)
+        jump0 = np.array([pm.state.is_jumping for pm in party], dtype=bool)
+
+        return cls(
+            party=list(party),
+            enemies=list(enemies),
+            hp=np.tile(hp0, (k, 1)),
+            max_hp=np.array(
+                [pm.max_hp for pm in party] + [em.max_hp for em in enemies],
+                dtype=np.int32,
+            ),
+            status=np.tile(status0, (k, 1)),
+            mp=np.tile(mp0, (k, 1, 1)),
+            max_mp=max_mp,
+            reflect=np.tile(reflect0, (k, 1)),
+            jumping=np.tile(jump0, (k, 1)),
+            defending=np.zeros((k, n_party), dtype=bool),
+            agility=np.array(
+                [pm.stats.agility for pm in party] + [em.stats.agility for em in enemies],
+                dtype=np.int64,
+            ),
+            end_reason=np.zeros(k, dtype=np.int8),
+            rounds=np.zeros(k, dtype=np.int32),
+        )
+
+    @property
+    def k(self) -> int:
+        return int(self.hp.shape[0])
+
+    @property
+    def n_party(self) -> int:
+        return len(self.party)
+
+    @property
+    def n_enemies(self) -> int:
+        return len(self.enemies)
+
+    def has(self, status: Status) -> "np.ndarray":
+        """(K, A) bool：その状態異常が付いているか"""
+        return (self.status & STATUS_BITS[status]) != 0
+
+    def alive(self) -> "np.ndarray":
+        """(K, A) bool：life_check.is_out_of_battle の否定"""
+        return (self.hp > 0) & ((self.status & _OUT_OF_BATTLE_BITS) == 0)
+
+    def active(self) -> "np.ndarray":
+        """(K,) bool：まだ決着していない戦闘"""
+        return self.end_reason == END_CONTINUE
+
+    def update_end_reason(self) -> None:
+        """全滅判定（run_battle_headless と同じく、パーティ全滅を先に見る）"""
+        alive = self.alive()
+        open_ = self.active()
+        party_down = ~alive[:, : self.n_party].any(axis=1)
+        enemy_down = ~alive[:, self.n_party :].any(axis=1)
+        self.end_reason[open_ & party_down] = END_CHAR_DEFEATED
+        self.end_reason[open_ & ~party_down & enemy_down] = END_ENEMY_DEFEATED
+
+    def end_reasons(self) -> List[str]:
+        return [END_REASON_NAMES[int(r)] for r in self.end_reason]
+
+
+# ============================================================
+# コマンドの事前解決
+# ============================================================
+
+
+def prepare_batch_actions(
+    bs: BatchBattleState,
+    actions: Sequence[Optional[BatchAction]],
+    spells_by_name: Dict[str, Dict[str, Any]],
+) -> List[Optional[PreparedBatchAction]]:
+    """
+    パーティスロットごとの BatchAction を解決する。
+    呪文 JSON の参照・SpellInfo 化・敵ごとの属性相性はここで1回だけ行う。
+    """
+    if len(actions) != bs.n_party:
+        raise ValueError(
+            f"actions の数がパーティ人数と一致しません: {len(actions)} != {bs.n_party}"
+        )
+
+    prepared: List[Optional[PreparedBatchAction]] = []
+    for pm, act in zip(bs.party, actions):
+        if act is None:
+            prepared.append(None)
+            continue
+
+        if act.kind == "defend":
+            prepared.append(PreparedBatchAction(kind="defend"))
+            continue
+
+        if act.kind == "fight":
+            prepared.append(
+                PreparedBatchAction(
+                    kind="fight",
+                    relations=[
+                        element_relation_and_hits_for_monster(
+                            em.json, pm.stats.main_weapon_elements
+                        )[0]
+                        for em in bs.enemies
+                    ],
+                )
+            )
+            continue
+
+        if act.kind != "magic":
+            raise ValueError(f"未対応のコマンドです: {act.kind}")
+
+        compiled = lookup_spell(spells_by_name, act.spell_name)
+        if compiled is None:
+            raise KeyError(f"呪文が見つかりません: {act.spell_name}")
+        spell = compiled.info
+        if spell.magic_type not in ("black", "white"):
+            raise ValueError(f"黒魔法/白魔法のみ対応しています: {act.spell_name}")
+
+        heal_kind = compiled.healing_kind
+        is_heal = heal_kind == "hp"
+        if not is_heal and not (
+            spell.magic_type == "black" or _is_offensive_white(spell)
+        ):
+            raise ValueError(
+                f"攻撃魔法またはHP回復魔法のみ対応しています: {act.spell_name}"
+            )
+
+        prepared.append(
+            PreparedBatchAction(
+                kind="magic",
+                spell_name=act.spell_name,
+                spell=spell,
+                mp_level=max(1, min(compiled.level, 8)),
+                is_heal=is_heal,
+                reflectable=compiled.reflectable,
+                relations=[
+                    resolve_element_relation(
+                        compiled.element_mask, monster_element_masks(em.json)
+                    )[0]
+                    for em in bs.enemies
+                ],
+            )
+        )
+    return prepared
+
+
+# ============================================================
+# 1 ラウンドの一括処理
+# ============================================================
+
+
+def _apply_damage(bs: BatchBattleState, rows, actor: int, dmg) -> None:
+    """hp -= dmg（吸収で負のダメージなら最大HPまで回復）"""
+    bs.hp[rows, actor] = np.clip(bs.hp[rows, actor] - dmg, 0, bs.max_hp[actor])
+
+
+def _first_alive_enemy(bs: BatchBattleState, rows) -> "np.ndarray":
+    """先頭の生存敵スロット（いなければ -1）"""
+    alive_e = bs.alive()[rows, bs.n_party :]
+    return np.where(alive_e.any(axis=1), np.argmax(alive_e, axis=1), -1)
+
+
+def _start_of_round(bs: BatchBattleState, open_: "np.ndarray") -> None:
+    """ターン開始時効果：毒ダメージ（最大HP // 16、最低1）"""
+    poisoned = open_[:, None] & bs.has(Status.POISON) & bs.alive()
+    if poisoned.any():
+        poison_dmg = np.maximum(1, bs.max_hp // 16)
+        bs.hp = np.where(poisoned, np.maximum(bs.hp - poison_dmg, 0), bs.hp)
+
+
+def _char_fight(bs, act, p: int, rows, gen, use_expectation: bool) -> None:
+    targets = _first_alive_enemy(bs, rows)
+    blind = bs.has(Status.BLIND)[rows, p]
+    small = (bs.status[rows, p] & _MINI_OR_TOAD_BITS) != 0
+    for e in range(bs.n_enemies):
+        sel = targets == e
+        if not sel.any():
+            continue
+        res = physical_damage_char_to_enemy_batch(
+            bs.party[p].stats,
+            bs.enemies[e].stats,
+            gen,
+            n=int(sel.sum()),
+            element_relation=act.relations[e],
+            use_expectation=use_expectation,
+            blind=blind[sel],
+            attacker_is_mini_or_toad=small[sel],
+        )
+        _apply_damage(bs, rows[sel], bs.n_party + e, res.damage)
+
+
+def _char_attack_magic(bs, act, p: int, rows, gen, use_expectation: bool) -> None:
+    targets = _first_alive_enemy(bs, rows)
+    blind = bs.has(Status.BLIND)[rows, p]
+    for e in range(bs.n_enemies):
+        sel = targets == e
+        if not sel.any():
+            continue
+        sub = rows[sel]
+        actor_e = bs.n_party + e
+
+        # Reflect：単体魔法は1回ぶん跳ね返して術者に当てる
+        bounced = np.zeros(len(sub), dtype=bool)
+        if act.reflectable:
+            bounced = bs.reflect[sub, actor_e] > 0
+            if bounced.any():
+                back = sub[bounced]
+                bs.reflect[back, actor_e] -= 1
+                res_back = magic_damage_char_to_enemy_batch(
+                    bs.party[p].stats,
+                    act.spell,
+                    ff3_confused_self_dummy_enemy(bs.party[p].stats),
+                    gen,
+                    n=len(back),
+                    use_expectation=use_expectation,
+                    blind=blind[sel][bounced],
+                )
+                _apply_damage(bs, back, p, res_back.damage)
+
+        hit = sub[~bounced]
+        if len(hit) == 0:
+            continue
+        res = magic_damage_char_to_enemy_batch(
+            bs.party[p].stats,
+            act.spell,
+            bs.enemies[e].stats,
+            gen,
+            n=len(hit),
+            element_relation=act.relations[e],
+            use_expectation=use_expectation,
+            blind=blind[sel][~bounced],
+        )
+        _apply_damage(bs, hit, actor_e, res.damage)
+
+
+def _char_heal_magic(bs, act, p: int, rows, gen, use_expectation: bool) -> None:
+    """magic_damage.magic_heal_amount_to_char の配列版（対象は HP 割合が最低の生存味方）"""
+    caster = bs.party[p].stats
+    power = _calc_magic_power(caster, act.spell)
+    mult = _calc_magic_multiplier(caster, act.spell)
+    blind = bs.has(Status.BLIND)[rows, p]
+    acc = np.where(
+        blind,
+        _calc_magic_accuracy(caster, act.spell, blind=True),
+        _calc_magic_accuracy(caster, act.spell),
+    )
+    expected_hits = mult * np.clip(acc, 0, 100) / 100.0
+
+    factor = 1.25 if use_expectation else gen.uniform(1.0, 1.5, len(rows))
+    base = np.maximum((power * factor).astype(np.int64), 1)
+    heal = np.where(expected_hits > 0, (base * expected_hits).astype(np.int64), 0)
+
+    P = bs.n_party
+    alive_p = bs.alive()[rows, :P]
+    ratio = np.where(alive_p, bs.hp[rows, :P] / np.maximum(bs.max_hp[:P], 1), np.inf)
+    target = np.argmin(ratio, axis=1)
+    ok = alive_p.any(axis=1)
+    rows, target, heal = rows[ok], target[ok], heal[ok]
+    bs.hp[rows, target] = np.minimum(bs.hp[rows, target] + heal, bs.max_hp[target])
+
+
+def _char_turn(bs, act, p: int, rows, gen, use_expectation: bool) -> None:
+    if act.kind == "defend":
+        bs.defending[rows, p] = True
+        return
+    if act.kind == "fight":
+        _char_fight(bs, act, p, rows, gen, use_expectation)
+        return
+
+    # magic：沈黙なら不発、MP が無ければ不発（MP は沈黙時は減らない）
+    rows = rows[~bs.has(Status.SILENCE)[rows, p]]
+    lv = act.mp_level - 1
+    has_mp = bs.mp[rows, p, lv] >= 1
+    rows = rows[has_mp]
+    if len(rows) == 0:
+        return
+    bs.mp[rows, p, lv] -= 1
+    if act.is_heal:
+        _char_heal_magic(bs, act, p, rows, gen, use_expectation)
+    else:
+        _char_attack_magic(bs, act, p, rows, gen, use_expectation)
+
+
+def _enemy_turn(bs, e: int, rows, gen, use_expectation: bool) -> None:
+    P = bs.n_party
+    actor_e = P + e
+    targetable = bs.alive()[rows, :P] & ~bs.jumping[rows]
+    counts = targetable.sum(axis=1)
+    ok = counts > 0
+    rows, targetable, counts = rows[ok], targetable[ok], counts[ok]
+    if len(rows) == 0:
+        return
+
+    # 生存メンバーから一様に1人（random_alive_char_index と同じ分布）
+    pick = (gen.random(len(rows)) * counts).astype(np.int64)
+    target = np.argmax(np.cumsum(targetable, axis=1) > pick[:, None], axis=1)
+
+    atk_blind = bs.has(Status.BLIND)[rows, actor_e]
+    atk_small = (bs.status[rows, actor_e] & _MINI_OR_TOAD_BITS) != 0
+    for p in range(P):
+        sel = target == p
+        if not sel.any():
+            continue
+        sub = rows[sel]
+        res = physical_damage_enemy_to_char_batch(
+            bs.enemies[e].stats,
+            bs.party[p].stats,
+            gen,
+            n=len(sub),
+            use_expectation=use_expectation,
+            attacker_is_blind=atk_blind[sel],
+            attacker_is_mini_or_toad=atk_small[sel],
+            target_is_mini_or_toad=(bs.status[sub, p] & _MINI_OR_TOAD_BITS) != 0,
+        )
+        dmg = res.damage
+        # 防御中は半減（正のダメージのみ）し、被弾で防御フラグが外れる
+        dmg = np.where(bs.defending[sub, p] & (dmg > 0), dmg // 2, dmg)
+        bs.defending[sub, p] = False
+        _apply_damage(bs, sub, p, dmg)
+
+
+def resolve_round_batch(
+    bs: BatchBattleState,
+    actions: Sequence[Optional[PreparedBatchAction]],
+    gen: "np.random.Generator",
+    *,
+    use_expectation: bool = False,
+) -> None:
+    """
+    決着していない全戦を 1 ラウンド進める（simulate_one_round_multi_party の配列版）。
+    行動順は戦闘ごとに違うので「r 番目に動くアクター」単位でまとめて処理する。
+    """
+    _require_numpy()
+    open_ = bs.active()
+    if not open_.any():
+        return
+    bs.rounds[open_] += 1
+
+    _start_of_round(bs, open_)
+    bs.update_end_reason()
+
+    P = bs.n_party
+    n_actors = bs.hp.shape[1]
+
+    # イニシアチブ = 素早さ×10 + 0〜9（戦闘不能は最後尾）
+    init = bs.agility[None, :] * 10 + gen.integers(0, 10, size=bs.hp.shape)
+    init = np.where(bs.alive(), init, -1)
+    order = np.argsort(-init, axis=1, kind="stable")
+
+    for r in range(n_actors):
+        open_ = bs.active()
+        if not open_.any():
+            break
+        alive = bs.alive()
+        can_act = alive & ((bs.status & _CANNOT_ACT_BITS) == 0)
+        slot = order[:, r]
+        for a in range(n_actors):
+            rows = np.flatnonzero(open_ & (slot == a) & can_act[:, a])
+            if len(rows) == 0:
+                continue
+            if a < P:
+                if actions[a] is not None:
+                    _char_turn(bs, actions[a], a, rows, gen, use_expectation)
+            else:
+                _enemy_turn(bs, a - P, rows, gen, use_expectation)
+        # r 番目の行動は各戦闘で1つだけなので、ここで全滅判定すれば逐次版と同じ
+        bs.update_end_reason()
+
+    # このラウンドだけ有効な防御を解除
+    bs.defending[:] = False
+
+
+def run_batch_battles(
+    bs: BatchBattleState,
+    actions: Sequence[Optional[BatchAction]],
+    gen: "np.random.Generator",
+    *,
+    spells_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    max_rounds: int = 50,
+    use_expectation: bool = False,
+) -> BatchBattleState:
+    """全戦が決着するか max_rounds に達するまで回す（上限到達は END_TIMEOUT）"""
+    prepared = prepare_batch_actions(bs, actions, spells_by_name or {})
+    bs.update_end_reason()
+    for _ in range(max_rounds):
+        if not bs.active().any():
+            break
+        resolve_round_batch(bs, prepared, gen, use_expectation=use_expectation)
+    bs.end_reason[bs.active()] = END_TIMEOUT
+    return bs
+
+
+def simulate_many_battles_batch(
+    party_template: List[PartyMemberRuntime],
+    enemy_names: List[str],
+    n_trials: int,
+    actions: Optional[Sequence[Optional[BatchAction]]] = None,
+    seed: Optional[int] = None,
+    *,
+    state=None,
+    spells_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    max_rounds: int = 50,
+    difficulty: int = 0,
+    confidence: float = 0.95,
+) -> Dict[str, Any]:
+    """
+    simulate_many_battles_multi_party の配列版（コマンドは全ラウンド固定）。
+    actions 省略時は全員 Fight。戻り値の dict は同じキーを持つ（escapes は常に 0）。
+    K 戦を一度に回すので逐次打ち切り（precision）は無い（stopped_early は常に False）。
+    """
+    _require_numpy()
+    if state is None:
+        from combat.runtime_state import get_state
+
+        state = get_state()
+    if actions is None:
+        actions = [BatchAction("fight") for _ in party_template]
+    if spells_by_name is None:
+        spells_by_name = state.spells
+
+    n_trials = max(0, int(n_trials))
+
+    enemy_template = build_enemies(
+        enemy_defs_by_name=state.monsters,
+        spells_by_name=state.spells,
+        enemy_names=enemy_names,
+        difficulty=difficulty,
+    )
+    exp_reward = compute_exp_reward(enemy_template)
+    gil_reward = compute_gil_reward(enemy_template)
+    cp_reward = compute_cp_reward(enemy_template)
+
+    end_reasons: Counter = Counter()
+    rounds_hist: Counter = Counter()
+    hp_hist: Counter = Counter()
+    member_hp_ratio = {pm.name: 0.0 for pm in party_template}
+    total_hp_ratio = 0.0
+    total_rounds = 0
+    total_rounds_sq = 0
+
+    if n_trials > 0:
+        bs = BatchBattleState.from_runtime(party_template, enemy_template, n_trials)
+        run_batch_battles(
+            bs,
+            actions,
+            np.random.default_rng(seed),
+            spells_by_name=spells_by_name,
+            max_rounds=max_rounds,
+        )
+        end_reasons.update(bs.end_reasons())
+        rounds_hist.update(int(r) for r in bs.rounds)
+        total_rounds = int(bs.rounds.sum())
+        total_rounds_sq = int((bs.rounds.astype(np.int64) ** 2).sum())
+
+        P = bs.n_party
+        won = bs.end_reason == END_ENEMY_DEFEATED
+        party_hp = np.maximum(bs.hp[won, :P], 0)
+        max_hp = np.maximum(bs.max_hp[:P], 1)
+        ratio = party_hp.sum(axis=1) / max_hp.sum()
+        total_hp_ratio = float(ratio.sum())
+        hp_hist.update(int(b) for b in np.minimum(10, (ratio * 10).astype(int)))
+        for i, pm in enumerate(party_template):
+            member_hp_ratio[pm.name] = float((party_hp[:, i] / max_hp[i]).sum())
+
+    wins_char = end_reasons.get("enemy_defeated", 0)
+    wins_enemy = end_reasons.get("char_defeated", 0)
+    draws = n_trials - wins_char - wins_enemy
+
+    def _rate(x: float) -> float:
+        return x / n_trials if n_trials > 0 else 0.0
+
+    return {
+        "trials": n_trials,
+        "wins_char": wins_char,
+        "wins_enemy": wins_enemy,
+        "escapes": 0,
+        "draws": draws,
+        "win_rate_char": _rate(wins_char),
+        "win_rate_enemy": _rate(wins_enemy),
+        "draw_rate": _rate(draws),
+        "average_turns": _rate(total_rounds),
+        "rounds_histogram": dict(sorted(rounds_hist.items())),
+        "hp_remaining_histogram": dict(sorted(hp_hist.items())),
+        "average_hp_remaining": total_hp_ratio / wins_char if wins_char else 0.0,
+        "member_hp_remaining": {
+            name: (v / wins_char if wins_char else 0.0)
+            for name, v in member_hp_ratio.items()
+        },
+        "average_exp": _rate(wins_char * exp_reward),
+        "average_gil": _rate(wins_char * gil_reward),
+        "average_cp": _rate(wins_char * cp_reward),
+        "end_reasons": dict(end_reasons),
+        "win_rate_char_ci": wilson_interval(wins_char, n_trials, confidence),
+        "average_turns_ci": mean_interval(
+            total_rounds, total_rounds_sq, n_trials, confidence
+        ),
+        "confidence": confidence,
+        "stopped_early": False,
+    }
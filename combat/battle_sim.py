@@ -8,12 +8,23 @@
 # simulate_battle_once	1対1（キャラ1人vs敵1体）の戦闘を、指定された物理攻撃又は魔法で決着に達するまで繰り返す
 # simulate_many_battles	同一条件でsimulate_battle_onceをn_trials回繰り返して、勝率・ターン数等表示
 # simulate_battle_multi_party	複数キャラvs複数敵の戦闘を、バトル終了（全滅・逃走・敵殲滅など）まで自動で進める高レベル関数
+# policy_always_fight	ヘッドレス用の既定ポリシー（生存メンバー全員が先頭の生存敵を「たたかう」）
+# clone_party_for_trial	PartyMemberRuntime を試行用に複製（job/raw は共有、base/stats/state は複製）
+# clone_enemies_for_trial	EnemyRuntime を試行用に複製（json は共有、stats/state は複製）
+# run_battle_headless	simulate_one_round_multi_party を終了まで回す（input/print なし）
+# simulate_many_battles_multi_party	複数キャラvs複数敵の戦闘を n_trials 回繰り返し、勝率・ラウンド数分布・残りHP分布・報酬を集計（precision 指定で逐次打ち切り）
+#   （1人 vs 1体・毎ターンたたかう なら analytics.solve_duel_from_stats で厳密に解く。条件外はモンテカルロ）
+# preview_battle_expected	期待値モード（mode="expected"）で1戦だけ決定的に解決し、結果の見込みを返す（ロケーション選択のプレビュー用）
 # ============================================================
 
+import contextlib
+import copy
+import dataclasses
+from collections import Counter
 from random import Random
-from typing import Optional, Literal, Dict, Any, Tuple, List
+from typing import Optional, Literal, Dict, Any, Tuple, List, Callable, Sequence
 
-from combat.enums import Status, BattleKind
+from combat.enums import Status, BattleKind, BattleMode
 from combat.models import (
     PartyMemberRuntime,
     EnemyRuntime,
@@ -33,10 +44,21 @@ from combat.life_check import (
     all_chars_defeated,
 )
 from combat.initiative import calc_initiative
+from combat.elements import element_relation_and_hits_for_monster
 from combat.turn_logic import run_enemy_turn, run_character_turn
-from combat.spell_repo import spell_from_json
-from combat.magic_damage import healing_spell_kind
-from combat.progression import apply_job_sp_for_command
+from combat.spell_table import lookup_spell
+from combat.name_index import lookup_by_name
+from combat.progression import (
+    apply_job_sp_for_command,
+    compute_exp_reward,
+    compute_gil_reward,
+    compute_cp_reward,
+)
+from combat.enemy_build import build_enemies
+from combat.replay import BattleRecorder
+from combat.verbosity import QUIET, debug_enabled, logs_enabled, verbosity
+from combat.expected_mode import rng_for_mode
+from combat.confidence import half_width, mean_interval, wilson_interval
 
 
 def simulate_one_round_multi_party(
@@ -48,10 +70,11 @@ def simulate_one_round_multi_party(
     save: Optional[dict] = None,
     spells_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
     items_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    mode: BattleMode = "random",
 ) -> Tuple[List[str], SideTurnResult, list[dict]]:
+    # mode="expected": ダメージは期待値、確率判定は ExpectedRandom（rng は戦闘単位で使い回すこと）
 
-    if rng is None:
-        rng = Random()  # ← モジュールではなくインスタンス
+    rng = rng_for_mode(mode, rng)  # ← モジュールではなくインスタンス
 
     logs: List[str] = []
     final_result = SideTurnResult(end_reason="continue")
@@ -102,7 +125,8 @@ def simulate_one_round_multi_party(
         actors.append(("enemy", i, init))
 
     actors.sort(key=lambda x: x[2], reverse=True)
-    print(f"[Debug:battle_sim/simulate_one_round_multi_party] {actors}")
+    if debug_enabled():
+        print(f"[Debug:battle_sim/simulate_one_round_multi_party] {actors}")
 
     # =====================================
     # ③ 行動ループ
@@ -110,12 +134,14 @@ def simulate_one_round_multi_party(
     for side, idx, _ in actors:
         # 全滅チェック
         if not any_char_alive(party_members):
-            logs.append("パーティは全滅した…")
+            if logs_enabled():
+                logs.append("パーティは全滅した…")
             final_result.end_reason = "char_defeated"
             break
 
         if not any_enemy_alive(enemies):
-            logs.append("敵は全滅した！")
+            if logs_enabled():
+                logs.append("敵は全滅した！")
             final_result.end_reason = "enemy_defeated"
             break
 
@@ -152,7 +178,8 @@ def simulate_one_round_multi_party(
 
             if action.kind == "defend":
                 pm.state.temp_flags["defending"] = True
-                logs.append(f"{pm.name}は防御した！")
+                if logs_enabled():
+                    logs.append(f"{pm.name}は防御した！")
 
                 # ★ JobSP加算（defendはrun_character_turnを通らないためここで）
                 old_jl, new_jl = apply_job_sp_for_command(
@@ -162,14 +189,15 @@ def simulate_one_round_multi_party(
                     armors=state.armors,
                     save_dict=state.save,  # ★これが必須
                 )
-                if new_jl != old_jl:
+                if new_jl != old_jl and logs_enabled():
                     logs.append(
                         f"★ {pm.name} のジョブレベルが {old_jl} → {new_jl} に上がった！"
                     )
 
                 continue
 
-            logs.append(f"▶ {pm.name} の行動（{action.command}）")
+            if logs_enabled():
+                logs.append(f"▶ {pm.name} の行動（{action.command}）")
 
             # ----- ターゲット決定 -----
             target_enemy: Optional[EnemyRuntime] = None
@@ -266,23 +294,27 @@ def simulate_one_round_multi_party(
 
             elif action.kind == "magic":
                 if not spells_by_name or not action.spell_name:
-                    logs.append(
-                        "※ 魔法が選択されなかったため、通常攻撃として扱います。"
-                    )
+                    if logs_enabled():
+                        logs.append(
+                            "※ 魔法が選択されなかったため、通常攻撃として扱います。"
+                        )
                     char_attack_kind = "physical"
                     char_battle_command = "Fight"
                 else:
                     spell_name = action.spell_name
-                    spell_json = spells_by_name.get(spell_name)
+                    # ★ 名前で前計算済みの CompiledSpell を引く（SpellInfo・回復種別を毎回作らない）
+                    compiled = lookup_spell(spells_by_name, spell_name)
+                    spell_json = compiled.json if compiled is not None else None
                     if not spell_json:
-                        logs.append(
-                            f"※ 魔法《{spell_name}》のデータが見つからないため、通常攻撃にフォールバックします。"
-                        )
+                        if logs_enabled():
+                            logs.append(
+                                f"※ 魔法《{spell_name}》のデータが見つからないため、通常攻撃にフォールバックします。"
+                            )
                         char_attack_kind = "physical"
                         char_battle_command = "Fight"
                     else:
-                        spell = spell_from_json(spell_json)
-                        healing_type = healing_spell_kind(spell_json)
+                        spell = compiled.info
+                        healing_type = compiled.healing_kind
 
                         char_attack_kind = "magic"
                         char_spell = spell
@@ -292,18 +324,20 @@ def simulate_one_round_multi_party(
 
             elif action.kind == "item":
                 if not items_by_name or not action.item_name:
-                    logs.append(
-                        "※ アイテムが選択されなかったため、通常攻撃として扱います。"
-                    )
+                    if logs_enabled():
+                        logs.append(
+                            "※ アイテムが選択されなかったため、通常攻撃として扱います。"
+                        )
                     char_attack_kind = "physical"
                     char_battle_command = "Fight"
                 else:
                     item_name = action.item_name
-                    item_json = items_by_name.get(item_name)
+                    item_json = lookup_by_name(items_by_name, item_name)
                     if not item_json:
-                        logs.append(
-                            f"※ アイテム《{item_name}》のデータが見つからないため、通常攻撃にフォールバックします。"
-                        )
+                        if logs_enabled():
+                            logs.append(
+                                f"※ アイテム《{item_name}》のデータが見つからないため、通常攻撃にフォールバックします。"
+                            )
                         char_attack_kind = "physical"
                         char_battle_command = "Fight"
                     else:
@@ -342,6 +376,7 @@ def simulate_one_round_multi_party(
                 target_index=getattr(action, "target_index", 0),
                 party_members=party_members,
                 aoe_selected_override=getattr(action, "target_all", None),
+                mode=mode,
             )
 
             # ★ JobSP加算（行動が実行された扱い）
@@ -352,7 +387,7 @@ def simulate_one_round_multi_party(
                 armors=state.armors,
                 save_dict=state.save,  # ★これが必須
             )
-            if new_jl != old_jl:
+            if new_jl != old_jl and logs_enabled():
                 logs.append(
                     f"★ {pm.name} のジョブレベルが {old_jl} → {new_jl} に上がった！"
                 )
@@ -409,7 +444,8 @@ def simulate_one_round_multi_party(
             if is_out_of_battle(em.state):
                 continue
 
-            logs.append(f"◆ {em.name} の行動")
+            if logs_enabled():
+                logs.append(f"◆ {em.name} の行動")
 
             target_idx = random_alive_char_index(party_members, rng)
             if target_idx is None:
@@ -439,6 +475,7 @@ def simulate_one_round_multi_party(
                 state=state,
                 rng=rng,
                 party_members=party_members,
+                mode=mode,
             )
 
             if all_enemies_defeated(enemies):
@@ -458,6 +495,541 @@ def simulate_one_round_multi_party(
     return logs, final_result, events
 
 
+
+# ============================================================
+# ヘッドレス・モンテカルロ（複数キャラ vs 複数敵）
+# ============================================================
+
+# ポリシー：(party_members, enemies, rng) -> planned_actions（メンバー順、行動しない枠は None）
+BattlePolicy = Callable[
+    [List[PartyMemberRuntime], List[EnemyRuntime], Random],
+    List[Optional[PlannedAction]],
+]
+
+
+def policy_always_fight(
+    party_members: List[PartyMemberRuntime],
+    enemies: List[EnemyRuntime],
+    rng: Random,
+) -> List[Optional[PlannedAction]]:
+    """
+    既定ポリシー：生存メンバー全員が「先頭の生存敵」を通常攻撃する。
+    （rng は使わないが、ポリシーの共通シグネチャとして受け取る）
+    """
+    t_idx = first_alive_enemy_index(enemies)
+    actions: List[Optional[PlannedAction]] = []
+    for pm in party_members:
+        if is_out_of_battle(pm.state) or t_idx is None:
+            actions.append(None)
+            continue
+        actions.append(
+            PlannedAction(
+                kind="physical",
+                command="Fight",
+                target_side="enemy",
+                target_index=t_idx,
+            )
+        )
+    return actions
+
+
+def clone_party_for_trial(
+    party_template: Sequence[PartyMemberRuntime],
+) -> List[PartyMemberRuntime]:
+    """
+    試行ごとに書き換わる部分（base / stats / state / equipment）だけ複製する。
+    Job（raw JSON 含む）は読み取り専用なので共有する。
+    """
+    cloned: List[PartyMemberRuntime] = []
+    for pm in party_template:
+        cloned.append(
+            dataclasses.replace(
+                pm,
+                base=copy.copy(pm.base),  # job_level / job_skill_point が増える
+                stats=copy.deepcopy(pm.stats),  # Haste/Protect 等で書き換わる
+                state=copy.deepcopy(pm.state),
+                equipment=copy.copy(pm.equipment),
+                equipment_logs=[],
+            )
+        )
+    return cloned
+
+
+def clone_enemies_for_trial(
+    enemy_template: Sequence[EnemyRuntime],
+) -> List[EnemyRuntime]:
+    """
+    敵は stats / state のみ複製し、json（enrich 済みモンスター定義）は共有する。
+    """
+    return [
+        dataclasses.replace(
+            em,
+            stats=copy.deepcopy(em.stats),
+            state=copy.deepcopy(em.state),
+        )
+        for em in enemy_template
+    ]
+
+
+def run_battle_headless(
+    party_members: List[PartyMemberRuntime],
+    enemies: List[EnemyRuntime],
+    state: RuntimeState,
+    *,
+    policy: BattlePolicy,
+    rng: Random,
+    max_rounds: int = 50,
+    spells_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    items_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    recorder: Optional["BattleRecorder"] = None,
+    policy_rng: Optional[Random] = None,
+    mode: BattleMode = "random",
+) -> Tuple[str, int]:
+    """
+    simulate_one_round_multi_party を決着（または max_rounds）まで回す。
+    party_members / enemies / state.save は破壊的に更新されるので、
+    呼び出し側で試行用の複製を渡すこと。
+    recorder を渡すと各ラウンドの PlannedAction を記録する（rng は recorder.rng を渡すこと）
+    policy_rng: ポリシー用の乱数。戦闘用 rng と分けておくと、リプレイ時に
+      （ポリシーを呼ばなくても）戦闘の乱数列がずれない
+    mode="expected": 期待値で決定的に解決する（rng が ExpectedRandom でなければ新しく作る）
+    戻り値: (end_reason, 実行ラウンド数)
+      end_reason は SideTurnResult.end_reason に加え、上限到達時は "timeout"
+    """
+    rng = rng_for_mode(mode, rng)
+    if policy_rng is None:
+        policy_rng = rng if recorder is None else Random(recorder.replay.seed + 1)
+
+    # ★追加：先読みするポリシー（mcts_planner など）には試行用の state を渡す
+    bind_state = getattr(policy, "bind_state", None)
+    if callable(bind_state):
+        bind_state(state)
+
+    rounds = 0
+    while rounds < max_rounds:
+        if not any_char_alive(party_members):
+            return "char_defeated", rounds
+        if not any_enemy_alive(enemies):
+            return "enemy_defeated", rounds
+
+        rounds += 1
+        planned_actions = policy(party_members, enemies, policy_rng)
+        if recorder is not None:
+            recorded_actions = recorder.snapshot_actions(planned_actions)
+        logs, round_result, events = simulate_one_round_multi_party(
+            party_members,
+            enemies,
+            planned_actions,
+            state=state,
+            rng=rng,
+            save=state.save,
+            spells_by_name=spells_by_name,
+            items_by_name=items_by_name,
+            mode=mode,
+        )
+        if recorder is not None:
+            recorder.record_round(
+                recorded_actions, logs, events, round_result.end_reason
+            )
+        if round_result.end_reason != "continue":
+            return round_result.end_reason, rounds
+
+    # ラウンド上限に達したが、最終ラウンドで決着している可能性もある
+    if not any_char_alive(party_members):
+        return "char_defeated", rounds
+    if not any_enemy_alive(enemies):
+        return "enemy_defeated", rounds
+    return "timeout", rounds
+
+
+def _is_plain_duel(
+    party_template: Sequence[PartyMemberRuntime],
+    enemy_template: Sequence[EnemyRuntime],
+    policy: BattlePolicy,
+) -> bool:
+    """
+    analytics.solve_duel_from_stats のモデル（毎ラウンド キャラの右手物理 vs 敵の通常物理）で
+    run_battle_headless と同じ結果になる 1対1 か。
+    状態異常・ジャンプ/Boost/Cheer・敵のスペシャル/Status Attack/逃走（格下の非ボス）があれば False
+    """
+    if policy is not policy_always_fight:
+        return False
+    if len(party_template) != 1 or len(enemy_template) != 1:
+        return False
+    pm, em = party_template[0], enemy_template[0]
+    for st in (pm.state, em.state):
+        if (
+            st.hp <= 0
+            or st.statuses
+            or st.is_jumping
+            or st.boost_count
+            or st.cheer_bonus
+            or st.temp_flags
+        ):
+            return False
+    monster = em.json or {}
+    if monster.get("Special Attacks") and (monster.get("SpecialAttackRate") or 0) > 0:
+        return False
+    if monster.get("Status Attack"):
+        return False
+    is_boss = bool(monster.get("Boss") or monster.get("IsBoss"))
+    if not is_boss and pm.stats.level - em.stats.level > 15:
+        return False
+    return True
+
+
+def _solve_plain_duel(
+    pm: PartyMemberRuntime,
+    em: EnemyRuntime,
+    n_trials: int,
+    max_rounds: int,
+    rewards: Tuple[int, int, int],
+    confidence: float,
+) -> Optional[Dict[str, Any]]:
+    """
+    1対1 を analytics.solve_duel_from_stats で解き、simulate_many_battles_multi_party と同じ形の dict にする。
+    回数は「n_trials 回回したときの期待値」（float）、区間は幅 0。NumPy が無ければ None
+    """
+    from combat import analytics
+
+    if analytics.np is None:
+        return None
+
+    relation, _ = element_relation_and_hits_for_monster(
+        em.json, pm.stats.main_weapon_elements
+    )
+    sol = analytics.solve_duel_from_stats(
+        pm.stats,
+        em.stats,
+        policy="fight",
+        element_relation=relation,
+        char_hp=pm.state.hp,
+        enemy_hp=em.state.hp,
+        max_rounds=max_rounds,
+    )
+
+    n = n_trials
+    rounds = range(len(sol.rounds_pmf))
+    average_turns = float(sum(r * p for r, p in zip(rounds, sol.rounds_pmf)))
+
+    hp_hist: Counter = Counter()
+    hp_ratio_sum = 0.0
+    for damage, p in enumerate(sol.win_damage_pmf):
+        if p <= 0.0:
+            continue
+        ratio = (pm.state.hp - damage) / max(1, pm.max_hp)
+        hp_ratio_sum += ratio * p
+        hp_hist[min(10, int(ratio * 10))] += p * n
+    win = sol.win_rate_char
+    average_hp = hp_ratio_sum / win if win > 0 else 0.0
+
+    exp_reward, gil_reward, cp_reward = rewards
+    end_reasons = {
+        reason: p * n
+        for reason, p in (
+            ("enemy_defeated", sol.win_rate_char),
+            ("char_defeated", sol.win_rate_enemy),
+            ("timeout", sol.draw_rate),
+        )
+        if p > 0.0
+    }
+
+    return {
+        "trials": n,
+        "wins_char": win * n,
+        "wins_enemy": sol.win_rate_enemy * n,
+        "escapes": 0,
+        "draws": sol.draw_rate * n,
+        "win_rate_char": win,
+        "win_rate_enemy": sol.win_rate_enemy,
+        "draw_rate": sol.draw_rate,
+        "average_turns": average_turns,
+        "rounds_histogram": {
+            r: float(p) * n for r, p in zip(rounds, sol.rounds_pmf) if p > 0.0
+        },
+        "hp_remaining_histogram": dict(sorted(hp_hist.items())),
+        "average_hp_remaining": average_hp,
+        "member_hp_remaining": {pm.name: average_hp},
+        "average_exp": win * exp_reward,
+        "average_gil": win * gil_reward,
+        "average_cp": win * cp_reward,
+        "end_reasons": end_reasons,
+        "win_rate_char_ci": (win, win),
+        "average_turns_ci": (average_turns, average_turns),
+        "confidence": confidence,
+        "stopped_early": False,
+        "exact": True,
+    }
+
+
+def simulate_many_battles_multi_party(
+    party_template: Sequence[PartyMemberRuntime],
+    enemy_names: Sequence[str],
+    n_trials: int = 1000,
+    policy: Optional[BattlePolicy] = None,
+    seed: Optional[int] = None,
+    *,
+    state: Optional[RuntimeState] = None,
+    spells_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    max_rounds: int = 50,
+    difficulty: int = 0,
+    quiet: bool = True,
+    precision: Optional[float] = None,
+    confidence: float = 0.95,
+    batch_size: int = 100,
+    exact: bool = True,
+) -> Dict[str, Any]:
+    """
+    複数キャラ vs 複数敵の戦闘を n_trials 回繰り返して集計する（input/print なし）。
+
+    ・party_template / 敵テンプレートは試行ごとに複製するので、呼び出し側の
+      PartyMemberRuntime や state.save は一切変更されない
+    ・seed を指定すると全試行が再現可能（試行 i は Random(seed) から派生したシードで回す）
+    ・spells_by_name 省略時は expand_spells_for_summons(state.spells) を使う
+    ・precision（例 0.01 = ±1%）を指定すると逐次打ち切り：batch_size 試行ごとに
+      勝率の Wilson 区間（信頼水準 confidence）を計算し、半幅が precision 以下になったら止める。
+      このとき n_trials は上限。試行 i の乱数は打ち切りの有無によらず同じなので、
+      打ち切った結果は「同じ seed・n_trials=trials」で回した結果と一致する
+    ・exact=True（既定）で 1人 vs 1体・policy_always_fight・状態異常なし・敵のスペシャル/逃走なし
+      のときは analytics.solve_duel_from_stats で厳密に解く（NumPy が要る。無ければモンテカルロ）。
+      回数系は n_trials 回あたりの期待値（float）、区間は幅 0、seed / precision は使わない。
+      常にモンテカルロで回したいときは exact=False
+
+    戻り値 dict:
+      trials, wins_char, wins_enemy, escapes, draws,
+      win_rate_char, win_rate_enemy, draw_rate, average_turns,
+      rounds_histogram      {ラウンド数: 回数}
+      hp_remaining_histogram {0〜10（残りHP割合×10 の切り捨て）: 回数}（勝利時のみ）
+      average_hp_remaining  勝利時の残りHP割合の平均（パーティ合計）
+      member_hp_remaining   {メンバー名: 勝利時の残りHP割合の平均}
+      average_exp / average_gil / average_cp  1戦あたり（勝利時のみ獲得）
+      end_reasons           {end_reason: 回数}
+      win_rate_char_ci      勝率の Wilson 区間 (lo, hi)
+      average_turns_ci      平均ラウンド数の正規近似区間 (lo, hi)
+      confidence            上の区間の信頼水準
+      stopped_early         precision に達して n_trials より前に止めたか
+      exact                 厳密解（solve_duel_from_stats）で求めたか
+    """
+    if state is None:
+        from combat.runtime_state import get_state
+
+        state = get_state()
+    if policy is None:
+        policy = policy_always_fight
+    if spells_by_name is None:
+        from combat.magic_menu import expand_spells_for_summons
+
+        spells_by_name = expand_spells_for_summons(state.spells)
+
+    n_trials = max(0, int(n_trials))
+    if precision is not None and precision <= 0:
+        raise ValueError(f"precision は正の値で指定してください: {precision}")
+    batch_size = max(1, int(batch_size))
+
+    # 敵テンプレート（enrich / 最終ステ計算は1回だけ）
+    enemy_template = build_enemies(
+        enemy_defs_by_name=state.monsters,
+        spells_by_name=state.spells,
+        enemy_names=enemy_names,
+        difficulty=difficulty,
+    )
+
+    # 勝利報酬は敵構成で決まるので先に計算しておく
+    exp_reward = compute_exp_reward(enemy_template)
+    gil_reward = compute_gil_reward(enemy_template)
+    cp_reward = compute_cp_reward(enemy_template)
+
+    # ★1対1・たたかうのみは HP マルコフ連鎖を解く（サンプリングしない）
+    if exact and n_trials > 0 and _is_plain_duel(party_template, enemy_template, policy):
+        solved = _solve_plain_duel(
+            party_template[0],
+            enemy_template[0],
+            n_trials,
+            max_rounds,
+            (exp_reward, gil_reward, cp_reward),
+            confidence,
+        )
+        if solved is not None:
+            return solved
+
+    master_rng = Random(seed)
+
+    end_reasons: Counter = Counter()
+    rounds_hist: Counter = Counter()
+    hp_hist: Counter = Counter()
+    total_rounds = 0
+    total_rounds_sq = 0
+    total_hp_ratio = 0.0
+    member_hp_sum: Dict[str, float] = {pm.name: 0.0 for pm in party_template}
+    total_exp = total_gil = total_cp = 0
+
+    # quiet=True の間はログ文字列もデバッグ print も作らない（呼び出し元の設定に従うなら False）
+    out_ctx = verbosity(QUIET) if quiet else contextlib.nullcontext()
+
+    trials = 0
+    stopped_early = False
+
+    with out_ctx:
+        while trials < n_trials:
+            # ★逐次打ち切り：precision 指定時は batch_size ごとに区間を確認する
+            if (
+                precision is not None
+                and trials > 0
+                and trials % batch_size == 0
+                and half_width(
+                    wilson_interval(
+                        end_reasons.get("enemy_defeated", 0), trials, confidence
+                    )
+                )
+                <= precision
+            ):
+                stopped_early = True
+                break
+            trials += 1
+
+            rng = Random(master_rng.getrandbits(64))
+            policy_rng = Random(master_rng.getrandbits(64))
+
+            party = clone_party_for_trial(party_template)
+            enemies = clone_enemies_for_trial(enemy_template)
+            trial_state = dataclasses.replace(state, save=copy.deepcopy(state.save))
+
+            end_reason, rounds = run_battle_headless(
+                party,
+                enemies,
+                trial_state,
+                policy=policy,
+                rng=rng,
+                policy_rng=policy_rng,
+                max_rounds=max_rounds,
+                spells_by_name=spells_by_name,
+                items_by_name=trial_state.items_by_name,
+            )
+
+            end_reasons[end_reason] += 1
+            rounds_hist[rounds] += 1
+            total_rounds += rounds
+            total_rounds_sq += rounds * rounds
+
+            if end_reason == "enemy_defeated":
+                hp_now = sum(max(0, pm.state.hp) for pm in party)
+                hp_max = sum(max(1, pm.max_hp) for pm in party)
+                ratio = hp_now / hp_max if hp_max > 0 else 0.0
+                total_hp_ratio += ratio
+                hp_hist[min(10, int(ratio * 10))] += 1
+                for pm in party:
+                    member_hp_sum[pm.name] += max(0, pm.state.hp) / max(1, pm.max_hp)
+
+                total_exp += exp_reward
+                total_gil += gil_reward
+                total_cp += cp_reward
+
+    wins_char = end_reasons.get("enemy_defeated", 0)
+    wins_enemy = end_reasons.get("char_defeated", 0)
+    escapes = end_reasons.get("escaped", 0) + end_reasons.get("enemy_escaped", 0)
+    draws = trials - wins_char - wins_enemy
+
+    def _rate(x: float) -> float:
+        return x / trials if trials > 0 else 0.0
+
+    return {
+        "trials": trials,
+        "wins_char": wins_char,
+        "wins_enemy": wins_enemy,
+        "escapes": escapes,
+        "draws": draws,
+        "win_rate_char": _rate(wins_char),
+        "win_rate_enemy": _rate(wins_enemy),
+        "draw_rate": _rate(draws),
+        "average_turns": _rate(total_rounds),
+        "rounds_histogram": dict(sorted(rounds_hist.items())),
+        "hp_remaining_histogram": dict(sorted(hp_hist.items())),
+        "average_hp_remaining": total_hp_ratio / wins_char if wins_char else 0.0,
+        "member_hp_remaining": {
+            name: (v / wins_char if wins_char else 0.0)
+            for name, v in member_hp_sum.items()
+        },
+        "average_exp": _rate(total_exp),
+        "average_gil": _rate(total_gil),
+        "average_cp": _rate(total_cp),
+        "end_reasons": dict(end_reasons),
+        "win_rate_char_ci": wilson_interval(wins_char, trials, confidence),
+        "average_turns_ci": mean_interval(
+            total_rounds, total_rounds_sq, trials, confidence
+        ),
+        "confidence": confidence,
+        "stopped_early": stopped_early,
+        "exact": False,
+    }
+
+
+def preview_battle_expected(
+    party_template: Sequence[PartyMemberRuntime],
+    enemy_names: Sequence[str],
+    policy: Optional[BattlePolicy] = None,
+    *,
+    state: Optional[RuntimeState] = None,
+    spells_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    max_rounds: int = 50,
+    difficulty: int = 0,
+) -> Dict[str, Any]:
+    """
+    期待値モードで1戦だけ解決する（乱数なし・常に同じ結果）。
+    1,000 試行のモンテカルロの代わりに、キー入力ごとのプレビューで使う想定の近似。
+    party_template / state.save は変更しない。
+
+    戻り値 dict:
+      end_reason, rounds,
+      hp_remaining         戦闘後の残りHP割合（パーティ合計）
+      member_hp_remaining  {メンバー名: 残りHP割合}
+      enemy_hp_remaining   戦闘後の敵の残りHP割合（敵合計）
+    """
+    if state is None:
+        from combat.runtime_state import get_state
+
+        state = get_state()
+    if policy is None:
+        policy = policy_always_fight
+    if spells_by_name is None:
+        from combat.magic_menu import expand_spells_for_summons
+
+        spells_by_name = expand_spells_for_summons(state.spells)
+
+    party = clone_party_for_trial(party_template)
+    enemies = build_enemies(
+        enemy_defs_by_name=state.monsters,
+        spells_by_name=state.spells,
+        enemy_names=enemy_names,
+        difficulty=difficulty,
+    )
+    trial_state = dataclasses.replace(state, save=copy.deepcopy(state.save))
+
+    with verbosity(QUIET):
+        end_reason, rounds = run_battle_headless(
+            party,
+            enemies,
+            trial_state,
+            policy=policy,
+            rng=rng_for_mode("expected"),
+            max_rounds=max_rounds,
+            spells_by_name=spells_by_name,
+            items_by_name=trial_state.items_by_name,
+            mode="expected",
+        )
+
+    hp_max = sum(max(1, pm.max_hp) for pm in party)
+    enemy_max = sum(max(1, em.max_hp) for em in enemies)
+    return {
+        "end_reason": end_reason,
+        "rounds": rounds,
+        "hp_remaining": sum(max(0, pm.state.hp) for pm in party) / hp_max,
+        "member_hp_remaining": {
+            pm.name: max(0, pm.state.hp) / max(1, pm.max_hp) for pm in party
+        },
+        "enemy_hp_remaining": sum(max(0, em.state.hp) for em in enemies) / enemy_max,
+    }
+
+
 """
 # ============================================================
 # 1ターンシミュレーション（魔法で攻撃する場合のためのラッパ）
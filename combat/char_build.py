@@ -12,27 +12,39 @@
 # weapon_stats	武器名→(威力,命中%,長距離フラグ,属性リスト)に変換
 # armor_stats	防具名→(Defense,Evasion,MagicDefense,盾フラグ,属性耐性,属性無効)に変換
 # compute_character_final_stats	基礎ステータス+装備名+JSONデータから、戦闘用の最終ステータスを自動算出
+# item_stat_table	マスタデータごとに1回だけ、正規化名インデックスと装備ごとの寄与表（ItemStatTable）を作って使い回す
+# invalidate_stat_caches	寄与表と最終ステータスのメモを捨てる（マスタデータ変更時）
+# final_stats_from_parts	スロットごとの寄与（weapon_stats/armor_stats の戻り値）から最終ステータスを組み立てる
 # interpolate_stats	StatsByLevelからStr/Agi/Vit/Int/Mndを線形補完してtarget_levelのステータスを作る
 # interpolate_mp	StatsByLevelからMPを線形補完してtarget_levelのMPを作る
+# compile_job_growth	StatsByLevelをLv1〜99の成長表（JobGrowthTable：補完済みステ・最大MP・HP期待値の累積）に前計算する
+# job_growth	Jobの成長表を返す（ロード時に作られていなければここで作って Job.growth に載せる）
 # ============================================================
 
-from dataclasses import replace
-from typing import Optional, Dict, Tuple, Any, List, Callable
+import copy
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Optional, Dict, Tuple, Any, List, Callable, Iterable
 import math
 
 from combat.enums import Status
 from combat.models import (
     Job,
+    JobGrowthTable,
     BaseCharacter,
     EquipmentSet,
     BattleActorState,
+    MpPool,
     FinalCharacterStats,
     PartyMemberRuntime,
     PartyEntryBuildResult,
 )
 from combat.elements import parse_elements
+from combat.job_profile import job_profile
+from combat.name_index import canonical_name
 from system.exp_system import LevelTable
 from utils.name_normalize import normalize_name
+from combat.verbosity import debug_enabled, logs_enabled
 
 
 # １．セーブデータ → キャラ最終ステ（パーティ全員）
@@ -65,7 +77,10 @@ def build_party_members_from_save(
         char_name = entry.get("name", "キャラ")
         portrait_key = entry.get("portrait_key")
 
-        print("[DBG eq]", entry.get("name"), "eq:", eq, "poryrait_key:", portrait_key)
+        if debug_enabled():
+            print(
+                "[DBG eq]", entry.get("name"), "eq:", eq, "poryrait_key:", portrait_key
+            )
 
         party_members.append(
             PartyMemberRuntime(
@@ -179,50 +194,40 @@ def character_from_party_entry(
         arms=eq_data.get("arms"),
     )
 
-    # --- StatsByLevel（キャラLvテーブル）を dict 化 ---
-    job_stats_levels = {row["Level"]: row for row in job.raw.get("StatsByLevel", [])}
-
-    # ★ ステータス補完
-    interp_stats = interpolate_stats(job_stats_levels, base.level)
-
-    base.strength = interp_stats["Str"]
-    base.agility = interp_stats["Agi"]
-    base.vitality = interp_stats["Vit"]
-    base.intelligence = interp_stats["Int"]
-    base.mind = interp_stats["Mnd"]
-
-    # ★最大HPの期待値をジョブのVitテーブルから取得
-    expected_hp = expected_max_hp_from_vit_table(
-        job_stats_levels,
-        base.level,
-        initial_hp_lv1=32,
-        rand_expect=1.25,
-    )
+    # ★ ステータス補完（StatsByLevel を前計算した成長表から引く）
+    growth = job_growth(job)
+    (
+        base.strength,
+        base.agility,
+        base.vitality,
+        base.intelligence,
+        base.mind,
+    ) = growth.stats_at(base.level)
+
+    # ★最大HPの期待値をジョブのVitテーブルから取得（initial_hp_lv1=32, rand_expect=1.25）
+    expected_hp = growth.expected_max_hp_at(base.level)
     base.max_hp = expected_hp
     max_hP = expected_hp
 
-    # ★最大MPを補完取得（L1MP〜L8MPのdict）
-    max_mp = interpolate_mp(job_stats_levels, base.level)
-
     state = BattleActorState(
         hp=max_hP,
         max_hp=max_hP,
         statuses=statuses_from_status_effects(entry.get("status_effects", {})),
     )
 
-    # ★最大MPプールをセット
-    state.max_mp_pool = {i: int(max_mp.get(f"L{i}MP", 0) or 0) for i in range(1, 9)}
+    # ★最大MPプールをセット（L1MP〜L8MP を補完済み）
+    state.max_mp_pool = growth.max_mp_at(base.level)
 
     # ★現在MP（savedata優先）
     mp_from_save = entry.get("mp")
     if isinstance(mp_from_save, dict):
-        state.mp_pool = {
-            i: min(int(mp_from_save.get(f"L{i}MP", 0) or 0), state.max_mp_pool[i])
+        state.mp_pool = MpPool(
+            min(int(mp_from_save.get(f"L{i}MP", 0) or 0), state.max_mp_pool[i])
             for i in range(1, 9)
-        }
+        )
     else:
         # savedataに無ければ満タン扱い
-        state.mp_pool = dict(state.max_mp_pool)
+        state.mp_pool = state.max_mp_pool.copy()
 
     # ★ 現在MPが最大MPを超えないように丸める
     for i in range(1, 9):
@@ -288,20 +293,19 @@ def apply_job_equipment_restrictions(
     """
     logs: List[str] = []
 
-    allowed_weapon_names = {
-        w["Name"] for w in job.raw.get("Weapons", []) if w.get("Name")
-    }
-    allowed_armor_names = {
-        a["Name"] for a in job.raw.get("Armors", []) if a.get("Name")
-    }
+    # ★JobProfile に前計算済みの装備可能名（frozenset）
+    profile = job_profile(job)
+    allowed_weapon_names = profile.weapon_names
+    allowed_armor_names = profile.armor_names
 
     new_eq = replace(eq)
 
     # --- メインハンド（武器） ---
     if new_eq.main_hand and new_eq.main_hand not in allowed_weapon_names:
-        logs.append(
-            f"  [{job.name}] は main_hand の武器「{new_eq.main_hand}」を装備できないため、外しました。"
-        )
+        if logs_enabled():
+            logs.append(
+                f"  [{job.name}] は main_hand の武器「{new_eq.main_hand}」を装備できないため、外しました。"
+            )
         new_eq.main_hand = None
 
     # --- オフハンド（武器 or 防具） ---
@@ -310,18 +314,20 @@ def apply_job_equipment_restrictions(
             new_eq.off_hand not in allowed_weapon_names
             and new_eq.off_hand not in allowed_armor_names
         ):
-            logs.append(
-                f"  [{job.name}] は off_hand の装備「{new_eq.off_hand}」を装備できないため、外しました。"
-            )
+            if logs_enabled():
+                logs.append(
+                    f"  [{job.name}] は off_hand の装備「{new_eq.off_hand}」を装備できないため、外しました。"
+                )
             new_eq.off_hand = None
 
     # --- 防具スロット ---
     for slot in ("head", "body", "arms"):
         name = getattr(new_eq, slot)
         if name and name not in allowed_armor_names:
-            logs.append(
-                f"  [{job.name}] は {slot} の防具「{name}」を装備できないため、外しました。"
-            )
+            if logs_enabled():
+                logs.append(
+                    f"  [{job.name}] は {slot} の防具「{name}」を装備できないため、外しました。"
+                )
             setattr(new_eq, slot, None)
 
     return new_eq, logs
@@ -396,7 +402,8 @@ def weapon_stats(
     key = normalizer(name)
     w = weapons_by_name_norm.get(key)
     if w is None:
-        print(f"[warn] weapon not found: {name} (norm={key})")
+        if logs_enabled():
+            print(f"[warn] weapon not found: {name} (norm={key})")
         return 0, 0, False, False, []
 
     power = int(w.get("BasePower", 0))
@@ -439,7 +446,8 @@ def armor_stats(
     key = normalizer(name)
     a = armors_by_name_norm.get(key)
     if a is None:
-        print(f"[warn] armor not found: {name} (norm={key})")
+        if logs_enabled():
+            print(f"[warn] armor not found: {name} (norm={key})")
         return 0, 0.0, 0, False, [], [], []
 
     defense = int(a.get("Defense", 0))
@@ -471,41 +479,165 @@ def compute_character_final_stats(
 ) -> FinalCharacterStats:
     """
     基礎ステータス + 装備名 + JSON データ から、戦闘用の最終ステータスを自動算出。
+    ★名前インデックス・装備ごとの寄与はマスタデータごとに1回だけ作る（item_stat_table）。
+    同じ (基礎ステータス, 装備, ジョブ) の結果はメモ化してあり、2回目以降はコピーを返すだけ。
+    マスタデータをその場で書き換えたときは invalidate_stat_caches() を呼ぶこと。
     """
-    weapons_norm = build_name_index(weapons_by_name)
-    armors_norm = build_name_index(armors_by_name)
+    table = item_stat_table(weapons_by_name, armors_by_name)
+    key = (
+        id(table),
+        _base_stats_key(base),
+        (eq.main_hand, eq.off_hand, eq.head, eq.body, eq.arms),
+        job_name,
+    )
+    cached = _FINAL_STATS_MEMO.get(key)
+    if cached is None:
+        # --- 攻撃側（武器）・防御側（防具 + 盾） ---
+        # 盾は off_hand に入る可能性が高いので、防具としても見る
+        cached = final_stats_from_parts(
+            base,
+            table.weapon(eq.main_hand),
+            table.weapon(eq.off_hand),
+            [table.armor(slot) for slot in (eq.off_hand, eq.head, eq.body, eq.arms)],
+            job_name=job_name,
+        )
+        if len(_FINAL_STATS_MEMO) >= FINAL_STATS_MEMO_MAX:
+            _FINAL_STATS_MEMO.popitem(last=False)
+        _FINAL_STATS_MEMO[key] = cached
+    else:
+        _FINAL_STATS_MEMO.move_to_end(key)
+
+    # 呼び出し側が stats を書き換えても（menu の row 同期など）メモが汚れないようにコピーを返す
+    return _copy_final_stats(cached)
+
+
+# ============================================================
+# 装備の寄与表・最終ステータスのメモ化
+# ============================================================
+
+FINAL_STATS_MEMO_MAX = 4096
 
+_ITEM_TABLES: Dict[Tuple[int, int], "ItemStatTable"] = {}
+_FINAL_STATS_MEMO: "OrderedDict[tuple, FinalCharacterStats]" = OrderedDict()
+
+
+@dataclass
+class ItemStatTable:
+    """
+    武器・防具の正規化名インデックスと、装備ごとの寄与（weapon_stats / armor_stats の戻り値）。
+    item_stat_table() でマスタデータ（dict）ごとに1回だけ作る。
     """
-    print("[DBG total_exp]", base.total_exp)
-    print(
-        "[DBG weapon index size]", len(weapons_by_name), "norm size", len(weapons_norm)
-    )
-    print("[DBG eq main/off]", repr(eq.main_hand), "/", repr(eq.off_hand))
 
-    print(
-        "[DBG eq.main_hand]",
-        repr(eq.main_hand),
-        "raw_in_weapons?",
-        eq.main_hand in weapons_by_name,
-    )
-    print(
-        "[DBG eq.off_hand ]",
-        repr(eq.off_hand),
-        "raw_in_weapons?",
-        eq.off_hand in weapons_by_name,
-    )
+    weapons_by_name: Dict[str, Dict[str, Any]]
+    armors_by_name: Dict[str, Dict[str, Any]]
+    weapons_norm: Dict[str, Dict[str, Any]]
+    armors_norm: Dict[str, Dict[str, Any]]
+    weapons: Dict[str, "WeaponParts"]
+    armors: Dict[str, "ArmorParts"]
+
+    def weapon(self, name: Optional[str]) -> "WeaponParts":
+        if not name:
+            return _NO_WEAPON
+        parts = self.weapons.get(normalize_name(name))
+        if parts is None:
+            # 見つからないときの警告は weapon_stats に任せる
+            return weapon_stats(self.weapons_norm, name)
+        return parts
+
+    def armor(self, name: Optional[str]) -> "ArmorParts":
+        if not name:
+            return _NO_ARMOR
+        parts = self.armors.get(normalize_name(name))
+        if parts is None:
+            return armor_stats(self.armors_norm, name)
+        return parts
+
+
+def item_stat_table(
+    weapons_by_name: Dict[str, Dict[str, Any]],
+    armors_by_name: Dict[str, Dict[str, Any]],
+) -> ItemStatTable:
+    """
+    マスタデータ（dict オブジェクト）ごとの ItemStatTable を返す。初回だけ build_name_index と
+    weapon_stats / armor_stats を全件ぶん回し、以降は同じ表を返す。
+    件数が変わっていたら作り直す（その場での値の書き換えは検知しないので invalidate_stat_caches() を呼ぶ）。
     """
+    key = (id(weapons_by_name), id(armors_by_name))
+    table = _ITEM_TABLES.get(key)
+    if (
+        table is not None
+        and table.weapons_by_name is weapons_by_name
+        and table.armors_by_name is armors_by_name
+        and len(table.weapons_norm) == len(weapons_by_name)
+        and len(table.armors_norm) == len(armors_by_name)
+    ):
+        return table
 
-    # --- 攻撃側（武器） ---
-    main_pow, main_acc, main_two, main_long, main_weapon_elements = weapon_stats(
-        weapons_norm, eq.main_hand
+    weapons_norm = build_name_index(weapons_by_name)
+    armors_norm = build_name_index(armors_by_name)
+    table = ItemStatTable(
+        weapons_by_name=weapons_by_name,
+        armors_by_name=armors_by_name,
+        weapons_norm=weapons_norm,
+        armors_norm=armors_norm,
+        weapons={k: weapon_stats(weapons_norm, k) for k in weapons_norm},
+        armors={k: armor_stats(armors_norm, k) for k in armors_norm},
     )
-    off_pow, off_acc, off_two, off_long, off_weapon_elements = weapon_stats(
-        weapons_norm, eq.off_hand
+    _ITEM_TABLES[key] = table
+    # 古い表に紐づくメモは使えないので捨てる
+    _FINAL_STATS_MEMO.clear()
+    return table
+
+
+def invalidate_stat_caches() -> None:
+    """寄与表と最終ステータスのメモをすべて捨てる（マスタデータの再読み込み・書き換え後に呼ぶ）"""
+    _ITEM_TABLES.clear()
+    _FINAL_STATS_MEMO.clear()
+
+
+def _base_stats_key(base: BaseCharacter) -> tuple:
+    # final_stats_from_parts が参照する項目だけ（total_exp / job_skill_point は結果に効かない）
+    return (
+        base.level,
+        base.job_level,
+        base.max_hp,
+        base.strength,
+        base.agility,
+        base.vitality,
+        base.intelligence,
+        base.mind,
+        base.row,
     )
 
-    # print(f"[Debug]eq:{eq.off_hand}")
-    # print(f"[Debug]off_pow:{off_pow} off_acc:{off_acc} off_long:{off_long} off_weapon_elements:{off_weapon_elements}")
+
+def _copy_final_stats(stats: FinalCharacterStats) -> FinalCharacterStats:
+    out = copy.copy(stats)
+    out.main_weapon_elements = list(stats.main_weapon_elements)
+    out.off_weapon_elements = list(stats.off_weapon_elements)
+    return out
+
+
+WeaponParts = Tuple[int, int, bool, bool, List[str]]
+ArmorParts = Tuple[int, float, int, bool, List[str], List[str], List[str]]
+
+_NO_WEAPON: WeaponParts = (0, 0, False, False, [])
+_NO_ARMOR: ArmorParts = (0, 0.0, 0, False, [], [], [])
+
+
+def final_stats_from_parts(
+    base: BaseCharacter,
+    main_weapon: WeaponParts,
+    off_weapon: WeaponParts,
+    armor_parts: Iterable[ArmorParts],
+    job_name: Optional[str] = None,
+) -> FinalCharacterStats:
+    """
+    スロットごとの寄与（weapon_stats / armor_stats の戻り値）から最終ステータスを組み立てる。
+    名前→データの引き直しをしないので、装備候補を大量に評価するとき（装備最適化など）は
+    寄与を1回だけ作ってこちらを直接呼ぶ。
+    """
+    main_pow, main_acc, main_two, main_long, main_weapon_elements = main_weapon
+    off_pow, off_acc, off_two, off_long, off_weapon_elements = off_weapon
 
     # ----------------------------------------
     # Black Belt / Monk 素手補正
@@ -542,11 +674,7 @@ def compute_character_final_stats(
     elem_null_total: set[str] = set()  # ★追加（現状は空のまま）
     status_imm_total: set[str] = set()
 
-    # 盾は off_hand に入る可能性が高いので、防具としても見る
-    for slot in (eq.off_hand, eq.head, eq.body, eq.arms):
-        d, e, m, is_shield, elem_resist, elem_null, status_imm = armor_stats(
-            armors_norm, slot
-        )
+    for d, e, m, is_shield, elem_resist, elem_null, status_imm in armor_parts:
         total_def += d
         total_eva += e
         total_mdef += m
@@ -814,6 +942,58 @@ def expected_max_hp_from_vit_table(
     return int(hp)
 
 
+# ★追加：成長表の前計算
+def compile_job_growth(stats_by_level_rows: Iterable[Dict[str, Any]]) -> JobGrowthTable:
+    """
+    StatsByLevel の行（{"Level":..,"Str":..,"L1MP":..}）から JobGrowthTable を作る。
+    Lv1〜99 の各レベルの補完結果（表にないレベルだけ interpolate_stats / interpolate_mp）を並べ、
+    HP期待値は expected_max_hp_from_vit_table と同じ式（32 + Σ floor(Lv + Vit×1.25)）を累積和で持つ。
+    """
+    job_stats_levels = {row["Level"]: row for row in stats_by_level_rows}
+
+    stats: List[Tuple[int, int, int, int, int]] = [(0, 0, 0, 0, 0)]
+    max_mp: List[MpPool] = [MpPool()]
+    for lv in range(1, 100):
+        # 表にあるレベルは補完しても行の値そのもの（None は 0）なので直接読む
+        row = job_stats_levels.get(lv)
+        if row is None:
+            s = interpolate_stats(job_stats_levels, lv)
+            mp = interpolate_mp(job_stats_levels, lv) if job_stats_levels else {}
+        else:
+            s = row
+            mp = row
+        stats.append(
+            tuple(int(s.get(k, 0) or 0) for k in ("Str", "Agi", "Vit", "Int", "Mnd"))
+        )
+        max_mp.append(MpPool(int(mp.get(f"L{i}MP", 0) or 0) for i in range(1, 9)))
+
+    # HP期待値：Lv1 は常に 32。Lv2 以降は欠けたレベル（または Vit が無いレベル）に当たったらそこから None
+    missing = tuple(lv for lv in range(1, 100) if lv not in job_stats_levels)
+    expected_hp: List[Optional[int]] = [None, 32]
+    hp: Optional[float] = None if 1 in missing else 32.0
+    for lv in range(2, 100):
+        if hp is not None:
+            vit = job_stats_levels[lv].get("Vit") if lv in job_stats_levels else None
+            hp = None if vit is None else hp + math.floor(lv + int(vit) * 1.25)
+        expected_hp.append(None if hp is None else int(hp))
+
+    return JobGrowthTable(
+        stats=tuple(stats),
+        max_mp=tuple(max_mp),
+        expected_hp=tuple(expected_hp),
+        missing_levels=missing,
+    )
+
+
+def job_growth(job: Job) -> JobGrowthTable:
+    """Job.growth を返す。load_jobs 以外で作った Job なら初回にここで前計算して載せる"""
+    growth = job.growth
+    if growth is None:
+        growth = compile_job_growth(job.raw.get("StatsByLevel", []))
+        job.growth = growth
+    return growth
+
+
 # セーブデータの正規化
 def normalize_party_entry(entry: dict, level_table: LevelTable) -> dict:
     # entry を破壊的に変更したくなければ copy() する
@@ -830,17 +1010,18 @@ def normalize_party_entry(entry: dict, level_table: LevelTable) -> dict:
 # 汎用：装備可能判定
 def can_equip_item(job, item_data: dict) -> bool:
     """
-    item_data["EquippedBy"] の中に job.slug or job.name が含まれる想定。
-    JSON仕様が違う場合はここだけ合わせればOK。
+    item_data["EquippedBy"]（"Wa" "Ni" などの略号）にジョブの略号が含まれるか（大小無視）。
+    略号は JobProfile.equip_code（JOB_EQUIP_CODE）。EquippedBy が空なら全ジョブ可。
     """
     eq = item_data.get("EquippedBy")
     if not eq:
         return True
+    code = (job_profile(job).equip_code or job.slug or job.name or "").lower()
     # EquippedBy が list/str どちらでも耐える
     if isinstance(eq, str):
-        return (job.slug in eq) or (job.name in eq)
+        return code in {c.strip().lower() for c in eq.split(",")}
     if isinstance(eq, list):
-        return (job.slug in eq) or (job.name in eq)
+        return code in {str(c).strip().lower() for c in eq}
     return True
 
 
@@ -854,7 +1035,11 @@ def strip_illegal_equipment_for_job(
     """
     新ジョブで装備できないものを None にして返す。
     戻り値: (new_eq, removed_list)
+    装備可否は equip_index（EquippedBy から作ったジョブ → スロット → 正式名の索引）を引くだけ。
     """
+    from combat.equip_index import job_equip_index  # equip_index が char_build を import するため
+
+    index = job_equip_index(job, weapons_by_name, armors_by_name)
     removed: list[str] = []
     new_eq = EquipmentSet(
         main_hand=eq.main_hand,
@@ -864,28 +1049,19 @@ def strip_illegal_equipment_for_job(
         arms=eq.arms,
     )
 
-    # 武器は main/off
-    for slot in ("main_hand", "off_hand"):
+    for slot in ("main_hand", "off_hand", "head", "body", "arms"):
         name = getattr(new_eq, slot)
         if not name:
             continue
-        data = weapons_by_name.get(name)
-        # 武器データに無い（表記違い等）なら外さない/外すの選択があるが、まずは外す
-        if data is None or not can_equip_item(job, data):
-            removed.append(f"{slot}: {name}")
-            setattr(new_eq, slot, None)
-
-    # 防具は off_hand(盾) / head / body / arms
-    for slot in ("off_hand", "head", "body", "arms"):
-        name = getattr(new_eq, slot)
-        if not name:
+        # 表記ゆれは正式名に直して引く（off_hand は武器か盾か両方ありうる）
+        is_hand = slot in ("main_hand", "off_hand")
+        weapon = canonical_name(weapons_by_name, name) if is_hand else None
+        armor = canonical_name(armors_by_name, name) if slot != "main_hand" else None
+        if weapon is None and armor is None and not is_hand:
+            continue  # 防具データに無いものは外さない（武器データに無い武器は外す）
+        if index.can_equip(slot, weapon) or index.can_equip(slot, armor):
             continue
-        data = armors_by_name.get(name)
-        # off_hand は武器か盾か両方ありうるので、防具側にも無いならスキップ
-        if data is None:
-            continue
-        if not can_equip_item(job, data):
-            removed.append(f"{slot}: {name}")
-            setattr(new_eq, slot, None)
+        removed.append(f"{slot}: {name}")
+        setattr(new_eq, slot, None)
 
     return new_eq, removed
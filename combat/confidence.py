@@ -0,0 +1,74 @@
+# ============================================================
+# confidence: モンテカルロ集計の信頼区間（逐次打ち切り・A/B 比較用）
+
+# z_value	信頼水準（0.95 など）に対応する標準正規分布の両側 z 値
+# wilson_interval	成功回数 / 試行回数から勝率の Wilson スコア区間を返す
+# mean_interval	合計・二乗和・件数から平均の正規近似区間を返す（ラウンド数・対応のある差など）
+# paired_diff_interval	対応のある勝敗の差（B - A）の区間。不一致対が 0 件でも幅が潰れない
+# half_width	区間の半幅（「±何%」の精度判定用）
+# ============================================================
+# ・Wilson 区間は勝率 99%+ のような偏ったセルでも 0〜1 をはみ出さず、
+#   少ない試行でも正規近似（p ± z√(p(1-p)/n)）より被覆率が良い
+# ・対応のある勝敗の差 d_i ∈ {-1, 0, 1} は最初の数百試行で全部 0 になりやすく、
+#   mean_interval だと分散 0 → 区間 0 ± 0 になって「もう十分」と誤判定する。
+#   paired_diff_interval は Var(d_i) ≤ P(d_i ≠ 0) を使い、不一致対の割合を Wilson 上限で見積もる
+# ・件数が足りないとき（Wilson は n=0、平均は n<2）は「何も分からない」区間を返す
+
+from __future__ import annotations
+
+import math
+from statistics import NormalDist
+from typing import Tuple
+
+
+def z_value(confidence: float = 0.95) -> float:
+    if not 0.0 < confidence < 1.0:
+        raise ValueError(f"confidence は 0〜1 の範囲で指定してください: {confidence}")
+    return NormalDist().inv_cdf(0.5 + confidence / 2.0)
+
+
+def wilson_interval(
+    successes: int, n: int, confidence: float = 0.95
+) -> Tuple[float, float]:
+    """勝率の Wilson スコア区間 (lo, hi)。n=0 なら (0.0, 1.0)"""
+    if n <= 0:
+        return 0.0, 1.0
+    z = z_value(confidence)
+    p = successes / n
+    z2n = z * z / n
+    center = (p + z2n / 2.0) / (1.0 + z2n)
+    half = z * math.sqrt(p * (1.0 - p) / n + z2n / (4.0 * n)) / (1.0 + z2n)
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def mean_interval(
+    total: float, total_sq: float, n: int, confidence: float = 0.95
+) -> Tuple[float, float]:
+    """平均の正規近似区間 (lo, hi)。標本分散（n-1 割り）を使う。n<2 なら (-inf, inf)"""
+    if n < 2:
+        return -math.inf, math.inf
+    mean = total / n
+    var = max(0.0, (total_sq - n * mean * mean) / (n - 1))
+    half = z_value(confidence) * math.sqrt(var / n)
+    return mean - half, mean + half
+
+
+def paired_diff_interval(
+    a_only: int, b_only: int, n: int, confidence: float = 0.95
+) -> Tuple[float, float]:
+    """
+    対応のある勝敗の差（B - A）の区間 (lo, hi)。
+    a_only / b_only は片方だけが勝った試行数。分散を不一致対の割合の Wilson 上限で抑えるので、
+    不一致が 0 件でも半幅は約 z²/n 残る。n=0 なら (-1.0, 1.0)
+    """
+    if n <= 0:
+        return -1.0, 1.0
+    diff = (b_only - a_only) / n
+    _, discordant_hi = wilson_interval(a_only + b_only, n, confidence)
+    half = z_value(confidence) * math.sqrt(discordant_hi / n)
+    return max(-1.0, diff - half), min(1.0, diff + half)
+
+
+def half_width(interval: Tuple[float, float]) -> float:
+    lo, hi = interval
+    return (hi - lo) / 2.0
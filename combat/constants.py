@@ -3,6 +3,7 @@
 # 属性相性、コマンド種別、状態異常種別 ❌ 基本変更しない
 
 # JOB_CAST_CODE: 「そのジョブが実際に詠唱できる魔法」に絞り込むためのキー
+# JOB_EQUIP_CODE: ジョブ名 → 武器・防具の EquippedBy に書かれている略号（装備可否の判定キー）
 # OFFENSIVE_WHITE: 白魔法の中でも「攻撃魔法」として扱う魔法名の集合（HolyやAero系など）で、白魔ダメージ計算対象の判定に使われる
 # OFFENSIVE_WHITE_ELEMENTS: 白魔法を名前ではなく「属性」で攻撃判定するための属性集合（holy/air）で、SpellInfoにnameが無い場合の代替判定に使われる
 # COMMAND_TO_KIND: 戦闘コマンド文字列（Fight,Magic,Item,Runなど）をBattleKindに正規化変換するための対応表
@@ -29,6 +30,32 @@ JOB_CAST_CODE = {
     "Sage": "Sa",
 }
 
+# ジョブ名 → EquippedBy の略号（patch_jobs_from_equippedby / 装備メニュー / equip_index で共有）
+JOB_EQUIP_CODE = {
+    "Onion Knight": "OK",
+    "Warrior": "Wa",
+    "Monk": "Mo",
+    "White Mage": "WM",
+    "Black Mage": "BM",
+    "Red Mage": "RM",
+    "Ranger": "Ra",
+    "Knight": "Kn",
+    "Thief": "Th",
+    "Scholar": "Sc",
+    "Geomancer": "Ge",
+    "Dragoon": "Dr",
+    "Viking": "Vi",
+    "Black Belt": "BB",
+    "Evoker": "Ev",
+    "Bard": "Ba",
+    "Magus": "Ma",
+    "Devout": "De",
+    "Summoner": "Su",
+    "Sage": "Sa",
+    "Ninja": "Ni",
+    "Mystic Knight": "MK",  # JSON内で MK 表記
+}
+
 # 白魔で「攻撃扱い」する名前と属性
 OFFENSIVE_WHITE = {"holy", "aero", "aeroga"}  # 必要なら追加
 OFFENSIVE_WHITE_ELEMENTS = {"holy", "air"}
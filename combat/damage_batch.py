@@ -0,0 +1,385 @@
+# ============================================================
+# damage_batch: ダメージ式のバッチ版（NumPy、一括シミュレーション用）
+
+# BatchAttackResult	バッチ版の戻り値（damage / hit_count / is_critical / net_hits の配列）
+# physical_damage_char_to_enemy_batch	キャラ→敵の物理ダメージを N 件まとめて計算（phys_damage 版と同じ式）
+# physical_damage_enemy_to_char_batch	敵→キャラの物理ダメージを N 件まとめて計算（phys_damage 版と同じ式）
+# magic_damage_char_to_enemy_batch	キャラ→敵の攻撃魔法ダメージを N 件まとめて計算（ヒットごとのロールも一括）
+# ============================================================
+# ・攻撃側/防御側は「1体」または「N体のシーケンス」を渡せる（1体なら N 件へブロードキャスト）
+# ・blind などのフラグも bool か長さ N の配列を渡せる
+# ・乱数は numpy.random.Generator を1つ渡す（random.Random は使わない）
+# ・スカラー版と「分布が一致」する（乱数列そのものは一致しない）。
+#   確認は tools/benchmarks/check_damage_batch_parity.py
+# ・NumPy は任意依存。未インストールなら呼び出し時に ImportError
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy 無しでもゲーム本体は動く
+    np = None  # type: ignore[assignment]
+
+from combat.enums import ElementRelation
+from combat.models import FinalCharacterStats, FinalEnemyStats, SpellInfo
+from combat.magic_damage import (
+    _calc_magic_accuracy,
+    _calc_magic_multiplier,
+    _calc_magic_power,
+)
+
+ArrayLike = Any  # np.ndarray / Sequence / スカラー
+Relations = Union[ElementRelation, Sequence[ElementRelation]]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "combat.damage_batch には NumPy が必要です（pip install numpy）"
+        )
+
+
+@dataclass
+class BatchAttackResult:
+    damage: "np.ndarray"  # int64
+    hit_count: "np.ndarray"  # int64（表示用、ミスは0）
+    is_critical: "np.ndarray"  # bool
+    net_hits: "np.ndarray"  # float64（期待ヒット数）
+
+
+# ============================================================
+# 共通ヘルパ
+# ============================================================
+
+
+def _as_list(objs: Any) -> list:
+    return list(objs) if isinstance(objs, (list, tuple)) else [objs]
+
+
+def _batch_size(n: Optional[int], *groups: list) -> int:
+    size = max([len(g) for g in groups] + [n or 1])
+    for g in groups:
+        if len(g) not in (1, size):
+            raise ValueError(
+                f"バッチサイズが一致しません: {len(g)}（1 または {size} を指定してください）"
+            )
+    return size
+
+
+def _gather(objs: list, n: int, getter: Callable[[Any], Any], dtype) -> "np.ndarray":
+    """オブジェクト列から1項目を取り出して長さ n の配列にする"""
+    arr = np.fromiter((getter(o) for o in objs), dtype=dtype, count=len(objs))
+    return np.broadcast_to(arr, (n,)) if len(objs) == 1 else arr
+
+
+def _flag(v: ArrayLike, n: int) -> "np.ndarray":
+    return np.broadcast_to(np.asarray(v, dtype=bool), (n,))
+
+
+def _apply_element_relation_batch(
+    dmg: "np.ndarray", relation: Relations, n: int
+) -> "np.ndarray":
+    """elements.apply_element_relation_to_damage の配列版"""
+    if isinstance(relation, str):
+        rel = np.full(n, relation, dtype=object)
+    else:
+        rel = np.broadcast_to(np.asarray(relation, dtype=object), (n,))
+    out = dmg.copy()
+    out = np.where(rel == "weak", dmg * 2, out)
+    # int(d * 0.5) は 0 方向への切り捨て
+    out = np.where(rel == "resist", np.trunc(dmg * 0.5).astype(np.int64), out)
+    out = np.where(rel == "absorb", -dmg, out)
+    out = np.where(rel == "null", 0, out)
+    return out
+
+
+def _per_hit_damage(
+    power: "np.ndarray",
+    defense: "np.ndarray",
+    gen: "np.random.Generator",
+    use_expectation: bool,
+    shape=None,
+) -> "np.ndarray":
+    """AttackPower * [1.0, 1.5] - Defense（最低 1）。shape 指定で複数ヒット分を一括ロール"""
+    if use_expectation:
+        factor = 1.25
+    else:
+        factor = gen.uniform(1.0, 1.5, shape if shape is not None else power.shape)
+    raw = (power * factor).astype(np.int64)
+    return np.maximum(raw - defense, 1)
+
+
+def _net_hits(
+    atk_mul: "np.ndarray",
+    hit_percent: "np.ndarray",
+    def_mul: "np.ndarray",
+    evade_percent: "np.ndarray",
+) -> "np.ndarray":
+    """phys_damage._calc_net_hits / magic_damage._calc_expected_magic_hits の配列版"""
+    h = np.clip(hit_percent, 0, 100) / 100.0
+    e = np.clip(evade_percent, 0, 100) / 100.0
+    return np.maximum(atk_mul * h - def_mul * e, 0.0)
+
+
+def _zeros_result(n: int) -> BatchAttackResult:
+    return BatchAttackResult(
+        damage=np.zeros(n, dtype=np.int64),
+        hit_count=np.zeros(n, dtype=np.int64),
+        is_critical=np.zeros(n, dtype=bool),
+        net_hits=np.zeros(n, dtype=np.float64),
+    )
+
+
+# ============================================================
+# 物理ダメージ：キャラ → 敵
+# ============================================================
+
+
+def physical_damage_char_to_enemy_batch(
+    chars: Union[FinalCharacterStats, Sequence[FinalCharacterStats]],
+    enemies: Union[FinalEnemyStats, Sequence[FinalEnemyStats]],
+    gen: "np.random.Generator",
+    *,
+    n: Optional[int] = None,
+    hand: str = "main",
+    element_relation: Relations = "normal",
+    use_expectation: bool = False,
+    blind: ArrayLike = False,
+    attacker_is_mini_or_toad: ArrayLike = False,
+    cheer_bonus: ArrayLike = 0,
+) -> BatchAttackResult:
+    """
+    phys_damage.physical_damage_char_to_enemy のバッチ版。
+    n を指定すると「同じ組み合わせを n 回」試行する。
+    """
+    _require_numpy()
+    cs, es = _as_list(chars), _as_list(enemies)
+    size = _batch_size(n, cs, es)
+
+    off = hand == "off"
+    atk_power = _gather(
+        cs, size, (lambda c: c.off_power) if off else (lambda c: c.main_power), np.int64
+    ) + np.broadcast_to(np.asarray(cheer_bonus, dtype=np.int64), (size,))
+    atk_mul = _gather(
+        cs,
+        size,
+        (lambda c: c.off_atk_multiplier) if off else (lambda c: c.main_atk_multiplier),
+        np.int64,
+    )
+    hit_percent = _gather(
+        cs,
+        size,
+        (lambda c: c.off_accuracy) if off else (lambda c: c.main_accuracy),
+        np.int64,
+    )
+    # ★後列ペナルティ：近距離武器のみ Hit% 半減（LongRangeは除外）
+    back_short = _gather(
+        cs,
+        size,
+        lambda c: c.row == "back" and not (c.off_long if off else c.main_long),
+        bool,
+    )
+    hit_percent = np.where(_flag(blind, size), hit_percent // 2, hit_percent)
+    hit_percent = np.where(back_short, hit_percent // 2, hit_percent)
+
+    net_hits = _net_hits(
+        atk_mul,
+        hit_percent,
+        _gather(es, size, lambda e: e.defense_multiplier, np.int64),
+        _gather(es, size, lambda e: e.evasion_percent, np.int64),
+    )
+    # Python の round と同じく偶数丸め
+    hit_count = np.rint(net_hits).astype(np.int64)
+
+    valid = (
+        ~_flag(attacker_is_mini_or_toad, size)
+        & (atk_power > 0)
+        & (atk_mul > 0)
+        & (hit_count > 0)
+    )
+
+    base_per_hit = _per_hit_damage(
+        atk_power,
+        _gather(es, size, lambda e: e.defense, np.int64),
+        gen,
+        use_expectation,
+    )
+    dmg = (base_per_hit * net_hits).astype(np.int64)
+    dmg = np.maximum(_apply_element_relation_batch(dmg, element_relation, size), 0)
+
+    # ★クリティカル（乱数モードのみ）: roll_critical と同じ確率
+    if use_expectation:
+        is_crit = np.zeros(size, dtype=bool)
+    else:
+        agility = _gather(cs, size, lambda c: c.agility, np.float64)
+        chance = np.clip(1.0 / 16.0 + agility / 512, 0.0, 0.5)
+        is_crit = (gen.random(size) < chance) & valid
+        dmg = np.where(is_crit, dmg * 2, dmg)
+
+    return BatchAttackResult(
+        damage=np.where(valid, dmg, 0),
+        hit_count=np.where(valid, hit_count, 0),
+        is_critical=is_crit,
+        net_hits=np.where(valid, net_hits, 0.0),
+    )
+
+
+# ============================================================
+# 物理ダメージ：敵 → キャラ
+# ============================================================
+
+
+def physical_damage_enemy_to_char_batch(
+    enemies: Union[FinalEnemyStats, Sequence[FinalEnemyStats]],
+    chars: Union[FinalCharacterStats, Sequence[FinalCharacterStats]],
+    gen: "np.random.Generator",
+    *,
+    n: Optional[int] = None,
+    use_expectation: bool = False,
+    attacker_is_blind: ArrayLike = False,
+    attacker_is_mini_or_toad: ArrayLike = False,
+    target_is_mini_or_toad: ArrayLike = False,
+    target_boosted: ArrayLike = False,
+) -> BatchAttackResult:
+    """
+    phys_damage.physical_damage_enemy_to_char のバッチ版。
+    target_boosted は target_state.boost_count > 0 に相当（防御値・防御倍率 0）。
+    """
+    _require_numpy()
+    es, cs = _as_list(enemies), _as_list(chars)
+    size = _batch_size(n, es, cs)
+
+    boosted = _flag(target_boosted, size)
+    defense_value = _gather(cs, size, lambda c: c.defense, np.int64)
+    defense_value = np.where(
+        _flag(target_is_mini_or_toad, size) | boosted, 0, defense_value
+    )
+    def_mul = np.where(
+        boosted, 0, _gather(cs, size, lambda c: c.defense_multiplier, np.int64)
+    )
+
+    hit_percent = _gather(es, size, lambda e: e.accuracy_percent, np.int64)
+    hit_percent = np.where(
+        _flag(attacker_is_blind, size), hit_percent // 2, hit_percent
+    )
+    # ★後列ペナルティ：後列を狙う物理攻撃は Hit% 半減
+    hit_percent = np.where(
+        _gather(cs, size, lambda c: c.row == "back", bool),
+        hit_percent // 2,
+        hit_percent,
+    )
+
+    net_hits = _net_hits(
+        _gather(es, size, lambda e: e.attack_multiplier, np.int64),
+        hit_percent,
+        def_mul,
+        _gather(cs, size, lambda c: c.evasion_percent, np.int64),
+    )
+    valid = ~_flag(attacker_is_mini_or_toad, size) & (net_hits > 0)
+
+    base_per_hit = _per_hit_damage(
+        _gather(es, size, lambda e: e.attack_power, np.int64),
+        defense_value,
+        gen,
+        use_expectation,
+    )
+    dmg = base_per_hit * net_hits
+
+    if use_expectation:
+        is_crit = np.zeros(size, dtype=bool)
+    else:
+        level = _gather(es, size, lambda e: e.level, np.float64)
+        chance = np.clip(1.0 / 20 + level / 9999, 0.0, 0.5)
+        is_crit = (gen.random(size) < chance) & valid
+        dmg = np.where(is_crit, dmg * 2, dmg)
+
+    dmg = np.maximum(dmg.astype(np.int64), 0)
+
+    return BatchAttackResult(
+        damage=np.where(valid, dmg, 0),
+        hit_count=np.where(valid, np.rint(net_hits).astype(np.int64), 0),
+        is_critical=is_crit,
+        net_hits=np.where(valid, net_hits, 0.0),
+    )
+
+
+# ============================================================
+# 魔法ダメージ：キャラ → 敵
+# ============================================================
+
+
+def magic_damage_char_to_enemy_batch(
+    casters: Union[FinalCharacterStats, Sequence[FinalCharacterStats]],
+    spell: SpellInfo,
+    enemies: Union[FinalEnemyStats, Sequence[FinalEnemyStats]],
+    gen: "np.random.Generator",
+    *,
+    n: Optional[int] = None,
+    element_relation: Relations = "normal",
+    use_expectation: bool = False,
+    split_to_targets: ArrayLike = 1,
+    blind: ArrayLike = False,
+) -> BatchAttackResult:
+    """
+    magic_damage.magic_damage_char_to_enemy のバッチ版。
+    乱数モードでは整数ヒット数をロールし、ヒットごとの基礎ダメージを (N, 最大ヒット数) の
+    行列で一括ロールして合計する（スカラー版の per-hit ループと同じ分布）。
+    魔法は呪文ごとに式が違うので spell は1つに固定。
+    """
+    _require_numpy()
+    cs, es = _as_list(casters), _as_list(enemies)
+    size = _batch_size(n, cs, es)
+
+    power = _gather(cs, size, lambda c: _calc_magic_power(c, spell), np.int64)
+    mult = _gather(cs, size, lambda c: _calc_magic_multiplier(c, spell), np.int64)
+    acc = np.where(
+        _flag(blind, size),
+        _gather(cs, size, lambda c: _calc_magic_accuracy(c, spell, blind=True), np.int64),
+        _gather(cs, size, lambda c: _calc_magic_accuracy(c, spell), np.int64),
+    )
+    mdef = _gather(es, size, lambda e: e.magic_defense, np.int64)
+
+    expected_hits = _net_hits(
+        mult,
+        acc,
+        _gather(es, size, lambda e: e.magic_def_multiplier, np.int64),
+        _gather(es, size, lambda e: e.magic_resistance_percent, np.int64),
+    )
+    valid = expected_hits > 0
+    if not valid.any():
+        return _zeros_result(size)
+
+    if use_expectation:
+        real_hits = expected_hits
+        dmg = _per_hit_damage(power, mdef, gen, True) * real_hits
+    else:
+        base_hits = np.floor(expected_hits)
+        frac = expected_hits - base_hits
+        real_hits = base_hits.astype(np.int64) + (gen.random(size) < frac)
+        max_hits = int(real_hits.max())
+        if max_hits > 0:
+            per_hit = _per_hit_damage(
+                power[:, None], mdef[:, None], gen, False, shape=(size, max_hits)
+            )
+            mask = np.arange(max_hits)[None, :] < real_hits[:, None]
+            dmg = (per_hit * mask).sum(axis=1)
+        else:
+            dmg = np.zeros(size, dtype=np.int64)
+
+    dmg = _apply_element_relation_batch(
+        np.asarray(dmg).astype(np.int64), element_relation, size
+    )
+
+    split = np.broadcast_to(np.asarray(split_to_targets, dtype=np.int64), (size,))
+    dmg = np.where(split > 1, np.trunc(dmg / np.maximum(split, 1)).astype(np.int64), dmg)
+    dmg = np.maximum(dmg, 0)
+
+    return BatchAttackResult(
+        damage=np.where(valid, dmg, 0),
+        hit_count=np.where(valid, np.asarray(real_hits).round().astype(np.int64), 0),
+        is_critical=np.zeros(size, dtype=bool),
+        net_hits=np.where(valid, expected_hits, 0.0),
+    )
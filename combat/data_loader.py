@@ -2,12 +2,12 @@
 # data_loader: JSON読込み + マスタ定義
 
 # _load_named_index	共通：JSONを読み込み、top_key配下をname_keyでdict化
-# load_monsters	モンスターJSONをname→dictにして返す
+# load_monsters	モンスターJSONをname→dictにして返す（属性相性のビットマスクも前計算）
 # load_weapons	武器JSONをname→dictにして返す
 # load_armors	防具JSONをname→dictにして返す
 # load_spells	魔法JSONをname→dictにして返す
-# load_items	アイテムJSONをName→dictにして返す
-# load_jobs	ジョブJSONを読み込み、Jobオブジェクトの辞書を作成
+# load_items	アイテムJSONをName→dictにして返す（効果記述子 ItemEffect も前計算）
+# load_jobs	ジョブJSONを読み込み、Jobオブジェクトの辞書を作成（成長表 JobGrowthTable・JobProfile もここで前計算）
 # load_savedata	セーブデータJSONを読み込む
 # MASTER_SPELLS_BY_NAME(代入)	ff3_calc内部から魔法定義を名前で引けるようにするための共有キャッシュ
 # ============================================================
@@ -17,6 +17,10 @@ from pathlib import Path
 from typing import Dict, Any, Sequence
 
 from combat.models import Job, JobLevelStats, EquipmentSet, PartyMemberRuntime
+from combat.char_build import compile_job_growth
+from combat.elements import compile_monster_element_masks
+from combat.item_effects import compile_item_effects
+from combat.job_profile import compile_job_profile
 
 
 # ============================================================
@@ -35,8 +39,10 @@ def _load_named_index(
 
 
 def load_monsters(path: Path) -> Dict[str, Dict[str, Any]]:
-    """モンスター JSON を name → dict にして返す"""
-    return _load_named_index(path, top_key="monsters")
+    """モンスター JSON を name → dict にして返す（属性相性のビットマスクもここで前計算）"""
+    monsters = _load_named_index(path, top_key="monsters")
+    compile_monster_element_masks(monsters.values())  # ★追加
+    return monsters
 
 
 def load_weapons(path: Path) -> Dict[str, Dict[str, Any]]:
@@ -55,8 +61,10 @@ def load_spells(path: Path) -> Dict[str, Dict[str, Any]]:
 
 
 def load_items(path: Path) -> Dict[str, Dict[str, Any]]:
-    """アイテム JSON を Name → dict にして返す"""
-    return _load_named_index(path, top_key="items", name_key="Name")
+    """アイテム JSON を Name → dict にして返す（効果記述子 ItemEffect もここで前計算）"""
+    items = _load_named_index(path, top_key="items", name_key="Name")
+    compile_item_effects(items.values())  # ★追加
+    return items
 
 
 # ジョブJSONを読み込み、Jobオブジェクトの辞書を作成（データの“ロード”というより“ドメインモデルの組み立て）
@@ -88,6 +96,8 @@ def load_jobs(path: Path) -> Dict[str, Job]:
             earned=j.get("Earned", ""),
             stats_by_level=stats_by_level,
             raw=j,
+            growth=compile_job_growth(j["StatsByLevel"]),  # ★追加
+            profile=compile_job_profile(j, j["Name"]),  # ★追加
         )
 
     return jobs
@@ -3,6 +3,14 @@
 
 # parse_elements	"Air,Ice"/["Air",Ice]/None/"-"を想定してElementsを正規化
 # _expand_synonyms	属性名リストをシノニム展開してsetで返す
+# element_mask	属性名リスト（str/list/set）をシノニム展開済みのビットマスク（int）にする（入力ごとにキャッシュ）
+# mask_to_elements	ビットマスクを属性名（小文字, ソート済み）のリストに戻す
+# ElementMasks	弱点/耐性/吸収/無効の4つのビットマスク
+# resolve_element_relation	攻撃属性のビットマスクと ElementMasks から属性相性とヒット属性を求める（ビット演算のみ）
+# monster_element_masks	モンスターのElementalVulnerabilityをElementMasksにする（ElementalVulnerabilityごとに1回だけ）
+# char_element_masks	キャラの elemental_* を ElementMasks にする
+# compile_monster_element_masks	モンスター定義をまとめて ElementMasks に前計算する（ロード時）
+# invalidate_element_masks	属性マスクのキャッシュを捨てる（マスタ変更時）
 # element_relation_and_hits_generic	攻撃属性と弱点/耐性/吸収/無効テーブルから属性相性とヒット属性集合を求める汎用関数
 # element_relation_and_hits_for_monster	モンスターのElementalVulnerabilityと攻撃属性から属性相性とヒット属性を求めるラッパー,
 # element_relation_for_monster	モンスターに対する属性相性（relation）だけを取得する薄いラッパー
@@ -10,9 +18,14 @@
 # apply_element_relation_to_damage	属性相性（弱点/耐性/吸収/無効）に応じてダメージ値を補正する
 # elements_from_monster_spell	モンスターのスペル定義からElement/Elementsを解析し、属性リストに正規化して返すヘルパー
 # ============================================================
+# ・属性名は初めて出てきた順に1ビットずつ割り当てる（シノニムは展開してから立てるので air と wind は両方のビット）。
+#   「展開した集合どうしの積集合」がそのまま「マスクの AND」になるので、相性・ヒット属性は従来の set 演算と同じ結果
+# ・ElementalVulnerability の dict はマスタ（enemy_build は浅いコピー）で共有されるので、dict ごとに1回だけ変換する。
+#   マスタの ElementalVulnerability を書き換えた場合は invalidate_element_masks() を呼ぶ
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Dict, Any, Iterable
 
 from combat.constants import _ELEMENT_SYNONYMS
@@ -35,7 +48,8 @@ def parse_elements(raw_elems) -> list[str]:
 
     if isinstance(raw_elems, str):
         elems = [e.strip().lower() for e in raw_elems.split(",") if e.strip()]
-    elif isinstance(raw_elems, list):
+    # ★ tuple / set / frozenset（FinalCharacterStats.elemental_* など）も list と同じ扱い
+    elif isinstance(raw_elems, (list, tuple, set, frozenset)):
         elems = [str(e).strip().lower() for e in raw_elems if str(e).strip()]
     else:
         elems = []
@@ -55,6 +69,184 @@ def _expand_synonyms(elems: Iterable[str]) -> set[str]:
     return out
 
 
+# ============================================================
+# ★追加：属性ビットマスク（ロード時・初回に1回だけ変換して、相性判定はビット演算で行う）
+# ============================================================
+
+_ELEMENT_BITS: Dict[str, int] = {}  # 属性名（小文字）→ ビット
+_BIT_NAMES: list[str] = []  # ビット位置 → 属性名
+_MASK_CACHE: Dict[Any, int] = {}  # element_mask の入力 → マスク
+_MASK_CACHE_MAX = 4096
+
+
+def _element_bit(name: str) -> int:
+    bit = _ELEMENT_BITS.get(name)
+    if bit is None:
+        bit = 1 << len(_BIT_NAMES)
+        _ELEMENT_BITS[name] = bit
+        _BIT_NAMES.append(name)
+    return bit
+
+
+def _mask_cache_key(raw_elems) -> Any:
+    if isinstance(raw_elems, (str, frozenset)):
+        return raw_elems
+    if isinstance(raw_elems, (list, tuple)):
+        try:
+            key = tuple(raw_elems)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    if isinstance(raw_elems, set):
+        return frozenset(raw_elems)
+    return None
+
+
+def element_mask(raw_elems) -> int:
+    """
+    parse_elements と同じ入力（"Air, Ice" / ["Air","Ice"] / set / None / "-"）を
+    シノニム展開済みのビットマスクにする。同じ入力は2回目からキャッシュを引くだけ。
+    """
+    if not raw_elems or raw_elems == "-":
+        return 0
+
+    key = _mask_cache_key(raw_elems)
+    if key is not None:
+        mask = _MASK_CACHE.get(key)
+        if mask is not None:
+            return mask
+
+    mask = 0
+    for e in _expand_synonyms(parse_elements(raw_elems)):
+        mask |= _element_bit(e)
+
+    if key is not None:
+        if len(_MASK_CACHE) >= _MASK_CACHE_MAX:
+            _MASK_CACHE.clear()
+        _MASK_CACHE[key] = mask
+    return mask
+
+
+def mask_to_elements(mask: int) -> list[str]:
+    """ビットマスク → 属性名（小文字, ソート済み）"""
+    names = []
+    i = 0
+    while mask:
+        if mask & 1:
+            names.append(_BIT_NAMES[i])
+        mask >>= 1
+        i += 1
+    return sorted(names)
+
+
+@dataclass(slots=True, frozen=True)
+class ElementMasks:
+    """弱点/耐性/吸収/無効のビットマスク"""
+
+    weak: int = 0
+    resist: int = 0
+    absorb: int = 0
+    null: int = 0
+
+
+NO_ELEMENT_MASKS = ElementMasks()
+
+
+def resolve_element_relation(
+    attack_mask: int, masks: ElementMasks
+) -> tuple[ElementRelation, list[str]]:
+    """
+    攻撃属性のマスクと ElementMasks から (relation, hit_elements) を返す。
+    優先順位は 吸収 > 無効 > 弱点 > 耐性（element_relation_and_hits_generic と同じ）。
+    """
+    if not attack_mask:
+        return "normal", []
+    hit = attack_mask & masks.absorb
+    if hit:
+        return "absorb", mask_to_elements(hit)
+    hit = attack_mask & masks.null
+    if hit:
+        return "null", mask_to_elements(hit)
+    hit = attack_mask & masks.weak
+    if hit:
+        return "weak", mask_to_elements(hit)
+    hit = attack_mask & masks.resist
+    if hit:
+        return "resist", mask_to_elements(hit)
+    return "normal", []
+
+
+# ElementalVulnerability の dict の id → (その dict, マスク)。dict を保持するので id が再利用されることはない
+_MONSTER_MASKS: Dict[int, tuple[dict, ElementMasks]] = {}
+
+
+def monster_element_masks(monster: dict[str, Any]) -> ElementMasks:
+    """monster["ElementalVulnerability"] の ElementMasks（dict ごとに1回だけ変換）"""
+    ev = monster.get("ElementalVulnerability")
+    if not ev:
+        return NO_ELEMENT_MASKS
+
+    hit = _MONSTER_MASKS.get(id(ev))
+    if hit is not None and hit[0] is ev:
+        return hit[1]
+
+    masks = ElementMasks(
+        weak=element_mask(ev.get("Weakness")),
+        resist=element_mask(ev.get("Resistance")),
+        absorb=element_mask(ev.get("Absorb")),
+        null=element_mask(ev.get("Null")),
+    )
+    if len(_MONSTER_MASKS) >= _MASK_CACHE_MAX:
+        _MONSTER_MASKS.clear()
+    _MONSTER_MASKS[id(ev)] = (ev, masks)
+    return masks
+
+
+# (weaks, resists, absorbs, nulls) の frozenset 4つ組 → マスク（frozenset はハッシュを覚えているので引くのは軽い）
+_CHAR_MASKS: Dict[tuple, ElementMasks] = {}
+
+
+def char_element_masks(char: FinalCharacterStats) -> ElementMasks:
+    """キャラの elemental_*（frozenset）の ElementMasks（同じ組み合わせは1回だけ変換）"""
+    key = (
+        char.elemental_weaks,
+        char.elemental_resists,
+        char.elemental_absorbs,
+        char.elemental_nulls,
+    )
+    try:
+        masks = _CHAR_MASKS.get(key)
+    except TypeError:  # set などハッシュできない型が入っていたらキャッシュしない
+        key = None
+        masks = None
+    if masks is None:
+        masks = ElementMasks(
+            weak=element_mask(char.elemental_weaks),
+            resist=element_mask(char.elemental_resists),
+            absorb=element_mask(char.elemental_absorbs),
+            null=element_mask(char.elemental_nulls),
+        )
+        if key is not None:
+            if len(_CHAR_MASKS) >= _MASK_CACHE_MAX:
+                _CHAR_MASKS.clear()
+            _CHAR_MASKS[key] = masks
+    return masks
+
+
+def compile_monster_element_masks(monsters: Iterable[dict[str, Any]]) -> None:
+    """モンスター定義の ElementalVulnerability をまとめて ElementMasks にしておく（ロード時）"""
+    for monster in monsters:
+        monster_element_masks(monster)
+
+
+def invalidate_element_masks() -> None:
+    """マスクのキャッシュを捨てる（マスタの属性データを書き換えたとき）"""
+    _MASK_CACHE.clear()
+    _MONSTER_MASKS.clear()
+    _CHAR_MASKS.clear()
+
+
 def element_relation_and_hits_generic(
     attack_elements: list[str] | None,
     *,
@@ -67,25 +259,21 @@ def element_relation_and_hits_generic(
     弱点/耐性/吸収/無効の候補と attack_elements から
     (relation, hit_elements) を返す汎用関数。
     hit_elements はマッチした属性名（小文字, ソート済み）。
+    ★ 中身は element_mask + resolve_element_relation の薄いラッパ
     """
-    elems = _expand_synonyms(parse_elements(attack_elements))
-    if not elems:
+    attack_mask = element_mask(attack_elements)
+    if not attack_mask:
         return "normal", []
 
-    absorbs = _expand_synonyms(parse_elements(absorb))
-    nulls = _expand_synonyms(parse_elements(null))
-    resists = _expand_synonyms(parse_elements(resist))
-    weaks = _expand_synonyms(parse_elements(weak))
-
-    if elems & absorbs:
-        return "absorb", sorted(elems & absorbs)
-    if elems & nulls:
-        return "null", sorted(elems & nulls)
-    if elems & weaks:
-        return "weak", sorted(elems & weaks)
-    if elems & resists:
-        return "resist", sorted(elems & resists)
-    return "normal", []
+    return resolve_element_relation(
+        attack_mask,
+        ElementMasks(
+            weak=element_mask(weak),
+            resist=element_mask(resist),
+            absorb=element_mask(absorb),
+            null=element_mask(null),
+        ),
+    )
 
 
 # モンスター用ラッパ関数
@@ -97,14 +285,8 @@ def element_relation_and_hits_for_monster(
     monster["ElementalVulnerability"] と attack_elements から
     (relation, hit_elements) を返す。
     """
-    ev = monster.get("ElementalVulnerability", {}) or {}
-
-    return element_relation_and_hits_generic(
-        parse_elements(attack_elements),  # ★ 攻撃側も正規化
-        weak=parse_elements(ev.get("Weakness")),
-        resist=parse_elements(ev.get("Resistance")),
-        absorb=parse_elements(ev.get("Absorb")),
-        null=parse_elements(ev.get("Null")),
+    return resolve_element_relation(
+        element_mask(attack_elements), monster_element_masks(monster)
     )
 
 
@@ -141,13 +323,7 @@ def element_relation_and_hits_for_char(
     キャラの elemental_* と attack_elements から
     (relation, hit_elements) を返す。
     """
-    return element_relation_and_hits_generic(
-        attack_elements,
-        weak=char.elemental_weaks,
-        resist=char.elemental_resists,
-        absorb=char.elemental_absorbs,
-        null=char.elemental_nulls,
-    )
+    return resolve_element_relation(element_mask(attack_elements), char_element_masks(char))
 
 
 # 属性相性をダメージに反映
@@ -1,15 +1,132 @@
 # ============================================================
 # enemy_build: 敵構築
 
-# build_enemies	敵名リスト → EnemyRuntime 群を構築する
+# build_enemies	敵名リスト → EnemyRuntime 群を構築する（MonsterPrototype を複製するだけ）
+# MonsterPrototype	1モンスター分の前計算（enrich 済み JSON・FinalEnemyStats・スペル索引・属性マスク）。spawn で EnemyRuntime を作る
+# compile_monster_prototype	monsters.jsonの1モンスターdictからMonsterPrototypeを作る
+# monster_prototypes	モンスター定義 × 魔法DB ごとに1回だけ MonsterPrototype の表を作って使い回す
+# invalidate_monster_prototypes	MonsterPrototype の表を捨てる（マスタ変更時）
 # compute_enemy_base_agility	敵JSONから「行動順決定用の擬似Agility」を計算する
 # compute_enemy_final_stats	monsters.jsonの1モンスターdictからFinalEnemyStatsを作成
 # ============================================================
+# ・MonsterPrototype.json は全スポーン・全試行で共有する（clone_enemies_for_trial と同じく読み取り専用の扱い）
+# ・マスタ（enemy_defs_by_name / spells_by_name）の dict を差し替えれば表は作り直される。
+#   中身をその場で書き換えた場合は invalidate_monster_prototypes() を呼ぶ
 
-from typing import Dict, Any, List, Iterable, Optional
+import copy
+from dataclasses import dataclass
+from typing import Dict, Any, List, Iterable, Optional, Tuple
 
+from combat.elements import ElementMasks, monster_element_masks
 from combat.models import FinalEnemyStats, EnemyRuntime, BattleActorState
-from combat.spell_repo import enrich_monster_spells
+from combat.spell_repo import MonsterSpellIndex, enrich_monster_spells, monster_spell_index
+
+
+# ============================================================
+# ★追加：モンスターの前計算（MonsterPrototype）
+# ============================================================
+@dataclass(slots=True, frozen=True)
+class MonsterPrototype:
+    """1モンスター分の前計算。spawn() が EnemyRuntime を作る（stats / state だけ新しく作り、json は共有）"""
+
+    name: str
+    json: Dict[str, Any]  # enrich_monster_spells 済み（共有・読み取り専用）
+    stats: FinalEnemyStats  # difficulty=0 の最終ステータス（spawn でコピーする）
+    spells: MonsterSpellIndex
+    element_masks: ElementMasks
+    sprite_id: Optional[str] = None
+    is_boss: bool = False
+
+    def spawn(self, difficulty: int = 0) -> EnemyRuntime:
+        if difficulty:
+            stats = compute_enemy_final_stats(self.json, difficulty=difficulty)
+        else:
+            stats = copy.copy(self.stats)
+        return EnemyRuntime(
+            name=self.name,
+            sprite_id=self.sprite_id,
+            stats=stats,
+            state=BattleActorState(hp=stats.hp, max_hp=stats.hp),
+            json=self.json,
+            is_boss=self.is_boss,
+        )
+
+
+def compile_monster_prototype(
+    name: str,
+    raw_enemy_json: Dict[str, Any],
+    spells_by_name: Dict[str, Dict[str, Any]],
+) -> MonsterPrototype:
+    """monsters.json の 1 モンスター dict から MonsterPrototype を作る（従来の build_enemies 1体分の処理）"""
+    # ★ 純度を上げる（enrich が破壊的でも安全）
+    enemy_json = enrich_monster_spells(dict(raw_enemy_json), spells_by_name=spells_by_name)
+
+    sprite_id: Optional[str] = enemy_json.get("sprite_id")
+    if isinstance(sprite_id, str):
+        sprite_id = sprite_id.strip() or None
+    else:
+        sprite_id = None
+
+    # ★ボス判定：PlotBattles が存在し、空でないならボス扱い
+    plot_battles = enemy_json.get("PlotBattles")
+    is_boss = isinstance(plot_battles, list) and len(plot_battles) > 0
+
+    return MonsterPrototype(
+        name=name,
+        json=enemy_json,
+        stats=compute_enemy_final_stats(enemy_json),
+        spells=monster_spell_index(enemy_json),
+        element_masks=monster_element_masks(enemy_json),
+        sprite_id=sprite_id,
+        is_boss=is_boss,
+    )
+
+
+# (id(enemy_defs_by_name), id(spells_by_name)) → (2つの dict, 件数, {名前: MonsterPrototype})
+_PROTOTYPE_TABLES: Dict[
+    Tuple[int, int],
+    Tuple[Dict[str, Any], Dict[str, Any], Tuple[int, int], Dict[str, MonsterPrototype]],
+] = {}
+
+
+def monster_prototypes(
+    enemy_defs_by_name: Dict[str, Dict[str, Any]],
+    spells_by_name: Dict[str, Dict[str, Any]],
+    *,
+    names: Optional[Iterable[str]] = None,
+) -> Dict[str, MonsterPrototype]:
+    """
+    モンスター定義 × 魔法DB の組ごとの {名前: MonsterPrototype}。
+    names を渡すとその名前だけ（まだ無ければ）作る。None なら全モンスターを作る（ロード時の前計算用）。
+    """
+    key = (id(enemy_defs_by_name), id(spells_by_name))
+    sizes = (len(enemy_defs_by_name), len(spells_by_name))
+    hit = _PROTOTYPE_TABLES.get(key)
+    if (
+        hit is None
+        or hit[0] is not enemy_defs_by_name
+        or hit[1] is not spells_by_name
+        or hit[2] != sizes
+    ):
+        if len(_PROTOTYPE_TABLES) >= 16:
+            _PROTOTYPE_TABLES.clear()
+        hit = (enemy_defs_by_name, spells_by_name, sizes, {})
+        _PROTOTYPE_TABLES[key] = hit
+    table = hit[3]
+
+    for name in enemy_defs_by_name if names is None else names:
+        if name in table:
+            continue
+        try:
+            raw_enemy_json = enemy_defs_by_name[name]
+        except KeyError as e:
+            raise KeyError(f"enemy_defs_by_name に '{name}' が存在しません") from e
+        table[name] = compile_monster_prototype(name, raw_enemy_json, spells_by_name)
+    return table
+
+
+def invalidate_monster_prototypes() -> None:
+    _PROTOTYPE_TABLES.clear()
 
 
 # ============================================================
@@ -23,48 +140,9 @@ def build_enemies(
     enemy_names: Iterable[str],
     difficulty: int = 0,
 ) -> List[EnemyRuntime]:
-    enemies: List[EnemyRuntime] = []
-
-    for enemy_name in enemy_names:
-        try:
-            raw_enemy_json = enemy_defs_by_name[enemy_name]
-        except KeyError as e:
-            raise KeyError(
-                f"enemy_defs_by_name に '{enemy_name}' が存在しません"
-            ) from e
-
-        # ★ 純度を上げる（enrich が破壊的でも安全）
-        raw_enemy_json = dict(raw_enemy_json)
-
-        enemy_json = enrich_monster_spells(
-            raw_enemy_json, spells_by_name=spells_by_name
-        )
-
-        sprite_id: Optional[str] = enemy_json.get("sprite_id")
-        if isinstance(sprite_id, str):
-            sprite_id = sprite_id.strip() or None
-        else:
-            sprite_id = None
-
-        enemy_final = compute_enemy_final_stats(enemy_json, difficulty=difficulty)
-        enemy_state = BattleActorState(hp=enemy_final.hp, max_hp=enemy_final.hp)
-
-        # ★ボス判定：PlotBattles が存在し、空でないならボス扱い
-        plot_battles = enemy_json.get("PlotBattles")
-        is_boss = isinstance(plot_battles, list) and len(plot_battles) > 0
-
-        enemies.append(
-            EnemyRuntime(
-                name=enemy_name,
-                sprite_id=sprite_id,
-                stats=enemy_final,
-                state=enemy_state,
-                json=enemy_json,
-                is_boss=is_boss,  # ★追加
-            )
-        )
-
-    return enemies
+    enemy_names = list(enemy_names)
+    table = monster_prototypes(enemy_defs_by_name, spells_by_name, names=enemy_names)
+    return [table[name].spawn(difficulty) for name in enemy_names]
 
 
 # 敵の擬似 Agilityの作成（Level + Attack 回数 + 回避率 から作る）
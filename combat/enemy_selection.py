@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 
 def _safe_int(v: Any, default: int = 0) -> int:
@@ -101,12 +101,15 @@ def pick_enemy_names(
     *,
     k_min: int = 2,
     k_max: int = 6,
+    rng: Optional[random.Random] = None,
 ) -> List[str]:
     """
     仕様:
       - entry の候補に PlotBattles 持ち（ボス）が含まれるなら、ボスを 1 体だけ出す
       - それ以外は通常どおり 2〜4体を重複OKで出す
+      - rng を渡すとその乱数で抽選する（None ならモジュールの random）
     """
+    r = rng if rng is not None else random
     candidates = list(entry.monster_names)
     if not candidates:
         raise ValueError("この場所に紐づくモンスターがありません。")
@@ -123,13 +126,13 @@ def pick_enemy_names(
 
     # ボス候補がいる場所なら「ボス1体のみ」
     if bosses:
-        return [random.choice(bosses)]
+        return [r.choice(bosses)]
 
     # 通常：2〜4体、重複OK
     if k_min < 1 or k_max < k_min:
         raise ValueError("k_min/k_max の指定が不正です。")
-    k = random.randint(k_min, k_max)
-    return random.choices(normals if normals else candidates, k=k)
+    k = r.randint(k_min, k_max)
+    return r.choices(normals if normals else candidates, k=k)
 
 
 # パーティメンバーの平均レベルを計算
@@ -4,6 +4,7 @@
 # ElementRelation: 属性相性の結果を表すための型定義（通常/弱点/耐性/吸収/無効の5種）で、ダメージ補正やログ表示の基準となる
 # BattleKind: 戦闘コマンドの大分類（物理/魔法/アイテム/防御/逃走/特殊）を表す型定義で、行動分岐の基準に使われる
 # BattleEndReason: 戦闘処理全体の終了理由（継続/敵全滅/味方全滅/逃走/強制終了）を統一的に扱うための型定義
+# BattleMode: 戦闘の解決方式（random: 乱数で1戦を再現 / expected: 期待値で決定的に解決）
 # Status: 戦闘中に付与される状態異常の種類（毒・ブラインド・石化・KO・混乱・睡眠など）を列挙するEnum
 # ============================================================
 
@@ -34,6 +35,11 @@ BattleEndReason = Literal[
     "forced_end",  # イベントなどで強制終了したい時用（将来拡張）
 ]
 
+# 戦闘の解決方式
+#   random  : 従来どおり（ダメージ・命中・状態異常を乱数で判定）
+#   expected: ダメージは期待値（小数ヒット・平均ダメージ）、確率判定は ExpectedRandom で決定的に
+BattleMode = Literal["random", "expected"]
+
 
 class MagicType(str, Enum):
     BLACK = "Black Magic"
@@ -0,0 +1,221 @@
+# ============================================================
+# equip_index: ジョブ → スロット → 装備できる武器・防具の逆引き索引（装備候補・ジョブ変更時の装備チェック用）
+
+# EquipCandidate	装備候補1件（種別・正式名・定義・スロット判定用の情報・寄与＝ステータス要約）
+# JobEquipIndex	1ジョブ分の索引（スロット → 候補タプル / スロット → 装備できる正式名の集合）
+# EquipIndex	全ジョブ分の索引（EquippedBy の略号 → JobEquipIndex）
+# equip_code_for_job	Job から EquippedBy の略号を決める（JobProfile.equip_code → 短い slug → name）
+# equip_index	武器・防具マスタ（dict の組）ごとに1回だけ EquipIndex を作って使い回す
+# job_equip_index	Job の JobEquipIndex を返す
+# invalidate_equip_indexes	索引を捨てる（マスタ dict をその場で書き換えたとき）
+# ============================================================
+# ・装備可否の正は武器・防具の EquippedBy（patch_jobs_from_equippedby と同じ）。EquippedBy が空なら全ジョブ可
+# ・略号の比較は大小無視（scenes/menu の allowed_by_job と同じ）
+# ・スロットの規則は scenes/menu の build_equip_candidates と同じ
+#   main_hand: 武器 / off_hand: 両手武器以外の武器 + 盾 / head・body・arms: ArmorType が Helm・Armor・Gloves の防具
+# ・候補の並びはマスタの並び（武器 → 防具）。装備メニューの表示順を変えない
+# ・stats は char_build.item_stat_table の寄与（武器は weapon_stats、防具は armor_stats の戻り値）。共有なので書き換えないこと
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Union
+
+from combat.char_build import ArmorParts, WeaponParts, item_stat_table
+from combat.constants import JOB_EQUIP_CODE
+from combat.job_profile import job_profile
+
+EQUIP_SLOTS: Tuple[str, ...] = ("main_hand", "off_hand", "head", "body", "arms")
+
+# スロット → ArmorType（scenes/menu の SLOT_TO_ARMORTYPE と同じ対応）
+SLOT_ARMOR_TYPE = {
+    "off_hand": "Shield",
+    "head": "Helm",
+    "body": "Armor",
+    "arms": "Gloves",
+}
+
+
+@dataclass(slots=True, frozen=True)
+class EquipCandidate:
+    kind: str  # "weapon" | "armor"
+    name: str  # マスタのキー（正式名）
+    data: Dict[str, Any]  # マスタの定義 dict
+    codes: FrozenSet[str]  # EquippedBy の略号（小文字）。空なら全ジョブ可
+    two_handed: bool  # 武器の "Two-Handed" キーがある（off_hand の候補にしない）
+    armor_type: str  # 防具の ArmorType（武器は ""）
+    stats: Union[WeaponParts, ArmorParts]  # item_stat_table の寄与
+
+    def allowed_for(self, code: str) -> bool:
+        return not self.codes or code in self.codes
+
+
+@dataclass(slots=True, frozen=True)
+class JobEquipIndex:
+    code: str  # EquippedBy の略号（小文字）
+    slots: Dict[str, Tuple[EquipCandidate, ...]]  # スロット → 候補（マスタの並び）
+    names: Dict[str, FrozenSet[str]]  # スロット → 装備できる正式名
+
+    def candidates(self, slot: str) -> Tuple[EquipCandidate, ...]:
+        return self.slots.get(slot, ())
+
+    def can_equip(self, slot: str, name: Optional[str]) -> bool:
+        """name は正式名（表記ゆれは name_index.canonical_name で直してから渡す）"""
+        return name in self.names.get(slot, ())
+
+
+@dataclass(slots=True, frozen=True)
+class EquipIndex:
+    weapons_by_name: Dict[str, Dict[str, Any]]
+    armors_by_name: Dict[str, Dict[str, Any]]
+    weapon_count: int
+    armor_count: int
+    weapons: Tuple[EquipCandidate, ...]
+    armors: Tuple[EquipCandidate, ...]
+    by_code: Dict[str, JobEquipIndex]  # EquippedBy の略号（小文字）→ JobEquipIndex
+
+    def for_code(self, code: str) -> JobEquipIndex:
+        """略号 → JobEquipIndex（EquippedBy に出てこない略号なら初回にここで作る）"""
+        code = code.strip().lower()
+        index = self.by_code.get(code)
+        if index is None:
+            index = _compile_job_index(code, self.weapons, self.armors)
+            self.by_code[code] = index
+        return index
+
+
+def equip_code_for_job(job: Any) -> str:
+    """
+    Job → EquippedBy の略号。
+    JOB_EQUIP_CODE に載っているジョブはその略号、無ければ slug が "Wa" のような略号ならそれ、最後は name
+    """
+    code = job_profile(job).equip_code
+    if code:
+        return code
+    slug = (getattr(job, "slug", "") or "").strip()
+    if slug and len(slug) <= 3:
+        return slug
+    name = (getattr(job, "name", "") or "").strip()
+    return JOB_EQUIP_CODE.get(name, name)
+
+
+def _codes_of(item: Dict[str, Any]) -> FrozenSet[str]:
+    return frozenset(str(c).strip().lower() for c in (item.get("EquippedBy") or []))
+
+
+def _compile_job_index(
+    code: str,
+    weapons: Tuple[EquipCandidate, ...],
+    armors: Tuple[EquipCandidate, ...],
+) -> JobEquipIndex:
+    allowed_w = [c for c in weapons if c.allowed_for(code)]
+    allowed_a = [c for c in armors if c.allowed_for(code)]
+
+    slots: Dict[str, Tuple[EquipCandidate, ...]] = {
+        "main_hand": tuple(allowed_w),
+        "off_hand": tuple(
+            [c for c in allowed_w if not c.two_handed]
+            + [c for c in allowed_a if c.armor_type == "Shield"]
+        ),
+    }
+    for slot in ("head", "body", "arms"):
+        slots[slot] = tuple(c for c in allowed_a if c.armor_type == SLOT_ARMOR_TYPE[slot])
+
+    return JobEquipIndex(
+        code=code,
+        slots=slots,
+        names={slot: frozenset(c.name for c in cands) for slot, cands in slots.items()},
+    )
+
+
+def _compile_equip_index(
+    weapons_by_name: Dict[str, Dict[str, Any]],
+    armors_by_name: Dict[str, Dict[str, Any]],
+) -> EquipIndex:
+    table = item_stat_table(weapons_by_name, armors_by_name)
+
+    weapons = tuple(
+        EquipCandidate(
+            kind="weapon",
+            name=name,
+            data=w,
+            codes=_codes_of(w),
+            two_handed="Two-Handed" in w,  # 値は説明文なのでキー存在で判定
+            armor_type="",
+            stats=table.weapon(name),
+        )
+        for name, w in weapons_by_name.items()
+        if isinstance(w, dict)
+    )
+    armors = tuple(
+        EquipCandidate(
+            kind="armor",
+            name=name,
+            data=a,
+            codes=_codes_of(a),
+            two_handed=False,
+            armor_type=a.get("ArmorType") or "",
+            stats=table.armor(name),
+        )
+        for name, a in armors_by_name.items()
+        if isinstance(a, dict)
+    )
+
+    # EquippedBy に出てくる略号 + 既知のジョブの略号は最初に全部作っておく
+    codes = {code.lower() for code in JOB_EQUIP_CODE.values()}
+    for c in weapons + armors:
+        codes |= c.codes
+    by_code = {code: _compile_job_index(code, weapons, armors) for code in sorted(codes)}
+
+    return EquipIndex(
+        weapons_by_name=weapons_by_name,
+        armors_by_name=armors_by_name,
+        weapon_count=len(weapons_by_name),
+        armor_count=len(armors_by_name),
+        weapons=weapons,
+        armors=armors,
+        by_code=by_code,
+    )
+
+
+# (id(武器マスタ), id(防具マスタ)) → EquipIndex。EquipIndex が dict を保持するので id が再利用されることはない
+_INDEXES: Dict[Tuple[int, int], EquipIndex] = {}
+_INDEXES_MAX = 16
+
+
+def equip_index(
+    weapons_by_name: Dict[str, Dict[str, Any]],
+    armors_by_name: Dict[str, Dict[str, Any]],
+) -> EquipIndex:
+    """
+    武器・防具マスタの EquipIndex（dict の組ごとに1回だけ作る）。
+    件数が変わっていたら作り直す（件数を変えずに中身を書き換えたときは invalidate_equip_indexes() を呼ぶ）
+    """
+    key = (id(weapons_by_name), id(armors_by_name))
+    index = _INDEXES.get(key)
+    if (
+        index is not None
+        and index.weapons_by_name is weapons_by_name
+        and index.armors_by_name is armors_by_name
+        and index.weapon_count == len(weapons_by_name)
+        and index.armor_count == len(armors_by_name)
+    ):
+        return index
+    index = _compile_equip_index(weapons_by_name, armors_by_name)
+    if len(_INDEXES) >= _INDEXES_MAX:
+        _INDEXES.clear()
+    _INDEXES[key] = index
+    return index
+
+
+def job_equip_index(
+    job: Any,
+    weapons_by_name: Dict[str, Dict[str, Any]],
+    armors_by_name: Dict[str, Dict[str, Any]],
+) -> JobEquipIndex:
+    """Job → JobEquipIndex（スロットごとの候補・装備可否が dict を引くだけになる）"""
+    return equip_index(weapons_by_name, armors_by_name).for_code(equip_code_for_job(job))
+
+
+def invalidate_equip_indexes() -> None:
+    _INDEXES.clear()
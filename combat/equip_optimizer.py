@@ -0,0 +1,562 @@
+# ============================================================
+# equip_optimizer: 1人分の装備（EquipmentSet）を敵編成 / ロケーションに対して探索する（python -m combat.equip_optimizer）
+
+# SlotTable	武器・防具ごとの寄与（char_build.item_stat_table）にスロット判定用の ArmorType を添えた表
+# owned_equipment	セーブの所持品 + 本人の現在装備から、装備品の所持数を数える
+# legal_candidates	ジョブが装備できる候補をスロットごとに列挙する（apply_job_equipment_restrictions と同じ規則）
+# prune_dominated	同じスロット内で、他の候補に全項目で負けている候補を落とす
+# expected_fight_damage	「たたかう」1回の期待ダメージ（敵の平均）
+# expected_damage_taken	敵の物理攻撃1回あたりの期待被ダメージ（敵の平均）
+# EquipSearchResult	optimize_equipment の戻り値
+# optimize_equipment	目的（damage / survival / win_rate）が最良になる EquipmentSet を探す
+# main	CLI エントリポイント
+# ============================================================
+# ・評価は final_stats_from_parts にスロットごとの寄与を渡すだけで、候補ごとに名前を引き直さない
+# ・「たたかう」は右手（main_hand）だけで殴る（battle_sim と同じ）ので、
+#   与ダメージは main_hand だけ、被ダメージは off_hand（盾）/ head / body / arms だけで決まる。
+#   それぞれを別に評価してから組み合わせるので、組み合わせ1つあたりはタプルの比較だけ
+# ・off_hand の候補は「なし」と盾。左手の武器は戦闘で使われないので候補にしない
+# ・両手武器を右手に持つときは off_hand を空ける
+# ・win_rate は damage / survival の上位候補（shortlist）だけを、全候補同じシードでシミュレーションして比べる
+# ・装備可否はパーティ構築時に実際に効く apply_job_equipment_restrictions の規則（JobProfile の武器・防具名）に合わせる。
+#   EquippedBy から補完済みなので、EquippedBy が空の防具（Rusty Mail。equip_index では全ジョブ可）を除いて equip_index と同じ結果になる
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import math
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from random import Random
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from combat.battle_sim import BattlePolicy, simulate_many_battles_multi_party
+from combat.char_build import (
+    ArmorParts,
+    WeaponParts,
+    build_party_members_from_save,
+    equipment_summary,
+    final_stats_from_parts,
+    item_stat_table,
+)
+from combat.elements import element_relation_and_hits_for_monster
+from combat.enemy_build import build_enemies
+from combat.enemy_selection import build_location_index, pick_enemy_names
+from combat.job_profile import job_profile
+from combat.models import (
+    BaseCharacter,
+    EnemyRuntime,
+    EquipmentSet,
+    FinalCharacterStats,
+    Job,
+    PartyMemberRuntime,
+)
+from combat.phys_damage import physical_damage_char_to_enemy, physical_damage_enemy_to_char
+from combat.runtime_state import RuntimeState, init_runtime_state
+from combat.verbosity import QUIET, verbosity
+from system.exp_system import LevelTable
+from utils.name_normalize import normalize_name
+
+OBJECTIVES: Tuple[str, ...] = ("damage", "survival", "win_rate")
+EQUIP_SLOTS: Tuple[str, ...] = ("main_hand", "off_hand", "head", "body", "arms")
+
+# スロット → ArmorType（scenes/menu の SLOT_TO_ARMORTYPE と同じ対応）
+_SLOT_ARMOR_TYPE = {
+    "off_hand": "Shield",
+    "head": "Helm",
+    "body": "Armor",
+    "arms": "Gloves",
+}
+
+NO_WEAPON: WeaponParts = (0, 0, False, False, [])
+NO_ARMOR: ArmorParts = (0, 0.0, 0, False, [], [], [])
+
+
+@dataclass
+class SlotTable:
+    """
+    正規化名 → 寄与（weapon_stats / armor_stats の戻り値）の表。
+    マスタデータから1回だけ作り、候補の評価ではこの表を引くだけにする。
+    """
+
+    weapons: Dict[str, WeaponParts]
+    armors: Dict[str, ArmorParts]
+    armor_types: Dict[str, str]
+    weapon_names: List[str]
+    armor_names: List[str]
+
+    @classmethod
+    def from_master(
+        cls,
+        weapons_by_name: Dict[str, Dict[str, Any]],
+        armors_by_name: Dict[str, Dict[str, Any]],
+    ) -> "SlotTable":
+        items = item_stat_table(weapons_by_name, armors_by_name)
+        return cls(
+            weapons=items.weapons,
+            armors=items.armors,
+            armor_types={
+                normalize_name(n): str(a.get("ArmorType") or "")
+                for n, a in armors_by_name.items()
+            },
+            weapon_names=list(weapons_by_name),
+            armor_names=list(armors_by_name),
+        )
+
+    def weapon(self, name: Optional[str]) -> WeaponParts:
+        if not name:
+            return NO_WEAPON
+        return self.weapons.get(normalize_name(name), NO_WEAPON)
+
+    def armor(self, name: Optional[str]) -> ArmorParts:
+        if not name:
+            return NO_ARMOR
+        return self.armors.get(normalize_name(name), NO_ARMOR)
+
+    def armor_type(self, name: str) -> str:
+        return self.armor_types.get(normalize_name(name), "")
+
+    def final_stats(
+        self, base: BaseCharacter, eq: EquipmentSet, job_name: Optional[str] = None
+    ) -> FinalCharacterStats:
+        """compute_character_final_stats と同じ結果を、表を引くだけで作る"""
+        return final_stats_from_parts(
+            base,
+            self.weapon(eq.main_hand),
+            self.weapon(eq.off_hand),
+            [self.armor(n) for n in (eq.off_hand, eq.head, eq.body, eq.arms)],
+            job_name=job_name,
+        )
+
+
+def owned_equipment(save: Dict[str, Any], member: PartyMemberRuntime) -> Dict[str, int]:
+    """
+    save["inventory"] の全カテゴリ + member の現在装備を数える（装備品以外も入るが、候補側で絞る）。
+    他のメンバーが装備中のものは数えない。
+    """
+    owned: Dict[str, int] = {}
+    for bucket in (save.get("inventory") or {}).values():
+        if not isinstance(bucket, dict):
+            continue
+        for name, qty in bucket.items():
+            try:
+                n = int(qty)
+            except (TypeError, ValueError):
+                continue
+            if n > 0:
+                owned[name] = owned.get(name, 0) + n
+    eq = member.equipment or EquipmentSet()
+    for slot in EQUIP_SLOTS:
+        name = getattr(eq, slot)
+        if name:
+            owned[name] = owned.get(name, 0) + 1
+    return owned
+
+
+def legal_candidates(
+    job: Job,
+    table: SlotTable,
+    owned: Optional[Mapping[str, int]] = None,
+) -> Dict[str, List[Optional[str]]]:
+    """
+    スロット → 候補名のリスト（先頭は常に None =「なし」）。
+    job が装備できない物（apply_job_equipment_restrictions で外される物）と、
+    owned を渡したときに所持数 0 の物は除く。
+    """
+
+    profile = job_profile(job)  # ★装備可能名は JobProfile に前計算済み
+
+    def allowed(slot: str, name: str) -> bool:
+        if owned is not None and owned.get(name, 0) <= 0:
+            return False
+        if slot == "main_hand":
+            return profile.can_equip_weapon(name)
+        if slot == "off_hand":
+            return profile.can_equip_weapon(name) or profile.can_equip_armor(name)
+        return profile.can_equip_armor(name)
+
+    out: Dict[str, List[Optional[str]]] = {
+        "main_hand": [None] + [n for n in table.weapon_names if allowed("main_hand", n)]
+    }
+    for slot, armor_type in _SLOT_ARMOR_TYPE.items():
+        out[slot] = [None] + [
+            n
+            for n in table.armor_names
+            if table.armor_type(n) == armor_type and allowed(slot, n)
+        ]
+    return out
+
+
+def _effective_weapon(
+    parts: WeaponParts, base: BaseCharacter, job_name: Optional[str]
+) -> WeaponParts:
+    # 素手の Black Belt / Monk は素手補正込みの値で比べる（final_stats_from_parts と同じ式）
+    if parts[0] == 0 and job_name in ("Black Belt", "Monk"):
+        return (1 + math.ceil(base.level * 1.5), 80, False, False, [])
+    return parts
+
+
+def _weapon_dominates(a: WeaponParts, b: WeaponParts) -> bool:
+    a_pow, a_acc, a_two, a_long, a_elems = a
+    b_pow, b_acc, b_two, b_long, b_elems = b
+    return (
+        a_pow >= b_pow
+        and a_acc >= b_acc
+        and (a_long or not b_long)
+        and (b_two or not a_two)
+        and set(a_elems) == set(b_elems)  # 属性は敵次第で得にも損にもなるので同じ物どうしだけ比べる
+    )
+
+
+def _armor_dominates(a: ArmorParts, b: ArmorParts) -> bool:
+    a_def, a_eva, a_mdef, a_shield, a_res, a_null, a_imm = a
+    b_def, b_eva, b_mdef, b_shield, b_res, b_null, b_imm = b
+    return (
+        a_def >= b_def
+        and a_eva >= b_eva
+        and a_mdef >= b_mdef
+        and a_shield == b_shield
+        and set(a_res) >= set(b_res)
+        and set(a_null) >= set(b_null)
+        and set(a_imm) >= set(b_imm)
+    )
+
+
+def prune_dominated(
+    slot: str,
+    names: Sequence[Optional[str]],
+    table: SlotTable,
+    base: BaseCharacter,
+    job_name: Optional[str] = None,
+) -> List[Optional[str]]:
+    """
+    他の候補に全項目で負けている（同点も含む）候補を落とす。寄与がまったく同じ候補は先に出た方を残す。
+    None（なし）も、何かに負けていれば落ちる（素手の Black Belt / Monk は素手補正込みで比べる）。
+    """
+    if slot == "main_hand":
+        parts = [_effective_weapon(table.weapon(n), base, job_name) for n in names]
+        dominates = _weapon_dominates
+    else:
+        parts = [table.armor(n) for n in names]
+        dominates = _armor_dominates
+
+    kept: List[Optional[str]] = []
+    for i, p in enumerate(parts):
+        beaten = False
+        for j, q in enumerate(parts):
+            if i == j or not dominates(q, p):
+                continue
+            # 同点どうしは先に出た方を残す
+            if dominates(p, q) and i < j:
+                continue
+            beaten = True
+            break
+        if not beaten:
+            kept.append(names[i])
+    return kept
+
+
+def expected_fight_damage(
+    stats: FinalCharacterStats, enemies: Sequence[EnemyRuntime]
+) -> float:
+    """右手の「たたかう」1回の期待ダメージ（期待値モード、属性相性込み）の敵平均"""
+    if not enemies:
+        return 0.0
+    total = 0
+    for em in enemies:
+        relation, _ = element_relation_and_hits_for_monster(
+            em.json, stats.main_weapon_elements
+        )
+        total += physical_damage_char_to_enemy(
+            stats, em.stats, hand="main", element_relation=relation, use_expectation=True
+        ).damage
+    return total / len(enemies)
+
+
+def expected_damage_taken(
+    stats: FinalCharacterStats, enemies: Sequence[EnemyRuntime]
+) -> float:
+    """敵の物理攻撃1回あたりの期待被ダメージ（期待値モード）の敵平均"""
+    if not enemies:
+        return 0.0
+    total = 0
+    for em in enemies:
+        total += int(physical_damage_enemy_to_char(em.stats, stats, use_expectation=True))
+    return total / len(enemies)
+
+
+@dataclass
+class EquipSearchResult:
+    member: str
+    objective: str
+    equipment: EquipmentSet
+    stats: FinalCharacterStats
+    expected_damage: float
+    expected_damage_taken: float
+    win_rate: Optional[float] = None
+    # スロット → (装備可能な候補数, 枝刈り後の候補数)
+    candidates: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    search_space: int = 0  # 枝刈り前の組み合わせ数
+    combinations: int = 0  # 実際に比べた組み合わせ数
+    simulated: int = 0  # win_rate でシミュレーションした候補数
+
+
+def _resolve_targets(
+    state: RuntimeState,
+    enemy_names: Optional[Sequence[str]],
+    location: Optional[str],
+) -> Tuple[List[str], Any]:
+    if (enemy_names is None) == (location is None):
+        raise ValueError("enemy_names と location はどちらか一方だけ指定してください")
+    if enemy_names is not None:
+        names = [n for n in enemy_names if n]
+        if not names:
+            raise ValueError("enemy_names が空です")
+        return names, None
+    for entry in build_location_index(state.monsters):
+        if entry.location == location:
+            return list(entry.monster_names), entry
+    raise KeyError(f"ロケーション {location} が見つかりません")
+
+
+def optimize_equipment(
+    member: PartyMemberRuntime,
+    *,
+    enemy_names: Optional[Sequence[str]] = None,
+    location: Optional[str] = None,
+    objective: str = "damage",
+    state: Optional[RuntimeState] = None,
+    table: Optional[SlotTable] = None,
+    owned: Optional[Mapping[str, int]] = None,
+    party: Optional[Sequence[PartyMemberRuntime]] = None,
+    policy: Optional[BattlePolicy] = None,
+    spells_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    n_trials: int = 200,
+    shortlist: int = 8,
+    n_formations: int = 4,
+    seed: Optional[int] = 0,
+    max_rounds: int = 50,
+    difficulty: int = 0,
+) -> EquipSearchResult:
+    """
+    member の装備を、enemy_names（敵編成）か location（ロケーションの出現モンスター）に対して探す。
+
+    objective:
+      damage    「たたかう」の期待与ダメージ最大（同点は被ダメージが小さい方）
+      survival  物理攻撃1回あたりの期待被ダメージ最小（同点は魔法防御・与ダメージが大きい方）
+      win_rate  damage / survival それぞれの上位 shortlist 件を party（省略時は member 1人）で
+                n_trials 回ずつ戦わせ、勝率最大（同点は平均ラウンド数が少ない方）
+                location 指定時は pick_enemy_names で n_formations 編成を抽選して試行を分ける
+    owned: 名前 → 所持数。渡すと所持している物だけを候補にする（owned_equipment 参照）
+    member / party / state.save は変更しない。
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective は {', '.join(OBJECTIVES)} のいずれかです: {objective}")
+    if state is None:
+        from combat.runtime_state import get_state
+
+        state = get_state()
+    if table is None:
+        table = SlotTable.from_master(state.weapons, state.armors)
+
+    names, loc_entry = _resolve_targets(state, enemy_names, location)
+    with verbosity(QUIET):
+        enemies = build_enemies(
+            enemy_defs_by_name=state.monsters,
+            spells_by_name=state.spells,
+            enemy_names=names,
+            difficulty=difficulty,
+        )
+
+    base = member.base
+    job_name = member.job.name
+    legal = legal_candidates(member.job, table, owned)
+    kept = {s: prune_dominated(s, legal[s], table, base, job_name) for s in EQUIP_SLOTS}
+
+    search_space = 1
+    for s in EQUIP_SLOTS:
+        search_space *= len(legal[s])
+
+    # --- 右手：与ダメージは右手だけで決まる ---
+    damage_by_main: Dict[Optional[str], float] = {}
+    for name in kept["main_hand"]:
+        stats = final_stats_from_parts(base, table.weapon(name), NO_WEAPON, (), job_name)
+        damage_by_main[name] = expected_fight_damage(stats, enemies)
+
+    # --- 盾 / 頭 / 体 / 腕：被ダメージは防具だけで決まる（部分和を持ちながら積み上げる） ---
+    armor_rows: List[Tuple[Tuple[Optional[str], ...], float, int]] = []
+    for shield in kept["off_hand"]:
+        p_shield = [table.armor(shield)]
+        for head in kept["head"]:
+            p_head = p_shield + [table.armor(head)]
+            for body in kept["body"]:
+                p_body = p_head + [table.armor(body)]
+                for arms in kept["arms"]:
+                    stats = final_stats_from_parts(
+                        base, NO_WEAPON, NO_WEAPON, p_body + [table.armor(arms)], job_name
+                    )
+                    armor_rows.append(
+                        (
+                            (shield, head, body, arms),
+                            expected_damage_taken(stats, enemies),
+                            stats.magic_defense,
+                        )
+                    )
+
+    # --- 組み合わせ：両手武器なら off_hand は空 ---
+    scored: List[Tuple[Tuple[float, ...], Tuple[float, ...], EquipmentSet]] = []
+    for main, dmg in damage_by_main.items():
+        two_handed = table.weapon(main)[2]
+        for (shield, head, body, arms), taken, mdef in armor_rows:
+            if two_handed and shield is not None:
+                continue
+            eq = EquipmentSet(main_hand=main, off_hand=shield, head=head, body=body, arms=arms)
+            scored.append(((dmg, -taken, mdef), (-taken, mdef, dmg), eq))
+
+    if not scored:
+        raise ValueError(f"{member.name} の装備候補がありません")
+
+    if objective == "damage":
+        best_eq = max(scored, key=lambda r: r[0])[2]
+    elif objective == "survival":
+        best_eq = max(scored, key=lambda r: r[1])[2]
+
+    win_rate: Optional[float] = None
+    simulated = 0
+    if objective == "win_rate":
+        short: List[EquipmentSet] = []
+        for key in (lambda r: r[0], lambda r: r[1]):
+            for row in sorted(scored, key=key, reverse=True)[: max(1, shortlist)]:
+                if row[2] not in short:
+                    short.append(row[2])
+
+        rng = Random(seed)
+        if loc_entry is not None:
+            formations = [
+                pick_enemy_names(loc_entry, state.monsters, rng=rng)
+                for _ in range(max(1, n_formations))
+            ]
+        else:
+            formations = [names]
+        per_formation = max(1, n_trials // len(formations))
+        seeds = [rng.getrandbits(32) for _ in formations]
+        team = list(party) if party is not None else [member]
+        if not any(pm is member for pm in team):
+            raise ValueError(f"party に {member.name} がいません")
+
+        best_key: Optional[Tuple[float, float]] = None
+        best_eq = short[0]
+        for eq in short:
+            variant = dataclasses.replace(
+                member, equipment=eq, stats=table.final_stats(base, eq, job_name)
+            )
+            trial_party = [variant if pm is member else pm for pm in team]
+            wins = rounds = trials = 0
+            for formation, formation_seed in zip(formations, seeds):
+                # 全候補で同じシード（共通乱数）なので、差は装備の違いによる分だけになる
+                res = simulate_many_battles_multi_party(
+                    trial_party,
+                    formation,
+                    per_formation,
+                    policy=policy,
+                    seed=formation_seed,
+                    state=state,
+                    spells_by_name=spells_by_name,
+                    max_rounds=max_rounds,
+                    difficulty=difficulty,
+                )
+                wins += res["wins_char"]
+                rounds += res["average_turns"] * res["trials"]
+                trials += res["trials"]
+            simulated += 1
+            key = (wins / trials, -rounds / trials)
+            if best_key is None or key > best_key:
+                best_key, best_eq = key, eq
+        win_rate = best_key[0] if best_key is not None else None
+
+    stats = table.final_stats(base, best_eq, job_name)
+    return EquipSearchResult(
+        member=member.name,
+        objective=objective,
+        equipment=best_eq,
+        stats=stats,
+        expected_damage=expected_fight_damage(stats, enemies),
+        expected_damage_taken=expected_damage_taken(stats, enemies),
+        win_rate=win_rate,
+        candidates={s: (len(legal[s]), len(kept[s])) for s in EQUIP_SLOTS},
+        search_space=search_space,
+        combinations=len(scored),
+        simulated=simulated,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m combat.equip_optimizer",
+        description="セーブのパーティ1人の装備を、敵編成 / ロケーションに対して探索する",
+    )
+    parser.add_argument("--member", required=True, help="パーティメンバー名")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--enemies", help="敵編成（カンマ区切り）")
+    target.add_argument("--location", help="ロケーション名")
+    parser.add_argument("--objective", choices=OBJECTIVES, default="damage")
+    parser.add_argument(
+        "--owned", action="store_true", help="所持品 + 現在装備だけを候補にする"
+    )
+    parser.add_argument("--trials", type=int, default=200, help="win_rate の候補ごとの試行数")
+    parser.add_argument("--shortlist", type=int, default=8, help="win_rate で試す上位候補数")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--base-dir", default=".", help="assets/data のあるディレクトリ")
+    args = parser.parse_args(argv)
+
+    base_dir = Path(args.base_dir)
+    state = init_runtime_state(base_dir)
+    with verbosity(QUIET):
+        party = build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=LevelTable(str(base_dir / "assets/data/level_exp.csv")),
+        )
+    member = next((pm for pm in party if pm.name == args.member), None)
+    if member is None:
+        parser.error(f"パーティに {args.member} がいません")
+
+    enemy_names = (
+        [n.strip() for n in args.enemies.split(",") if n.strip()] if args.enemies else None
+    )
+    result = optimize_equipment(
+        member,
+        enemy_names=enemy_names,
+        location=args.location,
+        objective=args.objective,
+        state=state,
+        owned=owned_equipment(state.save, member) if args.owned else None,
+        party=party,
+        n_trials=args.trials,
+        shortlist=args.shortlist,
+        seed=args.seed,
+    )
+
+    print(f"{result.member} ({member.job.name}) objective={result.objective}")
+    print("  現在:")
+    print(equipment_summary(member.equipment or EquipmentSet()))
+    print("  候補:")
+    print(equipment_summary(result.equipment))
+    print(
+        f"  期待与ダメージ {result.expected_damage:.1f} / 期待被ダメージ {result.expected_damage_taken:.1f}"
+        + (f" / 勝率 {result.win_rate:.3f}" if result.win_rate is not None else "")
+    )
+    print(
+        "  候補数 "
+        + " ".join(f"{s}={n}->{k}" for s, (n, k) in result.candidates.items())
+        + f" 組み合わせ {result.search_space} -> {result.combinations}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+# ============================================================
+# expected_mode: 期待値モード（mode="expected"）用の決定的な乱数
+
+# ExpectedRandom	random.Random 互換。黄金比の加法列を返し、同じ戦闘は常に同じ結果になる
+# uses_expectation	mode が期待値モードか（ダメージ関数の use_expectation に渡す値）
+# rng_for_mode	mode に合った rng を返す（expected なら ExpectedRandom を新規作成）
+# ============================================================
+# 期待値モードでは
+#   ・ダメージは use_expectation=True（小数ヒット・平均ダメージ、クリティカルなし）
+#   ・命中/状態異常/行動選択などの確率判定は ExpectedRandom で行う
+# ExpectedRandom は [0,1) を偏りなく埋める低食い違い列なので、確率 p の判定は
+# 戦闘を通して「だいたい p の割合で」成功する（確率で重み付けした適用になる）。
+# 1戦ごとに新しい ExpectedRandom を作ること（列の位置が結果に影響するため）。
+
+from __future__ import annotations
+
+import math
+from random import Random
+from typing import Any, Optional
+
+from combat.enums import BattleMode
+
+
+class ExpectedRandom(Random):
+    """
+    random() が 0.5, 0.118, 0.736, ... と黄金比ずつ進む列を返す Random。
+    randint / choice / uniform / shuffle などは random() 経由で動く。
+    ★ 標準の random() ベース実装は int(r * 2**63) % n なので下位ビット依存で列の性質が崩れる
+      → _randbelow を int(r * n) に差し替える。
+    """
+
+    _STEP = (math.sqrt(5.0) - 1.0) / 2.0
+
+    def __init__(self, start: float = 0.5):
+        self._start = start % 1.0
+        self._x = self._start
+        super().__init__(0)
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        super().seed(a, version)
+        self._x = getattr(self, "_start", 0.5)
+
+    def random(self) -> float:
+        v = self._x
+        self._x = (self._x + self._STEP) % 1.0
+        return v
+
+    def _randbelow(self, n: int) -> int:
+        return min(int(self.random() * n), n - 1) if n > 0 else 0
+
+    def getstate(self) -> tuple:
+        return (super().getstate(), self._x)
+
+    def setstate(self, state: tuple) -> None:
+        base, self._x = state
+        super().setstate(base)
+
+
+def uses_expectation(mode: BattleMode) -> bool:
+    if mode not in ("random", "expected"):
+        raise ValueError(f"不正な mode です: {mode}")
+    return mode == "expected"
+
+
+def rng_for_mode(mode: BattleMode, rng: Optional[Random] = None) -> Random:
+    """expected なら ExpectedRandom（渡された rng が ExpectedRandom ならそれを使う）"""
+    if uses_expectation(mode):
+        return rng if isinstance(rng, ExpectedRandom) else ExpectedRandom()
+    return rng if rng is not None else Random()
@@ -3,8 +3,8 @@
 
 # normalize_battle_command	バトルコマンド文字列をBattleKindに正規化
 # choose_magic	Lv別の魔法一覧を表示し、ユーザーに番号入力で魔法を選ばせて選択された魔法名を返す
-# categorize_anywhere_item	アイテムのEffectテキストからキーワードを判定し、Anywhereアイテムをカテゴリ名に割り振る。
-# categorize_combat_item	アイテムのEffectテキストからキーワードを判定し、Combatアイテムをカテゴリ名に割り振る。
+# categorize_anywhere_item	アイテムのEffectテキストからキーワードを判定し、Anywhereアイテムをカテゴリ名に割り振る。（item_effects に委譲）
+# categorize_combat_item	アイテムのEffectテキストからキーワードを判定し、Combatアイテムをカテゴリ名に割り振る。（item_effects に委譲）
 # build_grouped_item_menu	Anywhere/Combat別、細分別に表示順のアイテム名リスト（番号→名前対応用）を返す。
 # choose_item	効果別にグループ化されたアイテムメニューを表示し、ユーザーに番号で選ばせて選択されたアイテム名を返す
 # ask_action_for_member	戦闘コマンドをインタラクティブに入力させてPlannedActionを組み立てて返す関数
@@ -34,6 +34,12 @@ from combat.life_check import (
     first_alive_enemy_index,
 )
 from combat.inventory import build_item_list, is_item_visible_in_context
+from combat.job_profile import job_profile
+from combat.item_effects import (
+    anywhere_item_category,
+    combat_item_category,
+    item_effect,
+)
 
 
 # 1) コマンド正規化 ===========================================================================
@@ -93,23 +99,11 @@ def choose_magic(char_state: BattleActorState, magic_list) -> str:
 
 
 def categorize_anywhere_item(effect_text: str) -> str:
-    e = effect_text.lower()
-    if "revive from ko" in e:
-        return "Revive"
-    if "cure " in e:
-        return "Cure"
-    if "restore" in e:
-        return "Restore"
-    return "Other"
+    return anywhere_item_category(effect_text)
 
 
 def categorize_combat_item(effect_text: str) -> str:
-    e = effect_text.lower()
-    if "deal" in e and "damage" in e:
-        return "Damage"
-    if "inflict " in e:
-        return "Inflict"
-    return "Support"
+    return combat_item_category(effect_text)
 
 
 def build_grouped_item_menu(
@@ -123,17 +117,14 @@ def build_grouped_item_menu(
         if qty <= 0:
             continue
 
-        item_json = items_by_name.get(name, {})
-        spell_info = item_json.get("SpellInfo") or {}
-        effect_text = spell_info.get("Effect") or ""
+        # ★分類は ItemEffect に前計算済み（Effect テキストを毎回解釈しない）
+        eff = item_effect(items_by_name.get(name, {}))
 
         t = (itype or "").strip().lower()
         if t == "anywhere":
-            cat = categorize_anywhere_item(effect_text)
-            anywhere_buckets[cat].append((name, qty))
+            anywhere_buckets[eff.anywhere_category].append((name, qty))
         elif t == "combat":
-            cat = categorize_combat_item(effect_text)
-            combat_buckets[cat].append((name, qty))
+            combat_buckets[eff.combat_category].append((name, qty))
         else:
             anywhere_buckets["Other"].append((name, qty))
 
@@ -275,11 +266,7 @@ def ask_action_for_member(
     job_data = member.job
 
     # --- ジョブの戦闘コマンドを表示 ---
-    commands = [
-        job_data.raw[f"BattleCommand{i}"]["Command"]
-        for i in range(1, 5)
-        if job_data.raw.get(f"BattleCommand{i}")
-    ]
+    commands = list(job_profile(job_data).commands)  # ★JobProfile に前計算済み
     if not commands:
         commands = ["Fight", "Defend", "Item", "Run"]
 
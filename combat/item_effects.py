@@ -5,10 +5,19 @@
 # apply_status_item_to_enemy	「状態異常だけ」を与えるタイプのアイテムを判定し、敵ステートに状態異常を付与する共通ヘルパー
 # spell_from_item	アイテムJSONからSpellInfo（威力・命中・属性など）を組み立てる変換ヘルパー
 # item_damage_char_to_enemy	攻撃アイテムのSpellInfoと敵ステータスからダメージ量を計算する
+# ItemEffect	アイテム1件分の効果記述子（味方への効果・治す状態異常・与える状態異常・攻撃/吸収/即死・SpellInfo・対象・メニュー分類）
+# compile_item_effect	アイテムJSON1件から ItemEffect を作る（Effect テキストの解釈はここだけ）
+# item_effect	アイテムJSON（dict）ごとに1回だけ ItemEffect を作って使い回す
+# compile_item_effects	アイテムDBの全件を前計算する（load_items から呼ぶ）
+# invalidate_item_effects	前計算を捨てる（アイテムデータを書き換えたとき）
+# anywhere_item_category / combat_item_category	Effect テキスト → メニュー分類（input_ui の categorize_* の実体）
 # ============================================================
+# ・戦闘（turn_logic）・コンソールUI（input_ui）・フィールド（ui_pygame.logic / scenes.menu）は ItemEffect で分岐する
+# ・ItemEffect.spell（SpellInfo）は全使用で共有する。書き換えないこと
 
 import random
-from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 
 from combat.enums import ElementRelation, Status
 from combat.models import (
@@ -19,6 +28,221 @@ from combat.models import (
 )
 from combat.elements import parse_elements, apply_element_relation_to_damage
 from combat.status_effects import *
+from combat.verbosity import logs_enabled
+
+
+# ============================================================
+# アイテム効果の前計算（使うたびに Effect テキストを解釈し直さない）
+# ============================================================
+
+# 「状態異常を与えるだけ」のアイテム（apply_status_item_to_enemy）の Effect → (Status, 表示名)
+# 今の JSON だと "Inflict Paralysis" などが入っている。先に一致したものを使う
+_ITEM_INFLICT_MAP: Dict[str, Tuple[Status, str]] = {
+    "inflict poison": (Status.POISON, "毒"),
+    "inflict blind": (Status.BLIND, "盲目"),
+    "inflict mini": (Status.MINI, "小人"),
+    "inflict silence": (Status.SILENCE, "沈黙"),
+    "inflict toad": (Status.TOAD, "カエル"),
+    "inflict petrification": (Status.PETRIFY, "石化"),
+    "inflict ko": (Status.KO, "気絶"),
+    "inflict sleep": (Status.SLEEP, "睡眠"),
+    "inflict paralysis": (Status.PARALYZE, "麻痺"),
+    "inflict partial petrification": (Status.PARTIAL_PETRIFY, "一部石化"),
+    "inflict confusion": (Status.CONFUSION, "混乱"),
+    # ... 将来増やすときはここに追加
+}
+
+# 状態異常回復アイテムの Effect → 治す状態異常（石化は部分石化とまとめて cures_petrify で扱う）
+_ITEM_CURE_MAP: Tuple[Tuple[str, Status], ...] = (
+    ("cure poison", Status.POISON),
+    ("cure blind", Status.BLIND),
+    ("cure or inflict mini", Status.MINI),
+    ("cure silence", Status.SILENCE),
+    ("cure toad", Status.TOAD),
+)
+
+
+def anywhere_item_category(effect_text: str) -> str:
+    e = effect_text.lower()
+    if "revive from ko" in e:
+        return "Revive"
+    if "cure " in e:
+        return "Cure"
+    if "restore" in e:
+        return "Restore"
+    return "Other"
+
+
+def combat_item_category(effect_text: str) -> str:
+    e = effect_text.lower()
+    if "deal" in e and "damage" in e:
+        return "Damage"
+    if "inflict " in e:
+        return "Inflict"
+    return "Support"
+
+
+@dataclass(slots=True, frozen=True)
+class ItemEffect:
+    name: str
+    json: Dict[str, Any]
+    item_type: str  # ItemType（Anywhere / Combat / Field / Key Item）
+    # 味方（自分）に使ったときの効果（apply_item_effect_to_actor の分岐）
+    #   "haste" | "protect" | "heal" | "full_restore" | "revive" | "cure" | "none"
+    action: str
+    heal_amount: int  # Value（"heal" の回復量）
+    cure_statuses: Tuple[Status, ...]  # "cure" で治す状態異常（石化系以外）
+    cures_petrify: bool  # 石化・部分石化をまとめて治す
+    inflict: Optional[Tuple[Status, str]]  # 敵に与える状態異常（無ければ None）
+    partial_petrify_amount: Optional[float]  # 部分石化を与えるときのゲージ量（それ以外は None）
+    is_attack: bool  # ダメージ / 即死 / 吸収（敵専用・味方には不発）
+    is_drain: bool  # 与えたダメージぶん HP を吸収
+    inflicts_ko: bool  # 即死効果
+    grants_reflect: bool  # 反射バリア（Shining Curtain）
+    base_accuracy: Any  # SpellInfo.BaseAccuracy（未定義なら 1.0）
+    buff_power: float  # バフの BasePower（未定義なら 5）
+    buff_multiplier: int  # Haste の攻撃回数増加量（未定義なら 3）
+    damage_multiplier: int  # 攻撃アイテムのヒット数（item_json["Multiplier"]、未定義なら 3）
+    spell: Optional[SpellInfo]  # spell_from_item の結果（数値欄が壊れていれば None）
+    target: str  # SpellInfo.Target を strip + 小文字化したもの
+    target_rule: str  # "enemy"（攻撃・状態異常） | "ally"（回復・補助） | "none"
+    anywhere_category: str  # anywhere_item_category の結果
+    combat_category: str  # combat_item_category の結果
+
+
+def compile_item_effect(item_json: Dict[str, Any]) -> ItemEffect:
+    """アイテムJSON1件 → ItemEffect（Effect / SpellEffect / Name の解釈はここで1回だけ）"""
+    spell_info = item_json.get("SpellInfo") or {}
+    effect_raw = spell_info.get("Effect") or ""
+    effect_text = effect_raw.lower()
+    name = (item_json.get("Name") or "").strip()
+    name_lower = name.lower()
+    spell_effect = (item_json.get("SpellEffect") or "").strip().lower()
+
+    # --- 味方に使ったときの効果（上から順に判定） ---
+    cure_statuses = tuple(st for key, st in _ITEM_CURE_MAP if key in effect_text)
+    cures_petrify = "petrification" in effect_text
+    if (
+        "enhance accuracy and attack multiplier" in effect_text
+        or spell_effect == "haste"
+        or name_lower == "bacchus's cider"
+    ):
+        action = "haste"
+    elif (
+        "enhance defense and magic defense" in effect_text
+        or spell_effect == "protect"
+        or name_lower == "turtle shell"
+    ):
+        action = "protect"
+    elif "restore target's hp" in effect_text:
+        action = "heal"
+    elif "restore target to full hp and mp" in effect_text:
+        action = "full_restore"
+    elif "revive from ko" in effect_text:
+        action = "revive"
+    elif cure_statuses or cures_petrify:
+        action = "cure"
+    else:
+        action = "none"
+
+    # --- 敵に使ったときの効果 ---
+    inflict = None
+    partial_amount = None
+    for key, value in _ITEM_INFLICT_MAP.items():
+        if key in effect_text:
+            inflict = value
+            break
+    if "inflict partial petrification" in effect_text:
+        # どの段階か判定（アイテムJSONのEffectやNameに含まれる前提）
+        partial_amount = partial_petrify_amount_from_name(
+            (effect_text + " " + str(item_json.get("Name", ""))).lower()
+        )
+
+    item_spell_effect = str(item_json.get("SpellEffect") or "").lower()
+    item_name_lower = (item_json.get("Name") or "").lower()
+    is_drain = (
+        "absorb hp" in effect_text
+        or item_spell_effect == "drain"
+        or "lilith's kiss" in item_name_lower
+    )
+    inflicts_ko = "inflict ko" in effect_text
+    is_attack = ("deal" in effect_text and "damage" in effect_text) or inflicts_ko or is_drain
+    grants_reflect = name == "Shining Curtain" or "grant reflect" in effect_text
+
+    if is_attack:
+        target_rule = "enemy"
+    elif action != "none" or grants_reflect:
+        target_rule = "ally"  # Mallet（Cure or inflict Mini）は味方向けに分類
+    elif inflict is not None:
+        target_rule = "enemy"
+    else:
+        target_rule = "none"
+
+    try:
+        spell = spell_from_item(item_json)
+    except (TypeError, ValueError):
+        spell = None  # 攻撃に使ったときに従来どおり例外にする
+
+    base_acc = spell_info.get("BaseAccuracy")
+    return ItemEffect(
+        name=name,
+        json=item_json,
+        item_type=str(item_json.get("ItemType") or ""),
+        action=action,
+        heal_amount=int(item_json.get("Value", 0) or 0),
+        cure_statuses=cure_statuses,
+        cures_petrify=cures_petrify,
+        inflict=inflict,
+        partial_petrify_amount=partial_amount,
+        is_attack=is_attack,
+        is_drain=is_drain,
+        inflicts_ko=inflicts_ko,
+        grants_reflect=grants_reflect,
+        base_accuracy=1.0 if base_acc is None else base_acc,
+        buff_power=float(spell_info.get("BasePower", 5) or 0),
+        buff_multiplier=int(spell_info.get("Multiplier") or 3),
+        damage_multiplier=int(item_json.get("Multiplier", 3) or 3),
+        spell=spell,
+        target=str(spell_info.get("Target") or "").strip().lower(),
+        target_rule=target_rule,
+        anywhere_category=anywhere_item_category(effect_raw),
+        combat_category=combat_item_category(effect_raw),
+    )
+
+
+# id(アイテムJSON) → (その dict, ItemEffect)。dict を保持するので id が再利用されることはない
+_ITEM_EFFECTS: Dict[int, Tuple[Dict[str, Any], ItemEffect]] = {}
+_ITEM_EFFECTS_MAX = 4096
+
+
+def item_effect(item_json: Dict[str, Any]) -> ItemEffect:
+    """
+    アイテムJSON の ItemEffect（dict ごとに1回だけ作る）。
+    load_items で全件前計算してあるので、戦闘・メニューでは常にキャッシュを引く
+    """
+    hit = _ITEM_EFFECTS.get(id(item_json))
+    if hit is not None and hit[0] is item_json:
+        return hit[1]
+    eff = compile_item_effect(item_json)
+    if len(_ITEM_EFFECTS) >= _ITEM_EFFECTS_MAX:
+        _ITEM_EFFECTS.clear()
+    _ITEM_EFFECTS[id(item_json)] = (item_json, eff)
+    return eff
+
+
+def compile_item_effects(items: Iterable[Dict[str, Any]]) -> None:
+    """アイテムDBの全件を前計算する（解釈できない定義は使うときに従来どおり例外にする）"""
+    for item_json in items:
+        if not isinstance(item_json, dict):
+            continue
+        try:
+            item_effect(item_json)
+        except (TypeError, ValueError):
+            continue
+
+
+def invalidate_item_effects() -> None:
+    _ITEM_EFFECTS.clear()
 
 
 # ============================================================
@@ -44,8 +268,11 @@ def apply_item_effect_to_actor(
     """
     item_name = (item_json.get("Name") or "").strip()
 
-    # ここで「主語」を決める
-    if actor_name and actor_name != target_name:
+    # ここで「主語」を決める（QUIET ではログを作らないので空のまま）
+    prefix = ""
+    if not logs_enabled():
+        pass
+    elif actor_name and actor_name != target_name:
         prefix = f"{actor_name}は{target_name}に{item_name}を使った！ "
     else:
         prefix = f"{target_name}は{item_name}を使った！ "
@@ -53,9 +280,7 @@ def apply_item_effect_to_actor(
     if logs is None:
         return
 
-    spell_info = item_json.get("SpellInfo") or {}
-    effect_text = (spell_info.get("Effect") or "").lower()
-    value = int(item_json.get("Value", 0) or 0)
+    eff = item_effect(item_json)  # ★Effect テキストの解釈は前計算済み
 
     # 既に戦闘不能（HP<=0）の場合、HP回復系の扱いをどうするかは好みだが、
     # ここでは「蘇生系以外は効果なし」にしておく
@@ -67,20 +292,12 @@ def apply_item_effect_to_actor(
     #    SpellEffect: "Haste"
     #    Multiplier は 3 で固定
     # ------------------------------------------
-    name_lower = (item_json.get("Name") or "").strip().lower()
-    spell_effect = (item_json.get("SpellEffect") or "").strip().lower()
-
-    is_haste_item = (
-        "enhance accuracy and attack multiplier" in effect_text
-        or spell_effect == "haste"
-        or name_lower == "bacchus's cider"
-    )
-
-    if is_haste_item:
+    if eff.action == "haste":
         # ステータス情報が無いと攻撃力・攻撃回数をいじれないので念のため
         if target_stats is None:
             if logs is not None:
-                logs.append(f"{prefix} " f"しかし攻撃力アップ効果を適用できなかった…")
+                if logs_enabled():
+                    logs.append(f"{prefix} " f"しかし攻撃力アップ効果を適用できなかった…")
             return
 
         if rng is None:
@@ -89,16 +306,13 @@ def apply_item_effect_to_actor(
         mind = target_stats.mind
 
         # ✅ 命中率 = BaseAccuracy + mind/2 を共通ヘルパに委譲
-        base_acc = spell_info.get("BaseAccuracy")
-        if base_acc is None:
-            base_acc = 1.0
-
-        hit_percent = calc_buff_hit_percent(base_acc, mind)
+        hit_percent = calc_buff_hit_percent(eff.base_accuracy, mind)
 
         # 命中判定
         if rng.random() * 100.0 >= hit_percent:
             if logs is not None:
-                logs.append(f"{prefix} " f"しかし何も起こらなかった…")
+                if logs_enabled():
+                    logs.append(f"{prefix} " f"しかし何も起こらなかった…")
             return
 
         # --- ここから成功時のバフ計算（Haste と同様）---
@@ -106,10 +320,10 @@ def apply_item_effect_to_actor(
         J = target_stats.job_level
         base_factor = (mind // 16) + (L // 16) + (J // 32) + 1
 
-        base_power = float(spell_info.get("BasePower", 5))
+        base_power = eff.buff_power
 
         # Bacchus's Cider の攻撃回数増加量（デフォルト3）
-        mul_default = int(spell_info.get("Multiplier") or 3)
+        mul_default = eff.buff_multiplier
 
         # ✅ 実際の攻撃力・攻撃回数の更新は共通ヘルパへ
         old_main_pow, old_off_pow, old_main_mul, old_off_mul = apply_haste_buff(
@@ -121,22 +335,23 @@ def apply_item_effect_to_actor(
         )
 
         if logs is not None:
-            logs.append(
-                f"{prefix} "
-                f"攻撃力 右手 {old_main_pow}→{target_stats.main_power}"
-                + (
-                    f" / 左手 {old_off_pow}→{target_stats.off_power}"
-                    if old_off_pow > 0
-                    else ""
-                )
-                + f"、攻撃回数 右手 {old_main_mul}→{target_stats.main_atk_multiplier}"
-                + (
-                    f" / 左手 {old_off_mul}→{target_stats.off_atk_multiplier}"
-                    if old_off_mul > 0
-                    else ""
+            if logs_enabled():
+                logs.append(
+                    f"{prefix} "
+                    f"攻撃力 右手 {old_main_pow}→{target_stats.main_power}"
+                    + (
+                        f" / 左手 {old_off_pow}→{target_stats.off_power}"
+                        if old_off_pow > 0
+                        else ""
+                    )
+                    + f"、攻撃回数 右手 {old_main_mul}→{target_stats.main_atk_multiplier}"
+                    + (
+                        f" / 左手 {old_off_mul}→{target_stats.off_atk_multiplier}"
+                        if old_off_mul > 0
+                        else ""
+                    )
+                    + " に上がった。"
                 )
-                + " に上がった。"
-            )
 
         return
 
@@ -146,17 +361,12 @@ def apply_item_effect_to_actor(
     #    SpellEffect: "Protect"
     #    Multiplier は 3 で固定（※現状は未使用）
     # ------------------------------------------
-    is_protect_item = (
-        "enhance defense and magic defense" in effect_text
-        or spell_effect == "protect"
-        or name_lower == "turtle shell"
-    )
-
-    if is_protect_item:
+    if eff.action == "protect":
         # ステータス情報が無いと防御をいじれないので念のため
         if target_stats is None:
             if logs is not None:
-                logs.append(f"{prefix} " f"しかし防御アップ効果を適用できなかった…")
+                if logs_enabled():
+                    logs.append(f"{prefix} " f"しかし防御アップ効果を適用できなかった…")
             return
 
         if rng is None:
@@ -167,18 +377,16 @@ def apply_item_effect_to_actor(
         J = target_stats.job_level
 
         # 命中率 = BaseAccuracy + mind/2 （0〜100 にクランプ）
-        base_acc = spell_info.get("BaseAccuracy")
-        if base_acc is None:
-            base_acc = 1.0
-        hit_percent = calc_buff_hit_percent(base_acc, mind)
+        hit_percent = calc_buff_hit_percent(eff.base_accuracy, mind)
 
         if rng.random() * 100.0 >= hit_percent:
-            logs.append(f"{prefix} " f"しかし何も起こらなかった…")
+            if logs_enabled():
+                logs.append(f"{prefix} " f"しかし何も起こらなかった…")
             return
 
         # --- ここから成功時のバフ計算（白魔法 Protect と同じ式）---
         base_factor = (mind // 16) + (L // 16) + (J // 32) + 1
-        base_power = float(spell_info.get("BasePower", 5))
+        base_power = eff.buff_power
 
         old_def, old_mdef = apply_protect_buff(
             target_stats,
@@ -187,21 +395,23 @@ def apply_item_effect_to_actor(
             rng=rng,
         )
 
-        logs.append(
-            f"{prefix} "
-            f"防御力 {old_def}→{target_stats.defense}、"
-            f"魔法防御 {old_mdef}→{target_stats.magic_defense} に上がった。"
-        )
+        if logs_enabled():
+            logs.append(
+                f"{prefix} "
+                f"防御力 {old_def}→{target_stats.defense}、"
+                f"魔法防御 {old_mdef}→{target_stats.magic_defense} に上がった。"
+            )
         return
 
     # ------------------------------------------
     # 1) HP 回復系 ("Restore target's HP")
     # ------------------------------------------
-    if "restore target's hp" in effect_text:
+    if eff.action == "heal":
         if is_ko:
-            logs.append(f"{prefix}{target_name}は戦闘不能のため効果がなかった…")
+            if logs_enabled():
+                logs.append(f"{prefix}{target_name}は戦闘不能のため効果がなかった…")
             return
-        heal = value
+        heal = eff.heal_amount
         if max_hp is not None:
             old_hp = target_state.hp
             target_state.hp = min(target_state.hp + heal, max_hp)
@@ -209,34 +419,38 @@ def apply_item_effect_to_actor(
         else:
             target_state.hp += heal
             healed = heal
-        logs.append(f"{prefix}{target_name}のHPが {healed} 回復した！")
+        if logs_enabled():
+            logs.append(f"{prefix}{target_name}のHPが {healed} 回復した！")
         return
 
     # ------------------------------------------
     # 2) エリクサー系 ("Restore target to full HP and MP")
     #    ※ MPの最大値管理をまだしていないので、ここでは HP のみ最大まで回復。
     # ------------------------------------------
-    if "restore target to full hp and mp" in effect_text:
+    if eff.action == "full_restore":
         if is_ko and max_hp is None:
             # max_hp がないと蘇生＋全快を再現しにくいので、とりあえず 1 だけ復活させる例
             target_state.hp = 1
-            logs.append(f"{prefix}{target_name}はHP1で復活した！")
+            if logs_enabled():
+                logs.append(f"{prefix}{target_name}はHP1で復活した！")
         else:
             if max_hp is not None:
                 target_state.hp = max_hp
             else:
                 # max_hp 不明なら、とりあえず今の2倍にするなど適当な処理もあり
                 target_state.hp = max(target_state.hp, 1) * 2
-            logs.append(f"{prefix}{target_name}のHPが全回復した！")
+            if logs_enabled():
+                logs.append(f"{prefix}{target_name}のHPが全回復した！")
         # MP の最大値を別で管理するようにしたら、ここで MP も全快にする
         return
 
     # ------------------------------------------
     # 3) 蘇生系 ("Revive from KO")
     # ------------------------------------------
-    if "revive from ko" in effect_text:
+    if eff.action == "revive":
         if not is_ko:
-            logs.append(f"{prefix}{target_name}は倒れていないので効果がなかった。")
+            if logs_enabled():
+                logs.append(f"{prefix}{target_name}は倒れていないので効果がなかった。")
             return
         # 本家 FF3 だと成功率や回復量にランダム性があるが、
         # ここでは「確実に蘇生＋最大HPの 1/4 回復」など簡易ルールにしておく
@@ -244,9 +458,10 @@ def apply_item_effect_to_actor(
             target_state.hp = max(1, max_hp // 4)
         else:
             target_state.hp = 1
-        logs.append(
-            f"{prefix}{target_name}{target_name}は蘇生した！（HP {target_state.hp}）"
-        )
+        if logs_enabled():
+            logs.append(
+                f"{prefix}{target_name}{target_name}は蘇生した！（HP {target_state.hp}）"
+            )
         # 状態異常はそのままとし、必要ならここで解除しても良い
         return
 
@@ -259,41 +474,15 @@ def apply_item_effect_to_actor(
     #    "Cure Poison"
     # ------------------------------------------
     cured_any = False
-    recognized_any = False  # ★ 追加：「この関数で認識している Cure かどうか」
+    recognized_any = eff.action == "cure"  # ★「この関数で認識している Cure かどうか」
 
-    if "cure poison" in effect_text:
-        recognized_any = True
-        if Status.POISON in target_state.statuses:
-            target_state.statuses.discard(Status.POISON)
+    for st in eff.cure_statuses:
+        if st in target_state.statuses:
+            target_state.statuses.discard(st)
             cured_any = True
 
-    if "cure blind" in effect_text:
-        recognized_any = True
-        if Status.BLIND in target_state.statuses:
-            target_state.statuses.discard(Status.BLIND)
-            cured_any = True
-
-    if "cure or inflict mini" in effect_text:
-        recognized_any = True
-        if Status.MINI in target_state.statuses:
-            target_state.statuses.discard(Status.MINI)
-            cured_any = True
-
-    if "cure silence" in effect_text:
-        recognized_any = True
-        if Status.SILENCE in target_state.statuses:
-            target_state.statuses.discard(Status.SILENCE)
-            cured_any = True
-
-    if "cure toad" in effect_text:
-        recognized_any = True
-        if Status.TOAD in target_state.statuses:
-            target_state.statuses.discard(Status.TOAD)
-            cured_any = True
-
-    if "petrification" in effect_text:
+    if eff.cures_petrify:
         # "Cure Petrification and Partial Petrification" をまとめて処理
-        recognized_any = True
         if (
             Status.PETRIFY in target_state.statuses
             or Status.PARTIAL_PETRIFY in target_state.statuses
@@ -306,24 +495,27 @@ def apply_item_effect_to_actor(
             cured_any = True
 
     if cured_any:
-        logs.append(
-            f"{prefix}{target_name}の状態異常が回復した！（{item_json.get('Name')}）"
-        )
+        if logs_enabled():
+            logs.append(
+                f"{prefix}{target_name}の状態異常が回復した！（{item_json.get('Name')}）"
+            )
         return
 
     # ★ ここを追加：「治せる状態異常は理解しているが、対象がその状態ではなかった」
     if recognized_any and not cured_any:
-        logs.append(
-            f"{prefix}{target_name}は回復対象の状態異常ではなかったため、"
-            f"{item_json.get('Name')}は効果がなかった。"
-        )
+        if logs_enabled():
+            logs.append(
+                f"{prefix}{target_name}は回復対象の状態異常ではなかったため、"
+                f"{item_json.get('Name')}は効果がなかった。"
+            )
         return
 
     # ------------------------------------------
     # 5) ここまでにマッチしないものは「攻撃アイテム or キーアイテムなど」とみなす
     #    → 戦闘中の攻撃効果は別ヘルパーに任せ、ここでは何もしない。
     # ------------------------------------------
-    logs.append(f"{item_json.get('Name')}はこの関数では効果が定義されていません。")
+    if logs_enabled():
+        logs.append(f"{item_json.get('Name')}はこの関数では効果が定義されていません。")
 
 
 # ============================================================
@@ -346,52 +538,22 @@ def apply_status_item_to_enemy(
         True  : 状態異常アイテムとして処理した（命中したかどうかは問わない）
         False : この関数では扱わないアイテムだった（＝他で処理してね）
     """
-    spell_info = item_json.get("SpellInfo") or {}
-    effect_text = (spell_info.get("Effect") or "").lower()
-
-    # 今の JSON だと "Inflict Paralysis" などが入っている。
-    # 必要に応じて "inflict poison" なども増やせるようにマッピングで書いておく。
-    status_map: Dict[str, Tuple[Status, str]] = {
-        "inflict poison": (Status.POISON, "毒"),
-        "inflict blind": (Status.BLIND, "盲目"),
-        "inflict mini": (Status.MINI, "小人"),
-        "inflict silence": (Status.SILENCE, "沈黙"),
-        "inflict toad": (Status.TOAD, "カエル"),
-        "inflict petrification": (Status.PETRIFY, "石化"),
-        "inflict ko": (Status.KO, "気絶"),
-        "inflict sleep": (Status.SLEEP, "睡眠"),
-        "inflict paralysis": (Status.PARALYZE, "麻痺"),
-        "inflict partial petrification": (Status.PARTIAL_PETRIFY, "一部石化"),
-        "inflict confusion": (Status.CONFUSION, "混乱"),
-        # "inflict poison": (Status.POISON, "毒"),
-        # "inflict blind": (Status.BLIND, "暗闇"),
-        # ... 将来増やすときはここに追加
-    }
-
-    key = None
-    for k in status_map.keys():
-        if k in effect_text:
-            key = k
-            break
+    eff = item_effect(item_json)  # ★Effect → 状態異常は前計算済み（_ITEM_INFLICT_MAP）
 
-    if key is None:
+    if eff.inflict is None:
         # この関数の対象ではない
         return False
 
-    status_enum, status_label = status_map[key]
+    status_enum, status_label = eff.inflict
 
-    base_acc = spell_info.get("BaseAccuracy")
-    if base_acc is None:
-        # 精度が未定義ならとりあえず 100% とする
-        base_acc = 1.0
+    # 精度が未定義ならとりあえず 100% とする
+    base_acc = eff.base_accuracy
 
     if rng is None:
         rng = random.Random()
 
-    if "inflict partial petrification" in effect_text:
-        # どの段階か判定（アイテムJSONのEffectやNameに含まれる前提）
-        src = (effect_text + " " + str(item_json.get("Name", ""))).lower()
-        amount = partial_petrify_amount_from_name(src)
+    if eff.partial_petrify_amount is not None:
+        amount = eff.partial_petrify_amount
 
         # 命中したらゲージ処理へ
         if rng.random() < float(base_acc):
@@ -401,7 +563,7 @@ def apply_status_item_to_enemy(
                 target_name=enemy_name,
                 logs=logs,
             )
-        else:
+        elif logs_enabled():
             logs.append(f"{enemy_name}には一部石化が入らなかった…")
 
         return True
@@ -409,8 +571,9 @@ def apply_status_item_to_enemy(
     # ★ ここを追加：通常の状態異常付与
     if rng.random() < float(base_acc):
         enemy_state.statuses.add(status_enum)
-        logs.append(f"{enemy_name}に{status_label}が効いた！")
-    else:
+        if logs_enabled():
+            logs.append(f"{enemy_name}に{status_label}が効いた！")
+    elif logs_enabled():
         logs.append(f"{enemy_name}には{status_label}が効かなかった…")
 
     return True
@@ -504,7 +667,7 @@ def item_damage_char_to_enemy(
         rng = random.Random()
 
     base_power = int(item_spell.power)
-    multiplier = int(item_json.get("Multiplier", 3) or 3)
+    multiplier = item_effect(item_json).damage_multiplier
 
     total = 0
     for _ in range(multiplier):
@@ -0,0 +1,83 @@
+# ============================================================
+# job_profile: ジョブの行動・装備まわりの前計算（JobProfile）
+
+# command_skillpoints_from_raw	job.raw の BattleCommand1..4 から Command → SkillPoints の辞書を作る
+# compile_job_profile	job.raw 1件から JobProfile を作る
+# job_profile	Job.profile を返す（load_jobs 以外で作った Job なら初回にここで前計算して載せる）
+# ============================================================
+# ・戦闘の行動ごと（SP加算）・メニュー再描画ごと（コマンド一覧・魔法一覧）・装備変更ごとに job.raw を読み直さない
+# ・JobProfile は全呼び出しで共有する。command_skillpoints は素の dict（Job ごと deepcopy / pickle できるように）なので書き換えないこと
+
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from combat.constants import JOB_CAST_CODE, JOB_EQUIP_CODE
+from combat.models import JobProfile
+
+
+def command_skillpoints_from_raw(job_raw: Dict[str, Any]) -> Dict[str, int]:
+    """
+    job.raw から Command -> SkillPoints の辞書を作る（SkillPoints が数値でなければ 0）
+    """
+    m: Dict[str, int] = {}
+    for i in range(1, 5):
+        bc = job_raw.get(f"BattleCommand{i}")
+        if not isinstance(bc, dict):
+            continue
+        cmd = bc.get("Command")
+        sp = bc.get("SkillPoints", 0)
+        if isinstance(cmd, str) and cmd:
+            try:
+                m[cmd] = int(sp)
+            except (TypeError, ValueError):
+                m[cmd] = 0
+    return m
+
+
+def _name_set(rows: Any) -> FrozenSet[str]:
+    """[{"Name": ...}, ...] から Name の集合（Name が空のものは飛ばす）"""
+    if not isinstance(rows, list):
+        return frozenset()
+    return frozenset(r["Name"] for r in rows if isinstance(r, dict) and r.get("Name"))
+
+
+def compile_job_profile(job_raw: Dict[str, Any], name: Optional[str] = None) -> JobProfile:
+    """job.raw（ffiii_jobs_compact.json の1ジョブ）→ JobProfile"""
+    if name is None:
+        name = job_raw.get("Name") or ""
+
+    commands: List[str] = []
+    for i in range(1, 5):
+        bc = job_raw.get(f"BattleCommand{i}")
+        if not bc:
+            continue
+        c = (bc.get("Command") or "").strip()
+        if c:
+            commands.append(c)
+
+    return JobProfile(
+        name=name,
+        commands=tuple(commands),
+        command_skillpoints=command_skillpoints_from_raw(job_raw),
+        allowed_spells=_name_set(job_raw.get("Spells") or []),
+        cast_code=JOB_CAST_CODE.get(name),
+        equip_code=JOB_EQUIP_CODE.get(name),
+        weapon_names=_name_set(job_raw.get("Weapons", [])),
+        armor_names=_name_set(job_raw.get("Armors", [])),
+    )
+
+
+def job_profile(job: Any) -> JobProfile:
+    """Job.profile を返す。load_jobs 以外で作った Job（テスト用のダミー等）なら初回にここで前計算して載せる"""
+    profile = getattr(job, "profile", None)
+    if profile is None:
+        raw = getattr(job, "raw", None)
+        profile = compile_job_profile(
+            raw if isinstance(raw, dict) else {}, getattr(job, "name", None)
+        )
+        try:
+            job.profile = profile
+        except AttributeError:
+            pass  # profile 欄を持たないオブジェクトは毎回作る
+    return profile
@@ -8,6 +8,7 @@
 from typing import Literal
 
 from combat.enums import ElementRelation
+from combat.verbosity import logs_enabled
 
 
 # ============================================================
@@ -30,7 +31,10 @@ def log_damage(
 ) -> None:
     """
     ダメージログを組み立てて logs に追加するユーティリティ（位置引数対応版）
+    QUIET（verbosity）のときは何もしない
     """
+    if not logs_enabled():
+        return
 
     # 本文（誰がどれだけ喰らったか）
     if perspective == "attacker":
@@ -26,6 +26,7 @@ from combat.elements import (
 from combat.magic_damage import magic_damage_enemy_to_char
 from combat.life_check import is_out_of_battle
 from combat.logging import log_damage
+from combat.verbosity import logs_enabled
 
 
 # 敵→キャラ「純粋な全体攻撃」（Snowstorm等）用の汎用ヘルパ
@@ -39,6 +40,7 @@ def enemy_cast_aoe_damage_spell_to_party(
     logs: list[str],
     caster_state: "BattleActorState",  # ★ 反射ダメを食らう敵
     caster_max_hp: Optional[int] = None,  # ★ ログ用（なくてもOK）
+    use_expectation: bool = False,  # ★追加：期待値モード（mode="expected"）用
 ) -> bool:
     """
     AoEダメージ（魔法ダメージ式）専用。
@@ -60,7 +62,8 @@ def enemy_cast_aoe_damage_spell_to_party(
         base_acc = base_acc / 100.0
     hit_percent = base_acc * 100.0
 
-    logs.append(f"{enemy_name}の《{spell_name}》！")
+    if logs_enabled():
+        logs.append(f"{enemy_name}の《{spell_name}》！")
 
     alive_members = [pm for pm in party_members if not is_out_of_battle(pm.state)]
     split_to_targets = 1  # ★ All Enemies は割らない（あなたの仕様）
@@ -88,7 +91,8 @@ def enemy_cast_aoe_damage_spell_to_party(
 
         # ★ ここが肝：ジャンプ中なら AoE を無効化
         if getattr(state, "is_jumping", False):
-            logs.append(f"{name}は空中にいる！{spell_name}は届かない！")
+            if logs_enabled():
+                logs.append(f"{name}は空中にいる！{spell_name}は届かない！")
             continue
 
         # 1) 属性相性（nullは無効）
@@ -99,17 +103,19 @@ def enemy_cast_aoe_damage_spell_to_party(
                 stats, attack_elements
             )
             if relation == "null":
-                logs.append(
-                    f"{name}は{spell_name}を無効化した！（{','.join(e.capitalize() for e in hit_elems)}）"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{name}は{spell_name}を無効化した！（{','.join(e.capitalize() for e in hit_elems)}）"
+                    )
                 continue
 
         # 2) 命中判定
         roll = rng.random() * 100.0
         if roll >= hit_percent:
-            logs.append(
-                f"{name}は{spell_name}を耐えきった！（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
-            )
+            if logs_enabled():
+                logs.append(
+                    f"{name}は{spell_name}を耐えきった！（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
+                )
             continue
 
         # 3) ダメージ算出
@@ -121,7 +127,7 @@ def enemy_cast_aoe_damage_spell_to_party(
             char=stats,
             element_relation=relation,
             rng=rng,
-            use_expectation=False,
+            use_expectation=use_expectation,
             split_to_targets=split_to_targets,
             attacker_is_blind=False,
             target_is_mini_or_toad=target_is_mini_or_toad,
@@ -140,19 +146,20 @@ def enemy_cast_aoe_damage_spell_to_party(
 
             # 個別ログ（必要なら残す：あなたの案のまま）
             max_hp_enemy = caster_max_hp or getattr(caster_state, "max_hp", None)
-            log_damage(
-                logs,
-                f"{name}を覆う魔法障壁が《{spell_name}》を跳ね返した！ ",
-                enemy_name,
-                damage,
-                old_enemy_hp,
-                caster_state.hp,
-                "target",
-                "arrow_with_max" if max_hp_enemy is not None else "arrow",
-                max_hp_enemy,
-                "",
-                True,
-            )
+            if logs_enabled():
+                log_damage(
+                    logs,
+                    f"{name}を覆う魔法障壁が《{spell_name}》を跳ね返した！ ",
+                    enemy_name,
+                    damage,
+                    old_enemy_hp,
+                    caster_state.hp,
+                    "target",
+                    "arrow_with_max" if max_hp_enemy is not None else "arrow",
+                    max_hp_enemy,
+                    "",
+                    True,
+                )
 
             # ★ 反射で敵が倒れたら即終了（呼び出し側に通知）
             if caster_state.hp <= 0:
@@ -160,9 +167,10 @@ def enemy_cast_aoe_damage_spell_to_party(
                 # caster_state.statuses.add(Status.KO)
                 # ★ まとめログはここで出しておくと情報が欠けない
                 if reflect_count >= 2:
-                    logs.append(
-                        f"{spell_name}は{reflect_count}回反射された！（合計 {reflect_total_damage} ダメージ）"
-                    )
+                    if logs_enabled():
+                        logs.append(
+                            f"{spell_name}は{reflect_count}回反射された！（合計 {reflect_total_damage} ダメージ）"
+                        )
                 return True
 
             continue  # 対象への適用はしない（状態異常も不発扱い）
@@ -175,27 +183,30 @@ def enemy_cast_aoe_damage_spell_to_party(
             or getattr(stats, "max_hp", None)
             or getattr(state, "max_hp", None)
         )
-        log_damage(
-            logs=logs,
-            prefix="",
-            target_name=name,
-            damage=damage,
-            old_hp=old_hp,
-            new_hp=state.hp,
-            perspective="target",
-            hp_style="arrow_with_max" if max_hp is not None else "arrow",
-            max_hp=max_hp,
-            shout=True,
-        )
+        if logs_enabled():
+            log_damage(
+                logs=logs,
+                prefix="",
+                target_name=name,
+                damage=damage,
+                old_hp=old_hp,
+                new_hp=state.hp,
+                perspective="target",
+                hp_style="arrow_with_max" if max_hp is not None else "arrow",
+                max_hp=max_hp,
+                shout=True,
+            )
 
         if state.hp <= 0:
-            logs.append(f"{name}は力尽きた…")
+            if logs_enabled():
+                logs.append(f"{name}は力尽きた…")
 
     # ★ AoE Reflect まとめログ（2回以上のときだけ出すのがおすすめ）
     if reflect_count >= 2:
-        logs.append(
-            f"{spell_name}は{reflect_count}回反射された！（合計 {reflect_total_damage} ダメージ）"
-        )
+        if logs_enabled():
+            logs.append(
+                f"{spell_name}は{reflect_count}回反射された！（合計 {reflect_total_damage} ダメージ）"
+            )
 
     return False
 
@@ -220,13 +231,15 @@ def enemy_cast_aoe_status_spell_to_party(
         spell_json.get("StatusAilment") or spell_json.get("Status") or ""
     ).strip()
     if not ailment or ailment == "-":
-        logs.append(f"{enemy_name}の《{spell_name}》！")
+        if logs_enabled():
+            logs.append(f"{enemy_name}の《{spell_name}》！")
         return
 
     status_obj = STATUS_NAME_MAP.get(ailment.lower())
     if status_obj is None:
-        logs.append(f"{enemy_name}の《{spell_name}》！")
-        logs.append(f"（未対応の状態異常: {ailment}）")
+        if logs_enabled():
+            logs.append(f"{enemy_name}の《{spell_name}》！")
+            logs.append(f"（未対応の状態異常: {ailment}）")
         return
 
     # 命中率（0〜1 or 0〜100 対応）
@@ -235,7 +248,8 @@ def enemy_cast_aoe_status_spell_to_party(
         acc = acc / 100.0
     hit_percent = acc * 100.0
 
-    logs.append(f"{enemy_name}の《{spell_name}》！")
+    if logs_enabled():
+        logs.append(f"{enemy_name}の《{spell_name}》！")
 
     alive_members = [pm for pm in party_members if not is_out_of_battle(pm.state)]
 
@@ -246,18 +260,21 @@ def enemy_cast_aoe_status_spell_to_party(
         # 命中判定
         roll = rng.random() * 100.0
         if roll >= hit_percent:
-            logs.append(
-                f"{name}は{spell_name}を耐えきった！（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
-            )
+            if logs_enabled():
+                logs.append(
+                    f"{name}は{spell_name}を耐えきった！（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
+                )
             continue
 
         # すでに付いているなら上書きしない（ログだけ変えるなどお好みで）
         if state.has(status_obj):
-            logs.append(f"{name}にはすでに《{ailment}》が効いている…")
+            if logs_enabled():
+                logs.append(f"{name}にはすでに《{ailment}》が効いている…")
             continue
 
         state.add(status_obj)  # ← BattleActorStateに add() を追加した前提
-        logs.append(f"{name}は《{ailment}》状態になった！")
+        if logs_enabled():
+            logs.append(f"{name}は《{ailment}》状態になった！")
 
 
 # AoE状態異常専用関数用 判定ヘルパ（表記ゆれ吸収込み）
@@ -38,6 +38,11 @@ from combat.elements import (
 )
 from combat.elements import parse_elements
 from combat.logging import log_damage
+from combat.verbosity import debug_enabled, logs_enabled
+
+# ★ rng 省略時の共有インスタンス（呼び出しごとに random.Random() を作ると
+#   os.urandom からのシードで遅いため、モジュールで1つだけ作って使い回す）
+_FALLBACK_RNG = random.Random()
 
 
 def _is_offensive_white(spell: SpellInfo) -> bool:
@@ -240,7 +245,7 @@ def _calc_base_magic_damage_per_hit(
         factor = 1.25
     else:
         if rng is None:
-            rng = random.Random()
+            rng = _FALLBACK_RNG
         factor = rng.uniform(1.0, 1.5)
     raw = int(magic_power * factor)
     base = raw - magic_defense
@@ -265,7 +270,7 @@ def magic_damage_char_to_enemy(
     split_to_targets > 1 のときは単体魔法の全体化などでダメージを等分。
     """
     if rng is None:
-        rng = random.Random()
+        rng = _FALLBACK_RNG
 
     magic_power = _calc_magic_power(caster, spell)
     magic_mult = _calc_magic_multiplier(caster, spell)
@@ -339,7 +344,8 @@ def apply_tornado_to_state(
     - ボス免疫などは呼び出し元で判定する想定。
     """
     if target_state.hp <= 1:
-        logs.append(f"{target_name}にはTornadoの効果がなかった。")
+        if logs_enabled():
+            logs.append(f"{target_name}にはTornadoの効果がなかった。")
         return
 
     old_hp = target_state.hp
@@ -352,18 +358,19 @@ def apply_tornado_to_state(
     # max_hp が state にあるならそれも表示
     max_hp = getattr(target_state, "max_hp", None)
 
-    log_damage(
-        logs=logs,
-        prefix=prefix,  # 例: "Unei'S Cloneは《Tornado》を唱えた！ "
-        target_name=target_name,  # 例: "Runeth"
-        damage=damage,
-        old_hp=old_hp,
-        new_hp=new_hp,
-        perspective="target",  # 「Runethは○ダメージを受けた」
-        hp_style="arrow_with_max" if max_hp is not None else "arrow",
-        max_hp=max_hp,
-        shout=True,  # 「！」で〆る
-    )
+    if logs_enabled():
+        log_damage(
+            logs=logs,
+            prefix=prefix,  # 例: "Unei'S Cloneは《Tornado》を唱えた！ "
+            target_name=target_name,  # 例: "Runeth"
+            damage=damage,
+            old_hp=old_hp,
+            new_hp=new_hp,
+            perspective="target",  # 「Runethは○ダメージを受けた」
+            hp_style="arrow_with_max" if max_hp is not None else "arrow",
+            max_hp=max_hp,
+            shout=True,  # 「！」で〆る
+        )
 
 
 # 敵→キャラ Tornado 専用ヘルパー
@@ -381,7 +388,8 @@ def enemy_cast_tornado_to_char(
     relation, hit_elems = element_relation_and_hits_for_char(char_stats, elems)
 
     if relation == "null":
-        logs.append(f"{char_name}は風属性に完全耐性を持っている！Tornadoは無効だ。")
+        if logs_enabled():
+            logs.append(f"{char_name}は風属性に完全耐性を持っている！Tornadoは無効だ。")
         return
 
     # 2) 命中チェック
@@ -392,9 +400,10 @@ def enemy_cast_tornado_to_char(
 
     roll = rng.random() * 100.0
     if roll >= hit_percent:
-        logs.append(
-            f"{char_name}はTornadoを避けた！（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
-        )
+        if logs_enabled():
+            logs.append(
+                f"{char_name}はTornadoを避けた！（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
+            )
         return
 
     # 3) 実際のHP削り＋ログ
@@ -404,7 +413,7 @@ def enemy_cast_tornado_to_char(
         target_name=char_name,
         rng=rng,
         logs=logs,
-        prefix=f"{enemy_name}は《Tornado》を唱えた！ ",  # ★ ここが prefix
+        prefix=f"{enemy_name}は《Tornado》を唱えた！ " if logs_enabled() else "",  # ★ ここが prefix
     )
 
 
@@ -458,7 +467,8 @@ def enemy_cast_drain_to_char(
 
     # 無効なら何もしない
     if relation == "null":
-        logs.append(f"{char_name}はDrainを完全に無効化した！")
+        if logs_enabled():
+            logs.append(f"{char_name}はDrainを完全に無効化した！")
         return
 
     # 2) 素ダメージ計算
@@ -476,7 +486,8 @@ def enemy_cast_drain_to_char(
 
     if dmg <= 0:
         # 吸収されたパターンなど
-        logs.append(f"{char_name}はDrainを受けたが、HPは減らなかった。")
+        if logs_enabled():
+            logs.append(f"{char_name}はDrainを受けたが、HPは減らなかった。")
         return
 
     # 4) 実HP増減（敵が吸収する）
@@ -488,10 +499,11 @@ def enemy_cast_drain_to_char(
         enemy_state.max_hp or enemy_state.hp + dmg, enemy_state.max_hp or 9999
     )
 
-    logs.append(
-        f"{char_name}のHPが {old_char_hp} → {char_state.hp} に減少し、"
-        f"敵のHPが {old_enemy_hp} → {enemy_state.hp} に吸収された！（Drain）"
-    )
+    if logs_enabled():
+        logs.append(
+            f"{char_name}のHPが {old_char_hp} → {char_state.hp} に減少し、"
+            f"敵のHPが {old_enemy_hp} → {enemy_state.hp} に吸収された！（Drain）"
+        )
 
     # キャラが0なら KO フラグ
     if char_state.hp <= 0:
@@ -513,7 +525,11 @@ def enemy_caster_from_monster(
     monsters.json から敵の魔法攻撃用パラメータを作成するヘルパ。
     引数が指定されていればそちらを優先し、指定がなければ簡易に推定。
     """
-    if magic_power_base is None and int(monster.get("AttackPower", 0)) == 0:
+    if (
+        magic_power_base is None
+        and int(monster.get("AttackPower", 0)) == 0
+        and debug_enabled()
+    ):
         print(
             "[Debug:magic_damage/enemy_caster_from_monster] enemy_caster_from_monster got AttackPower=0, monster keys:",
             list(monster.keys()),
@@ -553,7 +569,7 @@ def magic_damage_enemy_to_char(
     """
     # print(f"[Debug:magic_damage/magic_damage_enemy_to_char] {enemy_caster}")
 
-    if enemy_caster.magic_power_base == 0:
+    if enemy_caster.magic_power_base == 0 and debug_enabled():
         print("[Debug] caller stack (power=0):", flush=True)
         stack = "".join(traceback.format_stack(limit=12))
         print(stack, flush=True)
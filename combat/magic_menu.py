@@ -8,11 +8,14 @@
 # print_magic_menu_by_level	魔法をLv単位で1行形式で表示する
 # expand_spells_for_summons	spells.json内のSummonMagic（親：Bahamut等）を、子召喚魔法へ展開する
 # ============================================================
+# ・expand_spells_for_summons は同じ spells_by_name には同じ展開結果（dict）を返す。
+#   戻り値は共有されるので書き換えないこと（spell_table の CompiledSpell 表もこの dict ごとに1回だけ作る）
 
-from typing import Optional, Dict, Any, Tuple, List, Iterable
+from typing import Optional, Dict, Any, FrozenSet, Tuple, List, Iterable
 from collections import defaultdict
 
 from combat.constants import JOB_CAST_CODE
+from combat.job_profile import job_profile
 from combat.models import (
     Job,
     BattleActorState,
@@ -180,13 +183,13 @@ def build_magic_list(
 # ============================================================
 
 
-def allowed_spell_names_for_job(job: Job) -> set[str]:
+def allowed_spell_names_for_job(job: Job) -> FrozenSet[str]:
     """
     ffiii_jobs_compact.json の job.raw["Spells"] を正とし、
     そのジョブが使用可能な魔法名の集合を返す。
+    ★JobProfile に前計算済みの frozenset を返す（呼ぶたびに集合を作らない）
     """
-    spells = job.raw.get("Spells") or []
-    return {s.get("Name") for s in spells if s.get("Name")}
+    return job_profile(job).allowed_spells
 
 
 # レベル別・黒白まとめ表示関数
@@ -241,7 +244,12 @@ def expand_spells_for_summons(
     - すでに展開済みの子（Spellsを持たない Summon Magic）はそのまま残す
     - 子には Power/Accuracy/Element 等を保持させる
     - 子の Type は "Summon" にする（spell_from_json が子分岐に入るため）
+    ★ 同じ spells_by_name（同一 dict・件数も同じ）なら前回の展開結果をそのまま返す
     """
+    hit = _EXPANDED_CACHE.get(id(spells_by_name))
+    if hit is not None and hit[0] is spells_by_name and hit[1] == len(spells_by_name):
+        return hit[2]
+
     expanded: Dict[str, Dict[str, Any]] = {}
 
     def norm_cast(x) -> List[str]:
@@ -282,4 +290,11 @@ def expand_spells_for_summons(
             # 召喚親ではない or すでに子として展開済み → そのまま採用
             expanded[name] = s
 
+    if len(_EXPANDED_CACHE) >= 16:
+        _EXPANDED_CACHE.clear()
+    _EXPANDED_CACHE[id(spells_by_name)] = (spells_by_name, len(spells_by_name), expanded)
     return expanded
+
+
+# id(spells_by_name) → (spells_by_name, 件数, 展開結果)。元の dict を保持するので id が再利用されることはない
+_EXPANDED_CACHE: Dict[int, Tuple[Dict[str, Any], int, Dict[str, Dict[str, Any]]]] = {}
@@ -0,0 +1,675 @@
+# ============================================================
+# mcts_planner: モンテカルロ木探索（MCTS）でパーティの PlannedAction を選ぶ自動戦闘AI
+
+# MctsPlanner	1ラウンド分の行動を時間予算（既定 50ms）内で探索して返す（BattlePolicy としても使える）
+# make_mcts_policy	MctsPlanner を作って返す（simulate_many_battles_multi_party の policy 用）
+# build_member_actions	メンバー1人の行動候補（ジョブコマンド / 魔法 / アイテム）を列挙する
+# ============================================================
+# 探索の流れ（1イテレーション）：
+#   ① BattleSnapshot で探索開始時点へ巻き戻す（deepcopy しない）
+#   ② 木の中（tree_depth ラウンド）はメンバーごとに UCB1 で行動を選ぶ（decoupled UCT）
+#      → simulate_one_round_multi_party で1ラウンド進める
+#      → 結果の状態（タプル）をキーに置換表（transposition table）からノードを引く
+#   ③ 木の外は rollout_rounds ラウンドだけ policy_always_fight で進める
+#   ④ 評価値（0〜1）を通ったノードへ逆伝播
+# 時間予算：ラウンドを進める前に毎回締切を確認し、超えていればそのイテレーションは捨てる
+#   （1ラウンドの解決は中断できないので、はみ出しは最大でも1ラウンド分）
+# 最終的な行動は「メンバーごとに最も訪問回数が多い行動」
+# ・探索用の乱数は planner が自前で持つ（戦闘用 rng の列は消費しない）
+# ・探索中の戦闘ログ/print は verbosity(QUIET) で止める
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass, field
+from random import Random
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from combat.battle_sim import policy_always_fight, simulate_one_round_multi_party
+from combat.job_profile import job_profile
+from combat.enums import Status
+from combat.input_ui import normalize_battle_command
+from combat.inventory import build_item_list, is_item_visible_in_context
+from combat.life_check import first_alive_enemy_index, is_out_of_battle
+from combat.magic_damage import healing_spell_kind
+from combat.magic_menu import allowed_spell_names_for_job, build_magic_list
+from combat.models import EnemyRuntime, PartyMemberRuntime, PlannedAction
+from combat.runtime_state import RuntimeState
+from combat.snapshot import BattleSnapshot
+from combat.verbosity import QUIET, verbosity
+
+SPECIAL_NO_TARGET = {"Cheer", "Scare", "Flee", "Terrain", "Boost"}
+
+# 評価値：勝ちは 0.6〜1.0（残りHPで加点）、負けは 0、決着前は 0〜0.6
+WIN_BASE = 0.6
+ESCAPED_VALUE = 0.3
+ROUND_DISCOUNT = 0.98
+
+# 状態回復の Effect 文言 → 治る状態異常
+_CURE_WORDS = {
+    "poison": Status.POISON,
+    "blind": Status.BLIND,
+    "silence": Status.SILENCE,
+    "toad": Status.TOAD,
+    "mini": Status.MINI,
+    "petrification": Status.PETRIFY,
+}
+
+
+# ============================================================
+# 行動候補
+# ============================================================
+
+
+def _hp_ratio(pm: PartyMemberRuntime) -> float:
+    return max(0, pm.state.hp) / (pm.max_hp or 1)
+
+
+def _enemy_targets(enemies: Sequence[EnemyRuntime]) -> List[int]:
+    return [i for i, em in enumerate(enemies) if not is_out_of_battle(em.state)]
+
+
+def _weakest_enemy_index(enemies: Sequence[EnemyRuntime]) -> Optional[int]:
+    alive = _enemy_targets(enemies)
+    if not alive:
+        return None
+    return min(alive, key=lambda i: enemies[i].state.hp)
+
+
+def _support_targets(kind: Optional[str], party: Sequence[PartyMemberRuntime]) -> List[int]:
+    """回復/補助の対象になりうる味方（効果が無い相手は候補にしない）"""
+    if kind == "revive":
+        return [
+            i
+            for i, pm in enumerate(party)
+            if pm.state.has(Status.KO) and not pm.state.has(Status.PETRIFY)
+        ]
+    alive = [i for i, pm in enumerate(party) if not is_out_of_battle(pm.state)]
+    if kind == "hp":
+        hurt = [i for i in alive if _hp_ratio(party[i]) < 1.0]
+        return [min(hurt, key=lambda i: _hp_ratio(party[i]))] if hurt else []
+    return alive
+
+
+def _status_targets(
+    effect: str, party: Sequence[PartyMemberRuntime]
+) -> List[int]:
+    """状態回復：Effect（"Cure Poison" など）に書かれた状態異常にかかっている味方だけ"""
+    text = effect.lower()
+    if "all status" in text:
+        cured = set(_CURE_WORDS.values()) | {Status.CONFUSION, Status.SLEEP, Status.PARALYZE}
+    else:
+        cured = {st for w, st in _CURE_WORDS.items() if w in text}
+        if "petrification" in text:
+            cured.add(Status.PARTIAL_PETRIFY)
+    return [
+        i
+        for i, pm in enumerate(party)
+        if not pm.state.has(Status.KO) and pm.state.hp > 0 and pm.state.statuses & cured
+    ]
+
+
+def _offensive_variants(
+    *,
+    kind: str,
+    command: str,
+    target: str,
+    enemies: Sequence[EnemyRuntime],
+    spell_name: Optional[str] = None,
+    item_name: Optional[str] = None,
+) -> List[PlannedAction]:
+    """敵向けの魔法/アイテム：単体は一番HPの低い敵、全体可なら全体版も候補にする"""
+    t_idx = _weakest_enemy_index(enemies)
+    if t_idx is None:
+        return []
+    n_alive = len(_enemy_targets(enemies))
+    out: List[PlannedAction] = []
+    if target != "All Enemies" or n_alive == 1:
+        out.append(
+            PlannedAction(
+                kind=kind,
+                command=command,
+                spell_name=spell_name,
+                item_name=item_name,
+                target_side="enemy",
+                target_index=t_idx,
+            )
+        )
+    if "All" in target and n_alive > 1:
+        out.append(
+            PlannedAction(
+                kind=kind,
+                command=command,
+                spell_name=spell_name,
+                item_name=item_name,
+                target_side="enemy",
+                target_index=t_idx,
+                target_all=True,
+            )
+        )
+    return out
+
+
+def _spell_actions(
+    pm: PartyMemberRuntime,
+    party: Sequence[PartyMemberRuntime],
+    enemies: Sequence[EnemyRuntime],
+    command: str,
+    magic_list: Sequence[Tuple[str, Any, int]],
+    spells_by_name: Dict[str, Dict[str, Any]],
+    max_spells: int,
+) -> List[PlannedAction]:
+    if pm.state.has(Status.SILENCE):
+        return []
+    out: List[PlannedAction] = []
+    offensive: List[Tuple[int, int, str, Dict[str, Any]]] = []
+    for name, _mtype, level in magic_list:
+        lv = max(1, min(8, int(level or 1)))
+        if pm.state.mp_pool.get(lv, 0) <= 0:
+            continue
+        spell_json = spells_by_name.get(name)
+        if not spell_json:
+            continue
+        heal = healing_spell_kind(spell_json)
+        if heal is None:
+            offensive.append((lv, int(spell_json.get("BasePower") or 0), name, spell_json))
+            continue
+        targets = (
+            _status_targets(str(spell_json.get("Effect") or ""), party)
+            if heal == "status"
+            else _support_targets(heal, party)
+        )
+        for t in targets:
+            out.append(
+                PlannedAction(
+                    kind="magic",
+                    command=command,
+                    spell_name=name,
+                    target_side="ally",
+                    target_index=t,
+                )
+            )
+
+    # 攻撃魔法は「高レベル・高威力」から max_spells 個だけ（分岐を増やしすぎない）
+    offensive.sort(key=lambda x: (-x[0], -x[1], x[2]))
+    for _lv, _power, name, spell_json in offensive[:max_spells]:
+        out.extend(
+            _offensive_variants(
+                kind="magic",
+                command=command,
+                target=str(spell_json.get("Target") or ""),
+                enemies=enemies,
+                spell_name=name,
+            )
+        )
+    return out
+
+
+def _is_offensive_item(item_json: Dict[str, Any]) -> bool:
+    effect = str((item_json.get("SpellInfo") or {}).get("Effect") or "").lower()
+    return any(w in effect for w in ("deal", "inflict", "absorb"))
+
+
+def _item_actions(
+    party: Sequence[PartyMemberRuntime],
+    enemies: Sequence[EnemyRuntime],
+    command: str,
+    items_by_name: Dict[str, Dict[str, Any]],
+    save: Optional[dict],
+    max_items: int,
+) -> List[PlannedAction]:
+    if not isinstance(save, dict):
+        return []
+    out: List[PlannedAction] = []
+    n_offensive = 0
+    for name, _itype, qty in build_item_list(items_by_name, save, in_battle=True):
+        item_json = items_by_name.get(name)
+        if qty <= 0 or not item_json:
+            continue
+        if not is_item_visible_in_context(item_json, in_combat=True):
+            continue
+        info = item_json.get("SpellInfo") or {}
+        if _is_offensive_item(item_json):
+            if n_offensive >= max_items:
+                continue
+            n_offensive += 1
+            out.extend(
+                _offensive_variants(
+                    kind="item",
+                    command=command,
+                    target=str(info.get("Target") or ""),
+                    enemies=enemies,
+                    item_name=name,
+                )
+            )
+            continue
+        heal = healing_spell_kind(info)
+        if heal is None and "full hp" in str(info.get("Effect") or "").lower():
+            heal = "hp"  # Elixir
+        targets = (
+            _status_targets(str(info.get("Effect") or ""), party)
+            if heal == "status"
+            else _support_targets(heal, party)
+        )
+        for t in targets:
+            out.append(
+                PlannedAction(
+                    kind="item",
+                    command=command,
+                    item_name=name,
+                    target_side="ally",
+                    target_index=t,
+                )
+            )
+    return out
+
+
+def _job_commands(pm: PartyMemberRuntime) -> Sequence[str]:
+    # BattleCommand1..4 は JobProfile に前計算済み（ノード展開ごとに job.raw を読み直さない）
+    return job_profile(pm.job).commands or ("Fight", "Defend", "Item", "Run")
+
+
+def build_member_actions(
+    member_idx: int,
+    party: Sequence[PartyMemberRuntime],
+    enemies: Sequence[EnemyRuntime],
+    *,
+    spells_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    items_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    save: Optional[dict] = None,
+    magic_list: Optional[Sequence[Tuple[str, Any, int]]] = None,
+    max_spells: int = 4,
+    max_items: int = 4,
+) -> List[Optional[PlannedAction]]:
+    """
+    メンバー1人の行動候補を返す。先頭は必ず「先頭の生存敵へ Fight」相当（フォールバック兼用）。
+    ・ジョブの BattleCommand（Run/Flee は探索しない）
+    ・magic_list のうち MP が残っている魔法（回復は効果のある味方だけ、攻撃は上位 max_spells 個）
+    ・戦闘中に使えるアイテム（在庫あり）
+    戦闘不能 / ジャンプ中（行動は解決側で上書きされる）なら [None]
+    """
+    pm = party[member_idx]
+    if is_out_of_battle(pm.state) or pm.state.is_jumping:
+        return [None]
+    t0 = first_alive_enemy_index(enemies)
+    if t0 is None:
+        return [None]
+
+    actions: List[Optional[PlannedAction]] = []
+    for cmd in _job_commands(pm):
+        kind = normalize_battle_command(cmd)
+        if kind == "run":
+            continue
+        if kind == "magic":
+            if spells_by_name and magic_list:
+                actions.extend(
+                    _spell_actions(
+                        pm, party, enemies, cmd, magic_list, spells_by_name, max_spells
+                    )
+                )
+            continue
+        if kind == "item":
+            if items_by_name:
+                actions.extend(
+                    _item_actions(party, enemies, cmd, items_by_name, save, max_items)
+                )
+            continue
+        if kind == "defend" or (kind == "special" and cmd in SPECIAL_NO_TARGET):
+            actions.append(
+                PlannedAction(
+                    kind=kind,
+                    command=cmd,
+                    target_side="self",
+                    target_index=member_idx,
+                )
+            )
+            continue
+        for i in _enemy_targets(enemies):
+            actions.append(
+                PlannedAction(
+                    kind=kind, command=cmd, target_side="enemy", target_index=i
+                )
+            )
+
+    # 先頭をフォールバック用の Fight に揃える（コマンドに Fight が無いジョブでも必ず1つは行動がある）
+    fallback = PlannedAction(
+        kind="physical", command="Fight", target_side="enemy", target_index=t0
+    )
+    actions = [a for a in actions if a != fallback]
+    return [fallback, *actions]
+
+
+# ============================================================
+# 探索木
+# ============================================================
+
+
+@dataclass(slots=True)
+class _Node:
+    # メンバーごとの行動候補と、その訪問回数・累積評価値（decoupled UCT）
+    actions: List[List[Optional[PlannedAction]]]
+    visits: List[List[int]]
+    totals: List[List[float]]
+    n: int = 0
+
+    @classmethod
+    def from_actions(cls, actions: List[List[Optional[PlannedAction]]]) -> "_Node":
+        return cls(
+            actions=actions,
+            visits=[[0] * len(a) for a in actions],
+            totals=[[0.0] * len(a) for a in actions],
+        )
+
+    def select(self, exploration: float, widening: float) -> List[int]:
+        """
+        メンバーごとに UCB1 で行動を選ぶ。
+        progressive widening：候補は先頭から 1 + widening*sqrt(n) 個だけ使う
+        （予算が短くイテレーションが少ないとき、全候補を1回ずつ試すだけで終わらないように）
+        """
+        picks: List[int] = []
+        log_n = math.log(self.n + 1)
+        width = 1 + int(widening * math.sqrt(self.n))
+        for visits, totals in zip(self.visits, self.totals):
+            k = min(width, len(visits))
+            untried = next((i for i in range(k) if visits[i] == 0), None)
+            if untried is not None:
+                picks.append(untried)
+                continue
+            best = max(
+                range(k),
+                key=lambda i: totals[i] / visits[i]
+                + exploration * math.sqrt(log_n / visits[i]),
+            )
+            picks.append(best)
+        return picks
+
+    def update(self, picks: Sequence[int], value: float) -> None:
+        self.n += 1
+        for m, a in enumerate(picks):
+            self.visits[m][a] += 1
+            self.totals[m][a] += value
+
+    def best(self) -> List[Optional[PlannedAction]]:
+        # 訪問回数が最多の行動（同数なら平均評価値が高いほう、さらに同じなら先頭寄り）
+        return [
+            acts[
+                max(
+                    range(len(acts)),
+                    key=lambda i: (
+                        visits[i],
+                        totals[i] / visits[i] if visits[i] else 0.0,
+                        -i,
+                    ),
+                )
+            ]
+            for acts, visits, totals in zip(self.actions, self.visits, self.totals)
+        ]
+
+
+# 置換表のキー（hash() に潰すと衝突した別の状態が同じノードを共有するので、タプルのまま引く）
+_StateKey = Tuple[int, Tuple[Tuple[Any, ...], ...]]
+
+
+def _state_key(
+    depth: int,
+    party: Sequence[PartyMemberRuntime],
+    enemies: Sequence[EnemyRuntime],
+) -> _StateKey:
+    """置換表のキー：深さ + 全員の可変状態（HP / 状態異常 / MP / Reflect / ジャンプ / 溜め）"""
+    return (
+        depth,
+        tuple(
+            (
+                a.state.hp,
+                frozenset(a.state.statuses),
+                tuple(a.state.mp_pool.values()),
+                a.state.reflect_charges,
+                a.state.is_jumping,
+                a.state.boost_count,
+                a.state.cheer_bonus,
+            )
+            for a in (*party, *enemies)
+        ),
+    )
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+@dataclass
+class MctsPlanner:
+    """
+    1ラウンド分の PlannedAction を時間予算内の MCTS で選ぶ。
+    planner(party_members, enemies, rng) で BattlePolicy としてそのまま使える。
+    budget_ms は1回の判断にかける壁時計時間の上限（UI が止まらないよう短めに）
+    """
+
+    state: RuntimeState
+    spells_by_name: Optional[Dict[str, Dict[str, Any]]] = None
+    items_by_name: Optional[Dict[str, Dict[str, Any]]] = None
+    budget_ms: float = 50.0
+    tree_depth: int = 2
+    rollout_rounds: int = 2
+    exploration: float = 1.0
+    widening: float = 1.5
+    max_spells: int = 4
+    max_items: int = 4
+    seed: Optional[int] = None
+
+    rng: Random = field(init=False, repr=False)
+    last_stats: Dict[str, float] = field(init=False, default_factory=dict)
+    _magic_lists: Dict[str, List[Tuple[str, Any, int]]] = field(
+        init=False, default_factory=dict, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.budget_ms <= 0:
+            raise ValueError(f"budget_ms は正の値にしてください: {self.budget_ms}")
+        if self.items_by_name is None:
+            self.items_by_name = self.state.items_by_name
+        self.rng = Random(self.seed)
+
+    # ---- BattlePolicy として ----
+    def __call__(
+        self,
+        party_members: List[PartyMemberRuntime],
+        enemies: List[EnemyRuntime],
+        rng: Random,
+    ) -> List[Optional[PlannedAction]]:
+        return self.plan(party_members, enemies)
+
+    def bind_state(self, state: RuntimeState) -> None:
+        """試行ごとに複製された RuntimeState を使う（run_battle_headless が呼ぶ）"""
+        self.state = state
+
+    # ---- 行動候補 ----
+    def _magic_list_for(self, pm: PartyMemberRuntime) -> List[Tuple[str, Any, int]]:
+        job_name = pm.job.name
+        if job_name not in self._magic_lists:
+            self._magic_lists[job_name] = (
+                build_magic_list(
+                    self.spells_by_name,
+                    allowed_names=allowed_spell_names_for_job(pm.job),
+                    cast_code=job_profile(pm.job).cast_code,
+                )
+                if self.spells_by_name
+                else []
+            )
+        return self._magic_lists[job_name]
+
+    def _actions(
+        self,
+        party: Sequence[PartyMemberRuntime],
+        enemies: Sequence[EnemyRuntime],
+        fixed: Sequence[Optional[PlannedAction]],
+    ) -> List[List[Optional[PlannedAction]]]:
+        out: List[List[Optional[PlannedAction]]] = []
+        for i, pm in enumerate(party):
+            if i < len(fixed) and fixed[i] is not None:
+                out.append([fixed[i]])
+                continue
+            acts = build_member_actions(
+                i,
+                party,
+                enemies,
+                spells_by_name=self.spells_by_name,
+                items_by_name=self.items_by_name,
+                save=self.state.save,
+                magic_list=self._magic_list_for(pm),
+                max_spells=self.max_spells,
+                max_items=self.max_items,
+            )
+            # 先頭（Fight）以外は順番を混ぜる：progressive widening で先に試す候補が偏らないように
+            tail = acts[1:]
+            self.rng.shuffle(tail)
+            out.append([acts[0], *tail])
+        return out
+
+    # ---- 評価 ----
+    @staticmethod
+    def _evaluate(
+        end_reason: str,
+        party: Sequence[PartyMemberRuntime],
+        enemies: Sequence[EnemyRuntime],
+        rounds: int,
+    ) -> float:
+        party_hp = sum(max(0, pm.state.hp) for pm in party)
+        party_max = sum(pm.max_hp or 1 for pm in party)
+        enemy_hp = sum(max(0, em.state.hp) for em in enemies if not is_out_of_battle(em.state))
+        enemy_max = sum(em.max_hp or 1 for em in enemies)
+        party_ratio = party_hp / party_max if party_max else 0.0
+        enemy_ratio = enemy_hp / enemy_max if enemy_max else 0.0
+
+        if end_reason == "char_defeated":
+            value = 0.0
+        elif end_reason in ("enemy_defeated", "enemy_escaped"):
+            value = WIN_BASE + (1.0 - WIN_BASE) * party_ratio
+        elif end_reason == "escaped":
+            value = ESCAPED_VALUE
+        else:
+            value = WIN_BASE * (0.5 * (1.0 - enemy_ratio) + 0.5 * party_ratio)
+        return value * ROUND_DISCOUNT**rounds
+
+    # ---- 探索 ----
+    def _step(
+        self,
+        party: List[PartyMemberRuntime],
+        enemies: List[EnemyRuntime],
+        actions: List[Optional[PlannedAction]],
+        deadline: float,
+    ) -> str:
+        if time.perf_counter() >= deadline:
+            raise _OutOfTime
+        _logs, result, _events = simulate_one_round_multi_party(
+            party,
+            enemies,
+            actions,
+            state=self.state,
+            rng=self.rng,
+            save=self.state.save,
+            spells_by_name=self.spells_by_name,
+            items_by_name=self.items_by_name,
+        )
+        return result.end_reason
+
+    def _iterate(
+        self,
+        party: List[PartyMemberRuntime],
+        enemies: List[EnemyRuntime],
+        root: _Node,
+        table: Dict[_StateKey, Optional[_Node]],
+        deadline: float,
+    ) -> None:
+        node: Optional[_Node] = root
+        path: List[Tuple[_Node, List[int]]] = []
+        end_reason = "continue"
+        rounds = 0
+
+        # ② 木の中
+        while rounds < self.tree_depth and end_reason == "continue":
+            if node is None:
+                key = _state_key(rounds, party, enemies)
+                if key not in table:
+                    # 初めて見る状態は印だけ付けてロールアウトへ（2回目に来たら展開する）
+                    # → 乱数で枝分かれして二度と来ない状態のために行動候補を作らない
+                    table[key] = None
+                    break
+                node = table[key]
+                if node is None:
+                    node = _Node.from_actions(self._actions(party, enemies, ()))
+                    table[key] = node
+            picks = node.select(self.exploration, self.widening)
+            joint = [acts[p] for acts, p in zip(node.actions, picks)]
+            end_reason = self._step(party, enemies, joint, deadline)
+            path.append((node, picks))
+            rounds += 1
+            node = None
+
+        # ③ ロールアウト
+        limit = rounds + self.rollout_rounds
+        while rounds < limit and end_reason == "continue":
+            joint = policy_always_fight(party, enemies, self.rng)
+            end_reason = self._step(party, enemies, joint, deadline)
+            rounds += 1
+
+        # ④ 逆伝播
+        value = self._evaluate(end_reason, party, enemies, rounds)
+        for n, picks in path:
+            n.update(picks, value)
+
+    def plan(
+        self,
+        party_members: List[PartyMemberRuntime],
+        enemies: List[EnemyRuntime],
+        fixed_actions: Optional[Sequence[Optional[PlannedAction]]] = None,
+    ) -> List[Optional[PlannedAction]]:
+        """
+        1ラウンド分の行動（メンバー順、行動しない枠は None）を返す。
+        fixed_actions の None でない枠はその行動で固定（UI で入力済みのメンバー）。
+        探索後は party_members / enemies / state.save を呼び出し時の状態へ戻す。
+        """
+        t_start = time.perf_counter()
+        deadline = t_start + self.budget_ms / 1000.0
+        fixed = list(fixed_actions or ())
+
+        root = _Node.from_actions(self._actions(party_members, enemies, fixed))
+        table: Dict[_StateKey, Optional[_Node]] = {}
+        iterations = 0
+
+        snap = BattleSnapshot.capture(party_members, enemies, self.state.save)
+        try:
+            with verbosity(QUIET):
+                while time.perf_counter() < deadline:
+                    try:
+                        self._iterate(party_members, enemies, root, table, deadline)
+                    except _OutOfTime:
+                        break
+                    finally:
+                        snap.restore()
+                    iterations += 1
+        finally:
+            snap.restore()
+
+        if iterations:
+            planned = root.best()
+        else:
+            # 1回も回らなかった（予算が短すぎる）→ 入力済み以外は既定ポリシー
+            planned = policy_always_fight(party_members, enemies, self.rng)
+            planned = [
+                fixed[i] if i < len(fixed) and fixed[i] is not None else a
+                for i, a in enumerate(planned)
+            ]
+
+        self.last_stats = {
+            "iterations": iterations,
+            "elapsed_ms": (time.perf_counter() - t_start) * 1000.0,
+            "nodes": 1 + sum(n is not None for n in table.values()),
+        }
+        return planned
+
+
+def make_mcts_policy(state: RuntimeState, **kwargs: Any) -> MctsPlanner:
+    """simulate_many_battles_multi_party(policy=...) に渡せる MCTS ポリシーを作る"""
+    return MctsPlanner(state, **kwargs)
@@ -2,8 +2,11 @@
 # models: Job / Character / Enemy などデータクラス
 
 # SideTurnResult: 片側（キャラ側or敵側）のターン処理の結果（終了理由・逃走可否・敵被弾情報など）をまとめる結果クラス
+# MpPool: レベル1〜8の魔法回数（MP）を array('h') 1本で持つ固定長マッピング（dict {1..8: int} と同じ書き方で使える）
 # BattleActorState: 戦闘中のアクター（キャラ/敵）の変動ステータス（HP・状態異常・MP・部分石化ゲージ・リフレク・一時フラグなど）を保持するクラス
 # JobLevelStats: ジョブごとのレベル別ステータス（Str/Agi/Vit/Int/MndとMPテーブル）を1レベル分だけ保持する行クラス
+# JobGrowthTable: ジョブのレベル別ステータス・MP・HP期待値を Lv1〜99 の添字で引ける形に前計算した成長表
+# JobProfile: ジョブのコマンド一覧・コマンド別SP・使用可能魔法・詠唱コード・装備可能な武器/防具名を前計算したもの
 # Job: ジョブ名・取得条件と、レベル別ステータス/武器防具/魔法定義など原データを束ねるジョブ定義クラス
 # BaseCharacter: 装備を含まないキャラクターの基礎ステータス（レベル・職Lv・能力値・前列/後列）を表すクラス
 # EquipmentSet: キャラクターが装備している武器/防具（main_hand/off_hand/head/body/arms）の名前セットを表すクラス
@@ -24,6 +27,8 @@
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterable, Mapping, MutableMapping
 from dataclasses import dataclass, field
 from typing import (
     Optional,
@@ -84,16 +89,73 @@ class SideTurnResult:
     enemy_attack_result: Optional[EnemyAttackResult] = None  # 敵ターン用
 
 
-@dataclass
+# ★追加：MP プール（dict {1..8: int} を置き換える固定長・省メモリ版）
+class MpPool(MutableMapping):
+    """
+    レベル1〜8の魔法回数を array('h')（8 × 2 バイト）で保持する。
+    pool[lvl] / pool.get(lvl, 0) / pool.items() / dict(pool) / sum(pool.values()) など
+    従来の dict と同じ書き方で使える。キーは 1〜8 の int 固定（それ以外は KeyError）。
+    """
+
+    __slots__ = ("_counts",)
+
+    def __init__(self, counts: Optional[Mapping[int, int] | Iterable[int]] = None):
+        self._counts = array("h", bytes(16))
+        if counts is None:
+            return
+        if isinstance(counts, Mapping):
+            for lvl, v in counts.items():
+                self[int(lvl)] = int(v)
+        else:
+            for i, v in enumerate(counts):
+                self[i + 1] = int(v)
+
+    def __getitem__(self, lvl: int) -> int:
+        if type(lvl) is not int or not 1 <= lvl <= 8:
+            raise KeyError(lvl)
+        return self._counts[lvl - 1]
+
+    def __setitem__(self, lvl: int, value: int) -> None:
+        if type(lvl) is not int or not 1 <= lvl <= 8:
+            raise KeyError(lvl)
+        self._counts[lvl - 1] = value
+
+    def __delitem__(self, lvl: int) -> None:
+        # 固定長なので「削除」は 0 に戻すだけ
+        self[lvl] = 0
+
+    def __iter__(self):
+        return iter(range(1, 9))
+
+    def __len__(self) -> int:
+        return 8
+
+    def __repr__(self) -> str:
+        return f"MpPool({dict(self)})"
+
+    def __reduce__(self):
+        return (MpPool, (self._counts.tolist(),))
+
+    def copy(self) -> "MpPool":
+        new = MpPool.__new__(MpPool)
+        new._counts = array("h", self._counts)
+        return new
+
+    def __copy__(self) -> "MpPool":
+        return self.copy()
+
+    def __deepcopy__(self, memo) -> "MpPool":
+        return self.copy()
+
+
+@dataclass(slots=True)
 class BattleActorState:
     hp: int
     statuses: Set[Status] = field(default_factory=set)
     max_hp: Optional[int] = None
 
-    mp_pool: Dict[int, int] = field(default_factory=lambda: {i: 0 for i in range(1, 9)})
-    max_mp_pool: Dict[int, int] = field(
-        default_factory=lambda: {i: 0 for i in range(1, 9)}
-    )
+    mp_pool: MpPool = field(default_factory=MpPool)
+    max_mp_pool: MpPool = field(default_factory=MpPool)
 
     partial_petrify_gauge: float = 0.0
 
@@ -113,6 +175,9 @@ class BattleActorState:
     # ★ Bard の Cheer 回数
     cheer_count: int = 0  # ★ 追加
 
+    # ★追加：Cheer による攻撃力ボーナス（phys_damage が getattr で読む。slots 化で後付け不可になったため明示）
+    cheer_bonus: int = 0
+
     def has(self, status: Status) -> bool:
         return status in self.statuses
 
@@ -134,6 +199,75 @@ class JobLevelStats:
     mp: Dict[str, int] = field(default_factory=dict)
 
 
+# ★追加：ジョブ成長表（char_build.compile_job_growth が StatsByLevel から作る）
+@dataclass(slots=True, frozen=True)
+class JobGrowthTable:
+    """
+    Lv1〜99 の各レベルについて、補完済みの Str/Agi/Vit/Int/Mnd・最大MP（L1〜L8）・
+    最大HP期待値を添字 = レベルで持つ（添字0は未使用）。
+    範囲外のレベルは 1 / 99 に丸める（interpolate_stats / interpolate_mp の端点扱いと同じ）。
+    HP期待値は StatsByLevel に欠けたレベルがあると、そのレベル以降は None（引くと KeyError）。
+    """
+
+    stats: Tuple[Tuple[int, int, int, int, int], ...]  # (Str, Agi, Vit, Int, Mnd)
+    max_mp: Tuple[MpPool, ...]
+    expected_hp: Tuple[Optional[int], ...]
+    missing_levels: Tuple[int, ...] = ()
+
+    @staticmethod
+    def _index(level: int) -> int:
+        return 1 if level < 1 else 99 if level > 99 else level
+
+    def stats_at(self, level: int) -> Tuple[int, int, int, int, int]:
+        return self.stats[self._index(level)]
+
+    def max_mp_at(self, level: int) -> MpPool:
+        """最大MPプール（呼び出し側で書き換えてよいようにコピーを返す）"""
+        return self.max_mp[self._index(level)].copy()
+
+    def expected_max_hp_at(self, level: int) -> int:
+        """expected_max_hp_from_vit_table(initial_hp_lv1=32, rand_expect=1.25) と同じ値"""
+        if not (1 <= level <= 99):
+            raise ValueError(f"target_level must be 1..99, got {level}")
+        hp = self.expected_hp[level]
+        if hp is None:
+            missing = [lv for lv in self.missing_levels if lv <= level]
+            raise KeyError(
+                f"job_stats_levels に Level が不足しています: {missing[:10]}"
+                + (" ..." if len(missing) > 10 else "")
+            )
+        return hp
+
+
+# ★追加：ジョブの行動・装備まわりの前計算（job_profile.compile_job_profile が job.raw から作る）
+@dataclass(slots=True, frozen=True)
+class JobProfile:
+    """
+    戦闘の行動ごと・メニュー再描画ごとに job.raw を読み直さないための前計算。
+    commands は BattleCommand1..4 の Command（空欄は飛ばす）、
+    command_skillpoints は Command → SkillPoints（数値でなければ 0）。
+    weapon_names / armor_names は job.raw["Weapons"] / ["Armors"]（EquippedBy から補完済み）の Name。
+    """
+
+    name: str
+    commands: Tuple[str, ...]
+    command_skillpoints: Dict[str, int]  # 共有なので書き換えないこと（MappingProxy は pickle できない）
+    allowed_spells: FrozenSet[str]
+    cast_code: Optional[str]  # JOB_CAST_CODE（魔法を使わないジョブは None）
+    equip_code: Optional[str]  # JOB_EQUIP_CODE（EquippedBy の略号。表に無いジョブは None）
+    weapon_names: FrozenSet[str]
+    armor_names: FrozenSet[str]
+
+    def skillpoints_for(self, command_name: str) -> int:
+        return self.command_skillpoints.get(command_name, 0)
+
+    def can_equip_weapon(self, name: Optional[str]) -> bool:
+        return name in self.weapon_names
+
+    def can_equip_armor(self, name: Optional[str]) -> bool:
+        return name in self.armor_names
+
+
 @dataclass
 class Job:
     name: str
@@ -143,6 +277,10 @@ class Job:
     raw: Dict[
         str, Any
     ]  # Weapons / Armors / Spells なども後で使いたければここに残しておく
+    # ★追加：ロード時に前計算した成長表（None なら char_build.job_growth が初回に作る）
+    growth: Optional[JobGrowthTable] = field(default=None, repr=False, compare=False)
+    # ★追加：ロード時に前計算したコマンド・SP・魔法・装備可否（None なら job_profile.job_profile が初回に作る）
+    profile: Optional[JobProfile] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -173,7 +311,7 @@ class EquipmentSet:
     arms: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalCharacterStats:
     """ダメージ計算に使うキャラクター最終ステータス"""
 
@@ -222,7 +360,7 @@ class FinalCharacterStats:
     off_weapon_elements: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalEnemyStats:
     """ダメージ計算に使う敵最終ステータス（JSON からそのまま整形）"""
 
@@ -251,7 +389,7 @@ class FinalEnemyStats:
 
 
 # 魔法用構造体
-@dataclass
+@dataclass(slots=True)
 class SpellInfo:
     power: int  # BasePower
     accuracy_percent: int
@@ -269,7 +407,7 @@ class EnemyCasterStats:
 
 
 # 攻撃結果を返す用の dataclass
-@dataclass
+@dataclass(slots=True)
 class EnemyAttackResult:
     damage: int
     attack_type: Literal["normal", "special", "mixed"]  # mixed = 期待値モード
@@ -291,7 +429,7 @@ class EnemyAttackResult:
 
 
 # 1ターンの攻防ループ結果用クラス
-@dataclass
+@dataclass(slots=True)
 class OneTurnResult:
     # 変更後:
     char_state: BattleActorState
@@ -343,11 +481,11 @@ class PartyMemberRuntime:
         return self.state.max_hp if self.state.max_hp is not None else self.state.hp
 
     @property
-    def mp_pool(self) -> Dict[int, int]:
+    def mp_pool(self) -> MpPool:
         return self.state.mp_pool
 
     @property
-    def max_mp_pool(self) -> Dict[int, int]:
+    def max_mp_pool(self) -> MpPool:
         return self.state.max_mp_pool
 
     @property
@@ -384,7 +522,7 @@ class EnemyRuntime:
         return self.state.max_hp if self.state.max_hp is not None else self.state.hp
 
 
-@dataclass
+@dataclass(slots=True)
 class PlannedAction:
     kind: BattleKind
     command: Optional[str] = (
@@ -410,7 +548,7 @@ class PartyMagicInfo:
 
 
 # 攻撃結果（キャラ攻撃・敵攻撃 共通で使える）
-@dataclass
+@dataclass(slots=True)
 class AttackResult:
     damage: int
     hit_count: int
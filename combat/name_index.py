@@ -0,0 +1,84 @@
+# ============================================================
+# name_index: マスタデータ（名前→定義 dict）の正規化名インデックス（表記ゆれ吸収・O(1)）
+
+# NameIndex	正規化名 → マスタのキー（正式名）の索引（マスタ dict 1つにつき1つ）
+# name_index	マスタ dict ごとに1回だけ NameIndex を作って使い回す
+# lookup_by_name	名前で定義を引く（完全一致 → normalize_name 一致の順。無ければ None）
+# canonical_name	表記ゆれのある名前をマスタのキー（正式名）に直す（無ければ None）
+# invalidate_name_indexes	索引を捨てる（マスタ dict のキーをその場で書き換えたとき）
+# ============================================================
+# ・正規化は utils.name_normalize.normalize_name（NFKC + 小文字化 + 空白・記号除去）に統一
+# ・索引は 正規化名 → キー を持つだけなので、マスタの値（定義 dict）を差し替えても作り直し不要
+# ・正規化名が衝突したときは先に出てきたキーを採用する（build_name_index と違い例外にしない）
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from utils.name_normalize import normalize_name
+
+
+@dataclass(slots=True, frozen=True)
+class NameIndex:
+    keys: Dict[str, str]  # 正規化名 → マスタのキー
+
+    def canonical(self, name: Optional[str]) -> Optional[str]:
+        if not isinstance(name, str) or not name:
+            return None
+        return self.keys.get(normalize_name(name))
+
+
+def _compile_name_index(master: Dict[str, Any]) -> NameIndex:
+    keys: Dict[str, str] = {}
+    for k in master:
+        if isinstance(k, str):
+            keys.setdefault(normalize_name(k), k)
+    return NameIndex(keys=keys)
+
+
+# id(マスタ dict) → (その dict, 件数, 索引)。dict を保持するので id が再利用されることはない
+_INDEXES: Dict[int, Tuple[Dict[str, Any], int, NameIndex]] = {}
+_INDEXES_MAX = 64
+
+
+def name_index(master: Dict[str, Any]) -> NameIndex:
+    """
+    マスタ dict の NameIndex（dict ごとに1回だけ作る）。
+    件数が変わっていたら作り直す（件数を変えずにキーを書き換えたときは invalidate_name_indexes() を呼ぶ）
+    """
+    hit = _INDEXES.get(id(master))
+    if hit is not None and hit[0] is master and hit[1] == len(master):
+        return hit[2]
+    index = _compile_name_index(master)
+    if len(_INDEXES) >= _INDEXES_MAX:
+        _INDEXES.clear()
+    _INDEXES[id(master)] = (master, len(master), index)
+    return index
+
+
+def canonical_name(master: Dict[str, Any], name: Optional[str]) -> Optional[str]:
+    """表記ゆれのある名前 → マスタのキー（完全一致を優先。無ければ None）"""
+    if not isinstance(name, str) or not name:
+        return None
+    if name in master:
+        return name
+    return name_index(master).canonical(name)
+
+
+def lookup_by_name(master: Dict[str, Any], name: Optional[str]) -> Optional[Any]:
+    """
+    名前 → マスタの定義（無ければ None）。
+    まず完全一致で引き、無ければ正規化名で引く（"fire" / " FIRE " / "Ｆｉｒｅ" → "Fire"）
+    """
+    if not isinstance(name, str) or not name:
+        return None
+    value = master.get(name)
+    if value is not None:
+        return value
+    key = name_index(master).canonical(name)
+    return master.get(key) if key is not None else None
+
+
+def invalidate_name_indexes() -> None:
+    _INDEXES.clear()
@@ -0,0 +1,585 @@
+# ============================================================
+# party_search: パーティのジョブ構成を CP 予算内で探す（python -m combat.party_search）
+
+# EvalCache	(パーティ指紋, ロケーション, ポリシー, 評価設定, マスタデータの指紋) → 勝利数・ラウンド数 の永続キャッシュ（JSONL 追記）
+# party_fingerprint	ジョブ・レベル・ジョブLv・隊列・装備からパーティの指紋を作る
+# PartyEval	1構成の評価結果（勝率・平均ラウンド数・クリアまでの期待ラウンド数・必要 CP）
+# PartySearch	ロケーション・ポリシー・評価設定を固定して、ジョブ構成 → パーティ構築 → 評価（キャッシュ経由）を行う
+# PartySearchResult	search_party_jobs の戻り値
+# search_party_jobs	1人ずつジョブを替えた近傍をビームサーチ（beam_width=1 なら山登り）で探す
+# main	CLI エントリポイント
+# ============================================================
+# ・22^4 通りを全部シミュレーションするのは無理なので、
+#     1) CP 予算を超える構成はシミュレーション前に落とす
+#     2) 近傍は screen_trials 回の粗い評価で並べ、上位 top_k だけを trials 回で評価し直す
+#     3) 評価は EvalCache に残るので、同じ構成・同じ条件は2回目以降シミュレーションしない（再実行・別の探索でも）
+#        マスタ JSON を書き換えると RuntimeState.data_fingerprint が変わり、古い評価は引かない
+# ・キャッシュのキーにするポリシー名は、名前付きのモジュール関数なら自動（module.qualname）。
+#   lambda / partial / MctsPlanner のようなインスタンスは設定が名前に出ないので policy_key が必須
+# ・ロケーションの敵編成は最初に seed から n_formations 個を抽選し、全構成で同じ編成・同じシードを使う
+#   （共通乱数。構成どうしの差が抽選の当たり外れに埋もれない）
+# ・パーティはセーブのレベル・隊列のまま、HP/MP 満タン・状態異常なしで作る（sweep と同じ）
+# ・ジョブLv はセーブの job_levels（無ければ 1）、CP は compute_job_change_cp_cost をメンバーごとに足した値
+# ・装備は equip="keep" ならセーブのまま（新ジョブで装備できない物は外れる）、
+#   equip="optimize" なら所持品 + パーティ全員の現在装備を共有の在庫として、
+#   前の人から順に equip_optimizer で選ぶ（前列は damage、後列は survival。開始構成も選び直した装備で評価する）
+
+from __future__ import annotations
+
+import argparse
+import copy
+import hashlib
+import json
+import sys
+import types
+from dataclasses import dataclass, field
+from pathlib import Path
+from random import Random
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from combat.battle_sim import BattlePolicy, policy_always_fight, simulate_many_battles_multi_party
+from combat.char_build import build_party_members_from_save
+from combat.enemy_selection import build_location_index, pick_enemy_names
+from combat.equip_optimizer import EQUIP_SLOTS, SlotTable, optimize_equipment
+from combat.magic_menu import expand_spells_for_summons
+from combat.models import EquipmentSet, PartyMemberRuntime
+from combat.runtime_state import RuntimeState, init_runtime_state
+from combat.verbosity import QUIET, verbosity
+from system.cp_system import compute_job_change_cp_cost, load_job_attribution
+from system.exp_system import LevelTable
+
+OBJECTIVES: Tuple[str, ...] = ("win_rate", "clear_time")
+
+Jobs = Tuple[str, ...]
+
+
+class EvalCache:
+    """
+    評価結果の永続キャッシュ。path を渡すと起動時に読み込み、put のたびに1行追記する
+    （途中で止めてもそこまでの評価は残る）。path=None ならメモリだけ。
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        if self.path is not None and self.path.exists():
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 書きかけの最終行など
+                    if isinstance(row, dict) and "key" in row:
+                        self._rows[row["key"]] = row
+
+    @staticmethod
+    def make_key(
+        fingerprint: str, location: str, policy: str, settings: str, data: str
+    ) -> str:
+        return "|".join((fingerprint, location, policy, settings, data))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._rows.get(key)
+        if row is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return row
+
+    def put(self, key: str, row: Dict[str, Any]) -> None:
+        row = {"key": key, **row}
+        self._rows[key] = row
+        if self.path is not None:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def party_fingerprint(party: Sequence[PartyMemberRuntime]) -> str:
+    """戦闘結果に効く構成（名前・ジョブ・Lv・ジョブLv・隊列・装備）の sha1（先頭16桁）"""
+    rows = []
+    for pm in party:
+        eq = pm.equipment or EquipmentSet()
+        rows.append(
+            [
+                pm.name,
+                pm.job.name,
+                pm.base.level,
+                pm.base.job_level,
+                pm.base.row,
+                [getattr(eq, s) for s in EQUIP_SLOTS],
+            ]
+        )
+    blob = json.dumps(rows, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class PartyEval:
+    jobs: Jobs
+    fingerprint: str
+    cp_cost: int
+    trials: int
+    wins: float  # 1人 vs 1体を厳密解で求めた分は期待値（小数）
+    total_rounds: int
+    cached: bool = False
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.trials if self.trials else 0.0
+
+    @property
+    def average_turns(self) -> float:
+        return self.total_rounds / self.trials if self.trials else 0.0
+
+    @property
+    def rounds_per_win(self) -> float:
+        """負けたらやり直す前提での、1勝までの期待ラウンド数（勝ち無しなら inf）"""
+        return self.total_rounds / self.wins if self.wins else float("inf")
+
+    def score(self, objective: str) -> Tuple[float, float]:
+        if objective == "clear_time":
+            return (-self.rounds_per_win, self.win_rate)
+        return (self.win_rate, -self.average_turns)
+
+
+def _policy_key(policy: BattlePolicy) -> str:
+    """
+    名前付きのモジュール関数なら "module.qualname"。
+    lambda / partial / 呼び出し可能なインスタンス / 関数内で作った関数は、同じ名前でも
+    束縛した引数や設定で結果が変わるので、キャッシュを取り違えないよう ValueError
+    """
+    name = getattr(policy, "__qualname__", None)
+    if not isinstance(policy, types.FunctionType) or not name or "<" in name:
+        raise ValueError(
+            f"名前付き関数以外のポリシーには policy_key を指定してください: {policy!r}"
+        )
+    return f"{policy.__module__}.{name}"
+
+
+@dataclass
+class PartySearch:
+    state: RuntimeState
+    level_table: LevelTable
+    location: str
+    job_attr: Dict[str, Dict[str, int]]
+    cache: EvalCache = field(default_factory=EvalCache)
+    policy: Optional[BattlePolicy] = None
+    policy_key: Optional[str] = None
+    objective: str = "win_rate"
+    equip: str = "keep"  # keep / optimize
+    n_formations: int = 8
+    seed: int = 0
+    max_rounds: int = 50
+    difficulty: int = 0
+    spells_by_name: Optional[Dict[str, Dict[str, Any]]] = None
+
+    simulated_battles: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        if self.objective not in OBJECTIVES:
+            raise ValueError(
+                f"objective は {', '.join(OBJECTIVES)} のいずれかです: {self.objective}"
+            )
+        if self.equip not in ("keep", "optimize"):
+            raise ValueError(f"equip は keep / optimize のいずれかです: {self.equip}")
+        entry = next(
+            (e for e in build_location_index(self.state.monsters) if e.location == self.location),
+            None,
+        )
+        if entry is None:
+            raise KeyError(f"ロケーション {self.location} が見つかりません")
+        self._location_entry = entry
+
+        rng = Random(self.seed)
+        self.formations: List[List[str]] = [
+            pick_enemy_names(entry, self.state.monsters, rng=rng)
+            for _ in range(max(1, self.n_formations))
+        ]
+        self._formation_seeds = [rng.getrandbits(32) for _ in self.formations]
+
+        if self.policy is None:
+            self.policy = policy_always_fight
+        if self.policy_key is None:
+            self.policy_key = _policy_key(self.policy)
+        if self.spells_by_name is None:
+            self.spells_by_name = expand_spells_for_summons(self.state.spells)
+
+        self._save_party: List[dict] = list(self.state.save.get("party", []))
+        self._table: Optional[SlotTable] = None
+        self._member_cache: Dict[Tuple[int, str], PartyMemberRuntime] = {}
+        self._party_cache: Dict[Jobs, Tuple[List[PartyMemberRuntime], str]] = {}
+
+    # ------------------------------------------------------------
+    # 構成 → パーティ
+    # ------------------------------------------------------------
+    def current_jobs(self) -> Jobs:
+        return tuple(str(e.get("job")) for e in self._save_party)
+
+    def _saved_job_level(self, index: int, job: str) -> int:
+        v = (self._save_party[index].get("job_levels") or {}).get(job)
+        if isinstance(v, dict):
+            return max(1, int(v.get("level", 1)))
+        return 1
+
+    def cp_cost(self, jobs: Jobs) -> int:
+        total = 0
+        for i, (old, new) in enumerate(zip(self.current_jobs(), jobs)):
+            if old != new:
+                total += compute_job_change_cp_cost(
+                    from_job=old,
+                    to_job=new,
+                    to_job_level=self._saved_job_level(i, new),
+                    job_attr=self.job_attr,
+                )
+        return total
+
+    def _entry(self, index: int, job: str) -> dict:
+        e = copy.deepcopy(self._save_party[index])
+        e["job"] = job
+        e["status_effects"] = {}
+        e.pop("mp", None)  # 無ければ満タン扱い
+        return e
+
+    def _build(self, entries: List[dict]) -> List[PartyMemberRuntime]:
+        with verbosity(QUIET):
+            return build_party_members_from_save(
+                save={"party": entries},
+                jobs_by_name=self.state.jobs_by_name,
+                weapons=self.state.weapons,
+                armors=self.state.armors,
+                level_table=self.level_table,
+            )
+
+    def _optimized_equipment(self, jobs: Jobs) -> List[Dict[str, Optional[str]]]:
+        if self._table is None:
+            self._table = SlotTable.from_master(self.state.weapons, self.state.armors)
+
+        # 共有の在庫：所持品 + パーティ全員の現在装備
+        pool: Dict[str, int] = {}
+        for bucket in (self.state.save.get("inventory") or {}).values():
+            if isinstance(bucket, dict):
+                for name, qty in bucket.items():
+                    if isinstance(qty, int) and qty > 0:
+                        pool[name] = pool.get(name, 0) + qty
+        for e in self._save_party:
+            for name in (e.get("equipment") or {}).values():
+                if name:
+                    pool[name] = pool.get(name, 0) + 1
+
+        out: List[Dict[str, Optional[str]]] = []
+        for i, job in enumerate(jobs):
+            member = self._member_cache.get((i, job))
+            if member is None:
+                member = self._build([self._entry(i, job)])[0]
+                self._member_cache[(i, job)] = member
+            result = optimize_equipment(
+                member,
+                location=self.location,
+                objective="damage" if member.base.row == "front" else "survival",
+                state=self.state,
+                table=self._table,
+                owned=pool,
+                difficulty=self.difficulty,
+            )
+            eq = {s: getattr(result.equipment, s) for s in EQUIP_SLOTS}
+            for name in eq.values():
+                if name:
+                    pool[name] -= 1
+            out.append(eq)
+        return out
+
+    def party_for(self, jobs: Jobs) -> Tuple[List[PartyMemberRuntime], str]:
+        """構成 → (パーティ, 指紋)。同じ構成はメモリ上で使い回す"""
+        hit = self._party_cache.get(jobs)
+        if hit is not None:
+            return hit
+        if len(jobs) != len(self._save_party):
+            raise ValueError(
+                f"ジョブの数（{len(jobs)}）がパーティの人数（{len(self._save_party)}）と合いません"
+            )
+        for job in jobs:
+            if job not in self.state.jobs_by_name:
+                raise KeyError(f"ジョブ {job} が見つかりません")
+
+        entries = [self._entry(i, job) for i, job in enumerate(jobs)]
+        if self.equip == "optimize":
+            for e, eq in zip(entries, self._optimized_equipment(jobs)):
+                e["equipment"] = eq
+        party = self._build(entries)
+        hit = (party, party_fingerprint(party))
+        self._party_cache[jobs] = hit
+        return hit
+
+    # ------------------------------------------------------------
+    # 評価
+    # ------------------------------------------------------------
+    def _settings_key(self, n_trials: int) -> str:
+        return (
+            f"n={n_trials};f={len(self.formations)};seed={self.seed};"
+            f"r={self.max_rounds};d={self.difficulty}"
+        )
+
+    def evaluate(self, jobs: Jobs, n_trials: int) -> PartyEval:
+        party, fp = self.party_for(jobs)
+        key = EvalCache.make_key(
+            fp,
+            self.location,
+            self.policy_key,
+            self._settings_key(n_trials),
+            self.state.data_fingerprint,
+        )
+        cp = self.cp_cost(jobs)
+
+        row = self.cache.get(key)
+        if row is not None:
+            return PartyEval(
+                jobs=jobs,
+                fingerprint=fp,
+                cp_cost=cp,
+                trials=int(row["trials"]),
+                wins=float(row["wins"]),
+                total_rounds=int(row["rounds"]),
+                cached=True,
+            )
+
+        per_formation = max(1, n_trials // len(self.formations))
+        trials = wins = rounds = 0
+        for formation, formation_seed in zip(self.formations, self._formation_seeds):
+            res = simulate_many_battles_multi_party(
+                party,
+                formation,
+                per_formation,
+                policy=self.policy,
+                seed=formation_seed,
+                state=self.state,
+                spells_by_name=self.spells_by_name,
+                max_rounds=self.max_rounds,
+                difficulty=self.difficulty,
+            )
+            trials += res["trials"]
+            wins += res["wins_char"]
+            rounds += int(round(res["average_turns"] * res["trials"]))
+        self.simulated_battles += trials
+
+        self.cache.put(
+            key,
+            {
+                "fingerprint": fp,
+                "location": self.location,
+                "policy": self.policy_key,
+                "data": self.state.data_fingerprint,
+                "jobs": list(jobs),
+                "trials": trials,
+                "wins": wins,
+                "rounds": rounds,
+            },
+        )
+        return PartyEval(
+            jobs=jobs, fingerprint=fp, cp_cost=cp, trials=trials, wins=wins, total_rounds=rounds
+        )
+
+
+@dataclass
+class PartySearchResult:
+    start: PartyEval
+    best: PartyEval
+    history: List[PartyEval]  # ステップごとのその時点の最良
+    candidates: int = 0  # 近傍として生成した構成数（重複除く）
+    pruned_by_cp: int = 0
+    screened: int = 0  # 粗い評価をした構成数
+    evaluated: int = 0  # 本評価をした構成数
+    cache_hits: int = 0
+    simulated_battles: int = 0
+
+
+def search_party_jobs(
+    search: PartySearch,
+    *,
+    jobs: Optional[Sequence[str]] = None,
+    members: Optional[Sequence[str]] = None,
+    cp_budget: Optional[int] = None,
+    beam_width: int = 2,
+    max_steps: int = 4,
+    screen_trials: int = 40,
+    trials: int = 200,
+    top_k: int = 6,
+) -> PartySearchResult:
+    """
+    セーブの構成から始めて、1人だけジョブを替えた近傍を広げていく。
+    ・jobs: 候補にするジョブ（省略時は全ジョブ）
+    ・members: ジョブを替えてよいメンバー名（省略時は全員）
+    ・cp_budget: CP の上限（省略時はセーブの CP）
+    ・各ステップで、ビーム内の各構成の近傍を screen_trials 回で評価 → 上位 top_k を trials 回で評価し、
+      ビーム（beam_width 件）を更新する。最良が良くならなければ終了
+    """
+    objective = search.objective
+    job_names = list(jobs) if jobs is not None else list(search.state.jobs_by_name)
+    for j in job_names:
+        if j not in search.state.jobs_by_name:
+            raise KeyError(f"ジョブ {j} が見つかりません")
+
+    names = [str(e.get("name")) for e in search._save_party]
+    if members is None:
+        changeable = list(range(len(names)))
+    else:
+        changeable = []
+        for m in members:
+            if m not in names:
+                raise KeyError(f"パーティに {m} がいません")
+            changeable.append(names.index(m))
+
+    if cp_budget is None:
+        try:
+            cp_budget = int(search.state.save.get("CP", 0))
+        except (TypeError, ValueError):
+            cp_budget = 0
+
+    hits0 = search.cache.hits
+    sims0 = search.simulated_battles
+
+    start = search.evaluate(search.current_jobs(), trials)
+    best = start
+    beam = [start]
+    history = [start]
+    seen = {start.jobs}
+    n_candidates = pruned = n_screened = n_evaluated = 0
+
+    def key(ev: PartyEval) -> Tuple[float, float]:
+        return ev.score(objective)
+
+    for _ in range(max(0, max_steps)):
+        neighbors: List[Jobs] = []
+        for b in beam:
+            for i in changeable:
+                for job in job_names:
+                    if job == b.jobs[i]:
+                        continue
+                    cand = b.jobs[:i] + (job,) + b.jobs[i + 1 :]
+                    if cand in seen:
+                        continue
+                    seen.add(cand)
+                    n_candidates += 1
+                    if search.cp_cost(cand) > cp_budget:
+                        pruned += 1
+                        continue
+                    neighbors.append(cand)
+        if not neighbors:
+            break
+
+        screened = sorted(
+            (search.evaluate(c, screen_trials) for c in neighbors), key=key, reverse=True
+        )
+        n_screened += len(screened)
+        finalists = [search.evaluate(ev.jobs, trials) for ev in screened[: max(1, top_k)]]
+        n_evaluated += len(finalists)
+
+        beam = sorted(beam + finalists, key=key, reverse=True)[: max(1, beam_width)]
+        if key(beam[0]) <= key(best):
+            break
+        best = beam[0]
+        history.append(best)
+
+    return PartySearchResult(
+        start=start,
+        best=best,
+        history=history,
+        candidates=n_candidates,
+        pruned_by_cp=pruned,
+        screened=n_screened,
+        evaluated=n_evaluated,
+        cache_hits=search.cache.hits - hits0,
+        simulated_battles=search.simulated_battles - sims0,
+    )
+
+
+def _format_eval(ev: PartyEval) -> str:
+    rpw = "inf" if ev.wins == 0 else f"{ev.rounds_per_win:.2f}"
+    return (
+        f"{' / '.join(ev.jobs)}  win={ev.win_rate:.3f} turns={ev.average_turns:.2f} "
+        f"rounds/win={rpw} CP={ev.cp_cost}"
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m combat.party_search",
+        description="セーブのパーティのジョブ構成を、CP 予算内でロケーションに対して探す",
+    )
+    parser.add_argument("--location", required=True, help="ロケーション名")
+    parser.add_argument("--objective", choices=OBJECTIVES, default="win_rate")
+    parser.add_argument("--policy", choices=("fight", "mcts"), default="fight")
+    parser.add_argument("--mcts-budget-ms", type=float, default=5.0)
+    parser.add_argument("--equip", choices=("keep", "optimize"), default="keep")
+    parser.add_argument("--jobs", default=None, help="候補ジョブ（カンマ区切り、既定: 全ジョブ）")
+    parser.add_argument("--member", action="append", default=None, help="ジョブを替えてよいメンバー（複数可）")
+    parser.add_argument("--cp", type=int, default=None, help="CP 予算（既定: セーブの CP）")
+    parser.add_argument("--beam", type=int, default=2)
+    parser.add_argument("--steps", type=int, default=4)
+    parser.add_argument("--screen-trials", type=int, default=40)
+    parser.add_argument("--trials", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=6)
+    parser.add_argument("--formations", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache", default=None, help="評価キャッシュ（JSONL）のパス")
+    parser.add_argument("--base-dir", default=".", help="assets/data のあるディレクトリ")
+    args = parser.parse_args(argv)
+
+    base_dir = Path(args.base_dir)
+    state = init_runtime_state(base_dir)
+
+    policy: Optional[BattlePolicy] = None
+    policy_key: Optional[str] = None
+    if args.policy == "mcts":
+        from combat.mcts_planner import make_mcts_policy
+
+        policy = make_mcts_policy(state, budget_ms=args.mcts_budget_ms, seed=args.seed)
+        policy_key = f"mcts:{args.mcts_budget_ms:g}ms"
+
+    search = PartySearch(
+        state=state,
+        level_table=LevelTable(str(base_dir / "assets/data/level_exp.csv")),
+        location=args.location,
+        job_attr=load_job_attribution(str(base_dir / "assets/data/job_attribution.csv")),
+        cache=EvalCache(args.cache),
+        policy=policy,
+        policy_key=policy_key,
+        objective=args.objective,
+        equip=args.equip,
+        n_formations=args.formations,
+        seed=args.seed,
+    )
+    result = search_party_jobs(
+        search,
+        jobs=[j.strip() for j in args.jobs.split(",") if j.strip()] if args.jobs else None,
+        members=args.member,
+        cp_budget=args.cp,
+        beam_width=args.beam,
+        max_steps=args.steps,
+        screen_trials=args.screen_trials,
+        trials=args.trials,
+        top_k=args.top_k,
+    )
+
+    print(f"location={args.location} objective={args.objective} policy={search.policy_key}")
+    print(f"  start: {_format_eval(result.start)}")
+    for i, ev in enumerate(result.history[1:], start=1):
+        print(f"  step{i}: {_format_eval(ev)}")
+    print(f"  best : {_format_eval(result.best)}")
+    print(
+        f"  candidates={result.candidates} pruned_by_cp={result.pruned_by_cp} "
+        f"screened={result.screened} evaluated={result.evaluated} "
+        f"cache_hits={result.cache_hits} simulated_battles={result.simulated_battles}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,6 +21,10 @@ from combat.models import (
 )
 from combat.elements import apply_element_relation_to_damage
 
+# ★ rng 省略時の共有インスタンス（呼び出しごとに random.Random() を作ると
+#   os.urandom からのシードで遅いため、モジュールで1つだけ作って使い回す）
+_FALLBACK_RNG = random.Random()
+
 
 # ============================================================
 # クリティカル判定ヘルパ
@@ -40,7 +44,7 @@ def roll_critical(
     chance = base_chance + agility / agi_bonus_div
     chance = min(max(chance, 0.0), 0.5)  # 上限50%
     if rng is None:
-        rng = random.Random()
+        rng = _FALLBACK_RNG
     return rng.random() < chance
 
 
@@ -77,7 +81,7 @@ def _calc_base_phys_damage_per_hit(
         factor = 1.25
     else:
         if rng is None:
-            rng = random.Random()
+            rng = _FALLBACK_RNG
         factor = rng.uniform(1.0, 1.5)
     raw = int(attack_power * factor)
     base = raw - defense
@@ -214,7 +218,7 @@ def physical_damage_char_to_enemy(
     is_crit = False
     if not use_expectation:
         if rng is None:
-            rng = random.Random()
+            rng = _FALLBACK_RNG
         if roll_critical(char.agility, rng):
             is_crit = True
             dmg *= 2
@@ -239,7 +243,7 @@ def _calc_base_phys_damage_per_hit_enemy_to_char(
         factor = 1.25
     else:
         if rng is None:
-            rng = random.Random()
+            rng = _FALLBACK_RNG
         factor = rng.uniform(1.0, 1.5)
     raw = int(enemy.attack_power * factor)
     base = raw - defense_value
@@ -305,7 +309,7 @@ def physical_damage_enemy_to_char(
     is_crit = False
     if not use_expectation:
         if rng is None:
-            rng = random.Random()
+            rng = _FALLBACK_RNG
         if roll_critical(enemy.level, rng, base_chance=1 / 20, agi_bonus_div=9999):
             is_crit = True
             dmg *= 2
@@ -6,6 +6,7 @@ import random
 from combat.constants import ITEM_CATEGORY_MAP
 from combat.models import PartyMemberRuntime, EquipmentSet, PlannedAction
 from combat.char_build import compute_character_final_stats
+from combat.job_profile import command_skillpoints_from_raw, job_profile
 from system.exp_system import LevelTable
 
 
@@ -166,21 +167,9 @@ JOB_LEVEL_MAX = 99  # 必要なら
 
 def build_command_skillpoints(job_raw: Dict[str, Any]) -> Dict[str, int]:
     """
-    job.raw から Command -> SkillPoints の辞書を作る
+    job.raw から Command -> SkillPoints の辞書を作る（★戦闘中は JobProfile.command_skillpoints を使う）
     """
-    m: Dict[str, int] = {}
-    for i in range(1, 5):
-        bc = job_raw.get(f"BattleCommand{i}")
-        if not isinstance(bc, dict):
-            continue
-        cmd = bc.get("Command")
-        sp = bc.get("SkillPoints", 0)
-        if isinstance(cmd, str) and cmd:
-            try:
-                m[cmd] = int(sp)
-            except (TypeError, ValueError):
-                m[cmd] = 0
-    return m
+    return command_skillpoints_from_raw(job_raw)
 
 
 def apply_job_skillpoints(base: Any, gained_sp: int) -> Tuple[int, int]:
@@ -212,14 +201,9 @@ def apply_job_skillpoints(base: Any, gained_sp: int) -> Tuple[int, int]:
 def _skillpoints_for_command(job: Any, command_name: str) -> int:
     """
     job(raw)の BattleCommand 定義から、指定コマンドの SkillPoints を返す。
-    見つからなければ 0
+    見つからなければ 0（★JobProfile に前計算済みの表を引くだけ）
     """
-    raw = getattr(job, "raw", None)
-    if not isinstance(raw, dict):
-        return 0
-
-    cmd_map = build_command_skillpoints(raw)
-    return int(cmd_map.get(command_name, 0))
+    return job_profile(job).skillpoints_for(command_name)
 
 
 def apply_job_sp_for_command(
@@ -438,11 +422,13 @@ def apply_victory_cp_reward(
 # ---------------------- Drop Item
 
 # 単体の敵からドロップ判定
-def roll_drops(enemy):
+def roll_drops(enemy, rng: Optional[random.Random] = None):
     """
     enemy: EnemyRuntime
+    rng: 乱数（None ならモジュールの random。リプレイ/一括シミュレーションでは必ず渡す）
     return: 入手したアイテム名のリスト
     """
+    r = rng if rng is not None else random
     obtained_items = []
 
     # ★ EnemyRuntime が持つ raw json を参照
@@ -454,7 +440,7 @@ def roll_drops(enemy):
         item_name = drop["Item"]
         drop_rate = drop["DropRate"]
 
-        if random.random() < drop_rate:
+        if r.random() < drop_rate:
             obtained_items.append(item_name)
 
     return obtained_items
@@ -462,16 +448,19 @@ def roll_drops(enemy):
 
 
 # 戦闘終了時：倒した敵全体を処理
-def process_battle_drops(defeated_monsters, item_stock):
+def process_battle_drops(
+    defeated_monsters, item_stock, rng: Optional[random.Random] = None
+):
     """
     defeated_monsters: 倒した敵データのリスト
     item_stock: 所持品dict（通常の dict を想定）
+    rng: roll_drops に渡す乱数
     return: 今回の戦闘で入手したアイテム一覧
     """
     battle_loot = []
 
     for monster in defeated_monsters:
-        drops = roll_drops(monster)
+        drops = roll_drops(monster, rng)
         for item in drops:
             # dict 前提で安全に加算
             item_stock[item] = item_stock.get(item, 0) + 1
@@ -504,9 +493,11 @@ def apply_victory_rewards(
     enemies,
     state,
     level_table,
+    rng: Optional[random.Random] = None,
 ) -> dict:
     """
     戻り値: 「この戦闘で何が起きたか」をまとめた事実データ
+    rng: ドロップ判定用（None ならモジュールの random）
     """
 
     # EXP / Lv
@@ -534,7 +525,7 @@ def apply_victory_rewards(
     item_stock = state.save.setdefault("item_stock", {})
 
     # Drop Item
-    battle_loot = process_battle_drops(enemies, item_stock)
+    battle_loot = process_battle_drops(enemies, item_stock, rng)
 
     # runtime → save
     persist_party_progress_to_save(state.save, party_members)
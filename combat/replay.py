@@ -0,0 +1,381 @@
+# ============================================================
+# replay: 戦闘の記録と再現（リプレイ）
+
+# BattleReplay	リプレイ1件分のデータ（JSON 1ファイルに対応）
+# BattleRecorder	戦闘開始時の状態・乱数シード・ラウンドごとの PlannedAction を記録する
+# ReplayResult	replay_battle の戻り値（ラウンドごとの logs / events）
+# fingerprint_of	ステータス等の dataclass から短いハッシュ（指紋）を作る
+# load_replay	リプレイファイルを読み込む
+# save_replay	リプレイファイルを書き出す
+# replay_file_path	保存先ディレクトリ内のリプレイファイル名（日時 + シード）を作る
+# replay_battle	リプレイファイルから戦闘を再実行し、logs / events を再現する
+# ============================================================
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import hashlib
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from random import Random
+from typing import Any, Dict, List, Optional, Sequence
+
+from combat.enums import BattleMode, Status
+from combat.expected_mode import rng_for_mode
+from combat.models import (
+    BaseCharacter,
+    BattleActorState,
+    EnemyRuntime,
+    EquipmentSet,
+    MpPool,
+    PartyMemberRuntime,
+    PlannedAction,
+)
+from combat.runtime_state import RuntimeState
+from combat.verbosity import get_verbosity, verbosity
+
+REPLAY_FORMAT_VERSION = 1
+
+
+# ============================================================
+# JSON 化ヘルパー
+# ============================================================
+
+
+def _jsonable(v: Any) -> Any:
+    """set / frozenset / Enum / tuple を JSON に載る形へ（集合は名前順に整列）"""
+    if isinstance(v, Enum):
+        return v.name
+    if isinstance(v, Mapping):  # dict / MpPool
+        return {str(k): _jsonable(x) for k, x in v.items()}
+    if isinstance(v, (set, frozenset)):
+        return sorted((_jsonable(x) for x in v), key=str)
+    if isinstance(v, (list, tuple)):
+        return [_jsonable(x) for x in v]
+    if dataclasses.is_dataclass(v) and not isinstance(v, type):
+        return _jsonable(dataclasses.asdict(v))
+    return v
+
+
+def fingerprint_of(obj: Any) -> str:
+    """dataclass / dict の内容から 16 桁の指紋を作る（記録時と再現時の一致確認用）"""
+    payload = json.dumps(_jsonable(obj), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _round_digest(logs: Sequence[str], events: Sequence[dict]) -> str:
+    payload = json.dumps(
+        {"logs": list(logs), "events": _jsonable(list(events))},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _state_to_dict(st: BattleActorState) -> Dict[str, Any]:
+    # slots 化したので vars() ではなく fields() で全項目を拾う（cheer_bonus も field）
+    return _jsonable({f.name: getattr(st, f.name) for f in dataclasses.fields(st)})
+
+
+def _state_from_dict(d: Dict[str, Any]) -> BattleActorState:
+    st = BattleActorState(hp=int(d.get("hp", 0)))
+    known = {f.name for f in dataclasses.fields(st)}
+    for k, v in d.items():
+        if k not in known:
+            continue
+        if k == "statuses":
+            v = {Status[n] for n in v}
+        elif k in ("mp_pool", "max_mp_pool"):
+            v = MpPool({int(lv): int(x) for lv, x in v.items()})
+        elif k == "temp_flags":
+            v = dict(v)
+        setattr(st, k, v)
+    return st
+
+
+def _action_to_dict(a: Optional[PlannedAction]) -> Optional[Dict[str, Any]]:
+    return None if a is None else dataclasses.asdict(a)
+
+
+def _action_from_dict(d: Optional[Dict[str, Any]]) -> Optional[PlannedAction]:
+    return None if d is None else PlannedAction(**d)
+
+
+# ============================================================
+# データ本体
+# ============================================================
+
+
+@dataclass
+class BattleReplay:
+    seed: int
+    enemy_names: List[str]
+    difficulty: int = 0
+
+    # 戦闘開始時のパーティ（再構築に必要な最小限 + 指紋）
+    party: List[Dict[str, Any]] = field(default_factory=list)
+    # 戦闘開始時の敵（状態 + 指紋）
+    enemies: List[Dict[str, Any]] = field(default_factory=list)
+    # 戦闘中に参照されるセーブデータの一部（inventory / map）
+    save_subset: Dict[str, Any] = field(default_factory=dict)
+
+    # ラウンドごとの PlannedAction（None は行動なし）
+    rounds: List[List[Optional[Dict[str, Any]]]] = field(default_factory=list)
+    # ラウンドごとの logs/events のダイジェスト（再現確認用）
+    round_digests: List[str] = field(default_factory=list)
+    end_reason: str = "continue"
+    # 記録時の verbosity（logs の中身が変わるので、再現時も同じレベルで回す）
+    verbosity: int = 2
+    # 戦闘の解決方式（"expected" は ExpectedRandom で回す）
+    mode: str = "random"
+
+    version: int = REPLAY_FORMAT_VERSION
+
+
+class BattleRecorder:
+    """
+    戦闘1回分を記録する。
+    ・戦闘中の乱数は必ず recorder.rng を使うこと（simulate_one_round_multi_party の rng に渡す）
+    ・各ラウンドの解決後に record_round を呼ぶ
+    ・mode="expected" の戦闘では recorder.rng が ExpectedRandom になる（再現時も同じ mode で回す）
+    """
+
+    def __init__(
+        self,
+        party_members: Sequence[PartyMemberRuntime],
+        enemies: Sequence[EnemyRuntime],
+        *,
+        save: Optional[dict] = None,
+        seed: Optional[int] = None,
+        difficulty: int = 0,
+        mode: BattleMode = "random",
+    ):
+        if seed is None:
+            seed = Random().getrandbits(63)
+        self.rng = rng_for_mode(mode, Random(seed))
+
+        save = save if isinstance(save, dict) else {}
+        self.replay = BattleReplay(
+            seed=int(seed),
+            enemy_names=[em.name for em in enemies],
+            difficulty=int(difficulty),
+            verbosity=get_verbosity(),
+            mode=mode,
+            party=[
+                {
+                    "name": pm.name,
+                    "job": pm.job.name,
+                    "portrait_key": pm.portrait_key,
+                    "base": _jsonable(pm.base),
+                    "equipment": _jsonable(pm.equipment or EquipmentSet()),
+                    "state": _state_to_dict(pm.state),
+                    "stats_fp": fingerprint_of(pm.stats),
+                }
+                for pm in party_members
+            ],
+            enemies=[
+                {
+                    "name": em.name,
+                    "state": _state_to_dict(em.state),
+                    "stats_fp": fingerprint_of(em.stats),
+                }
+                for em in enemies
+            ],
+            save_subset=_jsonable(
+                {
+                    "inventory": save.get("inventory") or {},
+                    "map": save.get("map") or {},
+                }
+            ),
+        )
+
+    def record_round(
+        self,
+        planned_actions: Sequence[Optional[PlannedAction]],
+        logs: Sequence[str],
+        events: Sequence[dict],
+        end_reason: str,
+    ) -> None:
+        # ★ PlannedAction はラウンド解決前の内容を渡すこと（snapshot_actions で先に複製しておく）
+        self.replay.rounds.append([_action_to_dict(a) for a in planned_actions])
+        self.replay.round_digests.append(_round_digest(logs, events))
+        self.replay.end_reason = end_reason
+
+    @staticmethod
+    def snapshot_actions(
+        planned_actions: Sequence[Optional[PlannedAction]],
+    ) -> List[Optional[PlannedAction]]:
+        """ラウンド解決前の PlannedAction を複製しておく（解決中に書き換わっても記録は不変）"""
+        return [copy.copy(a) for a in planned_actions]
+
+    def save(self, path: Path | str) -> Path:
+        return save_replay(self.replay, path)
+
+    def save_to_dir(self, replay_dir: Path | str) -> Path:
+        return save_replay(self.replay, replay_file_path(replay_dir, self.replay))
+
+
+def replay_file_path(replay_dir: Path | str, replay: BattleReplay) -> Path:
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return Path(replay_dir) / f"battle_{stamp}_{replay.seed:x}.json"
+
+
+def save_replay(replay: BattleReplay, path: Path | str) -> Path:
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    with p.open("w", encoding="utf-8") as f:
+        json.dump(
+            dataclasses.asdict(replay), f, ensure_ascii=False, separators=(",", ":")
+        )
+    return p
+
+
+def load_replay(path: Path | str) -> BattleReplay:
+    with Path(path).open("r", encoding="utf-8") as f:
+        d = json.load(f)
+    version = d.get("version")
+    if version != REPLAY_FORMAT_VERSION:
+        raise ValueError(
+            f"未対応のリプレイ形式です: version={version}（対応: {REPLAY_FORMAT_VERSION}）"
+        )
+    return BattleReplay(**d)
+
+
+# ============================================================
+# 再現
+# ============================================================
+
+
+@dataclass
+class ReplayResult:
+    logs: List[List[str]]
+    events: List[List[dict]]
+    end_reason: str
+    mismatched_rounds: List[int]  # ダイジェスト不一致のラウンド（1始まり）
+
+
+def _rebuild_party(
+    replay: BattleReplay, state: RuntimeState
+) -> List[PartyMemberRuntime]:
+    from combat.char_build import compute_character_final_stats
+
+    party: List[PartyMemberRuntime] = []
+    for rec in replay.party:
+        try:
+            job = state.jobs_by_name[rec["job"]]
+        except KeyError as e:
+            raise KeyError(f"jobs_by_name に '{rec['job']}' が存在しません") from e
+
+        base = BaseCharacter(**rec["base"])
+        eq = EquipmentSet(**rec["equipment"])
+        stats = compute_character_final_stats(
+            base, eq, state.weapons, state.armors, job_name=job.name
+        )
+        if fingerprint_of(stats) != rec["stats_fp"]:
+            raise ValueError(
+                f"{rec['name']} のステータスが記録時と一致しません"
+                "（マスタデータ変更、または戦闘前から補正がかかっていた可能性）"
+            )
+
+        party.append(
+            PartyMemberRuntime(
+                name=rec["name"],
+                job=job,
+                base=base,
+                stats=stats,
+                state=_state_from_dict(rec["state"]),
+                portrait_key=rec.get("portrait_key"),
+                equipment=eq,
+            )
+        )
+    return party
+
+
+def _rebuild_enemies(replay: BattleReplay, state: RuntimeState) -> List[EnemyRuntime]:
+    from combat.enemy_build import build_enemies
+
+    enemies = build_enemies(
+        enemy_defs_by_name=state.monsters,
+        spells_by_name=state.spells,
+        enemy_names=replay.enemy_names,
+        difficulty=replay.difficulty,
+    )
+    for em, rec in zip(enemies, replay.enemies):
+        if fingerprint_of(em.stats) != rec["stats_fp"]:
+            raise ValueError(f"{em.name} のステータスが記録時と一致しません")
+        em.state = _state_from_dict(rec["state"])
+    return enemies
+
+
+def replay_battle(
+    path: Path | str,
+    *,
+    state: Optional[RuntimeState] = None,
+    spells_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+    strict: bool = True,
+) -> ReplayResult:
+    """
+    リプレイファイルから戦闘を再実行する（input なし）。
+    ・state.save は変更しない（記録した inventory / map だけを持つ一時セーブで回す）
+    ・strict=True のとき、ラウンドのダイジェストが記録と違えば ValueError
+    """
+    from combat.battle_sim import simulate_one_round_multi_party
+
+    if state is None:
+        from combat.runtime_state import get_state
+
+        state = get_state()
+    if spells_by_name is None:
+        from combat.magic_menu import expand_spells_for_summons
+
+        spells_by_name = expand_spells_for_summons(state.spells)
+
+    replay = load_replay(path)
+
+    party = _rebuild_party(replay, state)
+    enemies = _rebuild_enemies(replay, state)
+
+    replay_save: Dict[str, Any] = json.loads(json.dumps(replay.save_subset))
+    replay_save["party"] = []
+    replay_state = dataclasses.replace(state, save=replay_save)
+
+    rng = rng_for_mode(replay.mode, Random(replay.seed))
+    all_logs: List[List[str]] = []
+    all_events: List[List[dict]] = []
+    mismatched: List[int] = []
+    end_reason = "continue"
+
+    for n, actions in enumerate(replay.rounds, start=1):
+        with verbosity(replay.verbosity):
+            logs, side_result, events = simulate_one_round_multi_party(
+                party,
+                enemies,
+                [_action_from_dict(a) for a in actions],
+                state=replay_state,
+                rng=rng,
+                save=replay_save,
+                spells_by_name=spells_by_name,
+                items_by_name=state.items_by_name,
+                mode=replay.mode,
+            )
+        all_logs.append(logs)
+        all_events.append(events)
+        end_reason = side_result.end_reason
+
+        if n <= len(replay.round_digests):
+            if _round_digest(logs, events) != replay.round_digests[n - 1]:
+                if strict:
+                    raise ValueError(f"ラウンド{n} の結果が記録と一致しません")
+                mismatched.append(n)
+
+    return ReplayResult(
+        logs=all_logs,
+        events=all_events,
+        end_reason=end_reason,
+        mismatched_rounds=mismatched,
+    )
@@ -5,12 +5,14 @@
 # STATE	JSONデータを保持するためのグローバル（宣言）
 # init_runtime_state	アプリ起動時に1回だけ呼ぶ想定の初期化（import runtime_state した瞬間に JSON を読み始める）
 # get_state	STATE（JSONデータ）参照用（グローバル・サービスロケータ）
+# data_files_fingerprint	マスタ JSON のファイル内容から指紋（sha1 先頭16桁）を作る（評価キャッシュのキー用）
 # ============================================================
 
 from __future__ import annotations
+import hashlib
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 from combat.data_loader import (
     load_monsters,
@@ -21,6 +23,8 @@ from combat.data_loader import (
     load_jobs,
     load_savedata,
 )
+from combat.enemy_build import monster_prototypes
+from combat.equip_index import equip_index
 
 
 @dataclass
@@ -32,6 +36,18 @@ class RuntimeState:
     items_by_name: Dict[str, Dict[str, Any]]
     jobs_by_name: Dict[str, Any]  # Job 型があれば Job に
     save: Dict[str, Any]
+    data_fingerprint: str = ""  # マスタ JSON（セーブ以外）の指紋。init_runtime_state が入れる
+
+
+# マスタデータ（セーブ以外）。init_runtime_state はこの順に読む
+DATA_FILES = (
+    "assets/data/ffiii_monsters.json",
+    "assets/data/ffiii_weapons.json",
+    "assets/data/ffiii_armors.json",
+    "assets/data/ffiii_spells.json",
+    "assets/data/ffiii_items.json",
+    "assets/data/ffiii_jobs_compact.json",
+)
 
 
 STATE: Optional[RuntimeState] = None
@@ -45,14 +61,22 @@ def init_runtime_state(
 ) -> RuntimeState:
     """アプリ起動時に1回だけ呼ぶ想定の初期化"""
 
-    monsters = load_monsters(base_dir / "assets/data/ffiii_monsters.json")
-    weapons = load_weapons(base_dir / "assets/data/ffiii_weapons.json")
-    armors = load_armors(base_dir / "assets/data/ffiii_armors.json")
-    spells = load_spells(base_dir / "assets/data/ffiii_spells.json")
-    items_by_name = load_items(base_dir / "assets/data/ffiii_items.json")
-    jobs_by_name = load_jobs(base_dir / "assets/data/ffiii_jobs_compact.json")
+    monster_path, weapon_path, armor_path, spell_path, item_path, job_path = (
+        base_dir / rel for rel in DATA_FILES
+    )
+    monsters = load_monsters(monster_path)
+    weapons = load_weapons(weapon_path)
+    armors = load_armors(armor_path)
+    spells = load_spells(spell_path)
+    items_by_name = load_items(item_path)
+    jobs_by_name = load_jobs(job_path)
     save = load_savedata(base_dir / "assets/data/ffiii_savedata.json")
 
+    # ★追加：全モンスターを MonsterPrototype に前計算（build_enemies は複製するだけになる）
+    monster_prototypes(monsters, spells)
+    # ★追加：ジョブ → スロット → 装備できる武器・防具の索引を前計算（装備候補・ジョブ変更時のチェックが dict を引くだけになる）
+    equip_index(weapons, armors)
+
     global STATE
     STATE = RuntimeState(
         monsters=monsters,
@@ -62,6 +86,7 @@ def init_runtime_state(
         items_by_name=items_by_name,
         jobs_by_name=jobs_by_name,
         save=save,
+        data_fingerprint=data_files_fingerprint(base_dir / rel for rel in DATA_FILES),
     )
     return STATE
 
@@ -70,3 +95,14 @@ def get_state() -> RuntimeState:
     if STATE is None:
         raise RuntimeError("runtime_state.init_runtime_state() を先に呼んでください")
     return STATE
+
+
+def data_files_fingerprint(paths: Iterable[Path]) -> str:
+    """ファイル名と中身の sha1（先頭16桁）。マスタを書き換えたら変わるので、古い評価キャッシュを引かない"""
+    h = hashlib.sha1()
+    for path in paths:
+        path = Path(path)
+        h.update(path.name.encode("utf-8") + b"\0")
+        h.update(path.read_bytes() if path.exists() else b"")
+        h.update(b"\0")
+    return h.hexdigest()[:16]
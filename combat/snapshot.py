@@ -0,0 +1,219 @@
+# ============================================================
+# snapshot: 戦闘中の可変状態だけを軽量に保存・巻き戻す（先読み・what-if 用）
+
+# BattleSnapshot	capture(party_members, enemies, save) で保存し、restore() で何度でも巻き戻す
+# ============================================================
+# 保存するもの（戦闘中に書き換わるものだけ）：
+#   ・BattleActorState の全フィールド（statuses / mp_pool / temp_flags は中身をコピー）
+#   ・PartyMemberRuntime.state / .stats の参照（差し替えられても元のオブジェクトへ戻す）
+#   ・ステータスのうち戦闘中に書き換わる項目だけ（Protect / Haste / Boost / 敵の強化など）
+#   ・BaseCharacter.job_level / job_skill_point（apply_job_sp_for_command が加算する）
+#   ・save["party"][*] の "job" / "job_level" / "job_levels"[ジョブ名]（同上の同期先）
+#   ・save["inventory"] の個数（Item で減る / Steal で増える）
+# 保存しないもの（戦闘中は読むだけ）：
+#   ・FinalCharacterStats / FinalEnemyStats の上記以外、Job.raw、敵 JSON（enrich 済み）
+# ・restore() は同じオブジェクトへ書き戻すので、呼び出し側が持っている参照はそのまま使える
+
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from combat.models import BattleActorState, EnemyRuntime, PartyMemberRuntime
+
+_STATE_FIELDS: Tuple[str, ...] = tuple(
+    f.name for f in dataclasses.fields(BattleActorState)
+)
+# 中身ごとコピーが必要なフィールド（それ以外は int / bool / None などの不変値）
+_COPY_FIELDS = frozenset({"statuses", "mp_pool", "max_mp_pool", "temp_flags"})
+_MISSING = object()
+
+# 戦闘中に書き換わるステータス項目（status_effects / turn_logic の強化・弱体処理）
+_CHAR_STAT_FIELDS: Tuple[str, ...] = (
+    "main_power",
+    "off_power",
+    "main_atk_multiplier",
+    "off_atk_multiplier",
+    "defense",
+    "magic_defense",
+)
+_ENEMY_STAT_FIELDS: Tuple[str, ...] = (
+    "level",
+    "attack_multiplier",
+    "defense",
+    "magic_defense",
+)
+# apply_job_sp_for_command が save["party"][*] に書き込むキー
+_SAVE_ENTRY_KEYS: Tuple[str, ...] = ("job", "job_level")
+
+
+def _capture_state(st: BattleActorState) -> Tuple[Any, ...]:
+    return tuple(
+        getattr(st, name).copy() if name in _COPY_FIELDS else getattr(st, name)
+        for name in _STATE_FIELDS
+    )
+
+
+def _restore_state(st: BattleActorState, values: Tuple[Any, ...]) -> None:
+    # スナップショットを何度でも使えるよう、可変コンテナは書き戻すたびにコピーする
+    for name, v in zip(_STATE_FIELDS, values):
+        setattr(st, name, v.copy() if name in _COPY_FIELDS else v)
+
+
+def _capture_fields(obj: Any, names: Tuple[str, ...]) -> Tuple[Any, ...]:
+    return tuple(getattr(obj, name) for name in names)
+
+
+def _restore_fields(obj: Any, names: Tuple[str, ...], values: Tuple[Any, ...]) -> None:
+    for name, v in zip(names, values):
+        setattr(obj, name, v)
+
+
+def _copy_value(v: Any) -> Any:
+    return dict(v) if isinstance(v, dict) else v
+
+
+def _save_party_entry(save: Optional[dict], name: str) -> Optional[dict]:
+    if not isinstance(save, dict):
+        return None
+    for p in save.get("party", []) or []:
+        if isinstance(p, dict) and p.get("name") == name:
+            return p
+    return None
+
+
+@dataclass
+class _MemberSnapshot:
+    member: PartyMemberRuntime
+    state_obj: BattleActorState
+    state_values: Tuple[Any, ...]
+    stats_obj: Any  # FinalCharacterStats（参照のみ）
+    stats_values: Tuple[Any, ...]  # _CHAR_STAT_FIELDS の値
+    job_level: int
+    job_skill_point: int
+    save_entry: Optional[dict]  # save["party"] の該当行（参照）
+    save_values: Tuple[Any, ...]  # _SAVE_ENTRY_KEYS の値（無ければ _MISSING）
+    save_job_level: Optional[dict]  # job_levels[ジョブ名] のコピー（無ければ None）
+
+
+@dataclass
+class BattleSnapshot:
+    members: List[_MemberSnapshot] = field(default_factory=list)
+    # (敵, state, state の値, FinalEnemyStats, _ENEMY_STAT_FIELDS の値)
+    enemies: List[Tuple[Any, ...]] = field(default_factory=list)
+    save: Optional[dict] = None
+    inventory: Optional[Dict[str, Dict[str, int]]] = None  # カテゴリ → {アイテム名: 個数}
+
+    @classmethod
+    def capture(
+        cls,
+        party_members: Sequence[PartyMemberRuntime],
+        enemies: Sequence[EnemyRuntime],
+        save: Optional[dict] = None,
+    ) -> "BattleSnapshot":
+        """
+        現在の戦闘状態を保存する。save（= state.save）を渡すと inventory の個数と
+        ジョブSPの同期先も保存する（Item / Steal / JobSP を含む先読みでは必須）。
+        """
+        members: List[_MemberSnapshot] = []
+        for pm in party_members:
+            entry = _save_party_entry(save, pm.name)
+            job_levels = entry.get("job_levels") if entry is not None else None
+            jl = (
+                job_levels.get(pm.job.name) if isinstance(job_levels, dict) else None
+            )
+            members.append(
+                _MemberSnapshot(
+                    member=pm,
+                    state_obj=pm.state,
+                    state_values=_capture_state(pm.state),
+                    stats_obj=pm.stats,
+                    stats_values=_capture_fields(pm.stats, _CHAR_STAT_FIELDS),
+                    job_level=pm.base.job_level,
+                    job_skill_point=pm.base.job_skill_point,
+                    save_entry=entry,
+                    save_values=(
+                        tuple(
+                            _copy_value(entry.get(k, _MISSING)) for k in _SAVE_ENTRY_KEYS
+                        )
+                        if entry is not None
+                        else ()
+                    ),
+                    save_job_level=dict(jl) if isinstance(jl, dict) else None,
+                )
+            )
+
+        inventory = None
+        if isinstance(save, dict) and isinstance(save.get("inventory"), dict):
+            inventory = {
+                cat: dict(items)
+                for cat, items in save["inventory"].items()
+                if isinstance(items, dict)
+            }
+
+        return cls(
+            members=members,
+            enemies=[
+                (
+                    em,
+                    em.state,
+                    _capture_state(em.state),
+                    em.stats,
+                    _capture_fields(em.stats, _ENEMY_STAT_FIELDS),
+                )
+                for em in enemies
+            ],
+            save=save,
+            inventory=inventory,
+        )
+
+    def restore(self) -> None:
+        """capture 時点の状態へ巻き戻す（何度呼んでもよい）"""
+        for ms in self.members:
+            pm = ms.member
+            pm.state = ms.state_obj
+            _restore_state(ms.state_obj, ms.state_values)
+            pm.stats = ms.stats_obj
+            _restore_fields(ms.stats_obj, _CHAR_STAT_FIELDS, ms.stats_values)
+            pm.base.job_level = ms.job_level
+            pm.base.job_skill_point = ms.job_skill_point
+
+            entry = ms.save_entry
+            if entry is None:
+                continue
+            for k, v in zip(_SAVE_ENTRY_KEYS, ms.save_values):
+                if v is _MISSING:
+                    entry.pop(k, None)
+                else:
+                    entry[k] = _copy_value(v)
+            job_levels = entry.get("job_levels")
+            if ms.save_job_level is None:
+                if isinstance(job_levels, dict):
+                    job_levels.pop(pm.job.name, None)
+            else:
+                if not isinstance(job_levels, dict):
+                    job_levels = {}
+                    entry["job_levels"] = job_levels
+                job_levels[pm.job.name] = dict(ms.save_job_level)
+
+        for em, state_obj, values, stats_obj, stats_values in self.enemies:
+            em.state = state_obj
+            _restore_state(state_obj, values)
+            em.stats = stats_obj
+            _restore_fields(stats_obj, _ENEMY_STAT_FIELDS, stats_values)
+
+        if self.inventory is not None and isinstance(self.save, dict):
+            inv = self.save.setdefault("inventory", {})
+            # Steal で新しく作られたカテゴリは消し、既存カテゴリは同じ dict に書き戻す
+            for cat in [
+                c for c, v in inv.items() if c not in self.inventory and isinstance(v, dict)
+            ]:
+                del inv[cat]
+            for cat, items in self.inventory.items():
+                cur = inv.get(cat)
+                if isinstance(cur, dict):
+                    cur.clear()
+                    cur.update(items)
+                else:
+                    inv[cat] = dict(items)
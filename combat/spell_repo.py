@@ -5,19 +5,28 @@
 # _choose_monster_special_spell	敵の生データ（monster JSON）から、使用すべきスペル定義を“検索・決定”する関数
 # _find_spell_json_for_enemy_attack	敵攻撃結果（special等）から対応するSpellJSONを引き直すためのヘルパ
 # _find_monster_spell_definition	monsters.jsonやMASTER_SPELLS_BY_NAMEから敵が使うスペル定義を検索・取得するヘルパー
+# build_alias_table	重みリストから Walker のエイリアス表（prob, alias）を作る
+# enemy_caster_from_spell_def	モンスターのスペル定義（Power/Multiplier/Accuracy）から EnemyCasterStats を作る
+# MonsterSpellIndex	モンスターの Spells を名前で引く索引・Special Attacks のエイリアス表・スペルごとの EnemyCasterStats
+# monster_spell_index	monster JSON ごとに1回だけ MonsterSpellIndex を作って使い回す
 # <魔法DBを参照してモンスター側スペル定義を正規化・補完する>
 # _spell_name_of	表記ゆれの補正
 # _merge_spell_defs	DB(master_def) をベースに、monster_def で上書きする。
 # enrich_monster_spell	smonster_json を破壊せず、Spells 等を魔法DBで補完した新しい dict を返す。
+# ・魔法DB（spells_by_name / MASTER_SPELLS_BY_NAME）の名前引きは name_index.lookup_by_name（正規化名インデックス）に統一
 # ============================================================
 
 import random
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 from copy import deepcopy
 
-from combat.models import SpellInfo, EnemyAttackResult
+from utils.name_normalize import normalize_name
+from utils.safe_int_float import safe_int
+from combat.models import SpellInfo, EnemyAttackResult, EnemyCasterStats
 from combat.constants import MASTER_SPELLS_BY_NAME
 from combat.elements import parse_elements
+from combat.name_index import lookup_by_name
 
 
 def spell_from_json(spell_json: Dict[str, Any]) -> SpellInfo:
@@ -114,46 +123,163 @@ def spell_from_json(spell_json: Dict[str, Any]) -> SpellInfo:
 # ============================================================
 
 
+# ★追加：Special Attacks 抽選用のエイリアス表
+def build_alias_table(weights: Sequence[float]) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """
+    Walker のエイリアス法（Vose 版）。weights（正の値）から (prob, alias) を返す。
+    u = random() * n の整数部 i と小数部 f で「f < prob[i] なら i、そうでなければ alias[i]」を選ぶと、
+    乱数1回・O(1) で weights に比例した添字が出る。
+    """
+    n = len(weights)
+    if n == 0:
+        return (), ()
+    total = float(sum(weights))
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s_i = small.pop()
+        l_i = large.pop()
+        prob[s_i] = scaled[s_i]
+        alias[s_i] = l_i
+        scaled[l_i] = scaled[l_i] + scaled[s_i] - 1.0
+        (small if scaled[l_i] < 1.0 else large).append(l_i)
+    # 残りは丸め誤差で 1 付近のものだけ（prob=1 のまま）
+    return tuple(prob), tuple(alias)
+
+
+def enemy_caster_from_spell_def(spell_def: Dict[str, Any]) -> EnemyCasterStats:
+    """モンスターのスペル定義 {Power, Multiplier, Accuracy} → EnemyCasterStats"""
+    return EnemyCasterStats(
+        magic_power_base=safe_int(spell_def.get("Power", 0)),
+        magic_multiplier=safe_int(spell_def.get("Multiplier", 1) or 1),
+        magic_accuracy_percent=safe_int(round((spell_def.get("Accuracy", 1.0) or 1.0) * 100)),
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class MonsterSpellIndex:
+    """
+    monster JSON の Spells / Special Attacks を前計算したもの。
+    ・by_name: Spells の "Name" 完全一致（同名が複数あれば先頭。従来の線形探索と同じ）
+    ・by_norm: "Name"（無ければ "name"）を normalize_name したキー（表記ゆれ吸収）
+    ・specials: Rate > 0 の Special Attacks の Attack 名と、その Rate のエイリアス表
+    ・casters: Spells の "Name" → EnemyCasterStats（共有するので書き換えないこと）
+    """
+
+    by_name: Dict[str, Dict[str, Any]]
+    by_norm: Dict[str, Dict[str, Any]]
+    special_attacks: Tuple[Optional[str], ...]
+    special_total_rate: float
+    alias_prob: Tuple[float, ...]
+    alias_idx: Tuple[int, ...]
+    casters: Dict[str, EnemyCasterStats]
+
+    def spell(self, name: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Spells から "Name" 完全一致で引く"""
+        return self.by_name.get(name) if name is not None else None
+
+    def caster(self, spell_def: Dict[str, Any]) -> EnemyCasterStats:
+        c = self.casters.get(spell_def.get("Name"))
+        if c is not None and self.by_name.get(spell_def.get("Name")) is spell_def:
+            return c
+        return enemy_caster_from_spell_def(spell_def)
+
+    def sample_special(self, rng: random.Random) -> Optional[Dict[str, Any]]:
+        """Rate の重みで Special Attacks を1つ選び、対応する Spells の定義を返す（乱数は1回）"""
+        if self.special_total_rate <= 0 or not self.alias_prob:
+            return None
+        n = len(self.alias_prob)
+        u = rng.random() * n
+        i = int(u)
+        if i >= n:
+            i = n - 1
+        if u - i >= self.alias_prob[i]:
+            i = self.alias_idx[i]
+        return self.spell(self.special_attacks[i])
+
+
+def _compile_monster_spell_index(monster: Dict[str, Any]) -> MonsterSpellIndex:
+    by_name: Dict[str, Dict[str, Any]] = {}
+    by_norm: Dict[str, Dict[str, Any]] = {}
+    for sp in monster.get("Spells") or monster.get("spells") or []:
+        if not isinstance(sp, dict):
+            continue
+        by_norm.setdefault(normalize_name(sp.get("Name") or sp.get("name") or ""), sp)
+    for sp in monster.get("Spells") or []:
+        if isinstance(sp, dict) and sp.get("Name") is not None:
+            by_name.setdefault(sp["Name"], sp)
+
+    casters: Dict[str, EnemyCasterStats] = {}
+    for name, sp in by_name.items():
+        try:
+            casters[name] = enemy_caster_from_spell_def(sp)
+        except (TypeError, ValueError):
+            pass  # 変な Accuracy は使うときに従来どおり例外にする
+
+    specials = monster.get("Special Attacks") or []
+    total_rate = sum((sa.get("Rate") or 0) for sa in specials)
+    attacks: List[Optional[str]] = []
+    weights: List[float] = []
+    for sa in specials:
+        rate = sa.get("Rate") or 0.0
+        if rate > 0:
+            attacks.append(sa.get("Attack"))
+            weights.append(float(rate))
+    prob, alias = build_alias_table(weights)
+
+    return MonsterSpellIndex(
+        by_name=by_name,
+        by_norm=by_norm,
+        special_attacks=tuple(attacks),
+        special_total_rate=float(total_rate),
+        alias_prob=prob,
+        alias_idx=alias,
+        casters=casters,
+    )
+
+
+# monster JSON の id → (その dict, 索引)。dict を保持するので id が再利用されることはない
+_SPELL_INDEXES: Dict[int, Tuple[Dict[str, Any], MonsterSpellIndex]] = {}
+_SPELL_INDEXES_MAX = 4096
+
+
+def monster_spell_index(monster: Dict[str, Any]) -> MonsterSpellIndex:
+    """
+    monster JSON の MonsterSpellIndex（dict ごとに1回だけ作る）。
+    enemy_build の MonsterPrototype が作った JSON は全スポーンで共有されるので、戦闘中は常にキャッシュを引く。
+    JSON の Spells / Special Attacks を書き換えた場合は invalidate_monster_spell_indexes() を呼ぶ
+    """
+    hit = _SPELL_INDEXES.get(id(monster))
+    if hit is not None and hit[0] is monster:
+        return hit[1]
+    index = _compile_monster_spell_index(monster)
+    if len(_SPELL_INDEXES) >= _SPELL_INDEXES_MAX:
+        _SPELL_INDEXES.clear()
+    _SPELL_INDEXES[id(monster)] = (monster, index)
+    return index
+
+
+def invalidate_monster_spell_indexes() -> None:
+    _SPELL_INDEXES.clear()
+
+
 def _choose_monster_special_spell(
     monster: Dict[str, Any],
     rng: Optional[random.Random] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     モンスター JSON から 1 つスペシャル攻撃用 Spell を選ぶ。
-    ・"Special Attacks" の Rate による重み付き抽選で Attack 名を選ぶ
-    ・monster["Spells"] 内の Name == Attack のものを返す
+    ・"Special Attacks" の Rate による重み付き抽選で Attack 名を選ぶ（★エイリアス表で O(1)）
+    ・monster["Spells"] 内の Name == Attack のものを返す（★名前索引）
     見つからなければ None を返す。
     """
     if rng is None:
         rng = random.Random()
 
-    specials = monster.get("Special Attacks") or []
-    if not specials:
-        return None
-
-    total_rate = sum((sa.get("Rate") or 0) for sa in specials)
-    if total_rate <= 0:
-        return None
-
-    r = rng.random() * total_rate
-    acc = 0.0
-    chosen_attack_name = None
-    for sa in specials:
-        rate = sa.get("Rate") or 0.0
-        acc += rate
-        if r <= acc:
-            chosen_attack_name = sa.get("Attack")
-            break
-
-    if not chosen_attack_name:
-        return None
-
-    spell_list = monster.get("Spells") or []
-    for s in spell_list:
-        if s.get("Name") == chosen_attack_name:
-            return s
-
-    return None
+    return monster_spell_index(monster).sample_special(rng)
 
 
 # まず Spell 定義を引けるようにする
@@ -173,7 +299,7 @@ def _find_monster_spell_definition(
 ) -> Optional[Dict[str, Any]]:
     """
     モンスターが使うスペルの JSON 定義を取得する。
-    ・Name（または name）の大小文字を問わず一致させる
+    ・Name（または name）の表記ゆれ（大小文字・空白・記号・全角半角）を問わず一致させる
     ・子召喚などを含む場合は spells_by_name（MASTER_SPELLS_BY_NAME）からの fallback も可能
 
     戻り値:
@@ -182,26 +308,16 @@ def _find_monster_spell_definition(
     if not spell_name:
         return None
 
-    sname = spell_name.strip().lower()
-
-    # 1) モンスターの Spells セクションを探す（最優先）
-    spells = monster.get("Spells") or monster.get("spells") or []
-    for sp in spells:
-        nm = (sp.get("Name") or sp.get("name") or "").strip().lower()
-        if nm == sname:
-            return sp
+    # 1) モンスターの Spells セクションを探す（最優先・★名前索引）
+    sp = monster_spell_index(monster).by_norm.get(normalize_name(spell_name))
+    if sp is not None:
+        return sp
 
     # 2) 次に、本体の spells.json (MASTER_SPELLS_BY_NAME) から引く
     #    expand_spells_for_summons() を使っている場合、子召喚もここに入る
-    global MASTER_SPELLS_BY_NAME
+    #    ★表記ゆれも正規化名インデックスで O(1)（全件の線形探索はしない）
     if MASTER_SPELLS_BY_NAME:
-        sp = MASTER_SPELLS_BY_NAME.get(spell_name)
-        if sp:
-            return sp
-        # 大文字小文字ゆれにも対応
-        for nm, js in MASTER_SPELLS_BY_NAME.items():
-            if nm.lower() == sname:
-                return js
+        return lookup_by_name(MASTER_SPELLS_BY_NAME, spell_name)
 
     return None
 
@@ -254,7 +370,7 @@ def enrich_monster_spells(
                 new_spells.append(s)
                 continue
 
-            master = spells_by_name.get(nm) or spells_by_name.get(nm.lower())
+            master = lookup_by_name(spells_by_name, nm)
             if isinstance(master, dict):
                 new_spells.append(_merge_spell_defs(s, master))
             else:
@@ -277,7 +393,7 @@ def enrich_monster_spells(
                 continue
 
             # 「魔法DBに存在する名前なら補完」くらいの緩い判定でOK
-            master = spells_by_name.get(nm) or spells_by_name.get(nm.lower())
+            master = lookup_by_name(spells_by_name, nm)
             if isinstance(master, dict):
                 new_specials.append(_merge_spell_defs(a, master))
             else:
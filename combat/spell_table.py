@@ -0,0 +1,128 @@
+# ============================================================
+# spell_table: 魔法定義の前計算（詠唱のたびに JSON の文字列を解釈し直さない）
+
+# CompiledSpell	魔法1件分の前計算（SpellInfo・対象/AoE・回復種別・状態異常・反射可否・Drain・属性マスク・MPレベル）
+# compile_spell	魔法JSON1件から CompiledSpell を作る
+# compiled_spell	魔法JSON（dict）ごとに1回だけ CompiledSpell を作って使い回す
+# spell_table	spells_by_name（expand_spells_for_summons 済み）の全魔法を 名前→CompiledSpell にした表
+# lookup_spell	spells_by_name の名前から CompiledSpell を引く（表の中身が差し替わっていれば作り直す）
+# invalidate_spell_tables	前計算を捨てる（魔法データを書き換えたとき）
+# ============================================================
+# ・CompiledSpell.info（SpellInfo）は全詠唱で共有する。書き換えないこと
+# ・ailments は apply_status_spell_to_enemy に summon_child_name=魔法名 で渡したときと同じ（spell_ailments の結果）
+# ・表は spells_by_name の dict ごと（同一 dict・件数も同じなら作り直さない）。
+#   expand_spells_for_summons は同じ入力に同じ dict を返すので、戦闘中はずっと同じ表を引く
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from combat.elements import element_mask
+from combat.magic_damage import healing_spell_kind
+from combat.models import SpellInfo
+from combat.spell_repo import spell_from_json
+from combat.status_effects import spell_ailments
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledSpell:
+    name: str
+    json: Dict[str, Any]
+    info: SpellInfo
+    target: str  # Target を strip + 小文字化したもの
+    is_aoe: bool  # Target == "all enemies"（magic_aoe.spell_is_aoe と同じ）
+    is_one_or_all: bool  # Target == "one/all enemies"
+    healing_kind: Optional[str]  # healing_spell_kind の結果
+    ailments: Tuple[str, ...]  # spell_ailments の結果（空なら状態異常魔法ではない）
+    reflectable: bool  # Reflectable == "yes"
+    is_drain: bool  # Effect に "absorb hp" を含む or 名前が Drain
+    element_mask: int  # info.elements の属性ビットマスク
+    level: int  # MP レベル（Level）
+
+
+def compile_spell(spell_json: Dict[str, Any], name: Optional[str] = None) -> CompiledSpell:
+    """魔法JSON1件 → CompiledSpell（name は spells_by_name のキー。省略時は Name / name）"""
+    if name is None:
+        name = spell_json.get("Name") or spell_json.get("name") or ""
+    info = spell_from_json(spell_json)
+    target = (spell_json.get("Target") or "").strip().lower()
+    effect_text = (spell_json.get("Effect") or "").lower()
+    return CompiledSpell(
+        name=name,
+        json=spell_json,
+        info=info,
+        target=target,
+        is_aoe=target == "all enemies",
+        is_one_or_all=target == "one/all enemies",
+        healing_kind=healing_spell_kind(spell_json),
+        ailments=tuple(spell_ailments(spell_json, summon_child_name=name)),
+        reflectable=str(spell_json.get("Reflectable", "No")).strip().lower() == "yes",
+        is_drain=(
+            "absorb hp" in effect_text or (spell_json.get("Name") or "").lower() == "drain"
+        ),
+        element_mask=element_mask(info.elements),
+        level=int(spell_json.get("Level", 1)),
+    )
+
+
+# id(魔法JSON) → (その dict, CompiledSpell)。dict を保持するので id が再利用されることはない
+_COMPILED: Dict[int, Tuple[Dict[str, Any], CompiledSpell]] = {}
+_COMPILED_MAX = 8192
+
+# id(spells_by_name) → (spells_by_name, 件数, 名前→CompiledSpell)
+_TABLES: Dict[int, Tuple[Dict[str, Any], int, Dict[str, CompiledSpell]]] = {}
+
+
+def compiled_spell(spell_json: Dict[str, Any], name: Optional[str] = None) -> CompiledSpell:
+    """魔法JSON の CompiledSpell（dict ごとに1回だけ作る）"""
+    hit = _COMPILED.get(id(spell_json))
+    if hit is not None and hit[0] is spell_json and (name is None or hit[1].name == name):
+        return hit[1]
+    cs = compile_spell(spell_json, name)
+    if len(_COMPILED) >= _COMPILED_MAX:
+        _COMPILED.clear()
+    _COMPILED[id(spell_json)] = (spell_json, cs)
+    return cs
+
+
+def spell_table(spells_by_name: Dict[str, Dict[str, Any]]) -> Dict[str, CompiledSpell]:
+    """
+    spells_by_name の全魔法を CompiledSpell にした表（dict ごとに1回だけ作る）。
+    解釈できない定義（数値欄が壊れている等）は表に入れない（lookup_spell が詠唱時に従来どおり例外にする）。
+    """
+    hit = _TABLES.get(id(spells_by_name))
+    if hit is not None and hit[0] is spells_by_name and hit[1] == len(spells_by_name):
+        return hit[2]
+
+    table: Dict[str, CompiledSpell] = {}
+    for name, spell_json in spells_by_name.items():
+        if not isinstance(spell_json, dict):
+            continue
+        try:
+            table[name] = compiled_spell(spell_json, name)
+        except (TypeError, ValueError):
+            continue
+
+    if len(_TABLES) >= 16:
+        _TABLES.clear()
+    _TABLES[id(spells_by_name)] = (spells_by_name, len(spells_by_name), table)
+    return table
+
+
+def lookup_spell(
+    spells_by_name: Dict[str, Dict[str, Any]], name: Optional[str]
+) -> Optional[CompiledSpell]:
+    """名前 → CompiledSpell（spells_by_name に無ければ None）"""
+    spell_json = spells_by_name.get(name or "")
+    if spell_json is None:
+        return None
+    cs = spell_table(spells_by_name).get(name)
+    if cs is None or cs.json is not spell_json:
+        cs = compiled_spell(spell_json, name)
+    return cs
+
+
+def invalidate_spell_tables() -> None:
+    _COMPILED.clear()
+    _TABLES.clear()
@@ -11,6 +11,7 @@ from typing import Union, Optional, Dict, Any, List
 from combat.enums import Status
 from combat.models import BattleActorState, FinalCharacterStats, FinalEnemyStats
 from combat.logging import log_damage
+from combat.verbosity import logs_enabled
 
 
 # 2) ターン開始処理（毒ダメージ＋開始時バフ/デバフ）==================================================
@@ -57,17 +58,18 @@ def start_of_turn_for_actor(
         # 毒では死なず HP1 で止まる
         state.hp = max(1, state.hp - poison_dmg)
 
-        log_damage(
-            logs,
-            f"{actor_name}は毒のダメージを受けた！",
-            actor_name,
-            poison_dmg,
-            old_hp,
-            state.hp,
-            "neutral",
-            "arrow_with_max",
-            max_hp,
-        )
+        if logs_enabled():
+            log_damage(
+                logs,
+                f"{actor_name}は毒のダメージを受けた！",
+                actor_name,
+                poison_dmg,
+                old_hp,
+                state.hp,
+                "neutral",
+                "arrow_with_max",
+                max_hp,
+            )
 
     # ③ 将来、リジェネや「ターンごとにゲージ減少」などもここに追加していける
 
@@ -7,6 +7,7 @@
 # partial_petrify_amount_from_name	名前からamountを返す小ヘルパー（部分石化）
 # ff3_confused_self_dummy_enemy	混乱時の「自傷」用に、キャラ自身を防御側として扱うためのダミー敵ステータスを作る
 # ff3_confused_self_dummy_char	混乱時の「敵の自傷」用に、敵自身を“キャラの防御側”として扱うダミーを作る
+# spell_ailments	魔法/召喚の定義（StatusAilment・召喚子のStatus・Effect文・Erase）から付与する状態異常名のリストを取り出す
 # apply_status_spell_to_enemy	魔法/召喚が持つ状態異常情報を解釈し、敵に状態異常を付与する共通ヘルパー
 # _compute_status_success_prob_for_enemy_spell	敵キャスターとキャラのステータスから状態異常スペルの成功確率を近似計算する
 # apply_status_spell_to_char	敵が唱えた状態異常系スペルをキャラに適用する共通ヘルパー,
@@ -21,11 +22,12 @@
 # ============================================================
 
 import random
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
 
 from combat.enums import Status
 from combat.models import BattleActorState, FinalCharacterStats, FinalEnemyStats
 from combat.models import EnemyCasterStats
+from combat.verbosity import logs_enabled
 
 
 # <状態異常> =============================================================================
@@ -57,11 +59,13 @@ def apply_partial_petrification(
         target_state.statuses.add(Status.PETRIFY)
         target_state.statuses.add(Status.KO)  # ← 修正！
         target_state.hp = 0  # 戦闘離脱ルールに合わせて HP 0 にしておく
-        logs.append(f"{target_name}は部分石化が進行し、完全に石化してしまった！")
+        if logs_enabled():
+            logs.append(f"{target_name}は部分石化が進行し、完全に石化してしまった！")
     else:
         # まだ途中段階
         target_state.statuses.add(Status.PARTIAL_PETRIFY)
-        logs.append(f"{target_name}は部分的に石化した！（蓄積 {new:.2f}）")
+        if logs_enabled():
+            logs.append(f"{target_name}は部分的に石化した！（蓄積 {new:.2f}）")
 
 
 def apply_partial_petrify_from_status_attack(
@@ -170,20 +174,14 @@ def ff3_confused_self_dummy_char(enemy: FinalEnemyStats) -> FinalCharacterStats:
 # ============================================================
 
 
-def apply_status_spell_to_enemy(
+def spell_ailments(
     spell_json: Dict[str, Any],
-    enemy_state: BattleActorState,
-    enemy_json: Dict[str, Any],
-    enemy_name: str,
-    rng: random.Random,
-    logs: List[str],
-    *,
-    caster_stats: Optional[FinalCharacterStats] = None,  # ★追加
     summon_child_name: Optional[str] = None,
-) -> bool:
+) -> List[str]:
     """
-    魔法/召喚が持つ状態異常を敵に付与する。
-    付与処理対象の魔法なら True を返す（成功/失敗は問わない）。
+    魔法/召喚の定義から、敵に付与する状態異常名（小文字）のリストを取り出す。
+    状態異常魔法でなければ空リスト。
+    （spell_table.CompiledSpell がロード時に1回だけ呼んで結果を持つ）
     """
 
     # ---- 0) 召喚の子スペル(Status)を拾う ----
@@ -224,11 +222,6 @@ def apply_status_spell_to_enemy(
                 spell_json = dict(spell_json)  # shallow copy
                 spell_json["StatusAilment"] = child_status
 
-    # ★ スペル名は最初に拾っておく（Name / name 両対応）
-    spell_name = (
-        (spell_json.get("Name") or spell_json.get("name") or "").strip().lower()
-    )
-
     # ---- 1) 状態異常リスト抽出（StatusAilment / StatusAilments） ----
     ailments = spell_json.get("StatusAilment") or spell_json.get("StatusAilments") or ""
 
@@ -272,16 +265,55 @@ def apply_status_spell_to_enemy(
         elif "toad" in effect_text and "turn target into a toad" in effect_text:
             ailments_list = ["toad"]
 
-    # ★ ここで Erase を特別扱いする（return False より前）
+    # ---- 2.5) Erase（黒魔法Lv5 全体即死）専用：ここでダミー状態異常を立てる ----
     if not ailments_list and spell_name == "erase":
         ailments_list = ["erase"]
 
-    if not ailments_list:
-        return False  # 状態異常魔法ではない
+    return ailments_list
+
+
+# ★ 名前→Status enum 対応（apply_status_spell_to_enemy 用）
+_SPELL_STATUS_MAP = {
+    "poison": Status.POISON,
+    "blind": Status.BLIND,
+    "mini": Status.MINI,
+    "silence": Status.SILENCE,
+    "toad": Status.TOAD,
+    "confusion": Status.CONFUSION,
+    "confuse": Status.CONFUSION,  # 表記ゆれ対策
+    "sleep": Status.SLEEP,
+    "paralysis": Status.PARALYZE,
+    "petrification": Status.PETRIFY,
+    "ko": Status.KO,
+    "partial petrification": Status.PARTIAL_PETRIFY,
+    "partial petrification (1/3)": Status.PARTIAL_PETRIFY,
+    "partial petrification (1/2)": Status.PARTIAL_PETRIFY,
+    "partial petrification (full)": Status.PETRIFY,
+}
 
-    # ---- 2.5) Erase（黒魔法Lv5 全体即死）専用：ここでダミー状態異常を立てる ----
-    if not ailments_list and spell_name == "erase":
-        ailments_list = ["erase"]
+
+def apply_status_spell_to_enemy(
+    spell_json: Dict[str, Any],
+    enemy_state: BattleActorState,
+    enemy_json: Dict[str, Any],
+    enemy_name: str,
+    rng: random.Random,
+    logs: List[str],
+    *,
+    caster_stats: Optional[FinalCharacterStats] = None,  # ★追加
+    summon_child_name: Optional[str] = None,
+    ailments: Optional[Sequence[str]] = None,  # ★追加：spell_ailments の結果（前計算済みなら渡す）
+) -> bool:
+    """
+    魔法/召喚が持つ状態異常を敵に付与する。
+    付与処理対象の魔法なら True を返す（成功/失敗は問わない）。
+    """
+
+    # ---- 0)〜2.5) 状態異常リスト（CompiledSpell.ailments があればそれを使う） ----
+    if ailments is None:
+        ailments_list = spell_ailments(spell_json, summon_child_name)
+    else:
+        ailments_list = list(ailments)
 
     if not ailments_list:
         return False  # 状態異常魔法ではない
@@ -299,7 +331,8 @@ def apply_status_spell_to_enemy(
 
         # 免疫なら即終了
         if ail in immune_set:
-            logs.append(f"{enemy_name}には{ail.title()}が効かなかった！（無効）")
+            if logs_enabled():
+                logs.append(f"{enemy_name}には{ail.title()}が効かなかった！（無効）")
             return True
 
         # 命中率（Magic Hit% = BaseAccuracy% + Mind/2）
@@ -317,11 +350,12 @@ def apply_status_spell_to_enemy(
         if roll < hit_percent:
             enemy_state.statuses.add(Status.KO)
             enemy_state.hp = 0
-            logs.append(
-                f"{enemy_name}は《{spell_label}》で逃げ出し、戦闘不能になった！"
-                f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
-            )
-        else:
+            if logs_enabled():
+                logs.append(
+                    f"{enemy_name}は《{spell_label}》で逃げ出し、戦闘不能になった！"
+                    f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
+                )
+        elif logs_enabled():
             logs.append(
                 f"{enemy_name}には《{spell_label}》が効かなかった…"
                 f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
@@ -353,11 +387,12 @@ def apply_status_spell_to_enemy(
         if roll < hit_percent:
             enemy_state.statuses.add(Status.KO)
             enemy_state.hp = 0
-            logs.append(
-                f"{enemy_name}は《Erase》の効果で消し去られた！"
-                f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
-            )
-        else:
+            if logs_enabled():
+                logs.append(
+                    f"{enemy_name}は《Erase》の効果で消し去られた！"
+                    f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
+                )
+        elif logs_enabled():
             logs.append(
                 f"{enemy_name}には《Erase》が効かなかった…"
                 f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
@@ -365,24 +400,8 @@ def apply_status_spell_to_enemy(
 
         return True  # Erase 用処理はここで完了
 
-    # ---- 4) 名前→Status enum 対応 ----
-    status_map = {
-        "poison": Status.POISON,
-        "blind": Status.BLIND,
-        "mini": Status.MINI,
-        "silence": Status.SILENCE,
-        "toad": Status.TOAD,
-        "confusion": Status.CONFUSION,
-        "confuse": Status.CONFUSION,  # 表記ゆれ対策
-        "sleep": Status.SLEEP,
-        "paralysis": Status.PARALYZE,
-        "petrification": Status.PETRIFY,
-        "ko": Status.KO,
-        "partial petrification": Status.PARTIAL_PETRIFY,
-        "partial petrification (1/3)": Status.PARTIAL_PETRIFY,
-        "partial petrification (1/2)": Status.PARTIAL_PETRIFY,
-        "partial petrification (full)": Status.PETRIFY,
-    }
+    # ---- 4) 名前→Status enum 対応（_SPELL_STATUS_MAP） ----
+    status_map = _SPELL_STATUS_MAP
 
     # ---- 5) 命中率 ----
     acc = spell_json.get("BaseAccuracy")
@@ -408,12 +427,14 @@ def apply_status_spell_to_enemy(
             key.startswith("partial petrification")
             and "partial petrification" in immune_set
         ):
-            logs.append(f"{enemy_name}には効かなかった！（{a}無効）")
+            if logs_enabled():
+                logs.append(f"{enemy_name}には効かなかった！（{a}無効）")
             continue
 
         st = status_map.get(key)
         if st is None:
-            logs.append(f"※ 未対応の状態異常: {a}")
+            if logs_enabled():
+                logs.append(f"※ 未対応の状態異常: {a}")
             continue
 
         # ★ ロールを保持してログに使う
@@ -429,37 +450,40 @@ def apply_status_spell_to_enemy(
                     target_name=enemy_name,
                     logs=logs,
                 )
-                logs.append(
-                    f"{enemy_name}は部分石化した！（魔法："
-                    f"命中率{hit_percent:.1f}% 判定{roll_percent:.1f}）"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{enemy_name}は部分石化した！（魔法："
+                        f"命中率{hit_percent:.1f}% 判定{roll_percent:.1f}）"
+                    )
             else:
                 enemy_state.statuses.add(st)
 
                 if st == Status.KO:
                     # 即死系：HP0 にして戦闘不能扱い
                     enemy_state.hp = 0
-                    logs.append(
-                        f"{enemy_name}はKO状態になった！（魔法："
-                        f"命中率{hit_percent:.1f}% 判定{roll_percent:.1f}）"
-                    )
+                    if logs_enabled():
+                        logs.append(
+                            f"{enemy_name}はKO状態になった！（魔法："
+                            f"命中率{hit_percent:.1f}% 判定{roll_percent:.1f}）"
+                        )
 
                 elif st == Status.PETRIFY:
                     # 完全石化：KO も付けて戦闘離脱扱い
                     enemy_state.statuses.add(Status.KO)
                     enemy_state.hp = 0
-                    logs.append(
-                        f"{enemy_name}は完全に石化してしまった！（魔法："
-                        f"命中率{hit_percent:.1f}% 判定{roll_percent:.1f}）"
-                    )
+                    if logs_enabled():
+                        logs.append(
+                            f"{enemy_name}は完全に石化してしまった！（魔法："
+                            f"命中率{hit_percent:.1f}% 判定{roll_percent:.1f}）"
+                        )
 
-                else:
+                elif logs_enabled():
                     # それ以外の通常状態異常
                     logs.append(
                         f"{enemy_name}は{st.name}状態になった！（魔法："
                         f"命中率{hit_percent:.1f}% 判定{roll_percent:.1f}）"
                     )
-        else:
+        elif logs_enabled():
             logs.append(
                 f"{enemy_name}は{a}を回避した！（魔法："
                 f"命中率{hit_percent:.1f}% 判定{roll_percent:.1f}）"
@@ -612,11 +636,12 @@ def apply_status_spell_to_char(
         if roll < hit_percent:
             char_state.statuses.add(Status.KO)
             char_state.hp = 0
-            logs.append(
-                f"{char_name}は《Erase》で消し去られた！"
-                f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
-            )
-        else:
+            if logs_enabled():
+                logs.append(
+                    f"{char_name}は《Erase》で消し去られた！"
+                    f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
+                )
+        elif logs_enabled():
             logs.append(
                 f"{char_name}には《Erase》が効かなかった…"
                 f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
@@ -628,18 +653,20 @@ def apply_status_spell_to_char(
         key = ail.lower()
         if key in ("toad", "mini"):
             if key in immune_set:
-                logs.append(f"{char_name}には{key.title()}が効かなかった！（無効）")
+                if logs_enabled():
+                    logs.append(f"{char_name}には{key.title()}が効かなかった！（無効）")
                 return True
 
             roll = rng.random() * 100.0
             if roll < hit_percent:
                 st = Status.TOAD if key == "toad" else Status.MINI
                 char_state.statuses.add(st)
-                logs.append(
-                    f"{char_name}は《{key.title()}》の効果を受けた！"
-                    f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
-                )
-            else:
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は《{key.title()}》の効果を受けた！"
+                        f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
+                    )
+            elif logs_enabled():
                 logs.append(
                     f"{char_name}には《{key.title()}》が効かなかった…"
                     f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
@@ -650,22 +677,25 @@ def apply_status_spell_to_char(
     for ail in ailments_list:
         key = ail.lower()
         if key in immune_set:
-            logs.append(f"{char_name}には{key}が効かなかった！（無効）")
+            if logs_enabled():
+                logs.append(f"{char_name}には{key}が効かなかった！（無効）")
             continue
 
         st = status_map.get(key)
         if st is None:
-            logs.append(f"※ 未対応の状態異常: {ail}")
+            if logs_enabled():
+                logs.append(f"※ 未対応の状態異常: {ail}")
             continue
 
         roll = rng.random() * 100.0
         if roll < hit_percent:
             char_state.statuses.add(st)
-            logs.append(
-                f"{char_name}は{st.name}状態になった！（魔法："
-                f"命中率{hit_percent:.1f}% 判定{roll:.1f}）"
-            )
-        else:
+            if logs_enabled():
+                logs.append(
+                    f"{char_name}は{st.name}状態になった！（魔法："
+                    f"命中率{hit_percent:.1f}% 判定{roll:.1f}）"
+                )
+        elif logs_enabled():
             logs.append(
                 f"{char_name}は{ail}を回避した！（魔法："
                 f"命中率{hit_percent:.1f}% 判定{roll:.1f}）"
@@ -742,10 +772,12 @@ def apply_reflect_to_actor(
     old = target_state.reflect_charges
     target_state.reflect_charges = charges
     if old <= 0 and charges > 0:
-        logs.append(f"{target_name}は魔法反射のバリアを張った！（Reflect）")
+        if logs_enabled():
+            logs.append(f"{target_name}は魔法反射のバリアを張った！（Reflect）")
     elif charges > 0:
-        logs.append(f"{target_name}のReflect効果が更新された。")
-    else:
+        if logs_enabled():
+            logs.append(f"{target_name}のReflect効果が更新された。")
+    elif logs_enabled():
         logs.append(f"{target_name}のReflect効果が消えた。")
 
 
@@ -0,0 +1,453 @@
+# ============================================================
+# sweep: 全ロケーション × パーティレベルの一括シミュレーション（python -m combat.sweep）
+
+# SweepTask	1セル（ロケーション × パーティレベル）分のタスク定義（pickle されるのはこれだけ）
+# build_party_template_at_level	セーブデータのパーティを指定レベルに揃えて PartyMemberRuntime 群を作る
+# build_sweep_tasks	build_location_index の全エントリ × パーティレベルのタスク一覧を作る
+# run_sweep_task	ワーカー側で1セルを実行し、集計行（dict）を返す（precision 指定時は区間が狭まった時点で打ち切り）
+# run_sweep	ProcessPoolExecutor でタスクを並列実行し、JSONL/CSV に逐次書き出す
+# main	CLI エントリポイント
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import random
+import signal
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple
+
+from combat.battle_sim import simulate_many_battles_multi_party
+from combat.confidence import half_width, mean_interval, wilson_interval
+from combat.char_build import build_party_members_from_save
+from combat.enemy_selection import build_location_index, pick_enemy_names
+from combat.magic_menu import expand_spells_for_summons
+from combat.models import PartyMemberRuntime
+from combat.runtime_state import RuntimeState, init_runtime_state
+from combat.verbosity import QUIET, set_verbosity, verbosity
+from system.exp_system import LevelTable
+
+DEFAULT_PARTY_LEVELS: Tuple[int, ...] = (10, 20, 30, 40, 50, 60, 70, 80, 90, 99)
+
+CSV_COLUMNS: Tuple[str, ...] = (
+    "location",
+    "avg_level",
+    "boss_count",
+    "party_level",
+    "trials",
+    "formations",
+    "win_rate",
+    "loss_rate",
+    "escape_rate",
+    "mean_rounds",
+    "win_rate_ci_low",
+    "win_rate_ci_high",
+    "mean_rounds_ci_low",
+    "mean_rounds_ci_high",
+    "exp_per_battle",
+    "gil_per_battle",
+    "cp_per_battle",
+    "elapsed_sec",
+)
+
+
+@dataclass(frozen=True)
+class SweepTask:
+    location: str
+    monster_names: Tuple[str, ...]
+    avg_level: int
+    boss_count: int
+    party_level: int
+    n_trials: int
+    n_formations: int
+    seed: int
+    max_rounds: int
+    # ★追加：逐次打ち切り（None なら n_trials 固定。指定時は n_trials が上限）
+    precision: Optional[float] = None
+    confidence: float = 0.95
+    batch_size: int = 100
+
+
+# ============================================================
+# ワーカー側（プロセスごとに1回だけマスタデータを読み込む）
+# ============================================================
+
+# ワーカープロセス内でだけ使うキャッシュ
+_WORKER_STATE: Optional[RuntimeState] = None
+_WORKER_LEVEL_TABLE: Optional[LevelTable] = None
+_WORKER_SPELLS: Optional[Dict[str, Dict[str, Any]]] = None
+_WORKER_PARTY_BY_LEVEL: Dict[int, List[PartyMemberRuntime]] = {}
+
+
+def _init_worker(base_dir: str) -> None:
+    """
+    ProcessPoolExecutor の initializer。
+    JSON 群はここで1回だけ読み込み、タスクには名前と数値だけを渡す。
+    """
+    global _WORKER_STATE, _WORKER_LEVEL_TABLE, _WORKER_SPELLS
+
+    # Ctrl+C は親プロセスだけが受けて、キャンセル処理を行う
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # ワーカーはログ文字列もデバッグ print も作らない
+    set_verbosity(QUIET)
+
+    base = Path(base_dir)
+    _WORKER_STATE = init_runtime_state(base)
+    _WORKER_LEVEL_TABLE = LevelTable(str(base / "assets/data/level_exp.csv"))
+    _WORKER_SPELLS = expand_spells_for_summons(_WORKER_STATE.spells)
+    _WORKER_PARTY_BY_LEVEL.clear()
+
+
+def build_party_template_at_level(
+    state: RuntimeState,
+    level_table: LevelTable,
+    party_level: int,
+) -> List[PartyMemberRuntime]:
+    """
+    セーブデータのパーティ（ジョブ・装備・列）をそのままに、
+    レベルだけ party_level に揃え、HP/MP 満タン・状態異常なしで構築する。
+    state.save は変更しない。
+    """
+    lv = max(1, min(int(party_level), level_table.max_level))
+    lower, _upper = level_table.level_exp_range(lv)
+
+    entries: List[dict] = []
+    for entry in state.save.get("party", []):
+        e = dict(entry)
+        e["level"] = lv
+        e["exp"] = lower
+        e["status_effects"] = {}
+        e.pop("mp", None)  # 無ければ満タン扱い
+        e["job_levels"] = dict(entry.get("job_levels") or {})
+        entries.append(e)
+
+    # build_party_members_from_save の装備デバッグ出力は出さない
+    with verbosity(QUIET):
+        return build_party_members_from_save(
+            save={"party": entries},
+            jobs_by_name=state.jobs_by_name,
+            weapons=state.weapons,
+            armors=state.armors,
+            level_table=level_table,
+        )
+
+
+def run_sweep_task(task: SweepTask) -> Dict[str, Any]:
+    """
+    ワーカー側で1セル分を実行する。
+    ・ロケーションから n_formations 通りの敵編成を抽選し、
+      n_trials をできるだけ均等に割り振って simulate_many_battles_multi_party を回す
+    ・precision 指定時は、全編成を batch_size 試行ずつ（編成に均等割り）巡回し、
+      1巡ごとにセル全体の勝率 Wilson 区間の半幅が precision 以下になったら止める
+      （1巡目の各編成は n_trials 固定時と同じ seed を使う）
+    """
+    if _WORKER_STATE is None or _WORKER_LEVEL_TABLE is None:
+        raise RuntimeError("_init_worker が呼ばれていません")
+    state = _WORKER_STATE
+
+    t0 = time.perf_counter()
+
+    party = _WORKER_PARTY_BY_LEVEL.get(task.party_level)
+    if party is None:
+        party = build_party_template_at_level(
+            state, _WORKER_LEVEL_TABLE, task.party_level
+        )
+        _WORKER_PARTY_BY_LEVEL[task.party_level] = party
+
+    # 編成抽選（セルごとの種で再現可能に）
+    form_rng = random.Random(task.seed)
+    n_form = max(1, min(task.n_formations, task.n_trials))
+    formations = [
+        pick_enemy_names(task, state.monsters, rng=form_rng) for _ in range(n_form)
+    ]
+
+    # 1巡あたりの総試行数（固定モードは1巡で n_trials 全部）
+    per_pass = task.n_trials if task.precision is None else max(n_form, task.batch_size)
+    base_n, extra = divmod(per_pass, n_form)
+    trials = wins = losses = escapes = 0
+    total_rounds = 0.0
+    total_rounds_sq = 0.0
+    total_exp = total_gil = total_cp = 0.0
+
+    n_pass = 0
+    while trials < task.n_trials:
+        for i, names in enumerate(formations):
+            n = min(base_n + (1 if i < extra else 0), task.n_trials - trials)
+            if n <= 0:
+                continue
+            r = simulate_many_battles_multi_party(
+                party,
+                names,
+                n,
+                seed=task.seed + i + n_pass * n_form,
+                state=state,
+                spells_by_name=_WORKER_SPELLS,
+                max_rounds=task.max_rounds,
+            )
+            trials += r["trials"]
+            wins += r["wins_char"]
+            losses += r["wins_enemy"]
+            escapes += r["escapes"]  # 敵の逃走（格下相手）を含む
+            total_rounds += r["average_turns"] * r["trials"]
+            total_rounds_sq += sum(k * k * v for k, v in r["rounds_histogram"].items())
+            total_exp += r["average_exp"] * r["trials"]
+            total_gil += r["average_gil"] * r["trials"]
+            total_cp += r["average_cp"] * r["trials"]
+        n_pass += 1
+
+        if task.precision is None:
+            break
+        ci = wilson_interval(wins, trials, task.confidence)
+        if half_width(ci) <= task.precision:
+            break
+
+    win_ci = wilson_interval(wins, trials, task.confidence)
+    rounds_ci = mean_interval(total_rounds, total_rounds_sq, trials, task.confidence)
+
+    def _per(x: float) -> float:
+        return round(x / trials, 4) if trials else 0.0
+
+    return {
+        "location": task.location,
+        "avg_level": task.avg_level,
+        "boss_count": task.boss_count,
+        "party_level": task.party_level,
+        "trials": trials,
+        "formations": n_form,
+        "win_rate": _per(wins),
+        "loss_rate": _per(losses),
+        "escape_rate": _per(escapes),
+        "mean_rounds": _per(total_rounds),
+        "win_rate_ci_low": round(win_ci[0], 4),
+        "win_rate_ci_high": round(win_ci[1], 4),
+        "mean_rounds_ci_low": round(rounds_ci[0], 4),
+        "mean_rounds_ci_high": round(rounds_ci[1], 4),
+        "exp_per_battle": _per(total_exp),
+        "gil_per_battle": _per(total_gil),
+        "cp_per_battle": _per(total_cp),
+        "elapsed_sec": round(time.perf_counter() - t0, 3),
+    }
+
+
+# ============================================================
+# 親プロセス側
+# ============================================================
+
+
+def _cell_seed(base_seed: int, location: str, party_level: int) -> int:
+    """セルごとの種（実行順やワーカー数に依存しない）"""
+    key = f"{location}|{party_level}".encode("utf-8")
+    return (int(base_seed) * 1_000_003 + zlib.crc32(key)) & 0x7FFFFFFF
+
+
+def build_sweep_tasks(
+    state: RuntimeState,
+    *,
+    party_levels: Sequence[int] = DEFAULT_PARTY_LEVELS,
+    n_trials: int = 1000,
+    n_formations: int = 20,
+    seed: int = 0,
+    max_rounds: int = 50,
+    locations: Optional[Sequence[str]] = None,
+    precision: Optional[float] = None,
+    confidence: float = 0.95,
+    batch_size: int = 100,
+) -> List[SweepTask]:
+    wanted = set(locations) if locations else None
+    tasks: List[SweepTask] = []
+    for entry in build_location_index(state.monsters):
+        if wanted is not None and entry.location not in wanted:
+            continue
+        for lv in party_levels:
+            tasks.append(
+                SweepTask(
+                    location=entry.location,
+                    monster_names=entry.monster_names,
+                    avg_level=entry.avg_level,
+                    boss_count=entry.boss_count,
+                    party_level=int(lv),
+                    n_trials=int(n_trials),
+                    n_formations=int(n_formations),
+                    seed=_cell_seed(seed, entry.location, int(lv)),
+                    max_rounds=int(max_rounds),
+                    precision=precision,
+                    confidence=float(confidence),
+                    batch_size=int(batch_size),
+                )
+            )
+    return tasks
+
+
+class _RowWriter:
+    """JSONL / CSV の逐次書き出し（1行ごとに flush）"""
+
+    def __init__(self, fp: TextIO, fmt: str):
+        self.fp = fp
+        self.fmt = fmt
+        self._csv: Optional[csv.DictWriter] = None
+        if fmt == "csv":
+            self._csv = csv.DictWriter(fp, fieldnames=list(CSV_COLUMNS))
+            self._csv.writeheader()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        if self._csv is not None:
+            self._csv.writerow({k: row.get(k) for k in CSV_COLUMNS})
+        else:
+            self.fp.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self.fp.flush()
+
+
+def run_sweep(
+    tasks: Sequence[SweepTask],
+    out: TextIO,
+    *,
+    fmt: str = "jsonl",
+    base_dir: Path = Path("."),
+    max_workers: Optional[int] = None,
+    progress: Optional[TextIO] = sys.stderr,
+) -> int:
+    """
+    タスクを全コアに分散して実行し、終わったセルから順に out へ書き出す。
+    Ctrl+C で未着手タスクをキャンセルし、書き出し済みの行はそのまま残す。
+    戻り値: 書き出した行数
+    """
+    writer = _RowWriter(out, fmt)
+    total = len(tasks)
+    done = 0
+    t0 = time.perf_counter()
+
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        initializer=_init_worker,
+        initargs=(str(Path(base_dir).resolve()),),
+    )
+    try:
+        futures = [executor.submit(run_sweep_task, t) for t in tasks]
+        for fut in as_completed(futures):
+            row = fut.result()
+            writer.write(row)
+            done += 1
+            if progress is not None:
+                elapsed = time.perf_counter() - t0
+                eta = elapsed / done * (total - done)
+                progress.write(
+                    f"\r[sweep] {done}/{total} ({done / total:.1%}) "
+                    f"経過 {elapsed:.0f}s / 残り約 {eta:.0f}s"
+                )
+                progress.flush()
+    except KeyboardInterrupt:
+        if progress is not None:
+            progress.write(f"\n[sweep] 中断しました（{done}/{total} セル書き出し済み）\n")
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    else:
+        executor.shutdown(wait=True)
+        if progress is not None:
+            progress.write("\n")
+    return done
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m combat.sweep",
+        description="全ロケーション × パーティレベルで戦闘を一括シミュレーションする",
+    )
+    parser.add_argument("-o", "--output", default="-", help="出力先（- で標準出力）")
+    parser.add_argument(
+        "--format",
+        choices=("jsonl", "csv"),
+        default=None,
+        help="出力形式（省略時は拡張子から判定、既定 jsonl）",
+    )
+    parser.add_argument(
+        "--levels",
+        default=",".join(str(x) for x in DEFAULT_PARTY_LEVELS),
+        help="パーティレベル（カンマ区切り）",
+    )
+    parser.add_argument(
+        "--trials",
+        type=int,
+        default=1000,
+        help="セルあたりの試行回数（--precision 指定時は上限）",
+    )
+    parser.add_argument(
+        "--precision",
+        type=float,
+        default=None,
+        help="勝率の目標精度（例 0.01 = ±1%%）。区間がこの半幅に収まったセルは打ち切る",
+    )
+    parser.add_argument(
+        "--confidence", type=float, default=0.95, help="信頼水準（--precision 用）"
+    )
+    parser.add_argument(
+        "--batch", type=int, default=100, help="打ち切り判定の間隔（試行数）"
+    )
+    parser.add_argument(
+        "--formations", type=int, default=20, help="セルあたりの敵編成の抽選数"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-rounds", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=None, help="既定: CPUコア数")
+    parser.add_argument(
+        "--location", action="append", default=None, help="対象ロケーション（複数可）"
+    )
+    parser.add_argument("--base-dir", default=".", help="assets/data のあるディレクトリ")
+    parser.add_argument("--no-progress", action="store_true")
+    args = parser.parse_args(argv)
+
+    try:
+        levels = [int(x) for x in args.levels.split(",") if x.strip()]
+    except ValueError:
+        parser.error(f"--levels の指定が不正です: {args.levels}")
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "csv" if str(args.output).lower().endswith(".csv") else "jsonl"
+
+    base_dir = Path(args.base_dir)
+    state = init_runtime_state(base_dir)
+    tasks = build_sweep_tasks(
+        state,
+        party_levels=levels,
+        n_trials=args.trials,
+        n_formations=args.formations,
+        seed=args.seed,
+        max_rounds=args.max_rounds,
+        locations=args.location,
+        precision=args.precision,
+        confidence=args.confidence,
+        batch_size=args.batch,
+    )
+
+    if args.output == "-":
+        out_ctx: Any = contextlib.nullcontext(sys.stdout)
+    else:
+        out_ctx = open(args.output, "w", encoding="utf-8", newline="")
+
+    try:
+        with out_ctx as out:
+            run_sweep(
+                tasks,
+                out,
+                fmt=fmt,
+                base_dir=base_dir,
+                max_workers=args.workers,
+                progress=None if args.no_progress else sys.stderr,
+            )
+    except KeyboardInterrupt:
+        return 130
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,8 +10,7 @@ from random import Random
 from types import SimpleNamespace
 from typing import Literal, Dict, Any, List, Tuple, cast
 
-from utils.safe_int_float import safe_int
-from combat.enums import BattleKind, Status
+from combat.enums import BattleKind, BattleMode, Status
 from combat.models import (
     Optional,
     FinalCharacterStats,
@@ -21,11 +20,12 @@ from combat.models import (
     SpellInfo,
     OneTurnResult,
     PartyMemberRuntime,
-    EnemyCasterStats,
     AttackResult,
 )
 from combat.runtime_state import RuntimeState
-from combat.spell_repo import _choose_monster_special_spell
+from combat.spell_repo import _choose_monster_special_spell, monster_spell_index
+from combat.spell_table import compiled_spell
+from combat.name_index import lookup_by_name
 from combat.elements import (
     elements_from_monster_spell,
     element_relation_and_hits_for_char,
@@ -70,6 +70,7 @@ from combat.magic_aoe import (
 from combat.item_effects import (
     apply_status_item_to_enemy,
     apply_item_effect_to_actor,
+    item_effect,
     spell_from_item,
     item_damage_char_to_enemy,
 )
@@ -84,6 +85,8 @@ from combat.phys_damage import (
 )
 from combat.life_check import any_char_alive, random_alive_char_index
 from combat.logging import log_damage, relation_comment
+from combat.verbosity import debug_enabled, logs_enabled
+from combat.expected_mode import rng_for_mode, uses_expectation
 
 
 def _to_int(v: Any) -> int:
@@ -155,21 +158,24 @@ def run_character_turn(
     target_index: int = 0,
     party_members=None,
     aoe_selected_override: Optional[bool] = None,  # ★追加
+    mode: BattleMode = "random",  # ★追加：expected ならダメージは期待値
 ) -> Tuple[int, Optional[OneTurnResult]]:
     """
     「キャラ1人分の行動フェーズ」だけを担当する関数。
     - HPや状態異常などは char_state / enemy_state / char_stats / enemy_stats に直接書き込む
     - ログは logs に append していく
+    - mode="expected" のときはダメージを期待値で計算する（rng は戦闘単位の ExpectedRandom を渡すこと）
     - 戦闘継続の場合： (dmg_to_enemy, None) を返す
     - 逃走成功 / ジャンプ上昇 / Terrain 即死などで「このターンで即座にターンを終える」場合：
         (dmg_to_enemy, OneTurnResult(...)) を返し、呼び出し側はそれをそのまま return する
     """
-    logs.append(
-        f"[DBG] kind={char_attack_kind}, cmd={char_battle_command}, is_jumping={getattr(char_state,'is_jumping',False)}"
-    )
+    if debug_enabled():
+        logs.append(
+            f"[DBG] kind={char_attack_kind}, cmd={char_battle_command}, is_jumping={getattr(char_state,'is_jumping',False)}"
+        )
 
-    if rng is None:
-        rng = Random()
+    rng = rng_for_mode(mode, rng)
+    use_expectation = uses_expectation(mode)
 
     # ---- 状態異常フラグ類の初期化 --------------------------------------------------
     char_is_blind = char_state.has(Status.BLIND)
@@ -182,11 +188,13 @@ def run_character_turn(
     # --- 麻痺の簡易回復判定（例：30%で回復） ---
     if char_para:
         r = rng.random()
-        logs.append(f"[{char_name}] Paralysis check {r:.2f}")
+        if debug_enabled():
+            logs.append(f"[{char_name}] Paralysis check {r:.2f}")
         if r < 0.3:  # 好きな確率に調整
             char_state.statuses.discard(Status.PARALYZE)
             char_para = False
-            logs.append(f"{char_name}の麻痺が解けた！")
+            if logs_enabled():
+                logs.append(f"{char_name}の麻痺が解けた！")
 
     # ---------------------------------------------------------
     # Jump（上昇/着地）をここで完結させる
@@ -210,44 +218,48 @@ def run_character_turn(
             else:
                 weapon_damage = char_stats.off_power
                 weapon_hit = char_stats.off_accuracy
-            print(
-                "main_power",
-                char_stats.main_power,
-                "main_mul",
-                char_stats.main_atk_multiplier,
-                "main_acc",
-                char_stats.main_accuracy,
-            )
+            if debug_enabled():
+                print(
+                    "main_power",
+                    char_stats.main_power,
+                    "main_mul",
+                    char_stats.main_atk_multiplier,
+                    "main_acc",
+                    char_stats.main_accuracy,
+                )
 
             strength = char_stats.strength
             agility = char_stats.agility
             level = char_stats.level
             job_level = char_stats.job_level
-            print(strength, agility, level, job_level)
+            if debug_enabled():
+                print(strength, agility, level, job_level)
 
             attack_damage = (weapon_damage + (strength // 4)) * 3
             attack_multiplier = (agility // 16) + (level // 16) + 1
             hit_percent = weapon_hit + (agility // 4) + (job_level // 4)
 
             dmg_to_enemy = attack_damage * attack_multiplier
-            print(dmg_to_enemy, attack_damage, attack_multiplier)
+            if debug_enabled():
+                print(dmg_to_enemy, attack_damage, attack_multiplier)
 
             old_enemy_hp = enemy_state.hp
             enemy_state.hp = max(enemy_state.hp - dmg_to_enemy, 0)
 
-            log_damage(
-                logs,
-                f"{char_name}は空から降下攻撃！ ",
-                enemy_name,
-                dmg_to_enemy,
-                old_enemy_hp,
-                enemy_state.hp,
-                "attacker",
-                "remain",
-                None,
-                "",
-                True,
-            )
+            if logs_enabled():
+                log_damage(
+                    logs,
+                    f"{char_name}は空から降下攻撃！ ",
+                    enemy_name,
+                    dmg_to_enemy,
+                    old_enemy_hp,
+                    enemy_state.hp,
+                    "attacker",
+                    "remain",
+                    None,
+                    "",
+                    True,
+                )
 
             # 攻撃後に消す
             if hasattr(char_state, "jump_target_index"):
@@ -258,17 +270,20 @@ def run_character_turn(
         # ジャンプ中でないなら「上昇」
         char_state.is_jumping = True
         char_state.jump_target_index = target_index
-        logs.append(f"{char_name}はジャンプした！次のターンに攻撃する。")
+        if logs_enabled():
+            logs.append(f"{char_name}はジャンプした！次のターンに攻撃する。")
         return 0, None
 
     # ---- 状態異常で行動不能ならログだけ出して終わり ------------------------------
     if char_sleep:
-        logs.append(f"{char_name}は眠っていて動けない…")
+        if logs_enabled():
+            logs.append(f"{char_name}は眠っていて動けない…")
         dmg_to_enemy = 0
         return dmg_to_enemy, None
 
     if char_para:
-        logs.append(f"{char_name}は麻痺していて動けない…")
+        if logs_enabled():
+            logs.append(f"{char_name}は麻痺していて動けない…")
         dmg_to_enemy = 0
         return dmg_to_enemy, None
 
@@ -294,7 +309,7 @@ def run_character_turn(
                     hand=char_weapon_hand,
                     element_relation=relation,
                     rng=rng,
-                    use_expectation=False,
+                    use_expectation=use_expectation,
                     blind=char_is_blind,
                     attacker_is_mini_or_toad=char_is_mini_or_toad,
                     return_crit=True,
@@ -308,32 +323,33 @@ def run_character_turn(
             old_enemy_hp = enemy_state.hp
             enemy_state.hp = max(enemy_state.hp - dmg_to_enemy, 0)
 
-            # ★ 共通ヘルパから相性コメント取得
-            relation_msg = relation_comment(relation, hit_elems, perspective="attacker")
+            # ★ ダメージログ共通関数で出力（QUIET では相性コメント・prefix も作らない）
+            if logs_enabled():
+                # ★ 共通ヘルパから相性コメント取得
+                relation_msg = relation_comment(relation, hit_elems, perspective="attacker")
 
-            # クリティカルかどうかで prefix だけ変える
-            if crit:
-                prefix = (
-                    f"{char_name}の物理攻撃！ クリティカルヒット！ "
-                    f"{relation_msg + ' ' if relation_msg else ''}"
-                )
-            else:
-                prefix = (
-                    f"{char_name}の物理攻撃！ "
-                    f"{relation_msg + ' ' if relation_msg else ''}"
-                )
+                # クリティカルかどうかで prefix だけ変える
+                if crit:
+                    prefix = (
+                        f"{char_name}の物理攻撃！ クリティカルヒット！ "
+                        f"{relation_msg + ' ' if relation_msg else ''}"
+                    )
+                else:
+                    prefix = (
+                        f"{char_name}の物理攻撃！ "
+                        f"{relation_msg + ' ' if relation_msg else ''}"
+                    )
 
-            # ★ ダメージログ共通関数で出力
-            log_damage(
-                logs,
-                prefix,
-                enemy_name,
-                dmg_to_enemy,
-                old_enemy_hp,
-                enemy_state.hp,
-                "attacker",
-                "remain",
-            )
+                log_damage(
+                    logs,
+                    prefix,
+                    enemy_name,
+                    dmg_to_enemy,
+                    old_enemy_hp,
+                    enemy_state.hp,
+                    "attacker",
+                    "remain",
+                )
 
             dmg_to_char_from_self = 0  # 自傷はしていない
 
@@ -347,7 +363,7 @@ def run_character_turn(
                     hand=char_weapon_hand,
                     element_relation="normal",
                     rng=rng,
-                    use_expectation=False,
+                    use_expectation=use_expectation,
                     blind=char_is_blind,
                     attacker_is_mini_or_toad=char_is_mini_or_toad,
                     return_crit=True,
@@ -360,31 +376,33 @@ def run_character_turn(
             old_hp = char_state.hp
             char_state.hp = max(char_state.hp - dmg_to_char_from_self, 0)
 
-            if crit:
-                prefix = (
-                    f"{char_name}は混乱して自分自身を攻撃した！ クリティカルヒット！ "
-                )
-            else:
-                prefix = f"{char_name}は混乱して自分自身を攻撃した！ "
-
             # ★ ダメージログ共通関数で出力（自傷なので target 視点）
-            log_damage(
-                logs,
-                prefix,
-                char_name,
-                dmg_to_char_from_self,
-                old_hp,
-                char_state.hp,
-                "target",
-                "remain",
-            )
+            if logs_enabled():
+                if crit:
+                    prefix = (
+                        f"{char_name}は混乱して自分自身を攻撃した！ クリティカルヒット！ "
+                    )
+                else:
+                    prefix = f"{char_name}は混乱して自分自身を攻撃した！ "
+
+                log_damage(
+                    logs,
+                    prefix,
+                    char_name,
+                    dmg_to_char_from_self,
+                    old_hp,
+                    char_state.hp,
+                    "target",
+                    "remain",
+                )
 
             dmg_to_enemy = 0
 
         # ★ 物理ダメージを「自分が受けた」場合は混乱解除
         if dmg_to_char_from_self > 0 and char_state.has(Status.CONFUSION):
             char_state.statuses.discard(Status.CONFUSION)
-            logs.append(f"{char_name}の混乱が解けた！")
+            if logs_enabled():
+                logs.append(f"{char_name}の混乱が解けた！")
 
         return dmg_to_enemy, None
 
@@ -394,7 +412,8 @@ def run_character_turn(
     # print(f"[Debug:turn_logic/run_character_turn] {char_attack_kind}")
     if char_attack_kind == "defend":
         char_state.temp_flags["defending"] = True
-        logs.append(f"{char_name}は防御した！")
+        if logs_enabled():
+            logs.append(f"{char_name}は防御した！")
         dmg_to_enemy = 0
         return dmg_to_enemy, None
 
@@ -405,18 +424,20 @@ def run_character_turn(
         # ★PlotBattles持ちは逃げられない（イベント/ボス想定）
         if enemy_json.get("PlotBattles"):
             if is_flee_cmd:
-                logs.append(
-                    f"{char_name}は《{char_battle_command}》で逃げようとしたが、"
-                    f"この戦いからは逃げられない！"
-                )
-            else:
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は《{char_battle_command}》で逃げようとしたが、"
+                        f"この戦いからは逃げられない！"
+                    )
+            elif logs_enabled():
                 logs.append(f"{char_name}は逃げようとしたが、逃げられない！")
             dmg_to_enemy = 0
             return dmg_to_enemy, None
 
         # ★ Flee は 100% 逃走成功
         if is_flee_cmd:
-            logs.append(f"{char_name}は《{char_battle_command}》で戦闘から逃げ出した！")
+            if logs_enabled():
+                logs.append(f"{char_name}は《{char_battle_command}》で戦闘から逃げ出した！")
             result = OneTurnResult(
                 char_state=char_state,
                 enemy_state=enemy_state,
@@ -433,7 +454,8 @@ def run_character_turn(
         escape_chance = min(0.95, max(0.05, char_agi / (char_agi + enemy_weight)))
 
         if rng.random() < escape_chance:
-            logs.append(f"{char_name}は逃げ出した！")
+            if logs_enabled():
+                logs.append(f"{char_name}は逃げ出した！")
             result = OneTurnResult(
                 char_state=char_state,
                 enemy_state=enemy_state,
@@ -444,7 +466,8 @@ def run_character_turn(
             )
             return 0, result
         else:
-            logs.append(f"{char_name}は逃げ出せなかった…")
+            if logs_enabled():
+                logs.append(f"{char_name}は逃げ出せなかった…")
             dmg_to_enemy = 0
             return dmg_to_enemy, None
 
@@ -465,7 +488,8 @@ def run_character_turn(
 
         # --- 魔法コマンド ---
         if char_is_silenced:
-            logs.append(f"{char_name}は沈黙していて魔法が使えない！")
+            if logs_enabled():
+                logs.append(f"{char_name}は沈黙していて魔法が使えない！")
             dmg_to_enemy = 0
             return dmg_to_enemy, None
 
@@ -486,9 +510,10 @@ def run_character_turn(
             lvl = int(char_spell_json.get("Level", 1))
 
             if not mp_used:
-                logs.append(
-                    f"{char_name}は{target_name}に《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{target_name}に《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
+                    )
                 dmg_to_enemy = 0
                 return dmg_to_enemy, None
 
@@ -502,7 +527,7 @@ def run_character_turn(
                 caster=char_stats,
                 spell=char_spell,
                 rng=rng,
-                use_expectation=False,
+                use_expectation=use_expectation,
                 blind=char_is_blind,
             )
             old_hp = target_state.hp
@@ -515,27 +540,29 @@ def run_character_turn(
             lvl = int(char_spell_json.get("Level", 1))
             remain = char_state.mp_pool[lvl]
             maxmp = char_state.max_mp_pool.get(lvl, remain)
-            suffix = f"（MP{lvl} {remain}/{maxmp}）"
+            suffix = f"（MP{lvl} {remain}/{maxmp}）" if logs_enabled() else ""
 
             if actual > 0:
                 if is_summon_heal:
-                    logs.append(
-                        f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
-                        f"癒しの光がパーティを包み、{target_name}のHPが{actual}回復。"
-                        f"（{target_name} 残りHP: {target_state.hp}） {suffix}"
-                    )
-                else:
+                    if logs_enabled():
+                        logs.append(
+                            f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
+                            f"癒しの光がパーティを包み、{target_name}のHPが{actual}回復。"
+                            f"（{target_name} 残りHP: {target_state.hp}） {suffix}"
+                        )
+                elif logs_enabled():
                     logs.append(
                         f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
                         f"HPが{actual}回復。（{target_name} 残りHP: {target_state.hp}） {suffix}"
                     )
             else:
                 if is_summon_heal:
-                    logs.append(
-                        f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
-                        f"しかしHPはこれ以上回復しない。（{target_name} 残りHP: {target_state.hp}） {suffix}"
-                    )
-                else:
+                    if logs_enabled():
+                        logs.append(
+                            f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
+                            f"しかしHPはこれ以上回復しない。（{target_name} 残りHP: {target_state.hp}） {suffix}"
+                        )
+                elif logs_enabled():
                     logs.append(
                         f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
                         f"しかしHPはこれ以上回復しない。（{target_name} 残りHP: {target_state.hp}） {suffix}"
@@ -556,9 +583,10 @@ def run_character_turn(
             lvl = int(char_spell_json.get("Level", 1))
 
             if not mp_used:
-                logs.append(
-                    f"{char_name}は{target_name}に《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{target_name}に《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
+                    )
                 dmg_to_enemy = 0
                 return dmg_to_enemy, None
 
@@ -605,14 +633,15 @@ def run_character_turn(
             lvl = int(char_spell_json.get("Level", 1))
             remain = char_state.mp_pool[lvl]
             maxmp = char_state.max_mp_pool.get(lvl, remain)
-            suffix = f"（MP{lvl} {remain}/{maxmp}）"
+            suffix = f"（MP{lvl} {remain}/{maxmp}）" if logs_enabled() else ""
 
             if cured:
-                logs.append(
-                    f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
-                    f"状態異常が回復した: {', '.join(cured)} {suffix}"
-                )
-            else:
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
+                        f"状態異常が回復した: {', '.join(cured)} {suffix}"
+                    )
+            elif logs_enabled():
                 logs.append(
                     f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
                     f"しかし治すべき状態異常が無かった。 {suffix}"
@@ -633,9 +662,10 @@ def run_character_turn(
             lvl = int(char_spell_json.get("Level", 1))
 
             if not mp_used:
-                logs.append(
-                    f"{char_name}は{target_name}に《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{target_name}に《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
+                    )
                 dmg_to_enemy = 0
                 return dmg_to_enemy, None
 
@@ -643,12 +673,13 @@ def run_character_turn(
             lvl = int(char_spell_json.get("Level", 1))
             remain = char_state.mp_pool[lvl]
             maxmp = char_state.max_mp_pool.get(lvl, remain)
-            suffix = f"（MP{lvl} {remain}/{maxmp}）"
+            suffix = f"（MP{lvl} {remain}/{maxmp}）" if logs_enabled() else ""
 
             if target_state.hp > 0 and not target_state.has(Status.KO):
-                logs.append(
-                    f"{char_name}は{target_name}に《{spell_label}》を唱えた！しかし効果がない。 {suffix}"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{target_name}に《{spell_label}》を唱えた！しかし効果がない。 {suffix}"
+                    )
                 dmg_to_enemy = 0
                 return dmg_to_enemy, None
 
@@ -659,17 +690,19 @@ def run_character_turn(
 
             if "full hp" in effect:
                 target_state.hp = target_stats.max_hp
-                logs.append(
-                    f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
-                    f"{target_name}は完全に蘇生した！（HP: {target_state.hp}） {suffix}"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
+                        f"{target_name}は完全に蘇生した！（HP: {target_state.hp}） {suffix}"
+                    )
             else:
                 revived_hp = max(1, int(target_stats.max_hp * 0.20))
                 target_state.hp = revived_hp
-                logs.append(
-                    f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
-                    f"{target_name}は蘇生した！（HP: {target_state.hp}） {suffix}"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
+                        f"{target_name}は蘇生した！（HP: {target_state.hp}） {suffix}"
+                    )
 
             dmg_to_enemy = 0
             return dmg_to_enemy, None
@@ -686,9 +719,10 @@ def run_character_turn(
             lvl = int(char_spell_json.get("Level", 1))
 
             if not mp_used:
-                logs.append(
-                    f"{char_name}は{target_name}に《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{target_name}に《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
+                    )
                 dmg_to_enemy = 0
                 return dmg_to_enemy, None
 
@@ -705,11 +739,12 @@ def run_character_turn(
             if rng.random() * 100.0 >= hit_percent:
                 remain = char_state.mp_pool[lvl]
                 maxmp = char_state.max_mp_pool.get(lvl, remain)
-                suffix = f"（MP{lvl} {remain}/{maxmp}）"
-                logs.append(
-                    f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
-                    f"しかし何も起こらなかった… {suffix}"
-                )
+                suffix = f"（MP{lvl} {remain}/{maxmp}）" if logs_enabled() else ""
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
+                        f"しかし何も起こらなかった… {suffix}"
+                    )
                 dmg_to_enemy = 0
                 return dmg_to_enemy, None
 
@@ -725,13 +760,14 @@ def run_character_turn(
 
             remain = char_state.mp_pool[lvl]
             maxmp = char_state.max_mp_pool.get(lvl, remain)
-            suffix = f"（MP{lvl} {remain}/{maxmp}）"
+            suffix = f"（MP{lvl} {remain}/{maxmp}）" if logs_enabled() else ""
 
-            logs.append(
-                f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
-                f"防御力 {old_def}→{target_stats.defense}、"
-                f"魔法防御 {old_mdef}→{target_stats.magic_defense} に上がった。 {suffix}"
-            )
+            if logs_enabled():
+                logs.append(
+                    f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
+                    f"防御力 {old_def}→{target_stats.defense}、"
+                    f"魔法防御 {old_mdef}→{target_stats.magic_defense} に上がった。 {suffix}"
+                )
 
             dmg_to_enemy = 0
             return dmg_to_enemy, None
@@ -748,9 +784,10 @@ def run_character_turn(
             lvl = int(char_spell_json.get("Level", 1))
 
             if not mp_used:
-                logs.append(
-                    f"{char_name}は{target_name}に《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{target_name}に《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
+                    )
                 dmg_to_enemy = 0
                 return dmg_to_enemy, None
 
@@ -767,11 +804,12 @@ def run_character_turn(
             if rng.random() * 100.0 >= hit_percent:
                 remain = char_state.mp_pool[lvl]
                 maxmp = char_state.max_mp_pool.get(lvl, remain)
-                suffix = f"（MP{lvl} {remain}/{maxmp}）"
-                logs.append(
-                    f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
-                    f"しかし何も起こらなかった… {suffix}"
-                )
+                suffix = f"（MP{lvl} {remain}/{maxmp}）" if logs_enabled() else ""
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
+                        f"しかし何も起こらなかった… {suffix}"
+                    )
                 dmg_to_enemy = 0
                 return dmg_to_enemy, None
 
@@ -794,24 +832,25 @@ def run_character_turn(
 
             remain = char_state.mp_pool[lvl]
             maxmp = char_state.max_mp_pool.get(lvl, remain)
-            suffix = f"（MP{lvl} {remain}/{maxmp}）"
-
-            logs.append(
-                f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
-                f"攻撃力 右手 {old_main_pow}→{target_stats.main_power}"
-                + (
-                    f" / 左手 {old_off_pow}→{target_stats.off_power}"
-                    if old_off_pow > 0
-                    else ""
-                )
-                + f"、攻撃回数 右手 {old_main_mul}→{target_stats.main_atk_multiplier}"
-                + (
-                    f" / 左手 {old_off_mul}→{target_stats.off_atk_multiplier}"
-                    if old_off_mul > 0
-                    else ""
+            suffix = f"（MP{lvl} {remain}/{maxmp}）" if logs_enabled() else ""
+
+            if logs_enabled():
+                logs.append(
+                    f"{char_name}は{target_name}に《{spell_label}》を唱えた！ "
+                    f"攻撃力 右手 {old_main_pow}→{target_stats.main_power}"
+                    + (
+                        f" / 左手 {old_off_pow}→{target_stats.off_power}"
+                        if old_off_pow > 0
+                        else ""
+                    )
+                    + f"、攻撃回数 右手 {old_main_mul}→{target_stats.main_atk_multiplier}"
+                    + (
+                        f" / 左手 {old_off_mul}→{target_stats.off_atk_multiplier}"
+                        if old_off_mul > 0
+                        else ""
+                    )
+                    + f" に上がった。 {suffix}"
                 )
-                + f" に上がった。 {suffix}"
-            )
 
             dmg_to_enemy = 0
             return dmg_to_enemy, None
@@ -833,9 +872,10 @@ def run_character_turn(
             lvl = int(char_spell_json.get("Level", 1))
 
             if not mp_used:
-                logs.append(
-                    f"{char_name}は{target_name}に《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{target_name}に《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
+                    )
                 dmg_to_enemy = 0
                 return dmg_to_enemy, None
 
@@ -869,18 +909,19 @@ def run_character_turn(
 
             remain = char_state.mp_pool[lvl]
             maxmp = char_state.max_mp_pool.get(lvl, remain)
-            suffix = f"（MP{lvl} {remain}/{maxmp}）"
+            suffix = f"（MP{lvl} {remain}/{maxmp}）" if logs_enabled() else ""
 
             if roll < hit_percent:
                 target_state.reflect_charges = 1
 
                 if raw_name == "Odin: Protective Light":
-                    logs.append(
-                        f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
-                        f"守護の光がパーティを包み、魔法を一度だけ跳ね返すバリアを張った。"
-                        f"（命中率{hit_percent:.1f}% 判定{roll:.1f}） {suffix}"
-                    )
-                else:
+                    if logs_enabled():
+                        logs.append(
+                            f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
+                            f"守護の光がパーティを包み、魔法を一度だけ跳ね返すバリアを張った。"
+                            f"（命中率{hit_percent:.1f}% 判定{roll:.1f}） {suffix}"
+                        )
+                elif logs_enabled():
                     logs.append(
                         f"{char_name}は《{spell_label}》を唱えた！ "
                         f"魔法を一度だけ跳ね返すバリアを張った。"
@@ -888,12 +929,13 @@ def run_character_turn(
                     )
             else:
                 if raw_name == "Odin: Protective Light":
-                    logs.append(
-                        f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
-                        f"しかし何も起こらなかった…"
-                        f"（命中率{hit_percent:.1f}% 判定{roll:.1f}） {suffix}"
-                    )
-                else:
+                    if logs_enabled():
+                        logs.append(
+                            f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
+                            f"しかし何も起こらなかった…"
+                            f"（命中率{hit_percent:.1f}% 判定{roll:.1f}） {suffix}"
+                        )
+                elif logs_enabled():
                     logs.append(
                         f"{char_name}は《{spell_label}》を唱えた！ "
                         f"しかし何も起こらなかった…"
@@ -917,30 +959,33 @@ def run_character_turn(
             lvl = int(char_spell_json.get("Level", 1))
 
             if not mp_used:
-                logs.append(
-                    f"{char_name}は召喚魔法《{spell_label}》を呼び出そうとしたが MP{lvl} が足りない！"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は召喚魔法《{spell_label}》を呼び出そうとしたが MP{lvl} が足りない！"
+                    )
                 dmg_to_enemy = 0
                 return dmg_to_enemy, None
 
             remain = char_state.mp_pool[lvl]
             maxmp = char_state.max_mp_pool.get(lvl, remain)
-            suffix = f"（MP{lvl} {remain}/{maxmp}）"
+            suffix = f"（MP{lvl} {remain}/{maxmp}）" if logs_enabled() else ""
 
             if enemy_json.get("PlotBattles"):
-                logs.append(
-                    f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
-                    f"しかしこの戦いからは逃げられない！ {suffix}"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
+                        f"しかしこの戦いからは逃げられない！ {suffix}"
+                    )
                 dmg_to_enemy = 0
                 return dmg_to_enemy, None
 
             roll = rng.random()
             if roll < 0.5:
-                logs.append(
-                    f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
-                    f"チョコボのダッシュで戦闘から逃げ出した！ {suffix}"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
+                        f"チョコボのダッシュで戦闘から逃げ出した！ {suffix}"
+                    )
                 result = OneTurnResult(
                     char_state=char_state,
                     enemy_state=enemy_state,
@@ -951,10 +996,11 @@ def run_character_turn(
                 )
                 return 0, result
             else:
-                logs.append(
-                    f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
-                    f"しかしチョコボは逃げ切れなかった… {suffix}"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は召喚魔法《{spell_label}》を呼び出した！ "
+                        f"しかしチョコボは逃げ切れなかった… {suffix}"
+                    )
                 dmg_to_enemy = 0
                 return dmg_to_enemy, None
 
@@ -966,8 +1012,10 @@ def run_character_turn(
                 raise ValueError("攻撃魔法には char_spell_json が必要です")
 
             spell_label = char_spell_name or "魔法"
+            # ★ 前計算した魔法定義（Target / Reflectable / Drain / 状態異常を毎回解釈しない）
+            compiled = compiled_spell(char_spell_json, char_spell_name)
             mp_used = use_mp_for_spell(char_state, char_spell_json)
-            lvl = int(char_spell_json.get("Level", 1))
+            lvl = compiled.level
 
             # ★ elements
             raw_elements = getattr(char_spell, "elements", None)
@@ -980,21 +1028,21 @@ def run_character_turn(
             spell_elements = parse_elements(raw_elements)
 
             if not mp_used:
-                logs.append(
-                    f"{char_name}は《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は《{spell_label}》を唱えようとしたが MP{lvl} が足りない！"
+                    )
                 return 0, None
 
             remain = char_state.mp_pool[lvl]
             maxmp = char_state.max_mp_pool.get(lvl, remain)
-            suffix = f"（MP{lvl} {remain}/{maxmp}）"
+            suffix = f"（MP{lvl} {remain}/{maxmp}）" if logs_enabled() else ""
 
             # ------------------------
             # ターゲット判定：All / One/All
             # ------------------------
-            target_raw = (char_spell_json.get("Target") or "").strip().lower()
-            is_all_only = target_raw == "all enemies"
-            is_one_or_all = target_raw == "one/all enemies"
+            is_all_only = compiled.is_aoe
+            is_one_or_all = compiled.is_one_or_all
 
             """
             aoe_selected = False
@@ -1033,9 +1081,7 @@ def run_character_turn(
             # Reflect（AoEでも「各敵ごと」に判定したいが、まずは最小：単体のみ対応）
             # AoEにReflectを入れたい場合は別途拡張（敵ごとに reflect_charges を見る必要がある）
             # ------------------------
-            is_reflectable = (
-                str(char_spell_json.get("Reflectable", "No")).strip().lower() == "yes"
-            )
+            is_reflectable = compiled.reflectable
             if (
                 (not aoe_selected)
                 and is_reflectable
@@ -1050,25 +1096,26 @@ def run_character_turn(
                     enemy=dummy_enemy,
                     element_relation="normal",
                     rng=rng,
-                    use_expectation=False,
+                    use_expectation=use_expectation,
                     blind=char_is_blind,
                 )
 
                 old_hp = char_state.hp
                 char_state.hp = max(char_state.hp - dmg_back, 0)
 
-                log_damage(
-                    logs,
-                    f"{enemy_name}を覆う魔法障壁が《{spell_label}》を跳ね返した！ ",
-                    char_name,
-                    dmg_back,
-                    old_hp,
-                    char_state.hp,
-                    "target",
-                    "remain",
-                    None,
-                    f" {suffix}",
-                )
+                if logs_enabled():
+                    log_damage(
+                        logs,
+                        f"{enemy_name}を覆う魔法障壁が《{spell_label}》を跳ね返した！ ",
+                        char_name,
+                        dmg_back,
+                        old_hp,
+                        char_state.hp,
+                        "target",
+                        "remain",
+                        None,
+                        f" {suffix}",
+                    )
                 return 0, None
 
             # ------------------------
@@ -1098,11 +1145,7 @@ def run_character_turn(
             def is_pure_status_spell(name: str) -> bool:
                 return any(name.endswith(ps) for ps in pure_status_spells)
 
-            is_drain_spell = False
-            effect_text = (char_spell_json.get("Effect") or "").lower()
-            name_lower = (char_spell_json.get("Name") or "").lower()
-            if "absorb hp" in effect_text or name_lower == "drain":
-                is_drain_spell = True
+            is_drain_spell = compiled.is_drain
 
             # ------------------------
             # AoE 実装（Reflect対応版 / Drainは合計ダメージ吸収）
@@ -1119,10 +1162,7 @@ def run_character_turn(
                 total_damage = 0
 
                 # ★ 反射まとめ
-                is_reflectable = (
-                    str(char_spell_json.get("Reflectable", "No")).strip().lower()
-                    == "yes"
-                )
+                is_reflectable = compiled.reflectable
                 reflect_count = 0
                 reflect_total = 0
 
@@ -1147,7 +1187,7 @@ def run_character_turn(
                             enemy=em_stats,
                             element_relation=rel,
                             rng=rng,
-                            use_expectation=False,
+                            use_expectation=use_expectation,
                             blind=char_is_blind,
                         )
                         if split > 1:
@@ -1171,26 +1211,28 @@ def run_character_turn(
                         char_state.hp = max(0, old_hp - dmg)
 
                         # 反射ログ（個別） ※個別ログ不要ならここを丸ごと削ってOK
-                        log_damage(
-                            logs,
-                            f"{em_name}を覆う魔法障壁が《{spell_label}》を跳ね返した！ ",
-                            char_name,
-                            dmg,
-                            old_hp,
-                            char_state.hp,
-                            "target",
-                            "remain",
-                            None,
-                            f" {suffix}",
-                        )
+                        if logs_enabled():
+                            log_damage(
+                                logs,
+                                f"{em_name}を覆う魔法障壁が《{spell_label}》を跳ね返した！ ",
+                                char_name,
+                                dmg,
+                                old_hp,
+                                char_state.hp,
+                                "target",
+                                "remain",
+                                None,
+                                f" {suffix}",
+                            )
 
                         # ★ 反射でキャラ死亡 → 即終了（ただし、ここまでの total_damage は返す）
                         if char_state.hp <= 0:
                             # まとめログ（2回以上のときだけ出す例）
                             if reflect_count >= 2:
-                                logs.append(
-                                    f"《{spell_label}》は{reflect_count}回反射された！（合計{reflect_total}ダメージ）"
-                                )
+                                if logs_enabled():
+                                    logs.append(
+                                        f"《{spell_label}》は{reflect_count}回反射された！（合計{reflect_total}ダメージ）"
+                                    )
 
                             return total_damage, OneTurnResult(
                                 char_state=char_state,
@@ -1217,10 +1259,11 @@ def run_character_turn(
                         logs=logs,
                         caster_stats=char_stats,
                         summon_child_name=char_spell_name,
+                        ailments=compiled.ailments,
                     )
 
                     # --- ダメージログ（敵ごと） ---
-                    if dmg > 0:
+                    if dmg > 0 and logs_enabled():
                         relation_msg = relation_comment(
                             rel, hit_elems, perspective="attacker"
                         )
@@ -1240,9 +1283,10 @@ def run_character_turn(
 
                 # ★ まとめログ（複数反射だけ出す例。1回でも出したければ >=1 に）
                 if reflect_count >= 2:
-                    logs.append(
-                        f"《{spell_label}》は{reflect_count}回反射された！（合計{reflect_total}ダメージ）"
-                    )
+                    if logs_enabled():
+                        logs.append(
+                            f"《{spell_label}》は{reflect_count}回反射された！（合計{reflect_total}ダメージ）"
+                        )
 
                 # ★ Drain：AoEは「敵に入った合計ダメージ」を吸収にする
                 if is_drain_spell and total_damage > 0:
@@ -1250,10 +1294,11 @@ def run_character_turn(
                     char_state.hp = min(char_state.hp + total_damage, char_stats.max_hp)
                     actual = char_state.hp - old_hp
                     if actual > 0:
-                        logs.append(
-                            f"{char_name}は敵からHPを{actual}吸収した！"
-                            f"（{char_name} 残りHP: {char_state.hp}）"
-                        )
+                        if logs_enabled():
+                            logs.append(
+                                f"{char_name}は敵からHPを{actual}吸収した！"
+                                f"（{char_name} 残りHP: {char_state.hp}）"
+                            )
 
                 # ★ 行動後：敵全滅チェック（ここで end_reason だけ返す。ログは外側が出す想定）
                 if enemies is not None and all(
@@ -1288,7 +1333,7 @@ def run_character_turn(
                     enemy=enemy_stats,
                     element_relation=char_spell_relation,
                     rng=rng,
-                    use_expectation=False,
+                    use_expectation=use_expectation,
                     blind=char_is_blind,
                 )
 
@@ -1304,16 +1349,16 @@ def run_character_turn(
                 logs=logs,
                 caster_stats=char_stats,
                 summon_child_name=char_spell_name,
-            )
-
-            relation_msg = relation_comment(
-                char_spell_relation,
-                char_spell_hit_elems,
-                perspective="attacker",
+                ailments=compiled.ailments,
             )
 
             # 即死系のログ抑制はあなたの既存ロジックを踏襲（必要ならここに移植）
-            if dmg_to_enemy > 0:
+            if dmg_to_enemy > 0 and logs_enabled():
+                relation_msg = relation_comment(
+                    char_spell_relation,
+                    char_spell_hit_elems,
+                    perspective="attacker",
+                )
                 log_damage(
                     logs,
                     f"{char_name}は《{spell_label}》を唱えた！ "
@@ -1333,10 +1378,11 @@ def run_character_turn(
                 char_state.hp = min(char_state.hp + dmg_to_enemy, char_stats.max_hp)
                 actual_heal = char_state.hp - old_hp
                 if actual_heal > 0:
-                    logs.append(
-                        f"{char_name}は{enemy_name}からHPを{actual_heal}吸収した！"
-                        f"（{char_name} 残りHP: {char_state.hp}）"
-                    )
+                    if logs_enabled():
+                        logs.append(
+                            f"{char_name}は{enemy_name}からHPを{actual_heal}吸収した！"
+                            f"（{char_name} 残りHP: {char_state.hp}）"
+                        )
 
             return dmg_to_enemy, None
 
@@ -1364,24 +1410,12 @@ def run_character_turn(
                 target_name = tpm.name
 
         spell_info = char_item.get("SpellInfo") or {}
-        effect_text = (spell_info.get("Effect") or "").lower()
-        item_spell_effect = str(char_item.get("SpellEffect") or "").lower()
-        item_name_lower = (char_item.get("Name") or "").lower()
 
         # =========================
-        # 攻撃/状態異常アイテム判定
+        # 攻撃/状態異常アイテム判定（★ItemEffect に前計算済み）
         # =========================
-        is_attack_item = False
-        if "deal" in effect_text and "damage" in effect_text:
-            is_attack_item = True
-        if "inflict ko" in effect_text:
-            is_attack_item = True
-        if (
-            "absorb hp" in effect_text
-            or item_spell_effect == "drain"
-            or "lilith's kiss" in item_name_lower
-        ):
-            is_attack_item = True
+        item_eff = item_effect(char_item)
+        is_attack_item = item_eff.is_attack
 
         # ============================================================
         # 1) 敵ターゲット：攻撃 or 状態異常（B案：消費できたら効果）
@@ -1398,18 +1432,20 @@ def run_character_turn(
             if is_attack_item:
                 # ★B案：在庫が無ければ効果ゼロ
                 if save is None:
-                    logs.append(
-                        f"{char_name}は{item_name}を使おうとした！ しかしセーブデータが無いので使用できない…"
-                    )
+                    if logs_enabled():
+                        logs.append(
+                            f"{char_name}は{item_name}を使おうとした！ しかしセーブデータが無いので使用できない…"
+                        )
                     return 0, None
 
                 if not consume_item_from_inventory(save, item_name):
-                    logs.append(
-                        f"{char_name}は{item_name}を使おうとした！ しかし在庫がなかった…"
-                    )
+                    if logs_enabled():
+                        logs.append(
+                            f"{char_name}は{item_name}を使おうとした！ しかし在庫がなかった…"
+                        )
                     return 0, None
 
-                spell = spell_from_item(char_item)
+                spell = item_eff.spell or spell_from_item(char_item)
                 relation, hit_elems = element_relation_and_hits_for_monster(
                     enemy_json,
                     spell.elements,
@@ -1426,64 +1462,60 @@ def run_character_turn(
                 old_enemy_hp = enemy_state.hp
                 enemy_state.hp = max(enemy_state.hp - dmg_to_enemy, 0)
 
-                relation_msg = relation_comment(
-                    relation,
-                    hit_elems,
-                    perspective="attacker",
-                )
-
-                log_damage(
-                    logs,
-                    f"{char_name}は{char_item.get('Name')}を使った！ "
-                    f"{relation_msg + ' ' if relation_msg else ''}",
-                    enemy_name,
-                    dmg_to_enemy,
-                    old_enemy_hp,
-                    enemy_state.hp,
-                    "attacker",
-                    "remain",
-                )
+                if logs_enabled():
+                    relation_msg = relation_comment(
+                        relation,
+                        hit_elems,
+                        perspective="attacker",
+                    )
+                    log_damage(
+                        logs,
+                        f"{char_name}は{char_item.get('Name')}を使った！ "
+                        f"{relation_msg + ' ' if relation_msg else ''}",
+                        enemy_name,
+                        dmg_to_enemy,
+                        old_enemy_hp,
+                        enemy_state.hp,
+                        "attacker",
+                        "remain",
+                    )
 
                 # 吸収系
-                is_drain_item = (
-                    "absorb hp" in effect_text
-                    or item_spell_effect == "drain"
-                    or "lilith's kiss" in item_name_lower
-                )
-                if is_drain_item and dmg_to_enemy > 0:
+                if item_eff.is_drain and dmg_to_enemy > 0:
                     old_hp = char_state.hp
                     heal = dmg_to_enemy
                     char_state.hp = min(char_state.hp + heal, char_stats.max_hp)
                     actual_heal = char_state.hp - old_hp
                     if actual_heal > 0:
-                        logs.append(
-                            f"{char_name}は{enemy_name}からHPを{actual_heal}吸収した！"
-                            f"（{char_name} 残りHP: {char_state.hp}）"
-                        )
+                        if logs_enabled():
+                            logs.append(
+                                f"{char_name}は{enemy_name}からHPを{actual_heal}吸収した！"
+                                f"（{char_name} 残りHP: {char_state.hp}）"
+                            )
 
                 # 即死系
-                if "inflict ko" in effect_text:
-                    ko_acc = spell_info.get("BaseAccuracy")
-                    if ko_acc is None:
-                        ko_acc = 1.0
-                    if rng.random() < float(ko_acc):
+                if item_eff.inflicts_ko:
+                    if rng.random() < float(item_eff.base_accuracy):
                         enemy_state.hp = 0
-                        logs.append(f"{enemy_name}に即死効果が発動した！")
+                        if logs_enabled():
+                            logs.append(f"{enemy_name}に即死効果が発動した！")
 
                 return dmg_to_enemy, None
 
             # ---- 状態異常アイテム（敵） ----
             # ★B案：在庫が無ければ効果ゼロ（消費できたら判定＆効果）
             if save is None:
-                logs.append(
-                    f"{char_name}は{item_name}を使おうとした！ しかしセーブデータが無いので使用できない…"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{item_name}を使おうとした！ しかしセーブデータが無いので使用できない…"
+                    )
                 return 0, None
 
             if not consume_item_from_inventory(save, item_name):
-                logs.append(
-                    f"{char_name}は{item_name}を使おうとした！ しかし在庫がなかった…"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{item_name}を使おうとした！ しかし在庫がなかった…"
+                    )
                 return 0, None
 
             handled_as_status = apply_status_item_to_enemy(
@@ -1500,7 +1532,8 @@ def run_character_turn(
 
             # 状態異常としても処理できず、攻撃アイテムでもない場合
             # 例：回復アイテムを敵に使おうとした、など
-            logs.append(f"{char_name}は{item_name}を使った！ しかし効果がなかった…")
+            if logs_enabled():
+                logs.append(f"{char_name}は{item_name}を使った！ しかし効果がなかった…")
             return 0, None
 
         # ============================================================
@@ -1508,34 +1541,38 @@ def run_character_turn(
         # ============================================================
         # 敵向け攻撃アイテムを味方に使おうとした場合は不発（消費しない）
         if is_attack_item:
-            logs.append(
-                f"{char_name}は{item_name}を使おうとした！ しかし対象が敵ではなかった…"
-            )
+            if logs_enabled():
+                logs.append(
+                    f"{char_name}は{item_name}を使おうとした！ しかし対象が敵ではなかった…"
+                )
             return 0, None
 
         # KO相手には不発（消費しない）にしたい場合
         if Status.KO in target_state.statuses:
-            logs.append(
-                f"{char_name}は{item_name}を使った！ "
-                f"しかし{target_name}は戦闘不能で、何も起こらなかった…"
-            )
+            if logs_enabled():
+                logs.append(
+                    f"{char_name}は{item_name}を使った！ "
+                    f"しかし{target_name}は戦闘不能で、何も起こらなかった…"
+                )
             return 0, None
 
         # ★B案：在庫が無ければ効果ゼロ
         if save is None:
-            logs.append(
-                f"{char_name}は{item_name}を使おうとした！ しかしセーブデータが無いので使用できない…"
-            )
+            if logs_enabled():
+                logs.append(
+                    f"{char_name}は{item_name}を使おうとした！ しかしセーブデータが無いので使用できない…"
+                )
             return 0, None
 
         if not consume_item_from_inventory(save, item_name):
-            logs.append(
-                f"{char_name}は{item_name}を使おうとした！ しかし在庫がなかった…"
-            )
+            if logs_enabled():
+                logs.append(
+                    f"{char_name}は{item_name}を使おうとした！ しかし在庫がなかった…"
+                )
             return 0, None
 
         # Shining Curtain : Reflect と同様の反射バリア
-        if item_name == "Shining Curtain":
+        if item_eff.grants_reflect:
             acc = spell_info.get("BaseAccuracy")
             if acc is None:
                 acc = spell_info.get("Accuracy", 1.0)
@@ -1557,12 +1594,13 @@ def run_character_turn(
 
             if roll < hit_percent:
                 target_state.reflect_charges = 1
-                logs.append(
-                    f"{char_name}は{item_name}を使った！ "
-                    f"{target_name}に魔法を一度だけ跳ね返すバリアを張った。"
-                    f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
-                )
-            else:
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{item_name}を使った！ "
+                        f"{target_name}に魔法を一度だけ跳ね返すバリアを張った。"
+                        f"（命中率{hit_percent:.1f}% 判定{roll:.1f}）"
+                    )
+            elif logs_enabled():
                 logs.append(
                     f"{char_name}は{item_name}を使った！ "
                     f"しかし何も起こらなかった…"
@@ -1595,17 +1633,20 @@ def run_character_turn(
             success_percent = max(0.0, min(success_percent, 100.0))
             success_prob = success_percent / 100.0
             r = rng.random()
-            logs.append(
-                f"{char_name}の《Steal》！ 成功率 {success_percent:.1f}% 判定値 {r:.3f}"
-            )
+            if logs_enabled():
+                logs.append(
+                    f"{char_name}の《Steal》！ 成功率 {success_percent:.1f}% 判定値 {r:.3f}"
+                )
 
             if r >= success_prob:
-                logs.append(f"しかし{enemy_name}からは何も盗めなかった…")
+                if logs_enabled():
+                    logs.append(f"しかし{enemy_name}からは何も盗めなかった…")
                 dmg_to_enemy = 0
             else:
                 stolen_list = enemy_json.get("Stolen Items") or []
                 if not stolen_list:
-                    logs.append(f"{enemy_name}から盗めるものは無いようだ…")
+                    if logs_enabled():
+                        logs.append(f"{enemy_name}から盗めるものは無いようだ…")
                     dmg_to_enemy = 0
                 else:
                     total_weight = 0.0
@@ -1630,17 +1671,19 @@ def run_character_turn(
 
                     item_name = chosen.get("Item")
                     if not item_name:
-                        logs.append(f"{enemy_name}から盗めるアイテム名が不正です。")
+                        if logs_enabled():
+                            logs.append(f"{enemy_name}から盗めるアイテム名が不正です。")
                         dmg_to_enemy = 0
                     else:
                         if save is not None:
                             category = add_item_to_inventory(save, item_name, qty=1)
                             from_qty = get_item_quantity(save, item_name)
-                            logs.append(
-                                f"{enemy_name}から{item_name}を盗んだ！"
-                                f"（{category or 'Anywhere'} に追加／所持数 {from_qty}）"
-                            )
-                        else:
+                            if logs_enabled():
+                                logs.append(
+                                    f"{enemy_name}から{item_name}を盗んだ！"
+                                    f"（{category or 'Anywhere'} に追加／所持数 {from_qty}）"
+                                )
+                        elif logs_enabled():
                             logs.append(
                                 f"{enemy_name}から{item_name}を盗んだ！（※セーブデータ未指定のため所持数は変化しません）"
                             )
@@ -1649,7 +1692,8 @@ def run_character_turn(
         # Scholar: Peep
         if char_battle_command == "Peep":
             handled_special = True
-            logs.append(f"{char_name}の《Peep》！")
+            if logs_enabled():
+                logs.append(f"{char_name}の《Peep》！")
 
             ev = enemy_json.get("ElementalVulnerability", {}) or {}
 
@@ -1664,33 +1708,40 @@ def run_character_turn(
             resist_s = _fmt_elems(ev.get("Resistance"))
 
             if weak_s:
-                logs.append(f"{enemy_name}は{weak_s}属性に弱い。")
+                if logs_enabled():
+                    logs.append(f"{enemy_name}は{weak_s}属性に弱い。")
             if absorb_s:
-                logs.append(f"{enemy_name}は{absorb_s}属性を吸収する。")
+                if logs_enabled():
+                    logs.append(f"{enemy_name}は{absorb_s}属性を吸収する。")
             if resist_s:
-                logs.append(f"{enemy_name}は{resist_s}属性に強い。")
+                if logs_enabled():
+                    logs.append(f"{enemy_name}は{resist_s}属性に強い。")
 
             if not (weak_s or absorb_s or resist_s):
-                logs.append(f"{enemy_name}の属性相性に目立った特徴はないようだ。")
+                if logs_enabled():
+                    logs.append(f"{enemy_name}の属性相性に目立った特徴はないようだ。")
 
             dmg_to_enemy = 0
 
         # Scholar: Study
         if char_battle_command == "Study":
             handled_special = True
-            logs.append(f"{char_name}の《Study》！")
+            if logs_enabled():
+                logs.append(f"{char_name}の《Study》！")
 
             hpmax = (
                 enemy_state.max_hp if enemy_state.max_hp is not None else enemy_state.hp
             )
-            logs.append(f"{enemy_name}のHPは{enemy_state.hp}/{hpmax}だ。")
+            if logs_enabled():
+                logs.append(f"{enemy_name}のHPは{enemy_state.hp}/{hpmax}だ。")
 
             dmg_to_enemy = 0
 
         # Geomancer: Terrain
         if char_battle_command == "Terrain":
             handled_special = True
-            logs.append(f"{char_name}の《Terrain》！")
+            if logs_enabled():
+                logs.append(f"{char_name}の《Terrain》！")
 
             surface = None
             if save is not None:
@@ -1719,10 +1770,12 @@ def run_character_turn(
                 spell = spells_by_name.get(spell_name)
 
             if not spell:
-                logs.append("しかし何も起こらなかった…")
+                if logs_enabled():
+                    logs.append("しかし何も起こらなかった…")
                 dmg_to_enemy = 0
             else:
-                logs.append(f"{spell_name} が発動！")
+                if logs_enabled():
+                    logs.append(f"{spell_name} が発動！")
 
                 base_power = spell.get("BasePower", 0)
                 base_acc = float(spell.get("BaseAccuracy", 0.0))
@@ -1752,21 +1805,23 @@ def run_character_turn(
                     )
                     backfire = max(1, max_hp_char // 4)
 
-                    logs.append(f"{spell_name}は不発に終わった！")
+                    if logs_enabled():
+                        logs.append(f"{spell_name}は不発に終わった！")
 
                     old_hp = char_state.hp
                     char_state.hp = max(char_state.hp - backfire, 0)
 
-                    log_damage(
-                        logs,
-                        "バックファイア！",
-                        char_name,
-                        backfire,
-                        old_hp,
-                        char_state.hp,
-                        "target",
-                        "arrow",
-                    )
+                    if logs_enabled():
+                        log_damage(
+                            logs,
+                            "バックファイア！",
+                            char_name,
+                            backfire,
+                            old_hp,
+                            char_state.hp,
+                            "target",
+                            "arrow",
+                        )
 
                     if char_state.hp <= 0:
                         char_state.statuses.add(Status.KO)
@@ -1780,16 +1835,18 @@ def run_character_turn(
 
                     if "Inflict KO" in effect:
                         if enemy_json.get("PlotBattles"):
-                            logs.append(f"{spell_name}はボスには効かなかった！")
+                            if logs_enabled():
+                                logs.append(f"{spell_name}はボスには効かなかった！")
                             dmg_to_enemy = 0
                         else:
                             old_enemy_hp = enemy_state.hp
                             enemy_state.hp = 0
                             enemy_state.statuses.add(Status.KO)
 
-                            logs.append(
-                                f"{enemy_name}は{spell_name}に飲み込まれた！即死！"
-                            )
+                            if logs_enabled():
+                                logs.append(
+                                    f"{enemy_name}は{spell_name}に飲み込まれた！即死！"
+                                )
 
                             dmg_to_enemy = old_enemy_hp
 
@@ -1808,37 +1865,39 @@ def run_character_turn(
                         old_enemy_hp = enemy_state.hp
                         enemy_state.hp = max(enemy_state.hp - final_damage, 0)
 
-                        log_damage(
-                            logs,
-                            "",
-                            enemy_name,
-                            final_damage,
-                            old_enemy_hp,
-                            enemy_state.hp,
-                            "attacker",
-                            "arrow",
-                            None,
-                            "",
-                            True,
-                        )
+                        if logs_enabled():
+                            log_damage(
+                                logs,
+                                "",
+                                enemy_name,
+                                final_damage,
+                                old_enemy_hp,
+                                enemy_state.hp,
+                                "attacker",
+                                "arrow",
+                                None,
+                                "",
+                                True,
+                            )
                         dmg_to_enemy = final_damage
                     else:
                         old_enemy_hp = enemy_state.hp
                         enemy_state.hp = max(enemy_state.hp - final_damage, 0)
 
-                        log_damage(
-                            logs,
-                            "",
-                            enemy_name,
-                            final_damage,
-                            old_enemy_hp,
-                            enemy_state.hp,
-                            "attacker",
-                            "arrow",
-                            None,
-                            "",
-                            True,
-                        )
+                        if logs_enabled():
+                            log_damage(
+                                logs,
+                                "",
+                                enemy_name,
+                                final_damage,
+                                old_enemy_hp,
+                                enemy_state.hp,
+                                "attacker",
+                                "arrow",
+                                None,
+                                "",
+                                True,
+                            )
                         dmg_to_enemy = final_damage
 
         # Black Belt: Boost
@@ -1846,7 +1905,8 @@ def run_character_turn(
             handled_special = True
 
             if char_state.boost_count >= 2:
-                logs.append(f"{char_name}は力をためすぎて《Overload》を起こした！")
+                if logs_enabled():
+                    logs.append(f"{char_name}は力をためすぎて《Overload》を起こした！")
 
                 dmg_to_enemy = 0
 
@@ -1855,16 +1915,17 @@ def run_character_turn(
                 old_hp = char_state.hp
                 char_state.hp = max(char_state.hp - overload_damage, 0)
 
-                log_damage(
-                    logs,
-                    "オーバーロードで",
-                    char_name,
-                    overload_damage,
-                    old_hp,
-                    char_state.hp,
-                    "target",
-                    "remain",
-                )
+                if logs_enabled():
+                    log_damage(
+                        logs,
+                        "オーバーロードで",
+                        char_name,
+                        overload_damage,
+                        old_hp,
+                        char_state.hp,
+                        "target",
+                        "remain",
+                    )
 
                 char_state.boost_count = 0
                 char_state.temp_flags.pop("boosting", None)
@@ -1872,9 +1933,10 @@ def run_character_turn(
                 char_state.boost_count += 1
                 char_state.temp_flags["boosting"] = True
 
-                logs.append(
-                    f"{char_name}は力をためた！（Boost {char_state.boost_count}回目）"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は力をためた！（Boost {char_state.boost_count}回目）"
+                    )
 
                 dmg_to_enemy = 0
 
@@ -1886,7 +1948,8 @@ def run_character_turn(
             dmg_to_enemy = 0
 
             if not enemies:
-                logs.append(f"{char_name}の《Scare》！ しかし敵がいなかった…")
+                if logs_enabled():
+                    logs.append(f"{char_name}の《Scare》！ しかし敵がいなかった…")
                 return dmg_to_enemy, None
 
             affected = 0
@@ -1902,21 +1965,26 @@ def run_character_turn(
                     continue
 
                 if before_lv <= 1:
-                    details.append(f"{e.name}: 効果なし（Lvはすでに1）")
+                    if logs_enabled():
+                        details.append(f"{e.name}: 効果なし（Lvはすでに1）")
                     continue
 
                 est.level = max(1, before_lv - 3)
                 decreased = before_lv - est.level
                 affected += 1
-                details.append(f"{e.name}: Lv {before_lv}→{est.level}（-{decreased}）")
+                if logs_enabled():
+                    details.append(f"{e.name}: Lv {before_lv}→{est.level}（-{decreased}）")
 
             # ログ（長ければ1行に圧縮してもOK）
             if affected == 0:
-                logs.append(f"{char_name}の《Scare》！ しかし誰にも効果がなかった…")
+                if logs_enabled():
+                    logs.append(f"{char_name}の《Scare》！ しかし誰にも効果がなかった…")
             else:
-                logs.append(f"{char_name}の《Scare》！ 敵全員のレベルを下げた！")
+                if logs_enabled():
+                    logs.append(f"{char_name}の《Scare》！ 敵全員のレベルを下げた！")
                 for line in details:
-                    logs.append("  - " + line)
+                    if logs_enabled():
+                        logs.append("  - " + line)
 
             return dmg_to_enemy, None
 
@@ -1958,20 +2026,23 @@ def run_character_turn(
                 )
 
             # ログ
-            logs.append(f"{char_name}の《Cheer》！ 味方全員の物理攻撃力が10上がった！")
+            if logs_enabled():
+                logs.append(f"{char_name}の《Cheer》！ 味方全員の物理攻撃力が10上がった！")
             for name, m0, m1, o0, o1 in applied:
                 if o0 is not None and o0 > 0:
-                    logs.append(f"  - {name}: 右手 {m0}→{m1} / 左手 {o0}→{o1}")
-                else:
+                    if logs_enabled():
+                        logs.append(f"  - {name}: 右手 {m0}→{m1} / 左手 {o0}→{o1}")
+                elif logs_enabled():
                     logs.append(f"  - {name}: {m0}→{m1}")
 
             return dmg_to_enemy, None
 
         # 未実装 special → 物理にフォールバック
         if char_attack_kind == "special" and not handled_special:
-            logs.append(
-                f"{char_name}のコマンド《{char_battle_command}》は未実装なので物理攻撃として処理します"
-            )
+            if logs_enabled():
+                logs.append(
+                    f"{char_name}のコマンド《{char_battle_command}》は未実装なので物理攻撃として処理します"
+                )
             char_attack_kind = "physical"
 
     # ----------------------------------------------------------------------
@@ -1994,7 +2065,7 @@ def run_character_turn(
                 hand=char_weapon_hand,
                 element_relation=relation,
                 rng=rng,
-                use_expectation=False,
+                use_expectation=use_expectation,
                 blind=char_is_blind,
                 attacker_is_mini_or_toad=char_is_mini_or_toad,
                 return_crit=True,
@@ -2006,18 +2077,15 @@ def run_character_turn(
         crit = res.is_critical
         net_hits = res.hit_count
 
-        print(
-            "main_power",
-            char_stats.main_power,
-            "main_mul",
-            char_stats.main_atk_multiplier,
-            "main_acc",
-            char_stats.main_accuracy,
-        )
-
-        # 表示用（整数に丸める）
-        hits_disp = max(0, int(round(net_hits)))  # 例：3.65 → 4
-        hits_msg = f"（{hits_disp}ヒット）" if hits_disp > 0 else "（ミス）"
+        if debug_enabled():
+            print(
+                "main_power",
+                char_stats.main_power,
+                "main_mul",
+                char_stats.main_atk_multiplier,
+                "main_acc",
+                char_stats.main_accuracy,
+            )
 
         # Black Belt: Boost 倍率適用
         boost_used = 0
@@ -2043,7 +2111,13 @@ def run_character_turn(
         old_enemy_hp = enemy_state.hp
         enemy_state.hp = max(enemy_state.hp - dmg_to_enemy, 0)
 
-        relation_msg = relation_comment(relation, hit_elems, perspective="attacker")
+        # ★QUIET ではログ文字列を組み立てない
+        if not logs_enabled():
+            return dmg_to_enemy, None
+
+        # 表示用（整数に丸める）
+        hits_disp = max(0, int(round(net_hits)))  # 例：3.65 → 4
+        hits_msg = f"（{hits_disp}ヒット）" if hits_disp > 0 else "（ミス）"
 
         attack_label = "の物理攻撃"
         if char_battle_command == "Sing":
@@ -2101,15 +2175,17 @@ def run_enemy_turn(
     state: RuntimeState,
     rng: Optional[Random] = None,
     party_members: list[PartyMemberRuntime],  # ← 型名はあなたの実装に合わせて
+    mode: BattleMode = "random",  # ★追加：expected ならダメージは期待値
 ) -> OneTurnResult:
     """
     「敵の1行動フェーズ」だけを担当する関数。
     - HPや状態異常などは char_state / enemy_state / char_stats / enemy_stats に直接書き込む
     - ログは logs に append していく
     - 1ターンの最終結果を OneTurnResult として返す
+    - mode="expected" のときは通常/スペシャル攻撃を期待値で混合したダメージになる
     """
-    if rng is None:
-        rng = Random()
+    rng = rng_for_mode(mode, rng)
+    use_expectation = uses_expectation(mode)
 
     # print(f"[Debug:turn_logic/run_enemy_turn - enemy_json] {enemy_json.get("Spells")}")
 
@@ -2139,7 +2215,8 @@ def run_enemy_turn(
     if char_state.hp <= 0:
         idx = random_alive_char_index(party_members, rng)
         if idx is None:
-            logs.append(f"{char_name}は力尽きた…")
+            if logs_enabled():
+                logs.append(f"{char_name}は力尽きた…")
             return OneTurnResult(
                 char_state=char_state,
                 enemy_state=enemy_state,
@@ -2173,11 +2250,13 @@ def run_enemy_turn(
     # ------------------------------------------------------------
     if enemy_para:
         r = rng.random()
-        logs.append(f"[{enemy_name}] Paralysis check {r:.2f}")
+        if debug_enabled():
+            logs.append(f"[{enemy_name}] Paralysis check {r:.2f}")
         if r < 0.3:
             enemy_state.statuses.discard(Status.PARALYZE)
             enemy_para = False
-            logs.append(f"{enemy_name}の麻痺が解けた！")
+            if logs_enabled():
+                logs.append(f"{enemy_name}の麻痺が解けた！")
 
     # 麻痺が治ったかどうかを再確認
     enemy_para = enemy_state.has(Status.PARALYZE)
@@ -2197,14 +2276,16 @@ def run_enemy_turn(
 
             r = rng.random() * 100.0
 
-            logs.append(
-                f"{enemy_name}は逃げ出そうとしている…"
-                f"（Lv差 {level_diff} / 逃走率 {chance_to_run:.1f}% / 判定値 {r:.1f}）"
-            )
+            if logs_enabled():
+                logs.append(
+                    f"{enemy_name}は逃げ出そうとしている…"
+                    f"（Lv差 {level_diff} / 逃走率 {chance_to_run:.1f}% / 判定値 {r:.1f}）"
+                )
 
             if r < chance_to_run:
                 # 逃走成功：HPを0にして「戦闘から退場」扱い
-                logs.append(f"{enemy_name}は逃げ出した！")
+                if logs_enabled():
+                    logs.append(f"{enemy_name}は逃げ出した！")
                 enemy_state.hp = 0
 
                 return OneTurnResult(
@@ -2232,11 +2313,13 @@ def run_enemy_turn(
     if enemy_was_physically_hit:
         if enemy_state.has(Status.CONFUSION):
             enemy_state.statuses.discard(Status.CONFUSION)
-            logs.append(f"{enemy_name}の混乱が解けた！")
+            if logs_enabled():
+                logs.append(f"{enemy_name}の混乱が解けた！")
 
         if enemy_state.has(Status.SLEEP):
             enemy_state.statuses.discard(Status.SLEEP)
-            logs.append(f"{enemy_name}は目を覚ました！")
+            if logs_enabled():
+                logs.append(f"{enemy_name}は目を覚ました！")
 
     # Sleep フラグ更新
     enemy_sleep = enemy_state.has(Status.SLEEP)
@@ -2253,18 +2336,21 @@ def run_enemy_turn(
 
     # --- Sleep / Paralysis で行動不能 ---
     if enemy_sleep:
-        logs.append(f"{enemy_name}は眠っていて動けない…")
+        if logs_enabled():
+            logs.append(f"{enemy_name}は眠っていて動けない…")
         enemy_attack = None
         dmg_to_char = 0
 
     elif enemy_para:
-        logs.append(f"{enemy_name}は麻痺していて動けない…")
+        if logs_enabled():
+            logs.append(f"{enemy_name}は麻痺していて動けない…")
         enemy_attack = None
         dmg_to_char = 0
 
     # --- Confusion（開始時から混乱状態だった場合のみ特別処理）---
     elif enemy_was_confused_at_start and enemy_state.has(Status.CONFUSION):
-        logs.append(f"{enemy_name}は混乱している！")
+        if logs_enabled():
+            logs.append(f"{enemy_name}は混乱している！")
 
         if rng.random() < 0.5:
             # ---- 自分を攻撃（自傷）----
@@ -2275,7 +2361,7 @@ def run_enemy_turn(
                     enemy=enemy_stats,
                     char=dummy_char,
                     rng=rng,
-                    use_expectation=False,
+                    use_expectation=use_expectation,
                     attacker_is_blind=enemy_is_blind,
                     attacker_is_mini_or_toad=enemy_is_mini_or_toad,
                     target_is_mini_or_toad=enemy_is_mini_or_toad,
@@ -2312,7 +2398,8 @@ def run_enemy_turn(
             # 自傷ダメージ > 0 なら混乱解除
             if dmg_to_self > 0 and enemy_state.has(Status.CONFUSION):
                 enemy_state.statuses.discard(Status.CONFUSION)
-                logs.append(f"{enemy_name}の混乱が解けた！")
+                if logs_enabled():
+                    logs.append(f"{enemy_name}の混乱が解けた！")
 
             # キャラはこの分岐では殴られてない
             dmg_to_char = 0
@@ -2324,7 +2411,7 @@ def run_enemy_turn(
                     enemy=enemy_stats,
                     char=char_stats,
                     rng=rng,
-                    use_expectation=False,
+                    use_expectation=use_expectation,
                     attacker_is_blind=enemy_is_blind,
                     attacker_is_mini_or_toad=enemy_is_mini_or_toad,
                     target_is_mini_or_toad=char_is_mini_or_toad,
@@ -2358,7 +2445,7 @@ def run_enemy_turn(
                 enemy=enemy_stats,
                 char=char_stats,
                 rng=rng,
-                use_expectation=False,
+                use_expectation=use_expectation,
                 attacker_is_blind=enemy_is_blind,
                 attacker_is_mini_or_toad=enemy_is_mini_or_toad,
                 target_is_mini_or_toad=char_is_mini_or_toad,
@@ -2392,7 +2479,8 @@ def run_enemy_turn(
 
         # ★ キャラがジャンプ中なら敵の攻撃は当たらない
         if char_state.is_jumping:
-            logs.append(f"{char_name}は空中にいる！敵の攻撃は届かない！")
+            if logs_enabled():
+                logs.append(f"{char_name}は空中にいる！敵の攻撃は届かない！")
             return OneTurnResult(
                 char_state=char_state,
                 enemy_state=enemy_state,
@@ -2411,7 +2499,7 @@ def run_enemy_turn(
             char=char_stats,
             state=state,
             rng=rng,
-            use_expectation=False,
+            use_expectation=use_expectation,
             attacker_is_blind=enemy_is_blind,
             attacker_is_mini_or_toad=enemy_is_mini_or_toad,
             target_is_mini_or_toad=char_is_mini_or_toad,
@@ -2459,6 +2547,7 @@ def run_enemy_turn(
                     logs=logs,
                     caster_state=enemy_state,
                     caster_max_hp=getattr(enemy_state, "max_hp", None),
+                    use_expectation=use_expectation,
                 )
 
                 if enemy_down:
@@ -2495,16 +2584,17 @@ def run_enemy_turn(
             old_enemy_hp = enemy_state.hp
             enemy_state.hp = max(enemy_state.hp - reflected_damage, 0)
 
-            log_damage(
-                logs,
-                f"{enemy_name}のスペル《{enemy_attack.attack_name}》はReflectで跳ね返された！ ",
-                enemy_name,
-                reflected_damage,
-                old_enemy_hp,
-                enemy_state.hp,
-                "target",
-                "remain",
-            )
+            if logs_enabled():
+                log_damage(
+                    logs,
+                    f"{enemy_name}のスペル《{enemy_attack.attack_name}》はReflectで跳ね返された！ ",
+                    enemy_name,
+                    reflected_damage,
+                    old_enemy_hp,
+                    enemy_state.hp,
+                    "target",
+                    "remain",
+                )
 
             # この攻撃は「キャラには当たっていない」扱いにしたいので、以降 enemy_attack=None
             enemy_attack = None
@@ -2559,6 +2649,7 @@ def run_enemy_turn(
                         logs=logs,
                         caster_state=enemy_state,  # ★ ここが重要：敵のstate
                         caster_max_hp=getattr(enemy_state, "max_hp", None),  # ★ あれば
+                        use_expectation=use_expectation,
                     )
                 if enemy_down:
                     # ここで即勝利扱いにする（あなたの end_reason に合わせる）
@@ -2628,9 +2719,10 @@ def run_enemy_turn(
                     hit_percent = calc_buff_hit_percent(base_acc, mind)
 
                     if rng.random() * 100.0 >= hit_percent:
-                        logs.append(
-                            f"{enemy_name}は《Haste》を唱えた！ しかし何も起こらなかった…"
-                        )
+                        if logs_enabled():
+                            logs.append(
+                                f"{enemy_name}は《Haste》を唱えた！ しかし何も起こらなかった…"
+                            )
                         dmg_to_char = 0
                         enemy_attack = None
                     else:
@@ -2646,10 +2738,11 @@ def run_enemy_turn(
                         old_mul = int(getattr(enemy_stats, "attack_multiplier", 1))
                         enemy_stats.attack_multiplier = max(1, old_mul + add)
 
-                        logs.append(
-                            f"{enemy_name}は《Haste》を唱えた！ "
-                            f"攻撃回数が {old_mul}→{enemy_stats.attack_multiplier} に上がった。"
-                        )
+                        if logs_enabled():
+                            logs.append(
+                                f"{enemy_name}は《Haste》を唱えた！ "
+                                f"攻撃回数が {old_mul}→{enemy_stats.attack_multiplier} に上がった。"
+                            )
 
                         dmg_to_char = 0
                         enemy_attack = None
@@ -2666,10 +2759,11 @@ def run_enemy_turn(
                     hit_percent = calc_buff_hit_percent(base_acc, mind)
 
                     if rng.random() * 100.0 >= hit_percent:
-                        logs.append(
-                            f"{enemy_name}は《Protect》を唱えた！ "
-                            f"しかし何も起こらなかった…"
-                        )
+                        if logs_enabled():
+                            logs.append(
+                                f"{enemy_name}は《Protect》を唱えた！ "
+                                f"しかし何も起こらなかった…"
+                            )
                         dmg_to_char = 0
                         enemy_attack = None
 
@@ -2691,11 +2785,12 @@ def run_enemy_turn(
                             rng=rng,
                         )
 
-                        logs.append(
-                            f"{enemy_name}は《Protect》を唱えた！ "
-                            f"防御力 {old_def}→{enemy_stats.defense}、"
-                            f"魔法防御 {old_mdef}→{enemy_stats.magic_defense} に上がった。"
-                        )
+                        if logs_enabled():
+                            logs.append(
+                                f"{enemy_name}は《Protect》を唱えた！ "
+                                f"防御力 {old_def}→{enemy_stats.defense}、"
+                                f"魔法防御 {old_mdef}→{enemy_stats.magic_defense} に上がった。"
+                            )
                         dmg_to_char = 0
                         enemy_attack = None
 
@@ -2726,13 +2821,17 @@ def run_enemy_turn(
         if getattr(char_state, "temp_flags", {}).get("defending"):
             if dmg_to_char > 0:
                 dmg_to_char = int(dmg_to_char * 0.5)
-                logs.append(f"{char_name}は防御してダメージを軽減した！")
+                if logs_enabled():
+                    logs.append(f"{char_name}は防御してダメージを軽減した！")
 
         # 最終的なダメージを適用
         char_state.hp = max(char_state.hp - dmg_to_char, 0)
 
         # ここまでで char_state.hp は更新済み（old_char_hp もある）
-        if enemy_attack is None:
+        # ★QUIET ではダメージログを組み立てない
+        if not logs_enabled():
+            pass
+        elif enemy_attack is None:
             # 例：AOE/Tornado などで enemy_attack を None にした、または行動不能など
             if dmg_to_char > 0:
                 log_damage(
@@ -2824,11 +2923,13 @@ def run_enemy_turn(
 
         if char_state.has(Status.CONFUSION):
             char_state.statuses.discard(Status.CONFUSION)
-            logs.append(f"{char_name}の混乱が解けた！")
+            if logs_enabled():
+                logs.append(f"{char_name}の混乱が解けた！")
 
         if char_state.has(Status.SLEEP):
             char_state.statuses.discard(Status.SLEEP)
-            logs.append(f"{char_name}は目を覚ました！")
+            if logs_enabled():
+                logs.append(f"{char_name}は目を覚ました！")
 
     # ------------------------------------------------------------
     # 8) enemy_attack.inflicted_status の処理
@@ -2860,15 +2961,17 @@ def run_enemy_turn(
 
             if inflicted_status_target is not None:
                 char_state.statuses.add(inflicted_status_target)
-                logs.append(
-                    f"{char_name}は{enemy_attack.attack_name}で{inflicted_status_target.name}状態になった！（簡易実装）"
-                )
+                if logs_enabled():
+                    logs.append(
+                        f"{char_name}は{enemy_attack.attack_name}で{inflicted_status_target.name}状態になった！（簡易実装）"
+                    )
 
     # ------------------------------------------------------------
     # 9) キャラが倒れたかどうかチェック（既存ヘルパ使用）
     # ------------------------------------------------------------
     if char_state.hp <= 0:
-        logs.append(f"{char_name}は力尽きた…")
+        if logs_enabled():
+            logs.append(f"{char_name}は力尽きた…")
         if not any_char_alive(party_members):
             end_reason = "char_defeated"
         else:
@@ -2964,34 +3067,25 @@ def enemy_attack_to_char_with_special(
             )
         )
 
-        spell_list = monster.get("Spells") or []
+        spell_index = monster_spell_index(monster)
         total_rate = sum((sa.get("Rate") or 0) for sa in specials)
 
         special_expect = 0.0
         status_prob_expect = 0.0  # 状態異常成功確率の期待値
+        # ★追加：重み付き成功確率が最大の状態異常（確率で重み付けして付与する用）
+        dominant_status: Optional[str] = None
+        dominant_attack: Optional[str] = None
+        dominant_weight = 0.0
         if total_rate > 0:
             for sa in specials:
                 rate = sa.get("Rate") or 0.0
                 if rate <= 0:
                     continue
-                attack_name = sa.get("Attack")
-                spell_def = None
-                for s in spell_list:
-                    if s.get("Name") == attack_name:
-                        spell_def = s
-                        break
+                spell_def = spell_index.spell(sa.get("Attack"))
                 if spell_def is None:
                     continue
 
-                power = int(spell_def.get("Power", 0))
-                mult = int(spell_def.get("Multiplier", 1) or 1)
-                acc_percent = int(round((spell_def.get("Accuracy", 1.0) or 1.0) * 100))
-
-                enemy_caster = EnemyCasterStats(
-                    magic_power_base=power,
-                    magic_multiplier=mult,
-                    magic_accuracy_percent=acc_percent,
-                )
+                enemy_caster = spell_index.caster(spell_def)
 
                 attack_elems = elements_from_monster_spell(spell_def)
                 rel_to_char, hit_elems = element_relation_and_hits_for_char(
@@ -3003,7 +3097,7 @@ def enemy_attack_to_char_with_special(
                     char=char,
                     element_relation=rel_to_char,
                     rng=rng,
-                    use_expectation=False,
+                    use_expectation=True,
                     split_to_targets=1,
                     attacker_is_blind=attacker_is_blind,
                     target_is_mini_or_toad=target_is_mini_or_toad,
@@ -3021,13 +3115,24 @@ def enemy_attack_to_char_with_special(
                 weight = rate / total_rate
                 special_expect += weight * dmg_spec
                 status_prob_expect += weight * status_prob
+                if status_name and weight * status_prob > dominant_weight:
+                    dominant_weight = weight * status_prob
+                    dominant_status = status_name
+                    dominant_attack = spell_def.get("Name")
 
         mixed = (1.0 - special_rate) * normal_dmg + special_rate * special_expect
+
+        # ★ 状態異常は「通常/スペシャル混合の成功確率」で判定する
+        #   （mode="expected" では rng が ExpectedRandom なので、戦闘を通して確率どおりの割合で入る）
+        inflicted_status: Optional[str] = None
+        if dominant_status and rng.random() < special_rate * status_prob_expect:
+            inflicted_status = dominant_status
+
         return EnemyAttackResult(
             damage=max(int(round(mixed)), 0),
             attack_type="mixed",
-            attack_name=None,
-            inflicted_status=None,
+            attack_name=dominant_attack if inflicted_status else None,
+            inflicted_status=inflicted_status,
             status_success_prob=(
                 (special_rate * status_prob_expect) if status_prob_expect > 0 else 0.0
             ),
@@ -3069,15 +3174,7 @@ def enemy_attack_to_char_with_special(
                     net_hits=net_hits,  # ★ここ
                 )
 
-            power = safe_int(spell_def.get("Power", 0))
-            mult = safe_int(spell_def.get("Multiplier", 1) or 1)
-            acc_percent = safe_int(round((spell_def.get("Accuracy", 1.0) or 1.0) * 100))
-
-            enemy_caster = EnemyCasterStats(
-                magic_power_base=power,
-                magic_multiplier=mult,
-                magic_accuracy_percent=acc_percent,
-            )
+            enemy_caster = monster_spell_index(monster).caster(spell_def)
 
             attack_elems = elements_from_monster_spell(spell_def)
             rel_to_char, hit_elems = element_relation_and_hits_for_char(
@@ -3117,7 +3214,7 @@ def enemy_attack_to_char_with_special(
             # 2) 無ければ spells.json 側（state.spells）から補完
             if reflectable_raw is None:
                 try:
-                    base_spell = state.spells.get(spell_def.get("Name", ""))
+                    base_spell = lookup_by_name(state.spells, spell_def.get("Name", ""))
                 except NameError:
                     base_spell = None  # state.spells が未セットの場合
 
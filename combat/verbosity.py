@@ -0,0 +1,55 @@
+# ============================================================
+# verbosity: 出力レベル（戦闘ログ文字列 / デバッグ print）の切り替え
+
+# QUIET	ログ文字列を作らず print もしない（structured events のみ）。一括シミュレーション用
+# NORMAL	戦闘ログ（logs）を作る。print は警告（装備データ欠損など）のみ
+# DEBUG	戦闘ログ + 開発用のデバッグ print（従来どおりの挙動。既定値）
+# set_verbosity	出力レベルを設定する（プロセス全体）
+# get_verbosity	現在の出力レベルを返す
+# logs_enabled	戦闘ログ文字列・警告を出すべきか（NORMAL 以上）
+# debug_enabled	デバッグ print を出すべきか（DEBUG）
+# verbosity	with 文で一時的に出力レベルを切り替える
+# ============================================================
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Iterator
+
+QUIET = 0
+NORMAL = 1
+DEBUG = 2
+
+# ★ runtime_state.STATE と同じくプロセス単位のグローバル
+#   （ProcessPoolExecutor のワーカーはそれぞれ自分で設定する）
+_LEVEL: int = DEBUG
+
+
+def set_verbosity(level: int) -> None:
+    global _LEVEL
+    if level not in (QUIET, NORMAL, DEBUG):
+        raise ValueError(f"不正な verbosity です: {level}")
+    _LEVEL = level
+
+
+def get_verbosity() -> int:
+    return _LEVEL
+
+
+def logs_enabled() -> bool:
+    return _LEVEL >= NORMAL
+
+
+def debug_enabled() -> bool:
+    return _LEVEL >= DEBUG
+
+
+@contextmanager
+def verbosity(level: int) -> Iterator[None]:
+    """with verbosity(QUIET): ... の間だけ出力レベルを切り替える"""
+    old = _LEVEL
+    set_verbosity(level)
+    try:
+        yield
+    finally:
+        set_verbosity(old)
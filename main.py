@@ -20,6 +20,10 @@ from combat.enemy_selection import (
 )
 from combat.progression import apply_victory_rewards
 from combat.save_prompt import prompt_save_progress_and_write, restore_backup_by_choice
+from combat.replay import BattleRecorder
+
+# 戦闘リプレイの保存先（combat.replay.replay_battle で再現できる）
+REPLAY_DIR = Path("assets/replays")
 
 
 def choose_location_console(
@@ -110,7 +114,9 @@ def main():
     # ==================================================
     # ３．戦闘ターン
     # ==================================================
-    rng = random.Random()
+    # ★リプレイ記録（戦闘中の乱数は recorder.rng を使う）
+    recorder = BattleRecorder(party_members, enemies, save=state.save)
+    rng = recorder.rng
     max_turns = 50
     end_reason = None
 
@@ -139,6 +145,7 @@ def main():
         print_planned_actions(party_members, planned_actions)  # debug_utils
 
         # ② イニシアティブ計算＆行動解決
+        recorded_actions = recorder.snapshot_actions(planned_actions)
         logs, round_result, _event = simulate_one_round_multi_party(  # battle_sim
             party_members,
             enemies,
@@ -151,6 +158,7 @@ def main():
         )
 
         print_logs(logs)  # debug_utils
+        recorder.record_round(recorded_actions, logs, _event, round_result.end_reason)
 
         # ラウンド後の終了判定
         if round_result.end_reason != "continue":
@@ -158,6 +166,9 @@ def main():
             print_end_reason(round_result.end_reason)  # debug_utils
             break
 
+    if recorder.replay.rounds:
+        print(f"リプレイを保存しました: {recorder.save_to_dir(REPLAY_DIR)}")
+
     # --- 戦闘終了後の報酬適用（ここで一回だけ） ---
     if end_reason == "enemy_defeated":
         # 勝利処理
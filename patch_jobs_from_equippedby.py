@@ -10,6 +10,8 @@ import json
 from pathlib import Path
 from collections import defaultdict
 
+from combat.constants import JOB_EQUIP_CODE
+
 WEAPONS_PATH = Path("assets/data/ffiii_weapons.json")
 ARMORS_PATH = Path("assets/data/ffiii_armors.json")
 JOBS_PATH = Path("assets/data/ffiii_jobs_compact.json")
@@ -143,32 +145,7 @@ def main():
         raise ValueError("jobs.json の構造が想定外（jobs配列が見つからない）")
 
     # ★ ここが必須：ジョブ名→略号（EquippedBy側のコード）
-    manual_code_map = {
-        # 例：必要分を全部埋める
-        "Onion Knight": "OK",
-        "Warrior": "Wa",
-        "Monk": "Mo",
-        "White Mage": "WM",
-        "Black Mage": "BM",
-        "Red Mage": "RM",
-        "Ranger": "Ra",
-        "Knight": "Kn",
-        "Thief": "Th",
-        "Scholar": "Sc",
-        "Geomancer": "Ge",
-        "Dragoon": "Dr",
-        "Viking": "Vi",
-        "Black Belt": "BB",
-        "Evoker": "Ev",
-        "Bard": "Ba",
-        "Magus": "Ma",
-        "Devout": "De",
-        "Summoner": "Su",
-        "Sage": "Sa",
-        "Ninja": "Ni",
-        "Mystic Knight": "MK",
-        # ...あなたの環境の全ジョブ分を入れる
-    }
+    manual_code_map = dict(JOB_EQUIP_CODE)  # combat.constants と共有
 
     patched_jobs = 0
     added_w_total = 0
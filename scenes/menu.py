@@ -13,6 +13,7 @@ from combat.constants import (
     FIELD_MAGIC_WHITELIST,
     FIELD_MAGIC_TARGET_REQUIRED,
     FIELD_ITEM_TARGET_REQUIRED,
+    JOB_EQUIP_CODE,
 )
 from combat.models import (
     PartyMemberRuntime,
@@ -21,7 +22,6 @@ from combat.models import (
 )
 from combat.char_build import (
     compute_character_final_stats,
-    build_name_index,
     strip_illegal_equipment_for_job,
     apply_job_equipment_restrictions,
 )
@@ -30,6 +30,9 @@ from combat.data_loader import (
     apply_party_equipment_to_save,
     apply_party_job_to_save,
 )
+from combat.name_index import lookup_by_name
+from combat.equip_index import job_equip_index
+from combat.item_effects import item_effect
 
 from ui_pygame.portrait_cache import PortraitCache
 from ui_pygame.logic import make_cast_field_magic_fn, make_use_field_item_fn
@@ -856,31 +859,8 @@ def _job_code_of_actor(actor) -> str:
     return (getattr(actor.job, "name", None) or "").strip()
 
 
-# 必要ならここをあなたの Job 名に合わせて拡張してください
-JOB_NAME_TO_CODE = {
-    "Onion Knight": "OK",
-    "Warrior": "Wa",
-    "Monk": "Mo",
-    "White Mage": "WM",
-    "Black Mage": "BM",
-    "Red Mage": "RM",
-    "Ranger": "Ra",
-    "Knight": "Kn",
-    "Thief": "Th",
-    "Scholar": "Sc",
-    "Geomancer": "Ge",
-    "Dragoon": "Dr",
-    "Viking": "Vi",
-    "Black Belt": "BB",
-    "Evoker": "Ev",
-    "Bard": "Ba",
-    "Magus": "Ma",
-    "Devout": "De",
-    "Summoner": "Su",
-    "Sage": "Sa",
-    "Ninja": "Ni",
-    "Mystic Knight": "MK",  # JSON内で MK 表記になっています :contentReference[oaicite:2]{index=2}
-}
+# ジョブ名 → EquippedBy の略号（combat.constants.JOB_EQUIP_CODE を共有）
+JOB_NAME_TO_CODE = JOB_EQUIP_CODE
 
 
 def actor_job_code(actor) -> str:
@@ -927,30 +907,10 @@ def _armor_allows(actor, armor_dict: dict) -> bool:
 
 
 def build_equip_candidates(actor, slot, *, weapons_by_name, armors_by_name):
+    # ジョブ → スロット → 候補は equip_index に前計算済み（規則は allowed_by_job / is_two_handed_weapon と同じ）
+    index = job_equip_index(actor.job, weapons_by_name, armors_by_name)
     out = [("none", "はずす", None)]
-
-    # ---- 武器候補 ----
-    if slot in ("main_hand", "off_hand"):
-        for name, w in weapons_by_name.items():
-            if not allowed_by_job(actor, w):
-                continue
-            if slot == "off_hand" and is_two_handed_weapon(w):
-                continue
-            out.append(("weapon", name, w))
-
-        # off_hand は盾も追加
-        if slot == "off_hand":
-            for name, a in armors_by_name.items():
-                if a.get("ArmorType") == "Shield" and allowed_by_job(actor, a):
-                    out.append(("armor", name, a))
-        return out
-
-    # ---- 防具候補（head/body/arms）----
-    allow_types = SLOT_TO_ARMORTYPE.get(slot, set())
-    for name, a in armors_by_name.items():
-        if a.get("ArmorType") in allow_types and allowed_by_job(actor, a):
-            out.append(("armor", name, a))
-
+    out.extend((c.kind, c.name, c.data) for c in index.candidates(slot))
     return out
 
 
@@ -983,10 +943,7 @@ def open_equip_candidate_pygame(
     header_h = line_h * 4
     max_rows = max(5, (screen.get_height() - header_h - 70) // line_h)
 
-    # 候補一覧の先頭で一回だけ作る
-    weapons_norm = build_name_index(weapons_by_name)
-    armors_norm = build_name_index(armors_by_name)
-
+    # 名前インデックス・装備ごとの寄与は compute_character_final_stats 側でキャッシュ済み
     def calc_preview_stats(item_kind, item_name):
         # 装備をコピー（本体は絶対に触らない）
         eq_preview = deepcopy(actor.equipment or EquipmentSet())
@@ -1861,10 +1818,6 @@ def open_magic_pygame(
 
     line_h = font.get_linesize() + 10
 
-    # spells_by_name は "Flare" のように大文字始まりキーなので、
-    # 小文字正規化で引ける index を一度作っておく（高速＆安全）
-    spells_key_lut = {str(k).strip().lower(): k for k in spells_by_name.keys()}
-
     def blit_line(text, x, y, color=WHITE):
         surf = font.render(text, True, color)
         screen.blit(surf, (x, y))
@@ -1873,13 +1826,9 @@ def open_magic_pygame(
         return str(name).strip().lower()
 
     def _spell_lookup(name: str) -> dict:
-        # 1) そのまま
-        sp = spells_by_name.get(name)
-        if sp:
-            return sp
-        # 2) 小文字正規化で引く
-        k = spells_key_lut.get(_canon_spell_name(name))
-        return spells_by_name.get(k, {}) if k else {}
+        # spells_by_name は "Flare" のように大文字始まりキーなので、
+        # 完全一致 → 正規化名インデックス（魔法DBごとに1回だけ作る）の順で引く
+        return lookup_by_name(spells_by_name, name) or {}
 
     def magic_mark(spell: dict) -> str:
         t = str(spell.get("Type", ""))
@@ -2337,14 +2286,25 @@ def open_item_pygame(
     def canon(s: str) -> str:
         return str(s).strip().lower()
 
+    # ★アイテムの効果は ItemEffect（load_items で前計算）で判定する
+    def effect_of(item_name: str):
+        item = lookup_by_name(items_by_name or {}, item_name)
+        return item_effect(item) if item is not None else None
+
     # --- 対象が必要なアイテム ---
     def needs_target(item_name: str) -> bool:
-        return canon(item_name) in FIELD_ITEM_TARGET_REQUIRED
+        eff = effect_of(item_name)
+        if eff is None:
+            return canon(item_name) in FIELD_ITEM_TARGET_REQUIRED
+        return eff.target_rule == "ally"
 
     # --- 対象候補 ---
     def target_candidates(item_name: str):
-        sn = canon(item_name)
-        is_revive = sn == "phoenix down"
+        eff = effect_of(item_name)
+        if eff is None:
+            is_revive = canon(item_name) == "phoenix down"
+        else:
+            is_revive = eff.action == "revive"
         cand = []
         for i, ch in enumerate(party[:4]):
             hp = int(ch.hp)
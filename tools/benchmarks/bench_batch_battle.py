@@ -0,0 +1,72 @@
+# ============================================================
+# bench_batch_battle: combat.batch_battle（K 戦一括）と simulate_many_battles_multi_party の比較
+
+# 使い方: python tools/benchmarks/bench_batch_battle.py [--battles 2000] [--enemies A,B,C]
+#   同じ条件（全員 Fight）で両方を回し、battles/sec と勝率・平均ラウンド数を並べて表示する。
+#   配列版は敵のスペシャル行動を扱わないので、特殊攻撃を持つ敵では勝率がずれる
+#   （既定の Ogre 編成は通常攻撃のみなので両者がほぼ一致するはず）
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.batch_battle import simulate_many_battles_batch  # noqa: E402
+from combat.battle_sim import simulate_many_battles_multi_party  # noqa: E402
+from combat.char_build import build_party_members_from_save  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.verbosity import QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+DEFAULT_ENEMIES = "Ogre,Cyclops,Minotaur"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--battles", type=int, default=2000)
+    parser.add_argument("--enemies", default=DEFAULT_ENEMIES)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    with verbosity(QUIET):
+        party = build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=LevelTable(str(ROOT / "assets/data/level_exp.csv")),
+        )
+    enemy_names = [n.strip() for n in args.enemies.split(",") if n.strip()]
+
+    print(f"enemies={args.enemies} battles={args.battles}")
+    results = []
+    for label, fn in (
+        ("scalar", simulate_many_battles_multi_party),
+        ("batch", simulate_many_battles_batch),
+    ):
+        with verbosity(QUIET):
+            t0 = time.perf_counter()
+            res = fn(party, enemy_names, args.battles, seed=args.seed, state=state)
+            elapsed = time.perf_counter() - t0
+        results.append(elapsed)
+        bps = args.battles / elapsed if elapsed > 0 else 0.0
+        print(
+            f"{label:<6} {elapsed:7.3f}s {bps:10.1f} battles/sec  "
+            f"win={res['win_rate_char']:.3f} lose={res['win_rate_enemy']:.3f} "
+            f"turns={res['average_turns']:.2f} hp={res['average_hp_remaining']:.3f}"
+        )
+    print(f"speedup x{results[0] / results[1]:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+# ============================================================
+# bench_crn_compare: 共通乱数（CRN）による A/B 比較と独立サンプリングの比較
+
+# 使い方: python tools/benchmarks/bench_crn_compare.py [--trials 1000] [--member Refia --weapon Masamune]
+#   A = セーブのパーティ、B = member の装備（または --row / --job）だけ変えたパーティ。
+#     crn  : compare_configurations（試行ごとに同じ乱数）
+#     indep: simulate_many_battles_multi_party を A / B で別シードに回し、差の区間を正規近似で作る
+#   同じ試行数での勝率差の区間の半幅と、independent_trials_factor を並べて表示する
+#   最後に A 対 A（対の差が全部 0）で precision 打ち切りを回し、最初の batch で止まらないこと・
+#   区間の幅が 0 に潰れないことを確認する（駄目なら終了コード 1）
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.ab_compare import compare_configurations, party_variant_from_save  # noqa: E402
+from combat.battle_sim import simulate_many_battles_multi_party  # noqa: E402
+from combat.confidence import half_width, z_value  # noqa: E402
+from combat.magic_menu import expand_spells_for_summons  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+DEFAULT_ENEMIES = "Kunoichi,Sleipnir"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trials", type=int, default=1000)
+    parser.add_argument("--enemies", default=DEFAULT_ENEMIES)
+    parser.add_argument("--member", default="Refia")
+    parser.add_argument("--weapon", default="Masamune", help="B の右手装備")
+    parser.add_argument("--row", default=None, help="B の隊列（front / back）")
+    parser.add_argument("--job", default=None, help="B のジョブ")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--precision", type=float, default=0.02, help="A 対 A の打ち切り精度")
+    parser.add_argument("--batch-size", type=int, default=50)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    spells = expand_spells_for_summons(state.spells)
+    level_table = LevelTable(str(ROOT / "assets/data/level_exp.csv"))
+    names = [n.strip() for n in args.enemies.split(",") if n.strip()]
+
+    party_a = party_variant_from_save(state, level_table, member=args.member)
+    party_b = party_variant_from_save(
+        state,
+        level_table,
+        member=args.member,
+        job=args.job,
+        equipment={"main_hand": args.weapon} if args.weapon else None,
+        row=args.row,
+    )
+
+    print(f"enemies={args.enemies} trials={args.trials} B: {args.member} "
+          f"weapon={args.weapon} row={args.row} job={args.job}")
+
+    t0 = time.perf_counter()
+    crn = compare_configurations(
+        party_a, party_b, names, args.trials, seed=args.seed, state=state,
+        spells_by_name=spells,
+    )
+    t_crn = time.perf_counter() - t0
+    lo, hi = crn["win_rate_diff_ci"]
+    print(
+        f"crn   {t_crn:6.1f}s A={crn['a']['win_rate']:.3f} B={crn['b']['win_rate']:.3f} "
+        f"diff={crn['win_rate_diff']:+.4f} [{lo:+.4f}, {hi:+.4f}] (±{(hi - lo) / 2:.4f}) "
+        f"turns_diff={crn['turns_diff']:+.2f} "
+        f"A_only={crn['a_only_wins']} B_only={crn['b_only_wins']}"
+    )
+
+    t0 = time.perf_counter()
+    ra = simulate_many_battles_multi_party(
+        party_a, names, args.trials, seed=args.seed, state=state, spells_by_name=spells
+    )
+    rb = simulate_many_battles_multi_party(
+        party_b, names, args.trials, seed=args.seed + 1, state=state, spells_by_name=spells
+    )
+    t_ind = time.perf_counter() - t0
+    pa, pb, n = ra["win_rate_char"], rb["win_rate_char"], args.trials
+    half = z_value(crn["confidence"]) * math.sqrt(
+        (pa * (1 - pa) + pb * (1 - pb)) / max(1, n - 1)
+    )
+    print(
+        f"indep {t_ind:6.1f}s A={pa:.3f} B={pb:.3f} diff={pb - pa:+.4f} "
+        f"[{pb - pa - half:+.4f}, {pb - pa + half:+.4f}] (±{half:.4f})"
+    )
+    factor = crn["independent_trials_factor"]
+    print(
+        "independent sampling needs "
+        + (f"x{factor:.1f}" if factor is not None else "(no discordant trials)")
+        + " trials for the same precision"
+    )
+
+    # --- 分散 0（A 対 A）の打ち切り確認 ---
+    same = compare_configurations(
+        party_a, party_a, names, args.trials, seed=args.seed, state=state,
+        spells_by_name=spells, precision=args.precision, batch_size=args.batch_size,
+    )
+    same_half = half_width(same["win_rate_diff_ci"])
+    ok = (
+        same["a_only_wins"] == same["b_only_wins"] == 0
+        and same_half > 0
+        and same["trials"] > args.batch_size
+    )
+    print(
+        f"zero-variance A vs A: trials={same['trials']} stopped_early={same['stopped_early']} "
+        f"±{same_half:.4f} (precision {args.precision}, batch {args.batch_size}) "
+        + ("OK" if ok else "NG")
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+# ============================================================
+# bench_duel_exact: 1対1・たたかうのみの厳密解（solve_duel_from_stats）とモンテカルロの一致確認・速度比較
+
+# 使い方: python tools/benchmarks/bench_duel_exact.py [--trials 2000] [--enemies 6]
+#   セーブの各メンバー（状態異常は外す）× 厳密解の対象になる敵（レベル順に --enemies 体）で
+#   simulate_many_battles_multi_party を exact=True / exact=False で回し、
+#     ・勝率の差が標本誤差の z で ±4 以内か
+#     ・平均ラウンド数がモンテカルロの区間（信頼水準 0.9999）に入るか
+#   を確認する。2人パーティ・スペシャル持ちの敵ではモンテカルロに戻ることも確認する
+#   不一致があれば終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.battle_sim import (  # noqa: E402
+    _is_plain_duel,
+    policy_always_fight,
+    simulate_many_battles_multi_party,
+)
+from combat.char_build import build_party_members_from_save  # noqa: E402
+from combat.enemy_build import build_enemies  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.verbosity import QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trials", type=int, default=2000)
+    parser.add_argument("--enemies", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    level_table = LevelTable(str(ROOT / "assets/data/level_exp.csv"))
+    with verbosity(QUIET):
+        party = build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=level_table,
+        )
+    for pm in party:
+        pm.state.statuses.clear()
+
+    def enemy(name):
+        return build_enemies(
+            enemy_defs_by_name=state.monsters,
+            spells_by_name=state.spells,
+            enemy_names=[name],
+            difficulty=0,
+        )
+
+    plain = sorted(
+        (enemy(n)[0] for n in state.monsters),
+        key=lambda em: -em.stats.level,
+    )
+    plain = [em for em in plain if _is_plain_duel(party[:1], [em], policy_always_fight)]
+    step = max(1, len(plain) // max(1, args.enemies))
+    names = [em.name for em in plain[::step][: args.enemies]]
+    print(f"plain duels: {len(plain)}/{len(state.monsters)} monsters; checking {', '.join(names)}")
+
+    bad = 0
+    t_exact = t_mc = 0.0
+    for pm in party:
+        for name in names:
+            t0 = time.perf_counter()
+            ex = simulate_many_battles_multi_party(
+                [pm], [name], args.trials, state=state, exact=True
+            )
+            t1 = time.perf_counter()
+            mc = simulate_many_battles_multi_party(
+                [pm], [name], args.trials, seed=args.seed, state=state, exact=False,
+                confidence=0.9999,
+            )
+            t2 = time.perf_counter()
+            t_exact += t1 - t0
+            t_mc += t2 - t1
+
+            p = ex["win_rate_char"]
+            se = math.sqrt(p * (1 - p) / args.trials)
+            z = (mc["win_rate_char"] - p) / se if se > 0 else 0.0
+            if se == 0 and mc["win_rate_char"] != p:
+                z = math.inf
+            lo, hi = mc["average_turns_ci"]
+            ok = ex["exact"] and abs(z) <= 4 and lo - 1e-9 <= ex["average_turns"] <= hi + 1e-9
+            bad += not ok
+            print(
+                f"{'OK' if ok else 'NG'} {pm.name:8s} {name:20s} "
+                f"win {p:.4f} / mc {mc['win_rate_char']:.4f} (z={z:+.2f})  "
+                f"turns {ex['average_turns']:.2f} / mc [{lo:.2f}, {hi:.2f}]"
+            )
+
+    # 条件外はモンテカルロ
+    special = next(
+        n for n, m in state.monsters.items()
+        if m.get("Special Attacks") and (m.get("SpecialAttackRate") or 0) > 0
+    )
+    for members, enemies in ((party[:2], names[:1]), (party[:1], [special])):
+        res = simulate_many_battles_multi_party(members, enemies, 10, seed=args.seed, state=state)
+        fallback = not res["exact"]
+        bad += not fallback
+        print(
+            f"{'OK' if fallback else 'NG'} fallback {len(members)} vs {', '.join(enemies)}: "
+            f"exact={res['exact']}"
+        )
+
+    n = len(party) * len(names)
+    print(
+        f"per matchup: exact {t_exact / n * 1e3:6.1f} ms  monte carlo ({args.trials} trials) "
+        f"{t_mc / n * 1e3:7.1f} ms  (x{t_mc / max(t_exact, 1e-9):.0f})"
+    )
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
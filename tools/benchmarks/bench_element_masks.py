@@ -0,0 +1,165 @@
+# ============================================================
+# bench_element_masks: 属性相性のビットマスク判定と従来の set 判定の一致確認・速度比較（マイクロベンチ）
+
+# 使い方: python tools/benchmarks/bench_element_masks.py [--repeat 20]
+#   1) 全モンスター × 攻撃属性（武器の Element・魔法の属性・組み合わせ）について、
+#      element_relation_and_hits_for_monster が従来の set 実装（_legacy_generic）と同じ (relation, hits) を返すか確認する
+#   2) 防具の ElementalResist から作ったキャラ耐性 × 攻撃属性で element_relation_and_hits_for_char も同様に確認する
+#      （従来実装は frozenset を parse_elements が捨てていたので、list にして渡したものと比べる）
+#   3) 1回あたりの判定時間を比べる
+#   不一致があれば終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import itertools
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.char_build import build_party_members_from_save  # noqa: E402
+from combat.elements import (  # noqa: E402
+    _expand_synonyms,
+    element_relation_and_hits_for_char,
+    element_relation_and_hits_for_monster,
+    parse_elements,
+)
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.spell_repo import spell_from_json  # noqa: E402
+from combat.verbosity import QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+
+def _legacy_generic(attack_elements, *, weak=(), resist=(), absorb=(), null=()):
+    """ビットマスク化する前の element_relation_and_hits_generic"""
+    elems = _expand_synonyms(parse_elements(attack_elements))
+    if not elems:
+        return "normal", []
+
+    absorbs = _expand_synonyms(parse_elements(absorb))
+    nulls = _expand_synonyms(parse_elements(null))
+    resists = _expand_synonyms(parse_elements(resist))
+    weaks = _expand_synonyms(parse_elements(weak))
+
+    if elems & absorbs:
+        return "absorb", sorted(elems & absorbs)
+    if elems & nulls:
+        return "null", sorted(elems & nulls)
+    if elems & weaks:
+        return "weak", sorted(elems & weaks)
+    if elems & resists:
+        return "resist", sorted(elems & resists)
+    return "normal", []
+
+
+def _legacy_for_monster(monster, attack_elements):
+    ev = monster.get("ElementalVulnerability", {}) or {}
+    return _legacy_generic(
+        parse_elements(attack_elements),
+        weak=parse_elements(ev.get("Weakness")),
+        resist=parse_elements(ev.get("Resistance")),
+        absorb=parse_elements(ev.get("Absorb")),
+        null=parse_elements(ev.get("Null")),
+    )
+
+
+def _legacy_for_char(char, attack_elements):
+    return _legacy_generic(
+        attack_elements,
+        weak=list(char.elemental_weaks),
+        resist=list(char.elemental_resists),
+        absorb=list(char.elemental_absorbs),
+        null=list(char.elemental_nulls),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    with verbosity(QUIET):
+        party = build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=LevelTable(str(ROOT / "assets/data/level_exp.csv")),
+        )
+    stats = party[0].stats
+
+    # 攻撃属性：武器の Element、魔法の属性、それらの2つ組
+    singles = {w.get("Element") for w in state.weapons.values() if w.get("Element")}
+    attacks = [[e] for e in sorted(singles)]
+    attacks += [spell_from_json(sj).elements for sj in state.spells.values()]
+    attacks += [list(p) for p in itertools.combinations(sorted(singles), 2)]
+    attacks += [None, [], "-", "Fire, Ice", ["wind"], ["thunder"]]
+
+    monsters = list(state.monsters.values())
+    resist_sets = {
+        frozenset(parse_elements(a.get("ElementalResist"))) for a in state.armors.values()
+    }
+    chars = [dataclasses.replace(stats, elemental_resists=r) for r in resist_sets]
+    chars.append(
+        dataclasses.replace(
+            stats,
+            elemental_resists=frozenset({"fire"}),
+            elemental_nulls=frozenset({"ice", "air"}),
+            elemental_weaks=frozenset({"holy"}),
+            elemental_absorbs=frozenset({"dark"}),
+        )
+    )
+
+    # --- 1) 2) 一致確認 ---
+    mismatches = checked = 0
+    for m in monsters:
+        for atk in attacks:
+            checked += 1
+            old = _legacy_for_monster(m, atk)
+            new = element_relation_and_hits_for_monster(m, atk)
+            if old != new:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"[NG] {m.get('name')} {atk}: {old} / {new}")
+    for ch in chars:
+        for atk in attacks:
+            checked += 1
+            old = _legacy_for_char(ch, atk)
+            new = element_relation_and_hits_for_char(ch, atk)
+            if old != new:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"[NG] char {set(ch.elemental_resists)} {atk}: {old} / {new}")
+    print(f"parity: {checked - mismatches}/{checked} match")
+
+    # --- 3) 速度 ---
+    def bench(fn, targets):
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            for t in targets:
+                for atk in attacks:
+                    fn(t, atk)
+        dt = time.perf_counter() - t0
+        n = args.repeat * len(targets) * len(attacks)
+        return dt / n * 1e6
+
+    old_m = bench(_legacy_for_monster, monsters)
+    new_m = bench(element_relation_and_hits_for_monster, monsters)
+    old_c = bench(_legacy_for_char, chars)
+    new_c = bench(element_relation_and_hits_for_char, chars)
+    print(f"monster: set {old_m:5.2f} us/call  mask {new_m:5.2f} us/call  (x{old_m / new_m:.1f})")
+    print(f"char   : set {old_c:5.2f} us/call  mask {new_c:5.2f} us/call  (x{old_c / new_c:.1f})")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+# ============================================================
+# bench_equip_index: 装備索引（equip_index）と従来の装備候補列挙・装備可否判定の一致確認・速度比較
+
+# 使い方: python tools/benchmarks/bench_equip_index.py [--repeat 200]
+#   1) 全ジョブ × 全スロットについて、索引の候補が従来の build_equip_candidates（scenes/menu。
+#      マスタを毎回全件なめて allowed_by_job / is_two_handed_weapon で絞る）と同じ並びになるか確認する
+#   2) 全ジョブ × 全武器・防具で can_equip_item が allowed_by_job と一致するか、
+#      strip_illegal_equipment_for_job が「スロットの候補に無いものだけを外す」か確認する
+#   3) 索引と JobProfile（job.raw の Weapons / Armors）の装備可否がマスタにある名前で一致するか確認する
+#      （EquippedBy が空のもの＝全ジョブ可は job.raw 側に載っていないので、名前だけ表示して比べない）
+#   4) 候補一覧1回・ジョブ変更時の装備チェック1回あたりの時間を比べる
+#   不一致があれば終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.char_build import can_equip_item, strip_illegal_equipment_for_job  # noqa: E402
+from combat.constants import JOB_EQUIP_CODE  # noqa: E402
+from combat.equip_index import (  # noqa: E402
+    EQUIP_SLOTS,
+    SLOT_ARMOR_TYPE,
+    job_equip_index,
+)
+from combat.job_profile import job_profile  # noqa: E402
+from combat.models import EquipmentSet  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from utils.name_normalize import normalize_name  # noqa: E402
+
+
+def _legacy_code(job):
+    """scenes/menu の actor_job_code"""
+    s = (getattr(job, "slug", "") or "").strip()
+    if s and len(s) <= 3:
+        return s
+    n = (getattr(job, "name", "") or "").strip()
+    return JOB_EQUIP_CODE.get(n, n)
+
+
+def _legacy_allowed(job, item):
+    """scenes/menu の allowed_by_job"""
+    allow = item.get("EquippedBy") or []
+    if not allow:
+        return True
+    return _legacy_code(job).lower() in {str(x).lower() for x in allow}
+
+
+def _legacy_candidates(job, slot, weapons, armors):
+    """索引導入前の scenes/menu.build_equip_candidates"""
+    out = [("none", "はずす", None)]
+    if slot in ("main_hand", "off_hand"):
+        for name, w in weapons.items():
+            if not _legacy_allowed(job, w):
+                continue
+            if slot == "off_hand" and "Two-Handed" in w:
+                continue
+            out.append(("weapon", name, w))
+        if slot == "off_hand":
+            for name, a in armors.items():
+                if a.get("ArmorType") == "Shield" and _legacy_allowed(job, a):
+                    out.append(("armor", name, a))
+        return out
+    for name, a in armors.items():
+        if a.get("ArmorType") == SLOT_ARMOR_TYPE[slot] and _legacy_allowed(job, a):
+            out.append(("armor", name, a))
+    return out
+
+
+def _new_candidates(job, slot, weapons, armors):
+    index = job_equip_index(job, weapons, armors)
+    return [("none", "はずす", None)] + [(c.kind, c.name, c.data) for c in index.candidates(slot)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    weapons, armors = state.weapons, state.armors
+    jobs = list(state.jobs_by_name.values())
+
+    # --- 1) 候補の一致 ---
+    mismatches = checked = 0
+    for job in jobs:
+        for slot in EQUIP_SLOTS:
+            checked += 1
+            old = _legacy_candidates(job, slot, weapons, armors)
+            new = _new_candidates(job, slot, weapons, armors)
+            if old != new:
+                mismatches += 1
+                print(f"[NG] candidates {job.name} {slot}: {len(old)} / {len(new)}")
+    print(f"candidates parity: {checked - mismatches}/{checked} match")
+
+    # --- 2) can_equip_item / strip_illegal_equipment_for_job ---
+    bad = 0
+    items = list(weapons.values()) + list(armors.values())
+    for job in jobs:
+        for item in items:
+            if can_equip_item(job, item) != _legacy_allowed(job, item):
+                bad += 1
+                print(f"[NG] can_equip_item {job.name}: {item.get('name')}")
+
+    # 全ジョブの候補をスロットごとに集め、どのジョブで外れるべきかを候補一覧から決める
+    pool = {slot: [] for slot in EQUIP_SLOTS}
+    for job in jobs:
+        for slot in EQUIP_SLOTS:
+            for _, name, _ in _legacy_candidates(job, slot, weapons, armors)[1:]:
+                if name not in pool[slot]:
+                    pool[slot].append(name)
+    loadouts = []
+    for i in range(max(len(names) for names in pool.values())):
+        picks = {slot: names[i % len(names)] for slot, names in pool.items() if names}
+        loadouts.append(EquipmentSet(**picks))
+    loadouts.append(EquipmentSet(main_hand="No Such Blade", head="No Such Helm"))
+    loadouts.append(EquipmentSet(main_hand="book of fire", off_hand=" leather shield "))
+
+    strip_checked = 0
+    for job in jobs:
+        legal = {
+            slot: {name for _, name, _ in _legacy_candidates(job, slot, weapons, armors)[1:]}
+            for slot in EQUIP_SLOTS
+        }
+        for eq in loadouts:
+            strip_checked += 1
+            new_eq, removed = strip_illegal_equipment_for_job(eq, job, weapons, armors)
+            for slot in EQUIP_SLOTS:
+                name = getattr(eq, slot)
+                keep = getattr(new_eq, slot)
+                expect_keep = name is None or normalize_name(name) in {
+                    normalize_name(n) for n in legal[slot]
+                }
+                if slot in ("head", "body", "arms") and name and name not in armors:
+                    expect_keep = True  # 防具データに無いものは外さない
+                if (keep is not None or name is None) != expect_keep:
+                    bad += 1
+                    print(f"[NG] strip {job.name} {slot}: {name!r} -> {keep!r}")
+            if len(removed) != sum(getattr(eq, s) != getattr(new_eq, s) for s in EQUIP_SLOTS):
+                bad += 1
+                print(f"[NG] strip removed list {job.name}: {removed}")
+    mismatches += bad
+    print(
+        f"can_equip / strip parity: {'OK' if not bad else f'{bad} NG'} "
+        f"({strip_checked} loadouts)"
+    )
+
+    # --- 3) JobProfile（job.raw の Weapons / Armors）との整合 ---
+    bad = 0
+    open_items = sorted(n for n, d in {**weapons, **armors}.items() if not d.get("EquippedBy"))
+    for job in jobs:
+        prof = job_profile(job)
+        index = job_equip_index(job, weapons, armors)
+        for name, w in weapons.items():
+            if not w.get("EquippedBy"):
+                continue
+            if index.can_equip("main_hand", name) != prof.can_equip_weapon(name):
+                bad += 1
+                print(f"[NG] profile {job.name} weapon {name}")
+        for slot in ("off_hand", "head", "body", "arms"):
+            for name, a in armors.items():
+                if a.get("ArmorType") != SLOT_ARMOR_TYPE[slot] or not a.get("EquippedBy"):
+                    continue
+                if index.can_equip(slot, name) != prof.can_equip_armor(name):
+                    bad += 1
+                    print(f"[NG] profile {job.name} {slot} {name}")
+    mismatches += bad
+    print(
+        f"JobProfile consistency: {'OK' if not bad else f'{bad} NG'} "
+        f"(EquippedBy 空＝全ジョブ可で比較対象外: {', '.join(open_items) or '-'})"
+    )
+
+    # --- 4) 速度 ---
+    def bench(fn):
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            for job in jobs:
+                for slot in EQUIP_SLOTS:
+                    fn(job, slot, weapons, armors)
+        return (time.perf_counter() - t0) / (args.repeat * len(jobs) * len(EQUIP_SLOTS)) * 1e6
+
+    t_old = bench(_legacy_candidates)
+    t_new = bench(_new_candidates)
+    print(
+        f"candidates: scan {t_old:6.1f} us/list  index {t_new:5.2f} us/list  "
+        f"(x{t_old / t_new:.0f})"
+    )
+
+    eq = loadouts[0]
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for job in jobs:
+            strip_illegal_equipment_for_job(eq, job, weapons, armors)
+    t_strip = (time.perf_counter() - t0) / (args.repeat * len(jobs)) * 1e6
+    print(f"job change: strip_illegal_equipment_for_job {t_strip:5.2f} us/call")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+# ============================================================
+# bench_equip_optimizer: 装備探索の寄与表評価と compute_character_final_stats の一致確認・速度比較
+
+# 使い方: python tools/benchmarks/bench_equip_optimizer.py [--samples 2000] [--enemies Kunoichi,Sleipnir]
+#   1) 全ジョブ × パーティ全員について、装備可能な候補からランダムに組んだ EquipmentSet で
+#      SlotTable.final_stats と compute_character_final_stats の結果が一致するか確認する
+#   2) 1候補あたりの評価時間を比べる（compute_character_final_stats は寄与表・メモ経由）
+#   3) パーティ全員について optimize_equipment（damage / survival）を回し、枝刈り前後の組み合わせ数と時間を出す
+#   不一致があれば終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import os
+import sys
+import time
+from pathlib import Path
+from random import Random
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.char_build import (  # noqa: E402
+    build_party_members_from_save,
+    compute_character_final_stats,
+)
+from combat.equip_optimizer import (  # noqa: E402
+    EQUIP_SLOTS,
+    SlotTable,
+    legal_candidates,
+    optimize_equipment,
+)
+from combat.models import EquipmentSet  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.verbosity import QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+DEFAULT_ENEMIES = "Kunoichi,Sleipnir"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument("--enemies", default=DEFAULT_ENEMIES)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    with verbosity(QUIET):
+        party = build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=LevelTable(str(ROOT / "assets/data/level_exp.csv")),
+        )
+
+    t0 = time.perf_counter()
+    table = SlotTable.from_master(state.weapons, state.armors)
+    t_table = time.perf_counter() - t0
+    print(f"SlotTable.from_master {t_table * 1000:.1f} ms")
+
+    # --- 1) 一致確認 ---
+    rng = Random(args.seed)
+    samples = []
+    for job in state.jobs_by_name.values():
+        legal = legal_candidates(job, table)
+        # 左手は武器も混ぜる（final_stats が武器・盾どちらでも同じ結果になるか）
+        off_pool = legal["off_hand"] + legal["main_hand"]
+        for pm in party:
+            for _ in range(max(1, args.samples // (len(state.jobs_by_name) * len(party)))):
+                eq = EquipmentSet(
+                    main_hand=rng.choice(legal["main_hand"]),
+                    off_hand=rng.choice(off_pool),
+                    head=rng.choice(legal["head"]),
+                    body=rng.choice(legal["body"]),
+                    arms=rng.choice(legal["arms"]),
+                )
+                samples.append((pm.base, eq, job.name))
+
+    mismatches = 0
+    with verbosity(QUIET):
+        t0 = time.perf_counter()
+        expected = [
+            compute_character_final_stats(base, eq, state.weapons, state.armors, job_name=j)
+            for base, eq, j in samples
+        ]
+        t_full = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    got = [table.final_stats(base, eq, j) for base, eq, j in samples]
+    t_table_eval = time.perf_counter() - t0
+
+    for (base, eq, j), a, b in zip(samples, expected, got):
+        if dataclasses.asdict(a) != dataclasses.asdict(b):
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"[NG] {j} {eq}")
+
+    n = len(samples)
+    print(
+        f"parity: {n - mismatches}/{n} match  "
+        f"compute_character_final_stats {t_full / n * 1e6:7.1f} us/eq  "
+        f"SlotTable.final_stats {t_table_eval / n * 1e6:6.1f} us/eq  "
+        f"(x{t_full / max(t_table_eval, 1e-9):.0f})"
+    )
+
+    # --- 3) 探索 ---
+    names = [x.strip() for x in args.enemies.split(",") if x.strip()]
+    for pm in party:
+        for objective in ("damage", "survival"):
+            t0 = time.perf_counter()
+            res = optimize_equipment(
+                pm, enemy_names=names, objective=objective, state=state, table=table
+            )
+            elapsed = time.perf_counter() - t0
+            eq = res.equipment
+            print(
+                f"{pm.name:<7} {pm.job.name:<10} {objective:<8} {elapsed * 1000:7.1f} ms "
+                f"space={res.search_space:>9} -> {res.combinations:>6} "
+                f"dmg={res.expected_damage:7.1f} taken={res.expected_damage_taken:6.1f}  "
+                + " / ".join(str(getattr(eq, s) or "-") for s in EQUIP_SLOTS)
+            )
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+# ============================================================
+# bench_growth_tables: ジョブ成長表（JobGrowthTable）と補完関数の一致確認・速度比較
+
+# 使い方: python tools/benchmarks/bench_growth_tables.py [--repeat 20]
+#   1) 全ジョブ × Lv0〜100 について、成長表の stats_at / max_mp_at / expected_max_hp_at が
+#      interpolate_stats / interpolate_mp / expected_max_hp_from_vit_table と一致するか確認する
+#      （HP は範囲外の ValueError・レベル欠けの KeyError も同じになるか）
+#   2) 全ジョブ × Lv1〜99 を引く時間を、補完関数（毎回 dict 化 + 補完 + Vit 累積）と成長表で比べる
+#   3) build_party_members_from_save 1回あたりの時間を出す
+#   不一致があれば終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.char_build import (  # noqa: E402
+    build_party_members_from_save,
+    compile_job_growth,
+    expected_max_hp_from_vit_table,
+    interpolate_mp,
+    interpolate_stats,
+    job_growth,
+)
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.verbosity import QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+
+def _old_lookup(rows, level):
+    """成長表導入前の character_from_party_entry と同じ手順（毎回 dict 化して補完）"""
+    levels = {row["Level"]: row for row in rows}
+    s = interpolate_stats(levels, level)
+    hp = expected_max_hp_from_vit_table(levels, level, initial_hp_lv1=32, rand_expect=1.25)
+    mp = interpolate_mp(levels, level)
+    return (
+        (s["Str"], s["Agi"], s["Vit"], s["Int"], s["Mnd"]),
+        hp,
+        tuple(int(mp.get(f"L{i}MP", 0) or 0) for i in range(1, 9)),
+    )
+
+
+def _new_lookup(growth, level):
+    return (
+        growth.stats_at(level),
+        growth.expected_max_hp_at(level),
+        tuple(growth.max_mp_at(level).values()),
+    )
+
+
+def _hp_outcome(fn):
+    try:
+        return fn()
+    except (KeyError, ValueError) as e:
+        return (type(e).__name__, str(e))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    jobs = list(state.jobs_by_name.values())
+
+    t0 = time.perf_counter()
+    for job in jobs:
+        compile_job_growth(job.raw["StatsByLevel"])
+    t_compile = time.perf_counter() - t0
+    print(f"compile_job_growth x{len(jobs)} jobs {t_compile * 1000:.1f} ms")
+
+    # --- 1) 一致確認 ---
+    mismatches = checked = 0
+    for job in jobs:
+        rows = job.raw["StatsByLevel"]
+        levels = {row["Level"]: row for row in rows}
+        growth = job_growth(job)
+        for lv in range(0, 101):
+            checked += 1
+            s = interpolate_stats(levels, lv)
+            mp = interpolate_mp(levels, lv)
+            ok = growth.stats_at(lv) == (s["Str"], s["Agi"], s["Vit"], s["Int"], s["Mnd"])
+            ok &= tuple(growth.max_mp_at(lv).values()) == tuple(
+                int(mp.get(f"L{i}MP", 0) or 0) for i in range(1, 9)
+            )
+            old_hp = _hp_outcome(lambda: expected_max_hp_from_vit_table(levels, lv))
+            new_hp = _hp_outcome(lambda: growth.expected_max_hp_at(lv))
+            ok &= old_hp == new_hp
+            if not ok:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"[NG] {job.name} Lv{lv}: hp {old_hp} / {new_hp}")
+    print(f"parity: {checked - mismatches}/{checked} match")
+
+    # --- 2) 速度比較（HP が引けるレベルだけ） ---
+    cases = []
+    for job in jobs:
+        growth = job_growth(job)
+        for lv in range(1, 100):
+            if growth.expected_hp[lv] is not None:
+                cases.append((job.raw["StatsByLevel"], growth, lv))
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for rows, _growth, lv in cases:
+            _old_lookup(rows, lv)
+    t_old = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for _rows, growth, lv in cases:
+            _new_lookup(growth, lv)
+    t_new = time.perf_counter() - t0
+
+    n = len(cases) * args.repeat
+    print(
+        f"lookup: interpolate {t_old / n * 1e6:7.1f} us/level  "
+        f"JobGrowthTable {t_new / n * 1e6:6.2f} us/level  (x{t_old / max(t_new, 1e-9):.0f})"
+    )
+
+    # --- 3) パーティ構築 ---
+    level_table = LevelTable(str(ROOT / "assets/data/level_exp.csv"))
+    with verbosity(QUIET):
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            build_party_members_from_save(
+                save=state.save,
+                weapons=state.weapons,
+                armors=state.armors,
+                jobs_by_name=state.jobs_by_name,
+                level_table=level_table,
+            )
+        t_party = time.perf_counter() - t0
+    print(f"build_party_members_from_save {t_party / args.repeat * 1000:.2f} ms/party")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+# ============================================================
+# bench_headless_rounds: ヘッドレス戦闘のラウンド処理速度（rounds/sec）を verbosity 別に計測
+
+# 使い方: python tools/benchmarks/bench_headless_rounds.py [--battles 300] [--enemies A,B,C] [--policy all|fight|mixed] [--repeat 3]
+#   DEBUG  : 従来どおり（デバッグ print は os.devnull へ捨てて計測。端末出力のコストは含まない）
+#   NORMAL : 戦闘ログ文字列は作るが print しない
+#   QUIET  : ログ文字列も print もなし（events のみ）
+#   ポリシー:
+#     fight : 全員「たたかう」（物理の経路だけ）
+#     mixed : mcts_planner.build_member_actions の候補（魔法・アイテム・ジョブコマンド）から乱数で選ぶ
+#             （魔法・アイテム・状態異常・敵行動の経路のログも通る）
+#   計測はラウンド解決（simulate_one_round_multi_party）の CPU 時間だけ：試行ごとの複製は先に作り、ポリシーの時間は差し引く
+#   （他プロセスの負荷で揺れないよう time.process_time で測り、各レベル --repeat 回の最速を採る）
+#   出力レベルで勝敗・ラウンド数が変わったら（ログの有無が乱数を消費していたら）終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import copy
+import dataclasses
+import os
+import sys
+import time
+from pathlib import Path
+from random import Random
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.battle_sim import (  # noqa: E402
+    clone_enemies_for_trial,
+    clone_party_for_trial,
+    policy_always_fight,
+    run_battle_headless,
+)
+from combat.char_build import build_party_members_from_save  # noqa: E402
+from combat.enemy_build import build_enemies  # noqa: E402
+from combat.job_profile import job_profile  # noqa: E402
+from combat.magic_menu import (  # noqa: E402
+    allowed_spell_names_for_job,
+    build_magic_list,
+    expand_spells_for_summons,
+)
+from combat.mcts_planner import build_member_actions  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.verbosity import DEBUG, NORMAL, QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+DEFAULT_ENEMIES = "Kunoichi,Shadow Master,Sleipnir"
+
+
+class MixedPolicy:
+    """build_member_actions の候補から乱数で1つずつ選ぶ（魔法・アイテム・ジョブコマンドを満遍なく通す）"""
+
+    def __init__(self, spells, items_by_name):
+        self.spells = spells
+        self.items_by_name = items_by_name
+        self.save = None
+        self._magic_lists = {}
+
+    def bind_state(self, state) -> None:
+        self.save = state.save
+
+    def _magic_list_for(self, pm):
+        if pm.job.name not in self._magic_lists:
+            self._magic_lists[pm.job.name] = build_magic_list(
+                self.spells,
+                allowed_names=allowed_spell_names_for_job(pm.job),
+                cast_code=job_profile(pm.job).cast_code,
+            )
+        return self._magic_lists[pm.job.name]
+
+    def __call__(self, party_members, enemies, rng):
+        return [
+            rng.choice(
+                build_member_actions(
+                    i,
+                    party_members,
+                    enemies,
+                    spells_by_name=self.spells,
+                    items_by_name=self.items_by_name,
+                    save=self.save,
+                    magic_list=self._magic_list_for(pm),
+                )
+            )
+            for i, pm in enumerate(party_members)
+        ]
+
+
+class _TimedPolicy:
+    """ポリシーの所要時間を測って差し引けるようにする（比べたいのはラウンド解決の時間なので）"""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.elapsed = 0.0
+
+    def bind_state(self, state) -> None:
+        bind_state = getattr(self.policy, "bind_state", None)
+        if callable(bind_state):
+            bind_state(state)
+
+    def __call__(self, party_members, enemies, rng):
+        t0 = time.process_time()
+        actions = self.policy(party_members, enemies, rng)
+        self.elapsed += time.process_time() - t0
+        return actions
+
+
+def bench(level: int, *, state, party, enemies, spells, policy, n_battles: int, seed: int):
+    """
+    同じシード列で n_battles 戦を回し、(総ラウンド数, 経過秒, 決着の列) を返す。
+    試行ごとの複製（save の deepcopy など）は計測の外で先に作り、ポリシーの時間は差し引く
+    """
+    trials = [
+        (
+            clone_party_for_trial(party),
+            clone_enemies_for_trial(enemies),
+            dataclasses.replace(state, save=copy.deepcopy(state.save)),
+        )
+        for _ in range(n_battles)
+    ]
+    timed = _TimedPolicy(policy)
+    rounds_total = 0
+    outcomes = []
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        with contextlib.redirect_stdout(devnull), verbosity(level):
+            t0 = time.process_time()
+            for i, (trial_party, trial_enemies, trial_state) in enumerate(trials):
+                end, rounds = run_battle_headless(
+                    trial_party,
+                    trial_enemies,
+                    trial_state,
+                    policy=timed,
+                    rng=Random(seed + i),
+                    spells_by_name=spells,
+                    items_by_name=state.items_by_name,
+                )
+                rounds_total += rounds
+                outcomes.append((end, rounds))
+            elapsed = time.process_time() - t0 - timed.elapsed
+    return rounds_total, elapsed, outcomes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--battles", type=int, default=300)
+    parser.add_argument("--enemies", default=DEFAULT_ENEMIES)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--policy", choices=("all", "fight", "mixed"), default="all")
+    parser.add_argument("--repeat", type=int, default=3, help="各レベルを何回測って最速を採るか")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    spells = expand_spells_for_summons(state.spells)
+    with verbosity(QUIET):
+        party = build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=LevelTable(str(ROOT / "assets/data/level_exp.csv")),
+        )
+    enemies = build_enemies(
+        enemy_defs_by_name=state.monsters,
+        spells_by_name=state.spells,
+        enemy_names=[n.strip() for n in args.enemies.split(",") if n.strip()],
+    )
+
+    policies = {
+        "fight": policy_always_fight,
+        "mixed": MixedPolicy(spells, state.items_by_name),
+    }
+    names = list(policies) if args.policy == "all" else [args.policy]
+
+    print(f"enemies={args.enemies} battles={args.battles}")
+    mismatches = 0
+    for policy_name in names:
+        print(f"[policy={policy_name}]")
+        levels = (("DEBUG", DEBUG), ("NORMAL", NORMAL), ("QUIET", QUIET))
+        best = {}
+        base_outcomes = None
+        for _ in range(max(1, args.repeat)):
+            # レベルを交互に回して、温まり方・揺らぎの偏りを減らす
+            for name, level in levels:
+                rounds, elapsed, outcomes = bench(
+                    level,
+                    state=state,
+                    party=party,
+                    enemies=enemies,
+                    spells=spells,
+                    policy=policies[policy_name],
+                    n_battles=args.battles,
+                    seed=args.seed,
+                )
+                if base_outcomes is None:
+                    base_outcomes = outcomes
+                elif outcomes != base_outcomes:
+                    mismatches += 1
+                    print(f"[NG] {name}: 決着が DEBUG と異なる")
+                if name not in best or elapsed < best[name][1]:
+                    best[name] = (rounds, elapsed)
+        base_rps = None
+        for name, _level in levels:
+            rounds, elapsed = best[name]
+            rps = rounds / elapsed if elapsed > 0 else 0.0
+            if base_rps is None:
+                base_rps = rps
+            print(
+                f"{name:<6} rounds={rounds:>6} {elapsed:7.3f}s "
+                f"{rps:10.1f} rounds/sec (x{rps / base_rps:.2f})"
+            )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
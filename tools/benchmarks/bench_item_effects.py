@@ -0,0 +1,174 @@
+# ============================================================
+# bench_item_effects: アイテム効果記述子（ItemEffect）と使用ごとの Effect テキスト解釈の一致確認・速度比較
+
+# 使い方: python tools/benchmarks/bench_item_effects.py [--repeat 2000]
+#   1) 全アイテムについて、ItemEffect の各欄が従来の判定（Effect / SpellEffect / Name の部分一致）と一致するか確認する
+#      （攻撃・吸収・即死・味方への効果・治す/与える状態異常・メニュー分類・SpellInfo）
+#   2) 全アイテム × 状態異常パターンで apply_item_effect_to_actor を回し、例外が出ないことを確認する
+#   3) 使用1回あたりの判定時間（従来：毎回テキスト解釈 + spell_from_item / 新：item_effect）を比べる
+#   不一致があれば終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import copy
+import dataclasses
+import os
+import sys
+import time
+from pathlib import Path
+from random import Random
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.char_build import build_party_members_from_save  # noqa: E402
+from combat.enums import Status  # noqa: E402
+from combat.item_effects import (  # noqa: E402
+    apply_item_effect_to_actor,
+    item_effect,
+    spell_from_item,
+)
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.verbosity import QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+
+def _legacy_describe(item_json, spell_as_dict=True):
+    """ItemEffect 導入前に使用のたびに行っていた判定（turn_logic / item_effects / input_ui）"""
+    spell_info = item_json.get("SpellInfo") or {}
+    effect_raw = spell_info.get("Effect") or ""
+    e = effect_raw.lower()
+    name_lower = (item_json.get("Name") or "").strip().lower()
+    spell_effect = (item_json.get("SpellEffect") or "").strip().lower()
+    is_drain = (
+        "absorb hp" in e
+        or str(item_json.get("SpellEffect") or "").lower() == "drain"
+        or "lilith's kiss" in (item_json.get("Name") or "").lower()
+    )
+    if "enhance accuracy and attack multiplier" in e or spell_effect == "haste" or name_lower == "bacchus's cider":
+        action = "haste"
+    elif "enhance defense and magic defense" in e or spell_effect == "protect" or name_lower == "turtle shell":
+        action = "protect"
+    elif "restore target's hp" in e:
+        action = "heal"
+    elif "restore target to full hp and mp" in e:
+        action = "full_restore"
+    elif "revive from ko" in e:
+        action = "revive"
+    elif any(k in e for k in ("cure poison", "cure blind", "cure or inflict mini", "cure silence", "cure toad", "petrification")):
+        action = "cure"
+    else:
+        action = "none"
+    if "revive from ko" in e:
+        anywhere = "Revive"
+    elif "cure " in e:
+        anywhere = "Cure"
+    elif "restore" in e:
+        anywhere = "Restore"
+    else:
+        anywhere = "Other"
+    if "deal" in e and "damage" in e:
+        combat = "Damage"
+    elif "inflict " in e:
+        combat = "Inflict"
+    else:
+        combat = "Support"
+    return (
+        ("deal" in e and "damage" in e) or "inflict ko" in e or is_drain,
+        is_drain,
+        "inflict ko" in e,
+        action,
+        int(item_json.get("Value", 0) or 0),
+        anywhere,
+        combat,
+        dataclasses.asdict(spell_from_item(item_json)) if spell_as_dict else spell_from_item(item_json),
+    )
+
+
+def _describe(eff, spell_as_dict=True):
+    return (
+        eff.is_attack,
+        eff.is_drain,
+        eff.inflicts_ko,
+        eff.action,
+        eff.heal_amount,
+        eff.anywhere_category,
+        eff.combat_category,
+        dataclasses.asdict(eff.spell) if spell_as_dict else eff.spell,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    with verbosity(QUIET):
+        party = build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=LevelTable(str(ROOT / "assets/data/level_exp.csv")),
+        )
+    items = list(state.items_by_name.values())
+
+    # --- 1) 記述子の一致 ---
+    mismatches = 0
+    for it in items:
+        old = _legacy_describe(it)
+        new = _describe(item_effect(it))
+        if old != new:
+            mismatches += 1
+            print(f"[NG] {it.get('Name')}: {old[:7]} / {new[:7]}")
+    print(f"descriptor parity: {len(items) - mismatches}/{len(items)} match")
+
+    # --- 2) 全アイテムを味方に使う ---
+    pm = party[0]
+    patterns = [set(), {Status.POISON, Status.BLIND}, {Status.PETRIFY}, {Status.PARTIAL_PETRIFY}, {Status.KO}]
+    used = 0
+    for it in items:
+        for sts in patterns:
+            target = copy.deepcopy(pm.state)
+            target.statuses = set(sts)
+            if Status.KO in sts:
+                target.hp = 0
+            logs = []
+            apply_item_effect_to_actor(
+                it,
+                target,
+                target_name=pm.name,
+                max_hp=pm.stats.max_hp,
+                logs=logs,
+                target_stats=copy.deepcopy(pm.stats),
+                rng=Random(1),
+            )
+            used += 1
+    print(f"apply_item_effect_to_actor: {used} uses OK")
+
+    # --- 3) 速度 ---
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for it in items:
+            _legacy_describe(it, spell_as_dict=False)
+    t_old = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for it in items:
+            _describe(item_effect(it), spell_as_dict=False)
+    t_new = time.perf_counter() - t0
+    n = args.repeat * len(items)
+    print(
+        f"per use: parse {t_old / n * 1e6:6.2f} us/item  "
+        f"ItemEffect {t_new / n * 1e6:5.2f} us/item  (x{t_old / max(t_new, 1e-9):.1f})"
+    )
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
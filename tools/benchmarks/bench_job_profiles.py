@@ -0,0 +1,122 @@
+# ============================================================
+# bench_job_profiles: ジョブの前計算（JobProfile）と job.raw の読み直しの一致確認・速度比較
+
+# 使い方: python tools/benchmarks/bench_job_profiles.py [--repeat 20000]
+#   1) 全ジョブについて、JobProfile のコマンド一覧・コマンド別SP・使用可能魔法・詠唱コード・装備可能名が
+#      従来の job.raw の読み方（ask_action_for_member / build_command_skillpoints /
+#      allowed_spell_names_for_job / JOB_CAST_CODE / apply_job_equipment_restrictions）と一致するか確認する
+#   2) legal_candidates の結果が「1件ずつ apply_job_equipment_restrictions に通す」従来の判定と一致するか確認する
+#   3) 行動1回あたりの SP 取得・魔法集合・コマンド一覧の取得時間を比べる
+#   不一致があれば終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.char_build import apply_job_equipment_restrictions  # noqa: E402
+from combat.constants import JOB_CAST_CODE  # noqa: E402
+from combat.equip_optimizer import _SLOT_ARMOR_TYPE, SlotTable, legal_candidates  # noqa: E402
+from combat.job_profile import job_profile  # noqa: E402
+from combat.magic_menu import allowed_spell_names_for_job  # noqa: E402
+from combat.models import EquipmentSet  # noqa: E402
+from combat.progression import _skillpoints_for_command  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+
+
+def _legacy_commands(raw):
+    return [raw[f"BattleCommand{i}"]["Command"] for i in range(1, 5) if raw.get(f"BattleCommand{i}")]
+
+
+def _legacy_skillpoints(raw):
+    m = {}
+    for i in range(1, 5):
+        bc = raw.get(f"BattleCommand{i}")
+        if not isinstance(bc, dict):
+            continue
+        cmd = bc.get("Command")
+        if isinstance(cmd, str) and cmd:
+            try:
+                m[cmd] = int(bc.get("SkillPoints", 0))
+            except (TypeError, ValueError):
+                m[cmd] = 0
+    return m
+
+
+def _legacy_spells(raw):
+    return {s.get("Name") for s in raw.get("Spells") or [] if s.get("Name")}
+
+
+def _legacy_legal(job, table):
+    def allowed(slot, name):
+        new_eq, _ = apply_job_equipment_restrictions(EquipmentSet(**{slot: name}), job)
+        return getattr(new_eq, slot) == name
+
+    out = {"main_hand": [None] + [n for n in table.weapon_names if allowed("main_hand", n)]}
+    for slot, armor_type in _SLOT_ARMOR_TYPE.items():
+        out[slot] = [None] + [
+            n for n in table.armor_names if table.armor_type(n) == armor_type and allowed(slot, n)
+        ]
+    return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    jobs = list(state.jobs_by_name.values())
+    table = SlotTable.from_master(state.weapons, state.armors)
+
+    # --- 1) 2) 一致確認 ---
+    mismatches = 0
+    for job in jobs:
+        raw = job.raw
+        p = job_profile(job)
+        checks = {
+            "commands": list(p.commands) == _legacy_commands(raw),
+            "skillpoints": dict(p.command_skillpoints) == _legacy_skillpoints(raw),
+            "spells": set(allowed_spell_names_for_job(job)) == _legacy_spells(raw),
+            "cast_code": p.cast_code == JOB_CAST_CODE.get(job.name),
+            "weapons": p.weapon_names == {w["Name"] for w in raw.get("Weapons", []) if w.get("Name")},
+            "armors": p.armor_names == {a["Name"] for a in raw.get("Armors", []) if a.get("Name")},
+            "legal_candidates": legal_candidates(job, table) == _legacy_legal(job, table),
+        }
+        for key, ok in checks.items():
+            if not ok:
+                mismatches += 1
+                print(f"[NG] {job.name}: {key}")
+    print(f"parity: {len(jobs) * 7 - mismatches}/{len(jobs) * 7} match")
+
+    # --- 3) 速度 ---
+    def bench(fn):
+        t0 = time.perf_counter()
+        for _ in range(args.repeat // len(jobs) + 1):
+            for job in jobs:
+                fn(job)
+        return (time.perf_counter() - t0) / ((args.repeat // len(jobs) + 1) * len(jobs)) * 1e6
+
+    rows = [
+        ("skillpoints", lambda j: _legacy_skillpoints(j.raw).get("Fight", 0), lambda j: _skillpoints_for_command(j, "Fight")),
+        ("spell set  ", lambda j: _legacy_spells(j.raw), allowed_spell_names_for_job),
+        ("commands   ", lambda j: _legacy_commands(j.raw), lambda j: job_profile(j).commands),
+    ]
+    for label, old_fn, new_fn in rows:
+        t_old = bench(old_fn)
+        t_new = bench(new_fn)
+        print(f"{label}: job.raw {t_old:6.2f} us/call  JobProfile {t_new:5.2f} us/call  (x{t_old / max(t_new, 1e-9):.0f})")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
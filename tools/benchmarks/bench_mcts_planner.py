@@ -0,0 +1,157 @@
+# ============================================================
+# bench_mcts_planner: MCTS 自動戦闘（combat.mcts_planner）の判断時間と強さを測る
+
+# 使い方: python tools/benchmarks/bench_mcts_planner.py [--battles 30] [--budget-ms 50] [--enemies A,B,C]
+#   1) 判断時間: plan() 1回あたりの壁時計時間（p50 / p95 / max）とイテレーション数。
+#                予算 + 1ラウンド分（解決は途中で止められない）を超えた回数も数える
+#   2) 強さ    : 同じシードの戦闘を policy_always_fight と MCTS でそれぞれ回し、
+#                勝率・平均ラウンド数・勝利時の残りHP割合を並べる
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import copy
+import dataclasses
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from random import Random
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.battle_sim import (  # noqa: E402
+    clone_enemies_for_trial,
+    clone_party_for_trial,
+    policy_always_fight,
+    run_battle_headless,
+)
+from combat.char_build import build_party_members_from_save  # noqa: E402
+from combat.enemy_build import build_enemies  # noqa: E402
+from combat.magic_menu import expand_spells_for_summons  # noqa: E402
+from combat.mcts_planner import MctsPlanner  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.verbosity import QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+DEFAULT_ENEMIES = "Kunoichi,Shadow Master,Sleipnir"
+
+
+class TimedPolicy:
+    """policy を包んで1回ごとの判断時間を記録する（bind_state はそのまま渡す）"""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.times_ms: list[float] = []
+        self.iterations: list[int] = []
+
+    def bind_state(self, state) -> None:
+        bind = getattr(self.policy, "bind_state", None)
+        if callable(bind):
+            bind(state)
+
+    def __call__(self, party, enemies, rng):
+        t0 = time.perf_counter()
+        actions = self.policy(party, enemies, rng)
+        self.times_ms.append((time.perf_counter() - t0) * 1000.0)
+        stats = getattr(self.policy, "last_stats", None)
+        if stats:
+            self.iterations.append(int(stats["iterations"]))
+        return actions
+
+
+def run_battles(state, party, enemies, spells, policy, n: int, seed: int):
+    wins = 0
+    rounds_total = 0
+    hp_on_win = []
+    for i in range(n):
+        p = clone_party_for_trial(party)
+        e = clone_enemies_for_trial(enemies)
+        trial_state = dataclasses.replace(state, save=copy.deepcopy(state.save))
+        with verbosity(QUIET):
+            end_reason, rounds = run_battle_headless(
+                p,
+                e,
+                trial_state,
+                policy=policy,
+                rng=Random(seed + i),
+                policy_rng=Random(seed + i + 1),
+                spells_by_name=spells,
+                items_by_name=trial_state.items_by_name,
+            )
+        rounds_total += rounds
+        if end_reason == "enemy_defeated":
+            wins += 1
+            hp_on_win.append(
+                sum(max(0, pm.state.hp) for pm in p) / sum(pm.max_hp for pm in p)
+            )
+    return wins / n, rounds_total / n, (statistics.mean(hp_on_win) if hp_on_win else 0.0)
+
+
+def _percentile(xs: list[float], q: float) -> float:
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(q * len(xs)))] if xs else 0.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--battles", type=int, default=30)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument("--enemies", default=DEFAULT_ENEMIES)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    spells = expand_spells_for_summons(state.spells)
+    with verbosity(QUIET):
+        party = build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=LevelTable(str(ROOT / "assets/data/level_exp.csv")),
+        )
+    enemies = build_enemies(
+        enemy_defs_by_name=state.monsters,
+        spells_by_name=state.spells,
+        enemy_names=[n.strip() for n in args.enemies.split(",") if n.strip()],
+    )
+
+    planner = TimedPolicy(
+        MctsPlanner(
+            state,
+            spells_by_name=spells,
+            budget_ms=args.budget_ms,
+            seed=args.seed,
+        )
+    )
+
+    print(f"enemies={args.enemies} battles={args.battles} budget={args.budget_ms}ms")
+    for label, policy in (("fight", policy_always_fight), ("mcts", planner)):
+        t0 = time.perf_counter()
+        win, rounds, hp = run_battles(
+            state, party, enemies, spells, policy, args.battles, args.seed
+        )
+        print(
+            f"{label:<6} win={win:.3f} rounds={rounds:5.2f} hp_on_win={hp:.3f} "
+            f"({time.perf_counter() - t0:.1f}s)"
+        )
+
+    times = planner.times_ms
+    # 締切は各ラウンドの前に確認するので、はみ出しは最大1ラウンド分（ここでは予算の 1.5 倍を目安）
+    over = sum(t > args.budget_ms * 1.5 for t in times)
+    print(
+        f"decisions={len(times)} p50={_percentile(times, 0.5):.1f}ms "
+        f"p95={_percentile(times, 0.95):.1f}ms max={max(times, default=0.0):.1f}ms "
+        f"iterations(mean)={statistics.mean(planner.iterations or [0]):.1f} "
+        f"over_budget={over}"
+    )
+    return 0 if over == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+# ============================================================
+# bench_model_memory: slots 化した戦闘モデルのメモリ量を tracemalloc で計測
+
+# 使い方: python tools/benchmarks/bench_model_memory.py [--actors 20000] [--battles 50]
+#   1) bytes/actor : BattleActorState + FinalCharacterStats（MP 満タン）を N 個作ったときの
+#                    1体あたりの確保量。比較用に「__dict__ 付き dataclass + dict の MP」版
+#                    （slots 化前と同じ形）を同じ値で作って並べる
+#   2) per round   : ヘッドレス戦闘（QUIET）1ラウンドあたりの確保ブロック数・バイト数
+#                    （ラウンド中に確保されたメモリブロックを tracemalloc のスナップショット差分で数える）
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import copy
+import dataclasses
+import gc
+import os
+import sys
+import tracemalloc
+from pathlib import Path
+from random import Random
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.battle_sim import (  # noqa: E402
+    clone_enemies_for_trial,
+    clone_party_for_trial,
+    policy_always_fight,
+    simulate_one_round_multi_party,
+)
+from combat.char_build import build_party_members_from_save  # noqa: E402
+from combat.enemy_build import build_enemies  # noqa: E402
+from combat.life_check import all_enemies_defeated, is_out_of_battle  # noqa: E402
+from combat.magic_menu import expand_spells_for_summons  # noqa: E402
+from combat.models import (  # noqa: E402
+    BattleActorState,
+    FinalCharacterStats,
+    MpPool,
+)
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.verbosity import QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+DEFAULT_ENEMIES = "Kunoichi,Shadow Master,Sleipnir"
+
+
+def _unslotted(cls):
+    """同じフィールドを持つ __dict__ 付き dataclass（slots 化前の形）を作る"""
+    fields = []
+    for f in dataclasses.fields(cls):
+        if f.default_factory is not dataclasses.MISSING:
+            fields.append((f.name, f.type, dataclasses.field(default_factory=f.default_factory)))
+        elif f.default is not dataclasses.MISSING:
+            fields.append((f.name, f.type, dataclasses.field(default=f.default)))
+        else:
+            fields.append((f.name, f.type))
+    return dataclasses.make_dataclass("Legacy" + cls.__name__, fields)
+
+
+def _measure(build, n: int):
+    """build() を n 回呼んだときの (bytes/個, blocks/個)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objs = [build() for _ in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    size = sum(d.size_diff for d in diff)
+    blocks = sum(d.count_diff for d in diff)
+    del objs
+    return size / n, blocks / n
+
+
+def bench_actors(stats: FinalCharacterStats, state: BattleActorState, n: int) -> None:
+    legacy_state_cls = _unslotted(BattleActorState)
+    legacy_stats_cls = _unslotted(FinalCharacterStats)
+    stats_kw = {f.name: getattr(stats, f.name) for f in dataclasses.fields(stats)}
+    mp = dict(state.max_mp_pool)
+
+    def build_slotted():
+        return (
+            BattleActorState(
+                hp=state.hp,
+                max_hp=state.max_hp,
+                mp_pool=MpPool(mp),
+                max_mp_pool=MpPool(mp),
+            ),
+            FinalCharacterStats(**stats_kw),
+        )
+
+    def build_legacy():
+        return (
+            legacy_state_cls(
+                hp=state.hp, max_hp=state.max_hp, mp_pool=dict(mp), max_mp_pool=dict(mp)
+            ),
+            legacy_stats_cls(**stats_kw),
+        )
+
+    new_b, new_k = _measure(build_slotted, n)
+    old_b, old_k = _measure(build_legacy, n)
+    print(f"actors={n}")
+    print(f"  dict/__dict__ : {old_b:8.1f} bytes/actor {old_k:6.2f} blocks/actor")
+    print(f"  slots/array   : {new_b:8.1f} bytes/actor {new_k:6.2f} blocks/actor")
+    print(f"  saved         : {old_b - new_b:8.1f} bytes/actor (x{old_b / new_b:.2f})")
+
+
+def bench_rounds(state, party, enemies, spells, n_battles: int, seed: int) -> None:
+    rounds = 0
+    size = 0
+    blocks = 0
+    with verbosity(QUIET):
+        for i in range(n_battles):
+            p = clone_party_for_trial(party)
+            e = clone_enemies_for_trial(enemies)
+            trial_state = dataclasses.replace(state, save=copy.deepcopy(state.save))
+            rng = Random(seed + i)
+            for _ in range(50):
+                if all(is_out_of_battle(pm.state) for pm in p) or all_enemies_defeated(e):
+                    break
+                actions = policy_always_fight(p, e, rng)
+                gc.collect()
+                tracemalloc.start()
+                before = tracemalloc.take_snapshot()
+                result = simulate_one_round_multi_party(
+                    p,
+                    e,
+                    actions,
+                    trial_state,
+                    rng=rng,
+                    save=trial_state.save,
+                    spells_by_name=spells,
+                    items_by_name=trial_state.items_by_name,
+                )
+                after = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+                # ラウンドの戻り値（logs / events / SideTurnResult）を含めた「残った確保」
+                diff = after.compare_to(before, "filename")
+                size += sum(max(d.size_diff, 0) for d in diff)
+                blocks += sum(max(d.count_diff, 0) for d in diff)
+                rounds += 1
+                if result[1].end_reason != "continue":
+                    break
+    print(f"rounds={rounds} (battles={n_battles})")
+    print(f"  {blocks / rounds:8.1f} blocks/round {size / rounds:10.1f} bytes/round")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--actors", type=int, default=20000)
+    parser.add_argument("--battles", type=int, default=50)
+    parser.add_argument("--enemies", default=DEFAULT_ENEMIES)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    spells = expand_spells_for_summons(state.spells)
+    with verbosity(QUIET):
+        party = build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=LevelTable(str(ROOT / "assets/data/level_exp.csv")),
+        )
+    enemies = build_enemies(
+        enemy_defs_by_name=state.monsters,
+        spells_by_name=state.spells,
+        enemy_names=[n.strip() for n in args.enemies.split(",") if n.strip()],
+    )
+
+    bench_actors(party[0].stats, party[0].state, args.actors)
+    bench_rounds(state, party, enemies, spells, args.battles, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
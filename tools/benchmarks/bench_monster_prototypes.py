@@ -0,0 +1,186 @@
+# ============================================================
+# bench_monster_prototypes: MonsterPrototype による敵構築・スペシャル攻撃抽選と従来処理の一致確認・速度比較
+
+# 使い方: python tools/benchmarks/bench_monster_prototypes.py [--repeat 20]
+#   1) 全モンスターについて、spawn() の EnemyRuntime（stats / json / sprite_id / is_boss）が
+#      従来の build_enemies（毎回 enrich_monster_spells + compute_enemy_final_stats）と一致するか確認する
+#   2) Special Attacks のエイリアス表が表す確率が Rate の比と一致するか、
+#      _find_monster_spell_definition（名前索引）が従来の線形探索と同じ定義を返すか確認する
+#   3) 1体あたりの構築時間と、スペシャル攻撃1回の抽選時間を比べる
+#   不一致があれば終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import os
+import sys
+import time
+from pathlib import Path
+from random import Random
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.enemy_build import (  # noqa: E402
+    build_enemies,
+    compute_enemy_final_stats,
+    monster_prototypes,
+)
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.spell_repo import (  # noqa: E402
+    _choose_monster_special_spell,
+    _find_monster_spell_definition,
+    enrich_monster_spells,
+    monster_spell_index,
+)
+
+
+def _legacy_spawn(name, monsters, spells):
+    """MonsterPrototype 導入前の build_enemies 1体分"""
+    enemy_json = enrich_monster_spells(dict(monsters[name]), spells_by_name=spells)
+    sprite_id = enemy_json.get("sprite_id")
+    sprite_id = (sprite_id.strip() or None) if isinstance(sprite_id, str) else None
+    plot_battles = enemy_json.get("PlotBattles")
+    is_boss = isinstance(plot_battles, list) and len(plot_battles) > 0
+    return compute_enemy_final_stats(enemy_json), enemy_json, sprite_id, is_boss
+
+
+def _legacy_choose(monster, rng):
+    """エイリアス表導入前の _choose_monster_special_spell（累積和の線形探索）"""
+    specials = monster.get("Special Attacks") or []
+    if not specials:
+        return None
+    total_rate = sum((sa.get("Rate") or 0) for sa in specials)
+    if total_rate <= 0:
+        return None
+    r = rng.random() * total_rate
+    acc = 0.0
+    chosen = None
+    for sa in specials:
+        acc += sa.get("Rate") or 0.0
+        if r <= acc:
+            chosen = sa.get("Attack")
+            break
+    if not chosen:
+        return None
+    for s in monster.get("Spells") or []:
+        if s.get("Name") == chosen:
+            return s
+    return None
+
+
+def _legacy_find_local(monster, spell_name):
+    sname = spell_name.strip().lower()
+    for sp in monster.get("Spells") or monster.get("spells") or []:
+        if (sp.get("Name") or sp.get("name") or "").strip().lower() == sname:
+            return sp
+    return None
+
+
+def _alias_probabilities(index):
+    n = len(index.alias_prob)
+    p = [0.0] * n
+    for i in range(n):
+        p[i] += index.alias_prob[i] / n
+        p[index.alias_idx[i]] += (1.0 - index.alias_prob[i]) / n
+    return p
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    monsters, spells = state.monsters, state.spells
+    names = list(monsters)
+    protos = monster_prototypes(monsters, spells)
+
+    # --- 1) 構築の一致 ---
+    mismatches = 0
+    for name in names:
+        stats, enemy_json, sprite_id, is_boss = _legacy_spawn(name, monsters, spells)
+        em = protos[name].spawn()
+        ok = (
+            dataclasses.asdict(stats) == dataclasses.asdict(em.stats)
+            and enemy_json == em.json
+            and sprite_id == em.sprite_id
+            and is_boss == em.is_boss
+            and em.state.hp == em.state.max_hp == stats.hp
+        )
+        if not ok:
+            mismatches += 1
+            print(f"[NG] spawn {name}")
+    print(f"spawn parity: {len(names) - mismatches}/{len(names)} match")
+
+    # --- 2) 抽選確率・スペル索引 ---
+    bad = 0
+    with_specials = []
+    for name in names:
+        j = protos[name].json
+        index = monster_spell_index(j)
+        rates = [
+            float(sa.get("Rate") or 0.0)
+            for sa in (j.get("Special Attacks") or [])
+            if (sa.get("Rate") or 0.0) > 0
+        ]
+        if rates:
+            with_specials.append(j)
+            total = sum(rates)
+            for got, rate in zip(_alias_probabilities(index), rates):
+                if abs(got - rate / total) > 1e-9:
+                    bad += 1
+                    print(f"[NG] alias {name}: {got} != {rate / total}")
+                    break
+        for sp in j.get("Spells") or []:
+            nm = sp.get("Name") or ""
+            for q in (nm, nm.upper(), f"  {nm.lower()} "):
+                if q.strip() and _find_monster_spell_definition(j, q) is not _legacy_find_local(j, q):
+                    bad += 1
+                    print(f"[NG] find {name}: {q!r}")
+    mismatches += bad
+    print(f"alias / index parity: {'OK' if not bad else f'{bad} NG'} ({len(with_specials)} monsters with specials)")
+
+    # --- 3) 速度 ---
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for name in names:
+            _legacy_spawn(name, monsters, spells)
+    t_old = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        build_enemies(enemy_defs_by_name=monsters, spells_by_name=spells, enemy_names=names)
+    t_new = time.perf_counter() - t0
+    n = args.repeat * len(names)
+    print(
+        f"spawn : legacy {t_old / n * 1e6:7.1f} us/enemy  prototype {t_new / n * 1e6:5.2f} us/enemy "
+        f"(x{t_old / max(t_new, 1e-9):.0f})"
+    )
+
+    draws = 2000
+    rng = Random(1)
+    t0 = time.perf_counter()
+    for j in with_specials:
+        for _ in range(draws):
+            _legacy_choose(j, rng)
+    t_old = time.perf_counter() - t0
+    rng = Random(1)
+    t0 = time.perf_counter()
+    for j in with_specials:
+        for _ in range(draws):
+            _choose_monster_special_spell(j, rng=rng)
+    t_new = time.perf_counter() - t0
+    n = draws * max(1, len(with_specials))
+    print(
+        f"special: linear {t_old / n * 1e6:5.2f} us/draw  alias {t_new / n * 1e6:5.2f} us/draw "
+        f"(x{t_old / max(t_new, 1e-9):.1f})"
+    )
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+# ============================================================
+# bench_name_index: 正規化名インデックス（name_index.lookup_by_name）と従来の名前引きの一致確認・速度比較
+
+# 使い方: python tools/benchmarks/bench_name_index.py [--repeat 200]
+#   1) 魔法・アイテム・武器・防具・モンスターの全マスタについて、表記ゆれ（小文字・大文字・前後空白・全角）で
+#      lookup_by_name が元のキーの定義を返すか、normalize_name の線形探索と同じ結果になるか確認する
+#   2) enrich_monster_spells で魔法DBと結び付いたスペル数を、従来（get(nm) or get(nm.lower())）と比べる
+#   3) 表記ゆれのある名前1回あたりの引き時間（線形探索 / 正規化名インデックス）を比べる
+#   不一致があれば終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.name_index import lookup_by_name  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.spell_repo import _spell_name_of  # noqa: E402
+from utils.name_normalize import normalize_name  # noqa: E402
+
+
+def _legacy_scan(master, name):
+    """索引導入前の fallback（全件の線形探索）"""
+    value = master.get(name)
+    if value is not None:
+        return value
+    key = normalize_name(name)
+    for nm, js in master.items():
+        if normalize_name(nm) == key:
+            return js
+    return None
+
+
+def _variants(name):
+    wide = "".join(
+        chr(ord(c) + 0xFEE0) if "!" <= c <= "~" else c for c in name
+    )  # 全角化（NFKC で元に戻る）
+    assert unicodedata.normalize("NFKC", wide) == name
+    return (name, name.lower(), name.upper(), f"  {name} ", wide)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    masters = {
+        "spells": state.spells,
+        "items": state.items_by_name,
+        "weapons": state.weapons,
+        "armors": state.armors,
+        "monsters": state.monsters,
+    }
+
+    # --- 1) 一致確認 ---
+    mismatches = checked = 0
+    queries = []
+    for label, master in masters.items():
+        for name in master:
+            for q in _variants(name):
+                checked += 1
+                got = lookup_by_name(master, q)
+                if got is not master[name] or got is not _legacy_scan(master, q):
+                    mismatches += 1
+                    if mismatches <= 5:
+                        print(f"[NG] {label} {q!r}")
+                if q != name:
+                    queries.append((master, q))
+        for q in ("", "no such name", None):
+            checked += 1
+            if lookup_by_name(master, q) is not None:
+                mismatches += 1
+                print(f"[NG] {label} {q!r} は None のはず")
+    print(f"parity: {checked - mismatches}/{checked} match")
+
+    # --- 2) enrich_monster_spells の結び付き ---
+    old_hits = new_hits = 0
+    for m in state.monsters.values():
+        for section in ("Spells", "Special Attacks"):
+            for s in m.get(section) or []:
+                nm = _spell_name_of(s) if isinstance(s, dict) else None
+                if not nm:
+                    continue
+                old_hits += isinstance(state.spells.get(nm) or state.spells.get(nm.lower()), dict)
+                new_hits += isinstance(lookup_by_name(state.spells, nm), dict)
+    print(f"enrich: legacy {old_hits} spells linked -> name_index {new_hits}")
+
+    # --- 3) 速度 ---
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for master, q in queries:
+            _legacy_scan(master, q)
+    t_old = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for master, q in queries:
+            lookup_by_name(master, q)
+    t_new = time.perf_counter() - t0
+    n = args.repeat * len(queries)
+    print(
+        f"lookup: linear {t_old / n * 1e6:7.2f} us/name  "
+        f"name_index {t_new / n * 1e6:5.2f} us/name  (x{t_old / max(t_new, 1e-9):.0f})"
+    )
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# ============================================================
+# bench_party_search: ジョブ構成探索の枝刈り・評価キャッシュの効果を見る
+
+# 使い方: python tools/benchmarks/bench_party_search.py [--location "Cave of Shadows B8"] [--cp 255]
+#   一時ファイルの EvalCache で search_party_jobs を2回回す。
+#     1回目: 近傍の生成数 / CP で落とした数 / 粗い評価・本評価の数 / シミュレーションした戦闘数
+#     2回目: 同じ条件なので全部キャッシュから返り、シミュレーションは 0 戦闘になるはず
+#     3回目: マスタデータの指紋だけ変えた state で回すと、キャッシュを引かずにシミュレーションし直すはず
+#   全探索（ジョブ数^人数 × trials）との比較も出す。lambda のポリシーを policy_key なしで渡すと
+#   ValueError になることも確認する。2回目の結果が1回目と違う / 3回目がキャッシュを引いたら終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.party_search import EvalCache, PartySearch, search_party_jobs  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from system.cp_system import load_job_attribution  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--location", default="Cave of Shadows B8")
+    parser.add_argument("--cp", type=int, default=None)
+    parser.add_argument("--trials", type=int, default=80)
+    parser.add_argument("--screen-trials", type=int, default=16)
+    parser.add_argument("--steps", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    level_table = LevelTable(str(ROOT / "assets/data/level_exp.csv"))
+    job_attr = load_job_attribution(str(ROOT / "assets/data/job_attribution.csv"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "party_search.jsonl"
+        results = []
+        runs = (
+            ("cold", state),
+            ("warm", state),
+            ("new data", dataclasses.replace(state, data_fingerprint="changed")),
+        )
+        for label, run_state in runs:
+            search = PartySearch(
+                state=run_state,
+                level_table=level_table,
+                location=args.location,
+                job_attr=job_attr,
+                cache=EvalCache(cache_path),
+                seed=args.seed,
+            )
+            t0 = time.perf_counter()
+            res = search_party_jobs(
+                search,
+                cp_budget=args.cp,
+                max_steps=args.steps,
+                screen_trials=args.screen_trials,
+                trials=args.trials,
+            )
+            elapsed = time.perf_counter() - t0
+            results.append(res)
+            print(
+                f"{label}: {elapsed:6.2f}s best={' / '.join(res.best.jobs)} "
+                f"win={res.best.win_rate:.3f} turns={res.best.average_turns:.2f} CP={res.best.cp_cost}"
+            )
+            print(
+                f"      candidates={res.candidates} pruned_by_cp={res.pruned_by_cp} "
+                f"screened={res.screened} evaluated={res.evaluated} "
+                f"cache_hits={res.cache_hits} simulated_battles={res.simulated_battles}"
+            )
+
+    n_jobs = len(state.jobs_by_name)
+    n_members = len(state.save.get("party", []))
+    naive = n_jobs**n_members * args.trials
+    print(
+        f"exhaustive: {n_jobs}^{n_members} = {n_jobs**n_members} parties x {args.trials} trials "
+        f"= {naive} battles (cold run simulated {results[0].simulated_battles}, "
+        f"x{naive / max(results[0].simulated_battles, 1):.0f} fewer)"
+    )
+    cold, warm, changed = results
+    same = cold.best.jobs == warm.best.jobs and warm.simulated_battles == 0
+    print(f"warm run reproduces cold run from cache: {'OK' if same else 'NG'}")
+    missed = changed.cache_hits == 0 and changed.simulated_battles == cold.simulated_battles
+    print(f"changed data fingerprint misses the cache: {'OK' if missed else 'NG'}")
+
+    try:
+        PartySearch(
+            state=state,
+            level_table=level_table,
+            location=args.location,
+            job_attr=job_attr,
+            policy=lambda party, enemies, rng: [None] * len(party),
+        )
+        keyed = False
+    except ValueError:
+        keyed = True
+    print(f"lambda policy without policy_key is rejected: {'OK' if keyed else 'NG'}")
+    return 0 if same and missed and keyed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+# ============================================================
+# bench_sequential_stopping: 逐次打ち切り（precision 指定）と固定試行数の比較
+
+# 使い方: python tools/benchmarks/bench_sequential_stopping.py [--trials 10000] [--precision 0.01]
+#   編成ごとに simulate_many_battles_multi_party を
+#     fixed : n_trials 固定
+#     seq   : precision 指定（n_trials は上限）
+#   で回し、使った試行数・時間・勝率とその Wilson 区間を並べる。
+#   fixed の勝率が seq の区間に入っていない編成があれば終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.battle_sim import simulate_many_battles_multi_party  # noqa: E402
+from combat.char_build import build_party_members_from_save  # noqa: E402
+from combat.magic_menu import expand_spells_for_summons  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.verbosity import QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+DEFAULT_FORMATIONS = (
+    "Ogre,Cyclops,Minotaur",  # 楽勝（勝率 ~100%）
+    "Kunoichi,Shadow Master,Sleipnir",  # 全滅（勝率 ~0%）
+    "Kunoichi,Sleipnir",  # 中間
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trials", type=int, default=10000)
+    parser.add_argument("--precision", type=float, default=0.01)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--formations", nargs="*", default=list(DEFAULT_FORMATIONS))
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    spells = expand_spells_for_summons(state.spells)
+    with verbosity(QUIET):
+        party = build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=LevelTable(str(ROOT / "assets/data/level_exp.csv")),
+        )
+
+    ok = True
+    total = {"fixed": [0, 0.0], "seq": [0, 0.0]}
+    for formation in args.formations:
+        names = [n.strip() for n in formation.split(",") if n.strip()]
+        results = {}
+        for label, precision in (("fixed", None), ("seq", args.precision)):
+            t0 = time.perf_counter()
+            res = simulate_many_battles_multi_party(
+                party,
+                names,
+                args.trials,
+                seed=args.seed,
+                state=state,
+                spells_by_name=spells,
+                precision=precision,
+                confidence=args.confidence,
+            )
+            elapsed = time.perf_counter() - t0
+            results[label] = res
+            total[label][0] += res["trials"]
+            total[label][1] += elapsed
+            lo, hi = res["win_rate_char_ci"]
+            tlo, thi = res["average_turns_ci"]
+            print(
+                f"{formation:<34} {label:<5} trials={res['trials']:6d} {elapsed:7.2f}s "
+                f"win={res['win_rate_char']:.4f} [{lo:.4f}, {hi:.4f}] "
+                f"turns={res['average_turns']:.2f} [{tlo:.2f}, {thi:.2f}]"
+            )
+        lo, hi = results["seq"]["win_rate_char_ci"]
+        ok &= lo <= results["fixed"]["win_rate_char"] <= hi
+
+    print(
+        f"total fixed={total['fixed'][0]} trials {total['fixed'][1]:.1f}s / "
+        f"seq={total['seq'][0]} trials {total['seq'][1]:.1f}s "
+        f"(x{total['fixed'][1] / max(total['seq'][1], 1e-9):.1f})"
+    )
+    print(f"fixed estimate inside sequential interval: {'OK' if ok else 'NG'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
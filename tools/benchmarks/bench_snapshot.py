@@ -0,0 +1,158 @@
+# ============================================================
+# bench_snapshot: BattleSnapshot（capture/restore）と copy.deepcopy の速度比較 + 巻き戻しの一致確認
+
+# 使い方: python tools/benchmarks/bench_snapshot.py [--cycles 5000] [--enemies A,B,C]
+#   1) 一致確認: capture → 数ラウンド進める（+ Item 消費 / Steal 相当の在庫追加 / JobSP 加算）→ restore
+#                を繰り返し、巻き戻し後の状態指紋（state / stats / save）が capture 時と同じか、
+#                同じシードで進め直した結果が1回目と同じかを確認（不一致なら終了コード 1）
+#   2) 速度    : capture+restore 1サイクル と deepcopy(party, enemies, save) 1回 の比較
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import copy
+import os
+import sys
+import time
+from pathlib import Path
+from random import Random
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.battle_sim import (  # noqa: E402
+    clone_enemies_for_trial,
+    clone_party_for_trial,
+    policy_always_fight,
+    simulate_one_round_multi_party,
+)
+from combat.char_build import build_party_members_from_save  # noqa: E402
+from combat.enemy_build import build_enemies  # noqa: E402
+from combat.inventory import (  # noqa: E402
+    add_item_to_inventory,
+    consume_item_from_inventory,
+)
+from combat.magic_menu import expand_spells_for_summons  # noqa: E402
+from combat.progression import apply_job_sp_for_command  # noqa: E402
+from combat.replay import _state_to_dict, fingerprint_of  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.snapshot import BattleSnapshot  # noqa: E402
+from combat.verbosity import QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+DEFAULT_ENEMIES = "Kunoichi,Shadow Master,Sleipnir"
+
+
+def battle_fingerprint(party, enemies, save) -> str:
+    return fingerprint_of(
+        {
+            "party": [
+                [
+                    _state_to_dict(pm.state),
+                    pm.stats,
+                    pm.base.job_level,
+                    pm.base.job_skill_point,
+                ]
+                for pm in party
+            ],
+            "enemies": [[_state_to_dict(em.state), em.stats] for em in enemies],
+            "inventory": save.get("inventory"),
+            "save_party": save.get("party"),
+        }
+    )
+
+
+def advance(state, party, enemies, spells, seed: int, rounds: int = 3):
+    """数ラウンド進め、在庫と JobSP も書き換えてからログを返す"""
+    rng = Random(seed)
+    logs_all = []
+    for _ in range(rounds):
+        actions = policy_always_fight(party, enemies, rng)
+        logs, result, _events = simulate_one_round_multi_party(
+            party,
+            enemies,
+            actions,
+            state,
+            rng=rng,
+            save=state.save,
+            spells_by_name=spells,
+            items_by_name=state.items_by_name,
+        )
+        logs_all.extend(logs)
+        if result.end_reason != "continue":
+            break
+    consume_item_from_inventory(state.save, "Potion")
+    add_item_to_inventory(state.save, "Elixir", qty=1)
+    add_item_to_inventory(state.save, "Snapshot Test Item", qty=1)
+    for pm in party:
+        apply_job_sp_for_command(
+            pm, "Fight", weapons=state.weapons, armors=state.armors, save_dict=state.save
+        )
+    return logs_all
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cycles", type=int, default=5000)
+    parser.add_argument("--enemies", default=DEFAULT_ENEMIES)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    spells = expand_spells_for_summons(state.spells)
+    with verbosity(QUIET):
+        party_template = build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=LevelTable(str(ROOT / "assets/data/level_exp.csv")),
+        )
+    enemy_template = build_enemies(
+        enemy_defs_by_name=state.monsters,
+        spells_by_name=state.spells,
+        enemy_names=[n.strip() for n in args.enemies.split(",") if n.strip()],
+    )
+    party = clone_party_for_trial(party_template)
+    enemies = clone_enemies_for_trial(enemy_template)
+
+    # ---- 1) 一致確認 ----
+    ok = True
+    with verbosity(QUIET):
+        snap = BattleSnapshot.capture(party, enemies, state.save)
+        fp0 = battle_fingerprint(party, enemies, state.save)
+        for i in range(20):
+            logs1 = advance(state, party, enemies, spells, args.seed + i)
+            fp1 = battle_fingerprint(party, enemies, state.save)
+            snap.restore()
+            ok &= battle_fingerprint(party, enemies, state.save) == fp0
+            logs2 = advance(state, party, enemies, spells, args.seed + i)
+            ok &= logs1 == logs2 and battle_fingerprint(party, enemies, state.save) == fp1
+            snap.restore()
+            ok &= battle_fingerprint(party, enemies, state.save) == fp0
+    print(f"restore matches capture: {'OK' if ok else 'NG'}")
+
+    # ---- 2) 速度 ----
+    n = args.cycles
+    t0 = time.perf_counter()
+    for _ in range(n):
+        BattleSnapshot.capture(party, enemies, state.save).restore()
+    t_snap = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(max(1, n // 10)):
+        copy.deepcopy((party, enemies, state.save))
+    t_deep = (time.perf_counter() - t0) * n / max(1, n // 10)
+
+    print(
+        f"snapshot {n / t_snap:10.1f} cycles/sec ({t_snap / n * 1e6:7.1f} us)\n"
+        f"deepcopy {n / t_deep:10.1f} cycles/sec ({t_deep / n * 1e6:7.1f} us)\n"
+        f"speedup x{t_deep / t_snap:.1f}"
+    )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+# ============================================================
+# bench_spell_table: 前計算した魔法表（CompiledSpell）と詠唱ごとの解釈の一致確認・速度比較
+
+# 使い方: python tools/benchmarks/bench_spell_table.py [--repeat 200]
+#   1) expand_spells_for_summons 済みの全魔法について、CompiledSpell の各欄が
+#      spell_from_json / healing_spell_kind / spell_ailments / spell_is_aoe などと一致するか確認する
+#   2) 詠唱1回あたりの準備時間（従来：毎回 JSON を解釈 / 新：lookup_spell）を比べる
+#   3) expand_spells_for_summons が同じ dict を使い回しているか確認する
+#   不一致があれば終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.elements import element_mask  # noqa: E402
+from combat.magic_aoe import spell_is_aoe  # noqa: E402
+from combat.magic_damage import healing_spell_kind  # noqa: E402
+from combat.magic_menu import expand_spells_for_summons  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.spell_repo import spell_from_json  # noqa: E402
+from combat.spell_table import lookup_spell, spell_table  # noqa: E402
+from combat.status_effects import spell_ailments  # noqa: E402
+
+
+def _legacy_prepare(spells_by_name, name):
+    """spell_table 導入前に詠唱のたびに行っていた解釈"""
+    sj = spells_by_name.get(name)
+    if sj is None:
+        return None
+    info = spell_from_json(sj)
+    effect_text = (sj.get("Effect") or "").lower()
+    return (
+        info,
+        healing_spell_kind(sj),
+        tuple(spell_ailments(sj, summon_child_name=name)),
+        spell_is_aoe(sj),
+        str(sj.get("Reflectable", "No")).strip().lower() == "yes",
+        "absorb hp" in effect_text or (sj.get("Name") or "").lower() == "drain",
+        int(sj.get("Level", 1)),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+
+    t0 = time.perf_counter()
+    spells = expand_spells_for_summons(state.spells)
+    table = spell_table(spells)
+    t_compile = time.perf_counter() - t0
+    print(f"expand + spell_table: {len(table)}/{len(spells)} spells {t_compile * 1000:.1f} ms")
+
+    # --- 1) 一致確認 ---
+    mismatches = 0
+    for name in spells:
+        old = _legacy_prepare(spells, name)
+        cs = lookup_spell(spells, name)
+        new = (
+            cs.info,
+            cs.healing_kind,
+            cs.ailments,
+            cs.is_aoe,
+            cs.reflectable,
+            cs.is_drain,
+            cs.level,
+        )
+        ok = dataclasses.asdict(old[0]) == dataclasses.asdict(new[0]) and old[1:] == new[1:]
+        ok &= cs.element_mask == element_mask(old[0].elements)
+        if not ok:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"[NG] {name}: {old[1:]} / {new[1:]}")
+    print(f"parity: {len(spells) - mismatches}/{len(spells)} match")
+
+    # --- 3) 使い回し ---
+    if expand_spells_for_summons(state.spells) is not spells or spell_table(spells) is not table:
+        mismatches += 1
+        print("[NG] expand_spells_for_summons / spell_table が作り直されている")
+
+    # --- 2) 速度 ---
+    names = list(spells)
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for name in names:
+            _legacy_prepare(spells, name)
+    t_old = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for name in names:
+            lookup_spell(expand_spells_for_summons(state.spells), name)
+    t_new = time.perf_counter() - t0
+    n = args.repeat * len(names)
+    print(
+        f"cast prep: parse {t_old / n * 1e6:6.2f} us/cast  "
+        f"lookup_spell {t_new / n * 1e6:5.2f} us/cast  (x{t_old / max(t_new, 1e-9):.0f})"
+    )
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
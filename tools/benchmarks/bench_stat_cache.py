@@ -0,0 +1,111 @@
+# ============================================================
+# bench_stat_cache: compute_character_final_stats の寄与表キャッシュ・メモ化の効果と一致確認
+
+# 使い方: python tools/benchmarks/bench_stat_cache.py [--repeat 300]
+#   cold : 毎回 invalidate_stat_caches() してから計算（名前インデックス・寄与表を毎回作る = 以前の挙動）
+#   table: 寄与表はキャッシュ済み・メモは外れる（基礎ステータスを毎回変える）
+#   memo : 同じ (基礎ステータス, 装備, ジョブ) の2回目以降
+#   party: build_party_members_from_save（run_battle_app のループ1周ぶんの再構築）
+#   cold と memo の結果が全員一致しなければ終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from combat.char_build import (  # noqa: E402
+    build_party_members_from_save,
+    compute_character_final_stats,
+    invalidate_stat_caches,
+)
+from combat.models import EquipmentSet  # noqa: E402
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.verbosity import QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    level_table = LevelTable(str(ROOT / "assets/data/level_exp.csv"))
+
+    def build_party():
+        return build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=level_table,
+        )
+
+    with verbosity(QUIET):
+        party = build_party()
+
+        def calc(pm, base=None):
+            return compute_character_final_stats(
+                base or pm.base,
+                pm.equipment or EquipmentSet(),
+                state.weapons,
+                state.armors,
+                job_name=pm.job.name,
+            )
+
+        n = args.repeat * len(party)
+
+        t0 = time.perf_counter()
+        cold = []
+        for _ in range(args.repeat):
+            for pm in party:
+                invalidate_stat_caches()
+                cold.append(calc(pm))
+        t_cold = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for i in range(args.repeat):
+            for pm in party:
+                calc(pm, dataclasses.replace(pm.base, max_hp=pm.base.max_hp + i + 1))
+        t_table = time.perf_counter() - t0
+
+        calc(party[0])
+        t0 = time.perf_counter()
+        memo = []
+        for _ in range(args.repeat):
+            for pm in party:
+                memo.append(calc(pm))
+        t_memo = time.perf_counter() - t0
+
+        invalidate_stat_caches()
+        t0 = time.perf_counter()
+        build_party()
+        t_party_cold = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for _ in range(args.repeat):
+            build_party()
+        t_party = (time.perf_counter() - t0) / args.repeat
+
+    ok = all(dataclasses.asdict(a) == dataclasses.asdict(b) for a, b in zip(cold, memo))
+    # 返り値は毎回別オブジェクト（呼び出し側の書き換えがメモに波及しない）
+    ok &= memo[0] is not memo[len(party)]
+
+    print(f"cold  {t_cold / n * 1e6:8.1f} us/call")
+    print(f"table {t_table / n * 1e6:8.1f} us/call  (x{t_cold / t_table:.0f})")
+    print(f"memo  {t_memo / n * 1e6:8.1f} us/call  (x{t_cold / t_memo:.0f})")
+    print(f"party rebuild: first {t_party_cold * 1000:.2f} ms, then {t_party * 1000:.2f} ms")
+    print(f"cold == memo for all members: {'OK' if ok else 'NG'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+# ============================================================
+# check_damage_batch_parity: combat.damage_batch（NumPy 版）とスカラー版ダメージ式の一致確認 + 速度比較
+
+# 使い方: python tools/benchmarks/check_damage_batch_parity.py [--samples 20000]
+#   1) 期待値モード（use_expectation=True）: 全組み合わせで値が完全一致すること
+#   2) 乱数モード: 同じ組み合わせを N 回ずつ回し、
+#        ・平均ダメージの差が標準誤差の 5 倍以内
+#        ・クリティカル率の差が標準誤差の 5 倍以内
+#        ・2 標本 KS 統計量が有意水準 0.1% の棄却限界未満
+#      を満たすこと（乱数列は別物なので「分布」で比べる）
+#   不一致があれば終了コード 1
+# ============================================================
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+
+from combat.char_build import build_party_members_from_save  # noqa: E402
+from combat.damage_batch import (  # noqa: E402
+    magic_damage_char_to_enemy_batch,
+    physical_damage_char_to_enemy_batch,
+    physical_damage_enemy_to_char_batch,
+)
+from combat.enemy_build import build_enemies  # noqa: E402
+from combat.magic_damage import magic_damage_char_to_enemy  # noqa: E402
+from combat.phys_damage import (  # noqa: E402
+    physical_damage_char_to_enemy,
+    physical_damage_enemy_to_char,
+)
+from combat.runtime_state import init_runtime_state  # noqa: E402
+from combat.spell_repo import spell_from_json  # noqa: E402
+from combat.verbosity import QUIET, verbosity  # noqa: E402
+from system.exp_system import LevelTable  # noqa: E402
+
+ENEMY_NAMES = ["Goblin", "Kunoichi", "Shadow Master", "Sleipnir"]
+SPELL_NAMES = ["Fire", "Blizzara", "Thundaga", "Flare"]
+KS_C_ALPHA = 1.95  # α=0.001
+
+
+def ks_statistic(a: np.ndarray, b: np.ndarray) -> float:
+    grid = np.union1d(a, b)
+    fa = np.searchsorted(np.sort(a), grid, side="right") / len(a)
+    fb = np.searchsorted(np.sort(b), grid, side="right") / len(b)
+    return float(np.max(np.abs(fa - fb)))
+
+
+def compare(label: str, scalar_dmg, scalar_crit, batch_dmg, batch_crit) -> bool:
+    a = np.asarray(scalar_dmg, dtype=np.float64)
+    b = np.asarray(batch_dmg, dtype=np.float64)
+    n, m = len(a), len(b)
+
+    se = np.sqrt(a.var() / n + b.var() / m)
+    mean_ok = abs(a.mean() - b.mean()) <= 5 * se + 1e-9
+
+    ca = np.asarray(scalar_crit, dtype=np.float64)
+    cb = np.asarray(batch_crit, dtype=np.float64)
+    se_c = np.sqrt(ca.var() / n + cb.var() / m)
+    crit_ok = abs(ca.mean() - cb.mean()) <= 5 * se_c + 1e-9
+
+    d = ks_statistic(a, b)
+    ks_ok = d < KS_C_ALPHA * np.sqrt((n + m) / (n * m))
+
+    ok = mean_ok and crit_ok and ks_ok
+    print(
+        f"{'OK ' if ok else 'NG '} {label:<42} "
+        f"mean {a.mean():8.1f} / {b.mean():8.1f}  "
+        f"crit {ca.mean():.3f} / {cb.mean():.3f}  KS={d:.4f}"
+    )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=12345)
+    args = parser.parse_args()
+    N = args.samples
+
+    os.chdir(ROOT)
+    state = init_runtime_state(ROOT)
+    with verbosity(QUIET):
+        party = build_party_members_from_save(
+            save=state.save,
+            weapons=state.weapons,
+            armors=state.armors,
+            jobs_by_name=state.jobs_by_name,
+            level_table=LevelTable(str(ROOT / "assets/data/level_exp.csv")),
+        )
+    enemies = build_enemies(
+        enemy_defs_by_name=state.monsters,
+        spells_by_name=state.spells,
+        enemy_names=[n for n in ENEMY_NAMES if n in state.monsters],
+    )
+    spells = [spell_from_json(state.spells[n]) for n in SPELL_NAMES if n in state.spells]
+
+    rng = random.Random(args.seed)
+    gen = np.random.default_rng(args.seed)
+    all_ok = True
+    t_scalar = 0.0
+    t_batch = 0.0
+
+    # ---- 1) 期待値モード：完全一致 ----
+    for pm in party:
+        for em in enemies:
+            s = physical_damage_char_to_enemy(pm.stats, em.stats, use_expectation=True)
+            b = physical_damage_char_to_enemy_batch(
+                pm.stats, em.stats, gen, use_expectation=True
+            )
+            all_ok &= s.damage == int(b.damage[0]) and s.hit_count == int(b.hit_count[0])
+
+            s2 = physical_damage_enemy_to_char(em.stats, pm.stats, use_expectation=True)
+            b2 = physical_damage_enemy_to_char_batch(
+                em.stats, pm.stats, gen, use_expectation=True
+            )
+            all_ok &= s2 == int(b2.damage[0])
+
+            for sp in spells:
+                s3 = magic_damage_char_to_enemy(pm.stats, sp, em.stats, use_expectation=True)
+                b3 = magic_damage_char_to_enemy_batch(
+                    pm.stats, sp, em.stats, gen, use_expectation=True
+                )
+                all_ok &= s3 == int(b3.damage[0])
+    print(f"expectation mode exact match: {'OK' if all_ok else 'NG'}")
+
+    # ---- 2) 乱数モード：分布の一致 ----
+    for pm in party:
+        for em in enemies:
+            t0 = time.perf_counter()
+            rs = [
+                physical_damage_char_to_enemy(
+                    pm.stats, em.stats, rng=rng, use_expectation=False
+                )
+                for _ in range(N)
+            ]
+            t1 = time.perf_counter()
+            rb = physical_damage_char_to_enemy_batch(pm.stats, em.stats, gen, n=N)
+            t2 = time.perf_counter()
+            t_scalar += t1 - t0
+            t_batch += t2 - t1
+            all_ok &= compare(
+                f"phys {pm.name}->{em.name}",
+                [r.damage for r in rs],
+                [r.is_critical for r in rs],
+                rb.damage,
+                rb.is_critical,
+            )
+
+            t0 = time.perf_counter()
+            es = [
+                physical_damage_enemy_to_char(
+                    em.stats, pm.stats, rng=rng, use_expectation=False, return_crit=True
+                )
+                for _ in range(N)
+            ]
+            t1 = time.perf_counter()
+            eb = physical_damage_enemy_to_char_batch(em.stats, pm.stats, gen, n=N)
+            t2 = time.perf_counter()
+            t_scalar += t1 - t0
+            t_batch += t2 - t1
+            all_ok &= compare(
+                f"phys {em.name}->{pm.name}",
+                [r[0] for r in es],
+                [r[1] for r in es],
+                eb.damage,
+                eb.is_critical,
+            )
+
+            for sp in spells:
+                t0 = time.perf_counter()
+                ms = [
+                    magic_damage_char_to_enemy(
+                        pm.stats, sp, em.stats, rng=rng, use_expectation=False
+                    )
+                    for _ in range(N)
+                ]
+                t1 = time.perf_counter()
+                mb = magic_damage_char_to_enemy_batch(pm.stats, sp, em.stats, gen, n=N)
+                t2 = time.perf_counter()
+                t_scalar += t1 - t0
+                t_batch += t2 - t1
+                all_ok &= compare(
+                    f"magic {pm.name}({sp.magic_type},{sp.power})->{em.name}",
+                    ms,
+                    [False] * N,
+                    mb.damage,
+                    mb.is_critical,
+                )
+
+    print(
+        f"\nscalar {t_scalar:.3f}s  batch {t_batch:.3f}s  "
+        f"(x{t_scalar / t_batch if t_batch > 0 else float('inf'):.1f})"
+    )
+    print("PASS" if all_ok else "FAIL")
+    return 0 if all_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
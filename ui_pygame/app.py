@@ -35,6 +35,9 @@ from combat.enemy_selection import (
     danger_label,
 )
 from combat.progression import apply_victory_rewards
+from combat.battle_sim import preview_battle_expected
+from combat.mcts_planner import MctsPlanner
+from combat.replay import BattleRecorder
 from combat.save_prompt import (
     save_savedata_with_backup,
     prompt_save_progress_and_write_pygame,
@@ -43,7 +46,7 @@ from combat.save_prompt import (
 from system.exp_system import LevelTable
 from system.cp_system import load_job_attribution
 
-from ui_pygame.logic import get_job_commands
+from ui_pygame.logic import get_job_commands_with_auto
 from ui_pygame.render.hub import draw_header
 from ui_pygame.render.sprites import (
     load_enemy_sprite_images,
@@ -75,6 +78,15 @@ from scenes.menu import open_menu_pygame
 
 SAVE_PATH = Path("assets/data/ffiii_savedata.json")
 
+# ロケーション選択のプレビュー表示（end_reason → 表示名）
+PREVIEW_OUTCOME_LABELS = {
+    "enemy_defeated": "Win",
+    "char_defeated": "Lose",
+    "escaped": "Escaped",
+    "enemy_escaped": "Enemy fled",
+    "timeout": "Timeout",
+}
+
 
 @dataclass
 class BattleAppConfig:
@@ -105,6 +117,12 @@ class BattleAppConfig:
     se_confirm_volume: float = 0.6
     se_rareitem_volume: float = 0.6
 
+    # ★リプレイ保存先（None なら記録しない）
+    replay_dir: str | None = "assets/replays"
+
+    # ★Auto コマンド（MCTS）の1回の判断にかける時間（ms）。長くすると強くなるが入力が待たされる
+    auto_budget_ms: float = 50.0
+
 
 def run_battle_app(
     enemy_names: list[str] | None = None, *, config: BattleAppConfig | None = None
@@ -194,6 +212,26 @@ def run_battle_app(
                     job_name=actor.job.name,  # ★ここがポイント
                 )
 
+            # ★ 期待値モードで1戦だけ解いた見込み（選択中のロケーションのみ・キャッシュあり）
+            def preview_fn(entry) -> str:
+                names = pick_enemy_names(
+                    entry,
+                    state.monsters,
+                    k_min=2,
+                    k_max=6,
+                    rng=random.Random(entry.location),  # 同じ場所は同じ編成で比べる
+                )
+                res = preview_battle_expected(
+                    party_members, names, state=state, spells_by_name=spells_expanded
+                )
+                outcome = PREVIEW_OUTCOME_LABELS.get(res["end_reason"], res["end_reason"])
+                return (
+                    f"Preview: {outcome} in {res['rounds']} rounds  "
+                    f"Party HP {res['hp_remaining'] * 100:.0f}%  "
+                    f"Enemy HP {res['enemy_hp_remaining'] * 100:.0f}%  "
+                    f"vs {', '.join(names)}"
+                )
+
             selected = choose_location_pygame(
                 screen,
                 font,
@@ -212,6 +250,7 @@ def run_battle_app(
                 build_magic_fn=build_magic_fn,
                 spells_by_name=state.spells,  # ★追加（ここが元の state.spells）
                 items_by_name=state.items_by_name,  # ★追加
+                preview_fn=preview_fn,  # ★追加
             )
             enemy_names = pick_enemy_names(selected, state.monsters, k_min=2, k_max=6)
 
@@ -221,6 +260,11 @@ def run_battle_app(
             enemy_names=enemy_names,
         )
 
+        # ★Auto コマンド用の先読みAI（戦闘ごとに作り直す）
+        planner = MctsPlanner(
+            state, spells_by_name=spells_expanded, budget_ms=cfg.auto_budget_ms
+        )
+
         ctx_base = {
             "enemies": enemies,
             "spells_expanded": spells_expanded,
@@ -231,12 +275,15 @@ def run_battle_app(
                 normalize_battle_command=normalize_battle_command,
                 reset_target_flags=reset_target_flags,
                 is_out_of_battle=is_out_of_battle,
-                get_job_commands=get_job_commands,
+                get_job_commands=get_job_commands_with_auto,
                 build_magic_candidates_for_member=build_magic_fn,
                 build_item_candidates_for_battle=lambda: build_item_candidates_for_battle_fn(
                     state.items_by_name, state.save
                 ),
                 make_planned_action=make_planned_action,
+                auto_plan=lambda party, enemies, fixed: planner.plan(
+                    list(party), list(enemies), fixed_actions=fixed
+                ),
             ),
         }
 
@@ -310,8 +357,14 @@ def run_one_battle(
     # enemies は ctx_base が持つ selected_enemy_names などから作る、でもOK
     enemies = ctx_base["enemies"]
 
+    # ★リプレイ記録（戦闘開始時点のパーティ/敵を控える）
+    recorder = (
+        BattleRecorder(party_members, enemies, save=state.save)
+        if cfg.replay_dir
+        else None
+    )
     controller = BattleController(
-        rng=random.Random()
+        rng=random.Random(), recorder=recorder
     )  # ★毎回作り直すと _bgm_started もリセットされる
 
     ui = BattleUIState()
@@ -504,6 +557,10 @@ def run_one_battle(
 
         pygame.display.flip()
 
+    # ★リプレイ保存（決着した戦闘のみ）
+    if recorder is not None and cfg.replay_dir and recorder.replay.rounds:
+        recorder.save_to_dir(cfg.replay_dir)
+
     # ★型チェッカー対策（通常ここには来ない想定）
     return end_reason
 
@@ -528,6 +585,7 @@ def choose_location_pygame(
     build_magic_fn=None,  # ★追加
     spells_by_name=None,  # ★追加
     items_by_name=None,  # ★追加
+    preview_fn: Callable[[object], str] | None = None,  # ★追加：選択中ロケーションの戦闘見込み
 ):
     """
     操作:
@@ -548,7 +606,11 @@ def choose_location_pygame(
     line_h = font.get_linesize() + 4
     header_h = line_h * 3
     help_h = line_h + 16
-    max_rows = max(3, (screen.get_height() - header_h - help_h) // line_h)
+    preview_h = line_h if preview_fn is not None else 0
+    max_rows = max(3, (screen.get_height() - header_h - help_h - preview_h) // line_h)
+
+    # ロケーション名 → プレビュー文字列（メニューで装備が変わったらクリア）
+    preview_cache: dict[str, str] = {}
 
     def apply_filter() -> None:
         nonlocal filtered, selected_idx, top_idx
@@ -610,6 +672,7 @@ def choose_location_pygame(
                         spells_by_name=spells_by_name,  # ★ここが重要
                         items_by_name=items_by_name,
                     )  # ← game_state等は後述
+                    preview_cache.clear()
                     continue
 
                 if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
@@ -735,7 +798,18 @@ def choose_location_pygame(
         # ---------- ヘルプ（画面下） ----------
         help_text = "M: Menu   Enter: Select   Esc: Quit   ↑↓/Wheel: Move"
         help_surf = font.render(help_text, True, (160, 160, 160))
-        screen.blit(help_surf, (16, screen.get_height() - help_surf.get_height() - 12))
+        help_y = screen.get_height() - help_surf.get_height() - 12
+        screen.blit(help_surf, (16, help_y))
+
+        # ---------- 戦闘見込み（期待値モード） ----------
+        if preview_fn is not None and filtered:
+            sel = filtered[selected_idx]
+            text = preview_cache.get(sel.location)
+            if text is None:
+                text = preview_fn(sel)
+                preview_cache[sel.location] = text
+            preview_surf = font.render(text, True, (200, 220, 160))
+            screen.blit(preview_surf, (16, help_y - line_h))
 
         pygame.display.flip()
         clock.tick(60)
@@ -47,6 +47,14 @@ class BattleAppContext:
 
     make_planned_action: MakePlannedActionFn
 
+    # ★追加：Auto コマンド用（party_members, enemies, 入力済みの行動）→ 全員分の行動
+    auto_plan: Optional[
+        Callable[
+            [Sequence[Any], Sequence[Any], Sequence[Optional[PlannedAction]]],
+            List[Optional[PlannedAction]],
+        ]
+    ] = None
+
     def on_committed(self, ui: BattleUIState) -> None:
         self.reset_target_flags(ui)
         if self.all_actions_committed(ui):
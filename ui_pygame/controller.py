@@ -8,6 +8,7 @@ from random import Random
 from combat.runtime_state import RuntimeState
 from combat.battle_sim import simulate_one_round_multi_party  # ←実際の場所に合わせて
 from combat.models import PartyMemberRuntime  # ←実際の場所に合わせて
+from combat.replay import BattleRecorder
 
 # EnemyRuntime / PlannedAction / SideTurnResult の import 先もあなたの構成に合わせて調整してください
 from combat.models import (
@@ -27,8 +28,14 @@ class ResolveResult:
 
 
 class BattleController:
-    def __init__(self, rng: Optional[Random] = None):
-        self.rng = rng or Random()
+    def __init__(
+        self,
+        rng: Optional[Random] = None,
+        recorder: Optional[BattleRecorder] = None,
+    ):
+        # ★リプレイ記録中は recorder の乱数を使う（シードから再現できるように）
+        self.recorder = recorder
+        self.rng = recorder.rng if recorder is not None else (rng or Random())
         self._bgm_started = False  # ★追加
 
     def update(
@@ -173,6 +180,9 @@ class BattleController:
         spells_by_name: Optional[Dict[str, Dict[str, Any]]],
         items_by_name: Optional[Dict[str, Dict[str, Any]]],
     ) -> ResolveResult:
+        if self.recorder is not None:
+            recorded_actions = self.recorder.snapshot_actions(planned_actions)
+
         logs, side_result, events = simulate_one_round_multi_party(
             party_members=party_members,
             enemies=enemies,
@@ -183,6 +193,11 @@ class BattleController:
             spells_by_name=spells_by_name,
             items_by_name=items_by_name,
         )
+
+        if self.recorder is not None:
+            self.recorder.record_round(
+                recorded_actions, logs, events, side_result.end_reason
+            )
         return ResolveResult(logs=logs, side_result=side_result, events=events)
 
     def _push_logs(self, ui, logs: List[str]) -> None:
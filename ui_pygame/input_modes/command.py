@@ -7,6 +7,7 @@ from combat.models import PlannedAction
 from combat.enums import BattleKind
 from ui_pygame.state import BattleUIState
 from ui_pygame.app_context import BattleAppContext
+from ui_pygame.logic import AUTO_COMMAND
 
 
 SPECIAL_NO_TARGET = {"Cheer", "Scare", "Flee", "Terrain", "Boost"}
@@ -46,6 +47,43 @@ def _confirm_self_action(
     ctx.on_committed(ui)
 
 
+def _describe_action(ctx: BattleAppContext, act: PlannedAction) -> str:
+    label = act.spell_name or act.item_name or act.command or act.kind
+    if act.target_all:
+        return f"{label} → 全体"
+    if act.target_side == "enemy" and act.target_index is not None:
+        target = ctx.enemies[act.target_index]
+    elif act.target_side == "ally" and act.target_index is not None:
+        target = ctx.party_members[act.target_index]
+    else:
+        return label
+    return f"{label} → {getattr(target, 'name', act.target_index)}"
+
+
+def _confirm_auto_actions(ui: BattleUIState, ctx: BattleAppContext) -> bool:
+    # ★追加：未入力の生存メンバー全員の行動を MCTS で決める（入力済みの行動は固定）
+    if ctx.auto_plan is None:
+        ui.logs.append("[入力] Auto は使用できません")
+        return False
+
+    planned = ctx.auto_plan(ctx.party_members, ctx.enemies, list(ui.planned_actions))
+    for i, act in enumerate(planned):
+        if ui.planned_actions[i] is not None or act is None:
+            continue
+        if ctx.is_out_of_battle(ctx.party_members[i].state):
+            continue
+        ui.planned_actions[i] = act
+        member = ctx.party_members[i]
+        ui.logs.append(
+            f"[Auto] {getattr(member, 'name', 'member')}: {_describe_action(ctx, act)}"
+        )
+
+    _play_se(getattr(ui, "se_confirm", None))
+    ui.input_mode = "member"
+    ctx.on_committed(ui)
+    return True
+
+
 def _enter_magic_menu(ui: BattleUIState, ctx: BattleAppContext) -> None:
     ui.magic_candidates = ctx.build_magic_candidates_for_member(ui.selected_member_idx)
     ui.selected_magic_idx = 0
@@ -158,6 +196,9 @@ def handle_command_keydown(
     ui.target_side = "enemy"  # type: ignore[assignment]
     ui.selected_target_idx = 0
 
+    if cmd == AUTO_COMMAND:
+        return _confirm_auto_actions(ui, ctx)
+
     if kind in ("defend", "run"):
         _confirm_self_action(ui=ui, ctx=ctx, kind=kind, command=cmd)
         return True
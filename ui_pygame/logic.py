@@ -7,6 +7,7 @@
 # build_item_candidates_for_battle: 戦闘中のアイテム候補リストを構築
 # normalize_battle_command: 戦闘コマンドを正規化
 # get_job_commands: ジョブから戦闘コマンドリストを取得
+# get_job_commands_with_auto: ジョブのコマンド + 自動行動（Auto）
 # find_next_unfilled: 次の未入力キャラを探す
 # to_int: 任意の値を整数に変換
 # ============================================================
@@ -16,6 +17,9 @@ from combat.enums import BattleKind
 from combat.constants import FIELD_ITEM_TARGET_REQUIRED
 from combat.models import PlannedAction, TargetSide
 from combat.inventory import build_item_list, is_item_visible_in_context
+from combat.name_index import lookup_by_name
+from combat.item_effects import item_effect
+from combat.job_profile import job_profile
 from combat.input_ui import normalize_battle_command
 from ui_pygame.state import BattleUIState
 from ui_pygame.ui_types import CommandCandidate
@@ -111,19 +115,11 @@ def build_item_candidates_for_battle(items_by_name, save) -> List[Tuple[str, str
 
 
 def get_job_commands(member) -> List[CommandCandidate]:
-    """ジョブ定義の BattleCommand1..4 を読む。cmd と kind をここで確定する。"""
-    job_data = member.job
+    """ジョブ定義の BattleCommand1..4（★JobProfile に前計算済み）から cmd と kind をここで確定する。"""
     cmds: List[CommandCandidate] = []
-    raw = getattr(job_data, "raw", {}) or {}
-
-    for i in range(1, 5):
-        bc = raw.get(f"BattleCommand{i}")
-        if not bc:
-            continue
-        c = (bc.get("Command") or "").strip()
-        if c:
-            k: BattleKind = normalize_battle_command(c)
-            cmds.append(CommandCandidate(cmd=c, kind=k))
+    for c in job_profile(member.job).commands:
+        k: BattleKind = normalize_battle_command(c)
+        cmds.append(CommandCandidate(cmd=c, kind=k))
 
     # 保険：空ならFF基本セット
     if not cmds:
@@ -133,6 +129,15 @@ def get_job_commands(member) -> List[CommandCandidate]:
     return cmds
 
 
+# ★追加：MCTS 自動戦闘（combat.mcts_planner）を呼ぶ UI 専用コマンド
+AUTO_COMMAND = "Auto"
+
+
+def get_job_commands_with_auto(member) -> List[CommandCandidate]:
+    """ジョブのコマンドの末尾に Auto（未入力メンバーの行動をまとめて自動決定）を足す"""
+    return [*get_job_commands(member), CommandCandidate(cmd=AUTO_COMMAND, kind="special")]
+
+
 # 次の未入力キャラを探す
 def find_next_unfilled(ui: BattleUIState) -> Optional[int]:
     n = len(ui.planned_actions)
@@ -358,7 +363,11 @@ def make_use_field_item_fn(
         return str(s).strip().lower()
 
     def _needs_target(item_name: str) -> bool:
-        return _canon(item_name) in FIELD_ITEM_TARGET_REQUIRED
+        # ★回復・蘇生・状態回復（ItemEffect.target_rule == "ally"）は対象が必要
+        item = lookup_by_name(items_by_name, item_name)
+        if item is None:
+            return _canon(item_name) in FIELD_ITEM_TARGET_REQUIRED
+        return item_effect(item).target_rule == "ally"
 
     def _find_item_type(item_name: str, hint: str | None) -> str | None:
         if hint in FIELD_ITEM_TYPES:
@@ -440,7 +449,7 @@ def make_use_field_item_fn(
         target_idx: int | None,
         item_type_hint: str | None = None,
     ) -> bool:
-        item = items_by_name.get(item_name, {})
+        item = lookup_by_name(items_by_name, item_name) or {}
         if not item:
             _toast("Item not found")
             return False